@@ -159,6 +159,7 @@ def _is_env_key(ek: str) -> bool:
         "EXTERNAL_SERVICES",
         "DEBUG",
         "LOG_LEVEL",
+        "LOG_ENQUEUE",
         "MAINTENANCE_MODE",
         "POOL_SIZE",
         "MAX_OVERFLOW",
@@ -1,16 +1,24 @@
 """Cache layer with optional Valkey (Redis-compatible) backend.
 
-Provides CacheService, backends (InMemoryBackend, ValkeyBackend), TTL cache,
-and cache managers (GuildConfigCacheManager, JailStatusCache).
+Provides CacheService, backends (InMemoryBackend, ValkeyBackend, TieredBackend),
+TTL cache, guild-scoped cache namespaces, and cache managers
+(GuildConfigCacheManager with full-row snapshots, JailStatusCache).
 """
 
 from tux.cache.backend import (
     AsyncCacheBackend,
     InMemoryBackend,
+    TieredBackend,
     ValkeyBackend,
+    close_cache_backend,
     get_cache_backend,
 )
-from tux.cache.managers import GuildConfigCacheManager, JailStatusCache
+from tux.cache.managers import (
+    GuildConfigCacheManager,
+    GuildConfigSnapshot,
+    JailStatusCache,
+)
+from tux.cache.namespace import CacheNamespace
 from tux.cache.service import CacheService
 from tux.cache.ttl import TTLCache
 
@@ -20,11 +28,15 @@ AsyncCacheBackendProtocol = AsyncCacheBackend
 __all__ = [
     "AsyncCacheBackend",
     "AsyncCacheBackendProtocol",
+    "CacheNamespace",
     "CacheService",
     "GuildConfigCacheManager",
+    "GuildConfigSnapshot",
     "InMemoryBackend",
     "JailStatusCache",
     "TTLCache",
+    "TieredBackend",
     "ValkeyBackend",
+    "close_cache_backend",
     "get_cache_backend",
 ]
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
+import uuid
+from collections.abc import Callable, Iterable, Mapping
 from typing import TYPE_CHECKING, Any, Protocol
 
 from loguru import logger
 
 from tux.cache.ttl import TTLCache
+from tux.services.sentry.metrics import record_cache_metric
 
 if TYPE_CHECKING:
     from tux.core.bot import Tux
@@ -15,12 +20,29 @@ if TYPE_CHECKING:
 __all__ = [
     "AsyncCacheBackend",
     "InMemoryBackend",
+    "TieredBackend",
     "ValkeyBackend",
+    "close_cache_backend",
     "get_cache_backend",
 ]
 
 KEY_PREFIX = "tux:"
 
+# Pub/sub channel used to keep TieredBackend L1 caches coherent across processes
+INVALIDATION_CHANNEL = f"{KEY_PREFIX}cache:invalidate"
+# L1 entries never outlive this, bounding staleness if an invalidation is lost
+L1_TTL = 30.0
+# L1 marker for a key known to be missing from Valkey (e.g. a never-bumped
+# generation counter), so repeated misses don't each cost a round trip
+_MISSING = object()
+L1_MAX_SIZE = 5000
+# Delay before resubscribing after the invalidation listener loses its connection
+LISTENER_RETRY_DELAY = 5.0
+# Keys and key prefixes invalidated by another process
+type InvalidationListener = Callable[[list[str], tuple[str, ...]], None]
+# Keys fetched per SCAN step and unlinked per call during prefix deletion
+SCAN_BATCH_SIZE = 500
+
 
 class AsyncCacheBackend(Protocol):
     """Protocol for async cache backends (in-memory or Valkey)."""
@@ -42,6 +64,25 @@ class AsyncCacheBackend(Protocol):
     async def exists(self, key: str) -> bool:  # type: ignore[reportReturnType]
         """Return True if key exists and is not expired."""
 
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:  # type: ignore[reportReturnType]
+        """Get several keys at once. Missing or expired keys are omitted."""
+
+    async def set_many(
+        self,
+        items: Mapping[str, Any],
+        ttl_sec: float | None = None,
+    ) -> None:
+        """Set several keys at once, all with the same optional TTL."""
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete several keys at once."""
+
+    async def delete_prefix(self, prefix: str) -> int:  # type: ignore[reportReturnType]
+        """Delete every key starting with prefix. Return the number deleted."""
+
+    async def incr(self, key: str) -> int:  # type: ignore[reportReturnType]
+        """Atomically increment an integer key (missing counts as 0), without expiry."""
+
 
 class InMemoryBackend:
     """
@@ -49,6 +90,9 @@ class InMemoryBackend:
 
     Used when Valkey is not configured or unavailable. Values are stored
     as-is (no JSON serialization) for compatibility with existing TTLCache usage.
+    Counters written by :meth:`incr` are kept outside the size-bounded cache:
+    evicting a generation counter would reset it to 0 and make entries from
+    before the last bump reachable again.
     """
 
     def __init__(
@@ -63,13 +107,17 @@ class InMemoryBackend:
         default_ttl : float, optional
             Default TTL in seconds when set() is called without ttl_sec.
         max_size : int | None, optional
-            Max entries (FIFO eviction). None for no limit.
+            Max entries (LRU eviction). None for no limit.
         """
         self._cache: TTLCache = TTLCache(ttl=default_ttl, max_size=max_size)
+        # Never evicted; one per generation counter, i.e. per namespace and guild
+        self._counters: dict[str, int] = {}
         self._default_ttl = default_ttl
 
     async def get(self, key: str) -> Any | None:
         """Get a value by key."""
+        if key in self._counters:
+            return self._counters[key]
         return self._cache.get(key)
 
     async def set(
@@ -84,6 +132,7 @@ class InMemoryBackend:
         ``None`` or non-positive ``ttl_sec`` stores without expiry (in-process
         only), like Redis ``SET`` without ``EX``.
         """
+        self._counters.pop(key, None)
         if ttl_sec is not None and ttl_sec > 0:
             self._cache.set(key, value, ttl=ttl_sec)
         else:
@@ -91,11 +140,64 @@ class InMemoryBackend:
 
     async def delete(self, key: str) -> None:
         """Delete a key."""
+        self._counters.pop(key, None)
         self._cache.invalidate(key)
 
     async def exists(self, key: str) -> bool:
         """Return True if key exists and is not expired."""
-        return self._cache.get(key) is not None
+        return key in self._counters or self._cache.get(key) is not None
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get several keys at once. Missing or expired keys are omitted."""
+        found: dict[str, Any] = {}
+        for key in keys:
+            value = self._counters.get(key)
+            if value is None:
+                value = self._cache.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set_many(
+        self,
+        items: Mapping[str, Any],
+        ttl_sec: float | None = None,
+    ) -> None:
+        """Set several keys at once, all with the same optional TTL."""
+        ttl = ttl_sec if ttl_sec is not None and ttl_sec > 0 else float("inf")
+        for key, value in items.items():
+            self._counters.pop(key, None)
+            self._cache.set(key, value, ttl=ttl)
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete several keys at once."""
+        for key in keys:
+            self._counters.pop(key, None)
+            self._cache.invalidate(key)
+
+    async def delete_prefix(self, prefix: str) -> int:
+        """Delete every key starting with prefix. Return the number deleted."""
+        counters = [key for key in self._counters if key.startswith(prefix)]
+        for key in counters:
+            del self._counters[key]
+        return len(counters) + self._cache.invalidate_keys_matching(
+            lambda key: isinstance(key, str) and key.startswith(prefix),
+        )
+
+    async def incr(self, key: str) -> int:
+        """Increment an integer key (missing counts as 0), without expiry."""
+        if key in self._counters:
+            value = self._counters[key] + 1
+        else:
+            value = int(self._cache.get(key) or 0) + 1
+            self._cache.invalidate(key)
+        self._counters[key] = value
+        return value
+
+
+def _escape_glob(text: str) -> str:
+    """Escape Valkey glob metacharacters so text matches literally in SCAN MATCH."""
+    return "".join(f"\\{c}" if c in "*?[]\\" else c for c in text)
 
 
 class ValkeyBackend:
@@ -163,17 +265,376 @@ class ValkeyBackend:
         full_key = self._key(key)
         return bool(await self._client.exists(full_key))
 
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get several keys with a single MGET. Missing keys are omitted."""
+        key_list = list(keys)
+        if not key_list:
+            return {}
+        raw_values = await self._client.mget([self._key(key) for key in key_list])
+        found: dict[str, Any] = {}
+        corrupt: list[str] = []
+        for key, raw in zip(key_list, raw_values, strict=True):
+            if raw is None:
+                continue
+            try:
+                found[key] = json.loads(raw)
+            except json.JSONDecodeError:
+                corrupt.append(self._key(key))
+        if corrupt:
+            logger.debug(
+                "Valkey keys returned non-JSON values, deleting and treating as misses",
+                keys=corrupt,
+            )
+            await self._client.unlink(*corrupt)
+        return found
+
+    async def set_many(
+        self,
+        items: Mapping[str, Any],
+        ttl_sec: float | None = None,
+    ) -> None:
+        """Set several keys in one pipelined round trip."""
+        if not items:
+            return
+        pipe = self._client.pipeline(transaction=False)
+        for key, value in items.items():
+            payload = json.dumps(value, default=str)
+            if ttl_sec is not None and ttl_sec > 0:
+                pipe.setex(self._key(key), int(ttl_sec), payload)
+            else:
+                pipe.set(self._key(key), payload)
+        await pipe.execute()
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete several keys with a single non-blocking UNLINK."""
+        full_keys = [self._key(key) for key in keys]
+        if full_keys:
+            await self._client.unlink(*full_keys)
+
+    async def delete_prefix(self, prefix: str) -> int:
+        """Delete every key starting with prefix using SCAN and batched UNLINK."""
+        pattern = f"{_escape_glob(self._key(prefix))}*"
+        deleted = 0
+        batch: list[str] = []
+        async for full_key in self._client.scan_iter(
+            match=pattern,
+            count=SCAN_BATCH_SIZE,
+        ):
+            batch.append(full_key)
+            if len(batch) >= SCAN_BATCH_SIZE:
+                deleted += await self._client.unlink(*batch)
+                batch.clear()
+        if batch:
+            deleted += await self._client.unlink(*batch)
+        return deleted
+
+    async def incr(self, key: str) -> int:
+        """Increment an integer key with INCR (missing counts as 0)."""
+        return int(await self._client.incr(self._key(key)))
+
+
+class TieredBackend:
+    """
+    Two-tier cache backend: bounded in-process L1 in front of Valkey (L2).
+
+    Reads are served from L1 when possible and fall through to Valkey on a
+    miss, filling L1 on the way back. Writes go to Valkey first, then L1, and
+    publish the key on ``INVALIDATION_CHANNEL`` so other bot processes drop
+    their L1 copy. L1 entries are capped at ``l1_ttl`` seconds, which bounds
+    staleness if an invalidation message is missed. Misses are cached in L1
+    the same way, since every write publishes the key it creates.
+
+    L1 stores values after a JSON round trip, so callers see the same types
+    (lists instead of tuples, string dict keys) whichever tier answers.
+
+    State kept outside the cache can follow the same channel through
+    :meth:`add_invalidation_listener`.
+    """
+
+    def __init__(
+        self,
+        l2: ValkeyBackend,
+        *,
+        l1_ttl: float = L1_TTL,
+        l1_max_size: int | None = L1_MAX_SIZE,
+        channel: str = INVALIDATION_CHANNEL,
+    ) -> None:
+        """Initialize the tiered backend.
+
+        Parameters
+        ----------
+        l2 : ValkeyBackend
+            Shared Valkey backend; its client is also used for pub/sub.
+        l1_ttl : float, optional
+            Maximum lifetime of an L1 entry in seconds.
+        l1_max_size : int | None, optional
+            Max L1 entries. None for no limit.
+        channel : str, optional
+            Pub/sub channel for cross-process invalidation.
+        """
+        self._l1: TTLCache = TTLCache(ttl=l1_ttl, max_size=l1_max_size)
+        self._l1_ttl = l1_ttl
+        self._l2 = l2
+        self._channel = channel
+        self._instance_id = uuid.uuid4().hex
+        self._listener: asyncio.Task[None] | None = None
+        self._invalidation_listeners: list[InvalidationListener] = []
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+
+    @property
+    def client(self) -> Any:
+        """Return the Valkey client backing L2."""
+        return self._l2._client  # pyright: ignore[reportPrivateUsage]
+
+    def _l1_ttl_for(self, ttl_sec: float | None) -> float:
+        """Return the L1 lifetime for an entry stored with ``ttl_sec``."""
+        if ttl_sec is not None and ttl_sec > 0:
+            return min(ttl_sec, self._l1_ttl)
+        return self._l1_ttl
+
+    async def get(self, key: str) -> Any | None:
+        """Get a value by key, from L1 if present, else from Valkey."""
+        value = self._l1.get(key)
+        if value is _MISSING:
+            self.misses += 1
+            record_cache_metric("tiered_l1", "get", hit=True)
+            return None
+        if value is not None:
+            self.l1_hits += 1
+            record_cache_metric("tiered_l1", "get", hit=True)
+            return value
+        record_cache_metric("tiered_l1", "get", miss=True)
+
+        value = await self._l2.get(key)
+        if value is None:
+            self.misses += 1
+            record_cache_metric("tiered_l2", "get", miss=True)
+            self._l1.set(key, _MISSING, ttl=self._l1_ttl)
+            return None
+        self.l2_hits += 1
+        record_cache_metric("tiered_l2", "get", hit=True)
+        self._l1.set(key, value, ttl=self._l1_ttl)
+        return value
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_sec: float | None = None,
+    ) -> None:
+        """Set a value in both tiers and notify other processes."""
+        await self._l2.set(key, value, ttl_sec=ttl_sec)
+        self._l1.set(
+            key,
+            json.loads(json.dumps(value, default=str)),
+            ttl=self._l1_ttl_for(ttl_sec),
+        )
+        await self._publish([key])
+
+    async def delete(self, key: str) -> None:
+        """Delete a key from both tiers and notify other processes."""
+        self._l1.set(key, _MISSING, ttl=self._l1_ttl)
+        await self._l2.delete(key)
+        await self._publish([key])
+
+    async def exists(self, key: str) -> bool:
+        """Return True if key exists in L1 or Valkey."""
+        value = self._l1.get(key)
+        if value is _MISSING:
+            return False
+        if value is not None:
+            return True
+        return await self._l2.exists(key)
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get several keys, fetching only the L1 misses from Valkey in one MGET."""
+        found: dict[str, Any] = {}
+        l1_misses: list[str] = []
+        for key in keys:
+            value = self._l1.get(key)
+            if value is _MISSING:
+                self.misses += 1
+            elif value is not None:
+                found[key] = value
+            else:
+                l1_misses.append(key)
+        self.l1_hits += len(found)
+        if not l1_misses:
+            return found
+
+        fetched = await self._l2.get_many(l1_misses)
+        self.l2_hits += len(fetched)
+        self.misses += len(l1_misses) - len(fetched)
+        for key in l1_misses:
+            self._l1.set(key, fetched.get(key, _MISSING), ttl=self._l1_ttl)
+        found.update(fetched)
+        return found
+
+    async def set_many(
+        self,
+        items: Mapping[str, Any],
+        ttl_sec: float | None = None,
+    ) -> None:
+        """Set several keys in both tiers and notify other processes once."""
+        if not items:
+            return
+        await self._l2.set_many(items, ttl_sec=ttl_sec)
+        l1_ttl = self._l1_ttl_for(ttl_sec)
+        for key, value in items.items():
+            self._l1.set(key, json.loads(json.dumps(value, default=str)), ttl=l1_ttl)
+        await self._publish(list(items))
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete several keys from both tiers and notify other processes once."""
+        key_list = list(keys)
+        if not key_list:
+            return
+        for key in key_list:
+            self._l1.set(key, _MISSING, ttl=self._l1_ttl)
+        await self._l2.delete_many(key_list)
+        await self._publish(key_list)
+
+    async def delete_prefix(self, prefix: str) -> int:
+        """Delete every key starting with prefix from both tiers."""
+        self._l1.invalidate_keys_matching(
+            lambda key: isinstance(key, str) and key.startswith(prefix),
+        )
+        deleted = await self._l2.delete_prefix(prefix)
+        await self._publish([], prefixes=[prefix])
+        return deleted
+
+    async def incr(self, key: str) -> int:
+        """Increment a counter in Valkey and refresh it in every process's L1."""
+        value = await self._l2.incr(key)
+        self._l1.set(key, value, ttl=self._l1_ttl)
+        await self._publish([key])
+        return value
+
+    def hit_rates(self) -> dict[str, float]:
+        """
+        Return the fraction of lookups answered by each tier.
+
+        Returns
+        -------
+        dict[str, float]
+            ``l1`` and ``l2`` hit rates over all lookups so far.
+        """
+        total = self.l1_hits + self.l2_hits + self.misses
+        if total == 0:
+            return {"l1": 0.0, "l2": 0.0}
+        return {"l1": self.l1_hits / total, "l2": self.l2_hits / total}
+
+    # ---------- Cross-process invalidation ----------
+
+    async def _publish(
+        self,
+        keys: list[str],
+        *,
+        prefixes: list[str] | None = None,
+    ) -> None:
+        """Publish an invalidation message; failures only cost coherence."""
+        payload: dict[str, Any] = {"source": self._instance_id, "keys": keys}
+        if prefixes:
+            payload["prefixes"] = prefixes
+        message = json.dumps(payload)
+        try:
+            await self.client.publish(self._channel, message)
+        except Exception as e:
+            logger.debug(f"Failed to publish cache invalidation: {e}")
+
+    def add_invalidation_listener(self, callback: InvalidationListener) -> None:
+        """
+        Call ``callback`` for every invalidation published by another process.
+
+        The callback receives the invalidated keys and key prefixes. After the
+        listener reconnects it is called with the prefix ``""``, since any
+        key may have changed while messages were being missed.
+
+        Parameters
+        ----------
+        callback : InvalidationListener
+            Synchronous function taking ``(keys, prefixes)``.
+        """
+        self._invalidation_listeners.append(callback)
+
+    def _notify(self, keys: list[str], prefixes: tuple[str, ...]) -> None:
+        """Pass a remote invalidation on to the registered listeners."""
+        for callback in self._invalidation_listeners:
+            try:
+                callback(keys, prefixes)
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener raised: {e}")
+
+    def _handle_message(self, data: str) -> None:
+        """Apply an invalidation message received from another process."""
+        try:
+            payload = json.loads(data)
+        except (TypeError, json.JSONDecodeError):
+            return
+        if not isinstance(payload, dict) or payload.get("source") == self._instance_id:
+            return
+        keys = list(payload.get("keys", ()))
+        for key in keys:
+            self._l1.invalidate(key)
+        prefixes = tuple(payload.get("prefixes", ()))
+        if prefixes:
+            self._l1.invalidate_keys_matching(
+                lambda key: isinstance(key, str) and key.startswith(prefixes),
+            )
+        self._notify(keys, prefixes)
+
+    async def start(self) -> None:
+        """Start listening for invalidations from other processes."""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(
+                self._listen(),
+                name="tiered-cache-invalidation",
+            )
+
+    async def close(self) -> None:
+        """Stop the invalidation listener and drop L1."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        self._l1.clear()
+
+    async def _listen(self) -> None:
+        """Consume invalidation messages, resubscribing after connection loss."""
+        while True:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self._channel)
+                logger.debug(f"Listening for cache invalidations on {self._channel}")
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._handle_message(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener failed: {e}")
+            finally:
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()
+            # Invalidations may have been missed while disconnected
+            self._l1.clear()
+            self._notify([], ("",))
+            await asyncio.sleep(LISTENER_RETRY_DELAY)
+
 
 _FALLBACK_BACKEND_ATTR = "_fallback_cache_backend"
+_TIERED_BACKEND_ATTR = "_tiered_cache_backend"
 
 
 def get_cache_backend(bot: Tux) -> AsyncCacheBackend:
     """
-    Return the cache backend for the bot (Valkey if connected, else in-memory).
+    Return the cache backend for the bot (tiered Valkey if connected, else in-memory).
 
-    When Valkey is not configured or disconnected, a single shared InMemoryBackend
-    is cached on the bot so all consumers (cache managers, prefix, permissions)
-    use the same in-memory store.
+    Both backends are cached on the bot so all consumers (cache managers, prefix,
+    permissions) share the same L1 / in-memory store.
 
     Parameters
     ----------
@@ -183,16 +644,38 @@ def get_cache_backend(bot: Tux) -> AsyncCacheBackend:
     Returns
     -------
     AsyncCacheBackend
-        ValkeyBackend if bot.cache_service is connected, else a shared InMemoryBackend.
+        A shared TieredBackend if bot.cache_service is connected, else a shared
+        InMemoryBackend.
     """
     cache_service = getattr(bot, "cache_service", None)
     if cache_service is not None and cache_service.is_connected():
         client = cache_service.get_client()
         if client is not None:
-            return ValkeyBackend(client)
+            tiered = getattr(bot, _TIERED_BACKEND_ATTR, None)
+            if not isinstance(tiered, TieredBackend) or tiered.client is not client:
+                tiered = TieredBackend(ValkeyBackend(client))
+                setattr(bot, _TIERED_BACKEND_ATTR, tiered)
+            return tiered
     fallback = getattr(bot, _FALLBACK_BACKEND_ATTR, None)
     if not isinstance(fallback, InMemoryBackend):
         logger.debug("Using in-memory cache backend (Valkey unavailable)")
         fallback = InMemoryBackend(default_ttl=300.0, max_size=10000)
         setattr(bot, _FALLBACK_BACKEND_ATTR, fallback)
     return fallback
+
+
+async def close_cache_backend(bot: Tux) -> None:
+    """
+    Stop the bot's tiered backend listener, if any.
+
+    Call before closing the Valkey connection on shutdown.
+
+    Parameters
+    ----------
+    bot : Tux
+        The bot instance.
+    """
+    tiered = getattr(bot, _TIERED_BACKEND_ATTR, None)
+    if isinstance(tiered, TieredBackend):
+        await tiered.close()
+        setattr(bot, _TIERED_BACKEND_ATTR, None)
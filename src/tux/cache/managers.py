@@ -3,23 +3,107 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine
+from collections import Counter
+from collections.abc import Callable, Coroutine, Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, cast
 
 from loguru import logger
 
 from tux.cache.backend import AsyncCacheBackend
+from tux.cache.namespace import CacheNamespace
 from tux.cache.ttl import TTLCache
 
-# Sentinel value to indicate a field was not provided
-_MISSING: Any = object()
-
 # Setup-once, rarely change; invalidated on config update. 2h = session-friendly, low staleness risk.
 GUILD_CONFIG_TTL_SEC = 7200.0  # 2 hours
+# One full-row snapshot per guild; sized for every guild of a large deployment
+GUILD_CONFIG_SNAPSHOT_MAX_SIZE = 10_000
 # Invalidated on jail/unjail; TTL only for cold expiry.
 JAIL_STATUS_TTL_SEC = 3600.0  # 1 hour
 
-__all__ = ["GuildConfigCacheManager", "JailStatusCache"]
+__all__ = ["GuildConfigCacheManager", "GuildConfigSnapshot", "JailStatusCache"]
+
+
+@dataclass(frozen=True, slots=True)
+class GuildConfigSnapshot:
+    """
+    Immutable copy of one guild's full config row.
+
+    Attributes
+    ----------
+    guild_id : int
+        The guild ID.
+    version : int
+        Cache version the snapshot was taken at. Every write-through or
+        invalidation of the guild bumps the version.
+    values : Mapping[str, Any] | None
+        Read-only column values in JSON form, or None if the guild has no
+        config row.
+    """
+
+    guild_id: int
+    version: int
+    values: Mapping[str, Any] | None
+
+    @property
+    def exists(self) -> bool:
+        """Return whether the guild has a config row."""
+        return self.values is not None
+
+    def get(self, field_name: str, default: Any = None) -> Any:
+        """
+        Return one config field.
+
+        Parameters
+        ----------
+        field_name : str
+            Column name, e.g. ``"jail_role_id"``.
+        default : Any, optional
+            Returned when there is no config row or no such field.
+
+        Returns
+        -------
+        Any
+            The field value, or ``default``.
+        """
+        if self.values is None:
+            return default
+        return self.values.get(field_name, default)
+
+    def to_payload(self) -> dict[str, Any]:
+        """Return a JSON-serializable form for cache backends."""
+        return {
+            "version": self.version,
+            "values": dict(self.values) if self.values is not None else None,
+        }
+
+    @classmethod
+    def from_payload(cls, guild_id: int, payload: Any) -> GuildConfigSnapshot | None:
+        """
+        Rebuild a snapshot from :meth:`to_payload` output.
+
+        Parameters
+        ----------
+        guild_id : int
+            The guild ID.
+        payload : Any
+            Value read from the cache backend.
+
+        Returns
+        -------
+        GuildConfigSnapshot | None
+            The snapshot, or None if the payload is not a snapshot.
+        """
+        if not isinstance(payload, dict) or "values" not in payload:
+            return None
+        data = cast(dict[str, Any], payload)
+        values = data["values"]
+        return cls(
+            guild_id=guild_id,
+            version=int(data.get("version", 0)),
+            values=MappingProxyType(dict(values)) if values is not None else None,
+        )
 
 
 class GuildConfigCacheManager:
@@ -29,25 +113,48 @@ class GuildConfigCacheManager:
     Provides a singleton instance that can be used across the application
     to cache and invalidate guild configuration data, ensuring consistency
     when config is updated from multiple sources. Supports optional
-    AsyncCacheBackend (e.g. Valkey); when set, get/set/invalidate
-    are async and use the backend.
+    AsyncCacheBackend (e.g. Valkey); when set, snapshots are stored in the
+    backend.
+
+    The manager holds a full-row :class:`GuildConfigSnapshot` per guild.
+    Snapshots carry a per-guild version: writers replace them with
+    :meth:`put_snapshot`, while readers that loaded a row from the database
+    store it with :meth:`fill_snapshot`, which is skipped if a write or
+    invalidation happened in between.
     """
 
-    __slots__ = ("_backend", "_cache", "_locks", "_locks_lock")
+    __slots__ = (
+        "_backend",
+        "_epoch",
+        "_locks",
+        "_locks_lock",
+        "_namespace",
+        "_snapshots",
+        "_versions",
+    )
     _instance: GuildConfigCacheManager | None = None
-    _cache: TTLCache
+    _snapshots: TTLCache
+    _versions: Counter[int]
+    _epoch: int
     _locks: dict[int, asyncio.Lock]
     _locks_lock: asyncio.Lock
     _backend: AsyncCacheBackend | None
+    _namespace: CacheNamespace | None
 
     def __new__(cls) -> GuildConfigCacheManager:
         """Create or return the singleton instance."""
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._cache = TTLCache(ttl=GUILD_CONFIG_TTL_SEC, max_size=1000)
+            cls._instance._snapshots = TTLCache(
+                ttl=GUILD_CONFIG_TTL_SEC,
+                max_size=GUILD_CONFIG_SNAPSHOT_MAX_SIZE,
+            )
+            cls._instance._versions = Counter()
+            cls._instance._epoch = 0
             cls._instance._locks = {}
             cls._instance._locks_lock = asyncio.Lock()
             cls._instance._backend = None
+            cls._instance._namespace = None
         return cls._instance
 
     def set_backend(self, backend: AsyncCacheBackend) -> None:
@@ -59,6 +166,7 @@ class GuildConfigCacheManager:
             Backend instance to use for cache operations.
         """
         self._backend = backend
+        self._namespace = CacheNamespace("guild_config", backend)
         logger.debug(
             "GuildConfigCacheManager backend set to {}",
             type(backend).__name__,
@@ -71,13 +179,28 @@ class GuildConfigCacheManager:
                 self._locks[guild_id] = asyncio.Lock()
         return self._locks[guild_id]
 
-    def _cache_key(self, guild_id: int) -> str:
-        """Return the cache key for a guild (backend adds tux: prefix)."""
-        return f"guild_config:{guild_id}"
+    async def write_lock(self, guild_id: int) -> asyncio.Lock:
+        """
+        Return the per-guild lock that orders config writes.
+
+        Hold it around a database write and the matching :meth:`put_snapshot`
+        so concurrent writers replace the snapshot in commit order.
+
+        Parameters
+        ----------
+        guild_id : int
+            The guild ID.
+
+        Returns
+        -------
+        asyncio.Lock
+            The guild's lock.
+        """
+        return await self._get_lock(guild_id)
 
-    async def get(self, guild_id: int) -> dict[str, int | None] | None:
+    def snapshot_version(self, guild_id: int) -> int:
         """
-        Get cached guild config for a guild.
+        Return the current snapshot version of a guild.
 
         Parameters
         ----------
@@ -86,145 +209,158 @@ class GuildConfigCacheManager:
 
         Returns
         -------
-        dict[str, int | None] | None
-            Cached config dict with audit_log_id, mod_log_id, jail_role_id,
-            and jail_channel_id, or None if not cached.
+        int
+            Version to pass to :meth:`fill_snapshot` after loading the row.
         """
-        key = self._cache_key(guild_id)
-        if self._backend is not None:
-            value = await self._backend.get(key)
-            return (
-                cast(dict[str, int | None], value) if isinstance(value, dict) else None
-            )
-        return self._cache.get(key)
+        return self._epoch + self._versions[guild_id]
 
-    async def _set_impl(
-        self,
-        guild_id: int,
-        audit_log_id: int | None = _MISSING,
-        mod_log_id: int | None = _MISSING,
-        jail_role_id: int | None = _MISSING,
-        jail_channel_id: int | None = _MISSING,
-    ) -> None:
-        """Merge and write guild config (caller holds lock if needed)."""
-        key = self._cache_key(guild_id)
-        if self._backend is not None:
-            raw = await self._backend.get(key)
-            existing: dict[str, int | None] = (
-                cast(dict[str, int | None], raw) if isinstance(raw, dict) else {}
-            )
-        else:
-            existing = cast(
-                dict[str, int | None],
-                self._cache.get(key) or {},
-            )
-        updated: dict[str, int | None] = dict(existing)
-        if audit_log_id is not _MISSING:
-            updated["audit_log_id"] = audit_log_id
-        if mod_log_id is not _MISSING:
-            updated["mod_log_id"] = mod_log_id
-        if jail_role_id is not _MISSING:
-            updated["jail_role_id"] = jail_role_id
-        if jail_channel_id is not _MISSING:
-            updated["jail_channel_id"] = jail_channel_id
+    async def get_snapshot(self, guild_id: int) -> GuildConfigSnapshot | None:
+        """
+        Get the cached full-row snapshot of a guild.
+
+        Parameters
+        ----------
+        guild_id : int
+            The guild ID.
+
+        Returns
+        -------
+        GuildConfigSnapshot | None
+            The snapshot (possibly of a missing row), or None if not cached.
+        """
         if self._backend is not None:
-            await self._backend.set(key, updated, ttl_sec=GUILD_CONFIG_TTL_SEC)
-        else:
-            self._cache.set(key, updated)
+            value = await self._backend.get(await self._snapshot_backend_key(guild_id))
+            return GuildConfigSnapshot.from_payload(guild_id, value)
+        return self._snapshots.get(guild_id)
 
-    async def set(
+    async def put_snapshot(
         self,
         guild_id: int,
-        audit_log_id: int | None = _MISSING,
-        mod_log_id: int | None = _MISSING,
-        jail_role_id: int | None = _MISSING,
-        jail_channel_id: int | None = _MISSING,
-        *,
-        use_lock: bool = False,
-    ) -> None:
+        values: Mapping[str, Any] | None,
+    ) -> GuildConfigSnapshot:
         """
-        Cache guild config for a guild (partial merge).
+        Replace a guild's snapshot after a write (write-through).
 
         Parameters
         ----------
         guild_id : int
             The guild ID.
-        audit_log_id : int | None, optional
-            The audit log channel ID. Omit to skip updating this field.
-        mod_log_id : int | None, optional
-            The mod log channel ID. Omit to skip updating this field.
-        jail_role_id : int | None, optional
-            The jail role ID. Omit to skip updating this field.
-        jail_channel_id : int | None, optional
-            The jail channel ID. Omit to skip updating this field.
-        use_lock : bool, optional
-            If True, acquire per-guild lock before read-merge-write (for concurrent
-            safety). Use when multiple coroutines may update the same guild.
+        values : Mapping[str, Any] | None
+            Column values of the row as written, or None if it was deleted.
+
+        Returns
+        -------
+        GuildConfigSnapshot
+            The stored snapshot.
         """
-        if use_lock:
-            async with await self._get_lock(guild_id):
-                await self._set_impl(
-                    guild_id,
-                    audit_log_id=audit_log_id,
-                    mod_log_id=mod_log_id,
-                    jail_role_id=jail_role_id,
-                    jail_channel_id=jail_channel_id,
-                )
-        else:
-            await self._set_impl(
-                guild_id,
-                audit_log_id=audit_log_id,
-                mod_log_id=mod_log_id,
-                jail_role_id=jail_role_id,
-                jail_channel_id=jail_channel_id,
-            )
+        self._versions[guild_id] += 1
+        snapshot = self._snapshot(guild_id, values, self.snapshot_version(guild_id))
+        await self._store_snapshots([snapshot])
+        return snapshot
 
-    async def async_set(
+    async def fill_snapshot(
         self,
         guild_id: int,
-        audit_log_id: int | None = _MISSING,
-        mod_log_id: int | None = _MISSING,
-        jail_role_id: int | None = _MISSING,
-        jail_channel_id: int | None = _MISSING,
-    ) -> None:
-        """Cache guild config for a guild with async locking (concurrent safety).
+        values: Mapping[str, Any] | None,
+        version: int,
+    ) -> GuildConfigSnapshot:
+        """
+        Cache a snapshot loaded from the database (read-through).
 
         Parameters
         ----------
         guild_id : int
             The guild ID.
-        audit_log_id : int | None, optional
-            The audit log channel ID. Omit to skip updating this field.
-        mod_log_id : int | None, optional
-            The mod log channel ID. Omit to skip updating this field.
-        jail_role_id : int | None, optional
-            The jail role ID. Omit to skip updating this field.
-        jail_channel_id : int | None, optional
-            The jail channel ID. Omit to skip updating this field.
+        values : Mapping[str, Any] | None
+            Column values as loaded, or None if the guild has no config row.
+        version : int
+            :meth:`snapshot_version` read before the row was loaded.
+
+        Returns
+        -------
+        GuildConfigSnapshot
+            The snapshot; it is only cached if no write happened since
+            ``version`` was read.
         """
-        await self.set(
-            guild_id,
-            audit_log_id=audit_log_id,
-            mod_log_id=mod_log_id,
-            jail_role_id=jail_role_id,
-            jail_channel_id=jail_channel_id,
-            use_lock=True,
+        snapshot = self._snapshot(guild_id, values, version)
+        if self.snapshot_version(guild_id) == version:
+            await self._store_snapshots([snapshot])
+        return snapshot
+
+    async def fill_snapshots(
+        self,
+        values_by_guild: Mapping[int, Mapping[str, Any] | None],
+        versions: Mapping[int, int],
+    ) -> int:
+        """
+        Cache many loaded snapshots at once, e.g. at startup.
+
+        Parameters
+        ----------
+        values_by_guild : Mapping[int, Mapping[str, Any] | None]
+            Column values per guild ID (None for guilds without a row).
+        versions : Mapping[int, int]
+            :meth:`snapshot_version` per guild, read before loading.
+
+        Returns
+        -------
+        int
+            Number of snapshots cached; guilds written to meanwhile are skipped.
+        """
+        snapshots = [
+            self._snapshot(guild_id, values, versions[guild_id])
+            for guild_id, values in values_by_guild.items()
+            if self.snapshot_version(guild_id) == versions[guild_id]
+        ]
+        await self._store_snapshots(snapshots)
+        return len(snapshots)
+
+    @staticmethod
+    def _snapshot(
+        guild_id: int,
+        values: Mapping[str, Any] | None,
+        version: int,
+    ) -> GuildConfigSnapshot:
+        """Build a snapshot holding a read-only copy of the values."""
+        return GuildConfigSnapshot(
+            guild_id=guild_id,
+            version=version,
+            values=MappingProxyType(dict(values)) if values is not None else None,
         )
 
+    async def _snapshot_backend_key(self, guild_id: int) -> str:
+        """Return the generation-versioned backend key of a guild's snapshot."""
+        return await cast(CacheNamespace, self._namespace).key(guild_id, "snapshot")
+
+    async def _store_snapshots(self, snapshots: Iterable[GuildConfigSnapshot]) -> None:
+        """Write snapshots to the backend in one batch, or to memory."""
+        if self._backend is None:
+            for snapshot in snapshots:
+                self._snapshots.set(snapshot.guild_id, snapshot)
+            return
+        items = {
+            await self._snapshot_backend_key(snapshot.guild_id): snapshot.to_payload()
+            for snapshot in snapshots
+        }
+        if items:
+            await self._backend.set_many(items, ttl_sec=GUILD_CONFIG_TTL_SEC)
+
     async def invalidate(self, guild_id: int) -> None:
         """
         Invalidate cached guild config for a guild.
 
+        Drops the full-row snapshot.
+
         Parameters
         ----------
         guild_id : int
             The guild ID to invalidate.
         """
-        key = self._cache_key(guild_id)
+        self._versions[guild_id] += 1
         if self._backend is not None:
-            await self._backend.delete(key)
+            await self._backend.delete(await self._snapshot_backend_key(guild_id))
         else:
-            self._cache.invalidate(key)
+            self._snapshots.invalidate(guild_id)
         logger.debug("Invalidated guild config cache for guild {}", guild_id)
 
     async def clear_all(self) -> None:
@@ -232,10 +368,13 @@ class GuildConfigCacheManager:
 
         Notes
         -----
-        Only the in-memory cache is cleared; when a backend is configured,
-        backend keys are not deleted (no pattern delete).
+        When a backend is configured, this bumps the namespace generation so
+        every guild's backend entry becomes unreachable and expires by TTL.
         """
-        self._cache.clear()
+        self._epoch += 1
+        self._snapshots.clear()
+        if self._backend is not None:
+            await cast(CacheNamespace, self._namespace).invalidate_all()
         logger.debug("Cleared all guild config cache entries")
 
 
@@ -247,12 +386,13 @@ class JailStatusCache:
     tuple. Supports optional AsyncCacheBackend (e.g. Valkey).
     """
 
-    __slots__ = ("_backend", "_cache", "_locks", "_locks_lock")
+    __slots__ = ("_backend", "_cache", "_locks", "_locks_lock", "_namespace")
     _instance: JailStatusCache | None = None
     _cache: TTLCache
     _locks: dict[tuple[int, int], asyncio.Lock]
     _locks_lock: asyncio.Lock
     _backend: AsyncCacheBackend | None
+    _namespace: CacheNamespace | None
 
     def __new__(cls) -> JailStatusCache:
         """Create or return the singleton instance."""
@@ -262,6 +402,7 @@ class JailStatusCache:
             cls._instance._locks = {}
             cls._instance._locks_lock = asyncio.Lock()
             cls._instance._backend = None
+            cls._instance._namespace = None
         return cls._instance
 
     def set_backend(self, backend: AsyncCacheBackend) -> None:
@@ -273,6 +414,7 @@ class JailStatusCache:
             Backend instance to use for cache operations.
         """
         self._backend = backend
+        self._namespace = CacheNamespace("jail_status", backend)
         logger.debug(
             "JailStatusCache backend set to {}",
             type(backend).__name__,
@@ -291,9 +433,13 @@ class JailStatusCache:
         return self._locks[lock_key]
 
     def _cache_key(self, guild_id: int, user_id: int) -> str:
-        """Return the cache key (backend adds tux: prefix)."""
+        """Return the in-memory cache key."""
         return f"jail_status:{guild_id}:{user_id}"
 
+    async def _backend_key(self, guild_id: int, user_id: int) -> str:
+        """Return the generation-versioned backend key."""
+        return await cast(CacheNamespace, self._namespace).key(guild_id, user_id)
+
     async def get(self, guild_id: int, user_id: int) -> bool | None:
         """
         Get cached jail status for a user.
@@ -303,9 +449,8 @@ class JailStatusCache:
         bool | None
             True if jailed, False if not jailed, None if not cached.
         """
-        key = self._cache_key(guild_id, user_id)
         if self._backend is not None:
-            value = await self._backend.get(key)
+            value = await self._backend.get(await self._backend_key(guild_id, user_id))
             if value is None:
                 return None
             if isinstance(value, bool):
@@ -313,7 +458,7 @@ class JailStatusCache:
             if isinstance(value, str):
                 return value in ("1", "true", "True")
             return bool(value)
-        return self._cache.get(key)
+        return self._cache.get(self._cache_key(guild_id, user_id))
 
     async def set(self, guild_id: int, user_id: int, is_jailed: bool) -> None:
         """Cache jail status for a user.
@@ -327,11 +472,14 @@ class JailStatusCache:
         is_jailed : bool
             Whether the user is jailed.
         """
-        key = self._cache_key(guild_id, user_id)
         if self._backend is not None:
-            await self._backend.set(key, is_jailed, ttl_sec=JAIL_STATUS_TTL_SEC)
+            await self._backend.set(
+                await self._backend_key(guild_id, user_id),
+                is_jailed,
+                ttl_sec=JAIL_STATUS_TTL_SEC,
+            )
         else:
-            self._cache.set(key, is_jailed)
+            self._cache.set(self._cache_key(guild_id, user_id), is_jailed)
 
     async def get_or_fetch(
         self,
@@ -380,13 +528,9 @@ class JailStatusCache:
         is_jailed : bool
             Whether the user is jailed.
         """
-        key = self._cache_key(guild_id, user_id)
         lock = await self._get_lock(guild_id, user_id)
         async with lock:
-            if self._backend is not None:
-                await self._backend.set(key, is_jailed, ttl_sec=JAIL_STATUS_TTL_SEC)
-            else:
-                self._cache.set(key, is_jailed)
+            await self.set(guild_id, user_id, is_jailed)
 
     async def invalidate(self, guild_id: int, user_id: int) -> None:
         """Invalidate cached jail status for a user.
@@ -398,11 +542,10 @@ class JailStatusCache:
         user_id : int
             The user ID.
         """
-        key = self._cache_key(guild_id, user_id)
         if self._backend is not None:
-            await self._backend.delete(key)
+            await self._backend.delete(await self._backend_key(guild_id, user_id))
         else:
-            self._cache.invalidate(key)
+            self._cache.invalidate(self._cache_key(guild_id, user_id))
         logger.debug(
             "Invalidated jail status cache for guild {}, user {}",
             guild_id,
@@ -410,7 +553,7 @@ class JailStatusCache:
         )
 
     async def invalidate_guild(self, guild_id: int) -> None:
-        """Invalidate in-memory jail status entries for a guild.
+        """Invalidate all jail status entries for a guild.
 
         Parameters
         ----------
@@ -419,10 +562,13 @@ class JailStatusCache:
 
         Notes
         -----
-        Only the in-memory cache is cleared for this guild; when a backend
-        (e.g. Valkey) is configured, backend keys for this guild are not
-        deleted. For full clear use :meth:`clear_all` (in-memory only).
+        With a backend this is a single generation bump for the guild; old
+        backend entries are never read again and expire by TTL.
         """
+        if self._backend is not None:
+            await cast(CacheNamespace, self._namespace).invalidate_guild(guild_id)
+            logger.debug("Invalidated jail status cache for guild {}", guild_id)
+            return
         prefix = f"jail_status:{guild_id}:"
         removed = self._cache.invalidate_keys_matching(
             lambda key: str(key).startswith(prefix),
@@ -434,11 +580,14 @@ class JailStatusCache:
         )
 
     async def clear_all(self) -> None:
-        """Clear all cached jail status entries (in-memory only).
+        """Clear all cached jail status entries.
 
         Notes
         -----
-        When a backend is configured, backend keys are not deleted.
+        When a backend is configured, this bumps the namespace generation
+        instead of deleting keys.
         """
         self._cache.clear()
+        if self._backend is not None:
+            await cast(CacheNamespace, self._namespace).invalidate_all()
         logger.debug("Cleared all jail status cache entries")
@@ -0,0 +1,99 @@
+"""Generation-versioned cache namespaces for O(1) bulk invalidation.
+
+Every key built by a :class:`CacheNamespace` embeds two counters stored in the
+backend: one for the whole namespace and one for the guild. Bumping a counter
+makes every key built from the old value unreachable, so invalidating all of a
+guild's entries (or all guilds') is a single ``INCR`` instead of a key scan.
+Orphaned entries are never read again and disappear when their TTL runs out.
+"""
+
+from __future__ import annotations
+
+from loguru import logger
+
+from tux.cache.backend import AsyncCacheBackend
+
+__all__ = ["CacheNamespace"]
+
+
+class CacheNamespace:
+    """
+    Guild-scoped key namespace over an AsyncCacheBackend.
+
+    Keys look like ``{name}:v{namespace_gen}:{guild_id}:v{guild_gen}:{suffix}``.
+    Both generations are read with one ``get_many`` per key build. A counter
+    that was never bumped is missing and counts as 0; TieredBackend caches
+    that miss in L1 as well, so a hot key build needs no Valkey round trip.
+
+    Attributes
+    ----------
+    name : str
+        Namespace name, used as the key prefix (e.g. ``"jail_status"``).
+    """
+
+    __slots__ = ("_backend", "name")
+
+    def __init__(self, name: str, backend: AsyncCacheBackend) -> None:
+        """Initialize the namespace.
+
+        Parameters
+        ----------
+        name : str
+            Namespace name, used as the key prefix.
+        backend : AsyncCacheBackend
+            Backend holding both the generation counters and the entries.
+        """
+        self.name = name
+        self._backend = backend
+
+    def _namespace_gen_key(self) -> str:
+        """Return the key of the namespace-wide generation counter."""
+        return f"{self.name}:gen"
+
+    def _guild_gen_key(self, guild_id: int) -> str:
+        """Return the key of a guild's generation counter."""
+        return f"{self.name}:gen:{guild_id}"
+
+    async def key(self, guild_id: int, suffix: str | int = "") -> str:
+        """
+        Build the current key for a guild-scoped entry.
+
+        Parameters
+        ----------
+        guild_id : int
+            The guild ID.
+        suffix : str | int, optional
+            Entry identifier within the guild (e.g. a user ID).
+
+        Returns
+        -------
+        str
+            Key valid until the guild or namespace generation is bumped.
+        """
+        namespace_key = self._namespace_gen_key()
+        guild_key = self._guild_gen_key(guild_id)
+        gens = await self._backend.get_many([namespace_key, guild_key])
+        base = (
+            f"{self.name}:v{int(gens.get(namespace_key, 0))}:"
+            f"{guild_id}:v{int(gens.get(guild_key, 0))}"
+        )
+        return f"{base}:{suffix}" if suffix != "" else base
+
+    async def invalidate_guild(self, guild_id: int) -> None:
+        """
+        Invalidate every entry of a guild with one counter increment.
+
+        Parameters
+        ----------
+        guild_id : int
+            The guild ID.
+        """
+        generation = await self._backend.incr(self._guild_gen_key(guild_id))
+        logger.trace(
+            f"Bumped {self.name} cache generation for guild {guild_id} to {generation}",
+        )
+
+    async def invalidate_all(self) -> None:
+        """Invalidate every entry of every guild with one counter increment."""
+        generation = await self._backend.incr(self._namespace_gen_key())
+        logger.trace(f"Bumped {self.name} cache generation to {generation}")
@@ -2,24 +2,281 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import itertools
+import math
 import time
-from collections.abc import Callable
-from typing import Any
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Literal
 
 from loguru import logger
 
 # Sentinel for caching None in get_or_fetch (get() returns None for misses)
 _CACHED_NONE: Any = object()
 
-__all__ = ["TTLCache"]
+__all__ = [
+    "EvictionPolicy",
+    "FIFOPolicy",
+    "LRUPolicy",
+    "TTLCache",
+    "TinyLFUPolicy",
+]
+
+EvictionPolicyName = Literal["fifo", "lru", "tinylfu"]
+
+# Rebuild the expiry heap once stale entries outnumber live ones by this factor
+_HEAP_COMPACT_FACTOR = 2
+
+
+class EvictionPolicy(ABC):
+    """
+    Base class for TTLCache eviction policies.
+
+    A policy only tracks key order/frequency; the cache owns the values. It is
+    told about every access, insert and removal and picks victims when the
+    cache is full. Subclasses must implement :meth:`on_insert`; the other
+    hooks are optional.
+    """
+
+    __slots__ = ()
+
+    def on_access(self, key: Hashable) -> None:  # noqa: B027
+        """Record a cache hit for key; a no-op unless hits affect eviction."""
+
+    @abstractmethod
+    def on_insert(self, key: Hashable, *, full: bool) -> Hashable | None:
+        """
+        Record a new key and choose an entry to evict.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key being added.
+        full : bool
+            True if the cache was already at max_size before this insert.
+
+        Returns
+        -------
+        Hashable | None
+            Key to evict (may be ``key`` itself if it is not admitted), or
+            None if nothing needs evicting.
+        """
+
+    def on_remove(self, key: Hashable) -> None:  # noqa: B027
+        """Forget a key removed by expiry or invalidation; a no-op by default."""
+
+    def clear(self) -> None:  # noqa: B027
+        """Forget all keys; a no-op by default."""
+
+
+class FIFOPolicy(EvictionPolicy):
+    """Evict the oldest inserted key; hits do not affect order."""
+
+    __slots__ = ("_order",)
+
+    def __init__(self) -> None:
+        """Initialize an empty insertion order."""
+        self._order: OrderedDict[Hashable, None] = OrderedDict()
+
+    def on_insert(self, key: Hashable, *, full: bool) -> Hashable | None:
+        """Append key and evict the oldest key if the cache was full."""
+        victim = self._order.popitem(last=False)[0] if full and self._order else None
+        self._order[key] = None
+        return victim
+
+    def on_remove(self, key: Hashable) -> None:
+        """Forget a removed key."""
+        self._order.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget all keys."""
+        self._order.clear()
+
+
+class LRUPolicy(FIFOPolicy):
+    """Evict the least recently used key; hits move a key to the back."""
+
+    __slots__ = ()
+
+    def on_access(self, key: Hashable) -> None:
+        """Mark key as most recently used."""
+        if key in self._order:
+            self._order.move_to_end(key)
+
+
+class _FrequencySketch:
+    """
+    Count-min sketch of approximate access frequencies with periodic aging.
+
+    Counters saturate at 15 and are halved after ``10 * capacity`` increments
+    so old popularity fades. Indexes come from a BLAKE2 digest of
+    ``repr(key)`` rather than ``hash()``, which is salted per process, so
+    admission decisions are reproducible.
+    """
+
+    __slots__ = (
+        "_additions",
+        "_digest_size",
+        "_mask",
+        "_reset_at",
+        "_shifts",
+        "_table",
+    )
+
+    _DEPTH = 4
+    _MAX_COUNT = 15
+    # Small caches still see many distinct keys during a scan; narrower rows
+    # let one-off keys collide with hot ones and inherit their counts
+    _MIN_WIDTH_BITS = 8
+
+    def __init__(self, capacity: int) -> None:
+        """Size the sketch for roughly ``capacity`` distinct hot keys."""
+        width_bits = max(
+            self._MIN_WIDTH_BITS,
+            math.ceil(math.log2(max(capacity, 1))),
+        )
+        # One digest is split into a lane per row; 16-bit lanes cover most sizes
+        lane_bits = 16 if width_bits <= 16 else 32
+        self._digest_size = self._DEPTH * lane_bits // 8
+        self._shifts = tuple(range(0, self._DEPTH * lane_bits, lane_bits))
+        self._mask = (1 << width_bits) - 1
+        self._table = [[0] * (1 << width_bits) for _ in range(self._DEPTH)]
+        self._additions = 0
+        self._reset_at = 10 * max(capacity, 1)
+
+    def _indexes(self, key: Hashable) -> list[int]:
+        """Return one counter index per row for key."""
+        digest = hashlib.blake2b(
+            repr(key).encode(),
+            digest_size=self._digest_size,
+        ).digest()
+        h = int.from_bytes(digest, "little")
+        return [(h >> shift) & self._mask for shift in self._shifts]
+
+    def increment(self, key: Hashable) -> None:
+        """Count one access to key, aging all counters when due."""
+        for row, index in zip(self._table, self._indexes(key), strict=True):
+            if row[index] < self._MAX_COUNT:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._reset_at:
+            for row in self._table:
+                row[:] = [count >> 1 for count in row]
+            self._additions //= 2
+
+    def frequency(self, key: Hashable) -> int:
+        """Return the estimated access count for key."""
+        return min(
+            row[index]
+            for row, index in zip(self._table, self._indexes(key), strict=True)
+        )
+
+    def clear(self) -> None:
+        """Reset all counters."""
+        for row in self._table:
+            row[:] = [0] * len(row)
+        self._additions = 0
+
+
+class TinyLFUPolicy(EvictionPolicy):
+    """
+    W-TinyLFU-style policy: a small LRU window in front of a frequency-gated main LRU.
+
+    New keys always enter the window, so a fresh ``set`` is readable. When the
+    window overflows, its oldest key competes with the main segment's LRU key
+    and only the more frequently accessed of the two is kept. This stops
+    one-off keys from flushing out hot ones.
+    """
+
+    __slots__ = ("_main", "_main_cap", "_sketch", "_window", "_window_cap")
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the policy.
+
+        Parameters
+        ----------
+        max_size : int
+            The owning cache's max_size; 1% (at least one slot) is the window.
+        """
+        self._window_cap = max(1, max_size // 100)
+        self._main_cap = max(0, max_size - self._window_cap)
+        self._window: OrderedDict[Hashable, None] = OrderedDict()
+        self._main: OrderedDict[Hashable, None] = OrderedDict()
+        self._sketch = _FrequencySketch(max_size)
+
+    def on_access(self, key: Hashable) -> None:
+        """Count the hit and refresh key's recency within its segment."""
+        self._sketch.increment(key)
+        if key in self._main:
+            self._main.move_to_end(key)
+        elif key in self._window:
+            self._window.move_to_end(key)
+
+    def on_insert(self, key: Hashable, *, full: bool) -> Hashable | None:
+        """Admit key to the window and settle any overflow into the main segment."""
+        self._sketch.increment(key)
+        self._window[key] = None
+        if len(self._window) <= self._window_cap:
+            return None
+
+        candidate = self._window.popitem(last=False)[0]
+        # Below max_size the main segment has room, so nothing competes
+        if not full:
+            self._main[candidate] = None
+            return None
+        if not self._main:
+            return candidate
+
+        victim = next(iter(self._main))
+        if self._sketch.frequency(candidate) > self._sketch.frequency(victim):
+            del self._main[victim]
+            self._main[candidate] = None
+            return victim
+        return candidate
+
+    def on_remove(self, key: Hashable) -> None:
+        """Forget a removed key (its frequency is kept in the sketch)."""
+        if self._window.pop(key, _CACHED_NONE) is _CACHED_NONE:
+            self._main.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget all keys and frequencies."""
+        self._window.clear()
+        self._main.clear()
+        self._sketch.clear()
+
+
+def _make_policy(
+    policy: EvictionPolicyName | EvictionPolicy,
+    max_size: int | None,
+) -> EvictionPolicy | None:
+    """Return the policy instance to use, or None for unbounded caches."""
+    if isinstance(policy, EvictionPolicy):
+        return policy
+    if max_size is None:
+        return None
+    if policy == "fifo":
+        return FIFOPolicy()
+    if policy == "lru":
+        return LRUPolicy()
+    if policy == "tinylfu":
+        return TinyLFUPolicy(max_size)
+    msg = f"Unknown eviction policy: {policy!r}"
+    raise ValueError(msg)
 
 
 class TTLCache:
     """
-    Thread-safe TTL cache with automatic expiration.
+    Thread-safe TTL cache with automatic expiration and bounded size.
 
-    Caches values with a time-to-live (TTL) in seconds. Expired entries
-    are automatically removed on access. Supports cache invalidation.
+    Caches values with a time-to-live (TTL) in seconds. Expiry times are kept
+    in a min-heap so expired entries are purged proactively on writes and on
+    ``size()``, not only when the dead key happens to be read again. When
+    ``max_size`` is reached the eviction policy (LRU by default) picks the
+    victim.
 
     Attributes
     ----------
@@ -27,11 +284,30 @@ class TTLCache:
         Time-to-live for cache entries in seconds.
     max_size : int | None
         Maximum number of entries. If None, no limit.
+    hits, misses, evictions, expirations : int
+        Running counters; see :meth:`stats`.
     """
 
-    __slots__ = ("_cache", "_max_size", "_ttl")
-
-    def __init__(self, ttl: float = 300.0, max_size: int | None = None) -> None:
+    __slots__ = (
+        "_cache",
+        "_expiry_heap",
+        "_heap_seq",
+        "_max_size",
+        "_policy",
+        "_ttl",
+        "evictions",
+        "expirations",
+        "hits",
+        "misses",
+    )
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_size: int | None = None,
+        *,
+        policy: EvictionPolicyName | EvictionPolicy = "lru",
+    ) -> None:
         """
         Initialize the TTL cache.
 
@@ -41,10 +317,61 @@ class TTLCache:
             Time-to-live in seconds, by default 300.0 (5 minutes).
         max_size : int | None, optional
             Maximum number of entries. If None, no limit, by default None.
+        policy : {"fifo", "lru", "tinylfu"} | EvictionPolicy, optional
+            Eviction policy used when max_size is reached, by default "lru".
         """
         self._cache: dict[Any, tuple[Any, float]] = {}
         self._ttl = ttl
         self._max_size = max_size
+        self._policy = _make_policy(policy, max_size)
+        self._expiry_heap: list[tuple[float, int, Any]] = []
+        self._heap_seq = itertools.count()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _remove(self, key: Any) -> None:
+        """Remove an entry from storage and the policy."""
+        del self._cache[key]
+        if self._policy is not None:
+            self._policy.on_remove(key)
+
+    def purge_expired(self) -> int:
+        """
+        Remove every expired entry.
+
+        Pops the expiry heap only as far as the first live deadline, so the
+        cost is proportional to the number of entries that actually expired.
+
+        Returns
+        -------
+        int
+            Number of entries removed.
+        """
+        now = time.monotonic()
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] < now:
+            expire_time, _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip heap entries left behind by overwrites or invalidation
+            if entry is not None and entry[1] == expire_time:
+                self._remove(key)
+                removed += 1
+        if removed:
+            self.expirations += removed
+            logger.trace("Cache purged {} expired entries", removed)
+        return removed
+
+    def _compact_heap(self) -> None:
+        """Drop heap entries that no longer match a live cache entry."""
+        self._expiry_heap = [
+            item
+            for item in self._expiry_heap
+            if (entry := self._cache.get(item[2])) is not None and entry[1] == item[0]
+        ]
+        heapq.heapify(self._expiry_heap)
 
     def get(self, key: Any) -> Any | None:
         """
@@ -70,16 +397,23 @@ class TTLCache:
         pattern here has no await points, so no other coroutine can run between
         the check and the access, making it race-condition safe.
         """
-        if key not in self._cache:
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
             return None
 
-        value, expire_time = self._cache[key]
+        value, expire_time = entry
         if time.monotonic() > expire_time:
             # Expired, remove it
-            del self._cache[key]
-            logger.trace(f"Cache entry expired for key: {key}")
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            logger.trace("Cache entry expired for key: {}", key)
             return None
 
+        self.hits += 1
+        if self._policy is not None:
+            self._policy.on_access(key)
         if value is _CACHED_NONE:
             return None
         return value
@@ -99,21 +433,29 @@ class TTLCache:
             Use ``float("inf")`` for entries that should not expire until
             invalidated or cleared.
         """
-        # Evict oldest entry only when at max size and adding a new key (updating
-        # an existing key does not increase size)
-        if (
-            self._max_size is not None
-            and len(self._cache) >= self._max_size
-            and key not in self._cache
-        ):
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
-            logger.trace(f"Cache evicted oldest entry: {oldest_key}")
+        self.purge_expired()
 
         effective_ttl = self._ttl if ttl is None else ttl
         expire_time = time.monotonic() + effective_ttl
+        is_new = key not in self._cache
         self._cache[key] = (value, expire_time)
-        logger.trace(f"Cache entry set for key: {key} (expires in {effective_ttl}s)")
+        if expire_time != math.inf:
+            heapq.heappush(
+                self._expiry_heap,
+                (expire_time, next(self._heap_seq), key),
+            )
+            if len(self._expiry_heap) > _HEAP_COMPACT_FACTOR * len(self._cache) + 64:
+                self._compact_heap()
+
+        # Updating an existing key does not change size; only new keys can evict
+        if is_new and self._policy is not None and self._max_size is not None:
+            full = len(self._cache) > self._max_size
+            victim = self._policy.on_insert(key, full=full)
+            if victim is not None and victim in self._cache:
+                del self._cache[victim]
+                self.evictions += 1
+                logger.trace("Cache evicted entry: {}", victim)
+        logger.trace("Cache entry set for key: {} (expires in {}s)", key, effective_ttl)
 
     def invalidate(self, key: Any | None = None) -> None:
         """
@@ -128,19 +470,23 @@ class TTLCache:
         if key is None:
             count = len(self._cache)
             self._cache.clear()
-            logger.debug(f"Cache cleared: {count} entries removed")
+            self._expiry_heap.clear()
+            if self._policy is not None:
+                self._policy.clear()
+            logger.debug("Cache cleared: {} entries removed", count)
         elif key in self._cache:
-            del self._cache[key]
-            logger.trace(f"Cache entry invalidated: {key}")
+            self._remove(key)
+            logger.trace("Cache entry invalidated: {}", key)
 
     def invalidate_keys_matching(self, predicate: Callable[[Any], bool]) -> int:
         """Remove all entries whose key matches the predicate. Return count removed."""
         to_remove = [k for k in self._cache if predicate(k)]
         for k in to_remove:
-            del self._cache[k]
+            self._remove(k)
         if to_remove:
             logger.trace(
-                f"Cache invalidated {len(to_remove)} entries matching predicate",
+                "Cache invalidated {} entries matching predicate",
+                len(to_remove),
             )
         return len(to_remove)
 
@@ -165,10 +511,12 @@ class TTLCache:
             The cached or fetched value.
         """
         # Check raw cache for _CACHED_NONE so we return None without refetch
-        if key in self._cache:
-            stored, expire_time = self._cache[key]
-            if time.monotonic() <= expire_time and stored is _CACHED_NONE:
-                return None
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() <= entry[1]:
+            self.hits += 1
+            if self._policy is not None:
+                self._policy.on_access(key)
+            return None if entry[0] is _CACHED_NONE else entry[0]
         cached = self.get(key)
         if cached is not None:
             return cached
@@ -187,15 +535,26 @@ class TTLCache:
             Number of cache entries.
         """
         # Clean expired entries first
-        now = time.monotonic()
-        expired_keys = [
-            key for key, (_, expire_time) in self._cache.items() if now > expire_time
-        ]
-        for key in expired_keys:
-            del self._cache[key]
-
+        self.purge_expired()
         return len(self._cache)
 
+    def stats(self) -> dict[str, int]:
+        """
+        Return cache counters for monitoring.
+
+        Returns
+        -------
+        dict[str, int]
+            ``size``, ``hits``, ``misses``, ``evictions`` and ``expirations``.
+        """
+        return {
+            "size": self.size(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
     def clear(self) -> None:
         """Clear all cache entries."""
         self.invalidate()
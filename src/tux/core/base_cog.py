@@ -18,6 +18,7 @@ from discord.ext import commands
 from loguru import logger
 
 from tux.core.decorators import command_permission_check
+from tux.services.listener_profiler import ListenerProfiler
 from tux.shared.config import CONFIG
 from tux.shared.functions import generate_usage
 
@@ -66,6 +67,26 @@ class BaseCog(commands.Cog):
         self._setup_command_usage()
         # Run permission check before argument conversion for eligible commands
         self._setup_permission_checks()
+        # Time every event listener for the dev listener report
+        self._setup_listener_profiling()
+
+    def _setup_listener_profiling(self) -> None:
+        """
+        Wrap this cog's event listeners with the bot's listener profiler.
+
+        The wrappers are stored as instance attributes, which shadow the class
+        methods that ``add_cog`` would otherwise register.
+        """
+        profiler = getattr(self.bot, "listener_profiler", None)
+        if not isinstance(profiler, ListenerProfiler):
+            return
+        for _event, method_name in self.__cog_listeners__:
+            listener = getattr(self, method_name)
+            setattr(
+                self,
+                method_name,
+                profiler.wrap(f"{self.qualified_name}.{method_name}", listener),
+            )
 
     def _setup_permission_checks(self) -> None:
         """
@@ -18,15 +18,18 @@ from discord.ext import commands
 from loguru import logger
 from rich.console import Console
 
-from tux.cache import CacheService
+from tux.cache import CacheService, close_cache_backend
+from tux.core.message_pipeline import MessagePipeline
 from tux.core.prefix_manager import PrefixManager
-from tux.core.setup.orchestrator import BotSetupOrchestrator
+from tux.core.setup.orchestrator import BotSetupOrchestrator, StartupReport
 from tux.core.task_monitor import TaskMonitor
 from tux.database.controllers import DatabaseCoordinator
 from tux.database.models.enums import CaseType
 from tux.database.service import DatabaseService
 from tux.services.emoji_manager import EmojiManager
+from tux.services.expiry_sweep import ExpirySweeper
 from tux.services.http_client import http_client
+from tux.services.listener_profiler import ListenerProfiler
 from tux.services.sentry import (
     SentryManager,
     capture_database_error,
@@ -58,11 +61,15 @@ class Tux(commands.Bot):
         self.first_ready: bool = False  # Track if this is the first on_ready event
 
         # Internal flags to prevent duplicate initialization
-        self._emoji_manager_initialized: bool = False
+        self._emoji_manager_initialized: bool = False  # Set by EmojiSetupService
         self._banner_logged: bool = False
         self._startup_task: asyncio.Task[None] | None = None
         self._commands_instrumented: bool = False
 
+        # Per-listener latency stats, including DB and Discord REST wait time
+        self.listener_profiler = ListenerProfiler()
+        self.listener_profiler.instrument_http(self.http)
+
         # Background task monitor (manages periodic tasks and cleanup)
         self.task_monitor = TaskMonitor(self)
 
@@ -76,6 +83,12 @@ class Tux(commands.Bot):
         self._db_coordinator: DatabaseCoordinator | None = None  # Cached coordinator
         self.sentry_manager = SentryManager()
         self.prefix_manager: PrefixManager | None = None  # Initialized during setup
+        self.startup_report: StartupReport | None = None  # Setup phase timings
+        self.expiry_sweeper = ExpirySweeper(self)  # Shared tempban/AFK expiry sweeps
+
+        # Single on_message listener; cogs register stages instead of listeners
+        self.message_pipeline = MessagePipeline(self)
+        self.add_listener(self.message_pipeline.dispatch, "on_message")
 
         # UI components
         self.emoji_manager = EmojiManager(self)
@@ -152,12 +165,7 @@ class Tux(commands.Bot):
 
         configure_discord_http_client(self)
 
-        # Initialize emoji manager (loads custom emojis, etc.)
-        if not self._emoji_manager_initialized:
-            await self.emoji_manager.init()
-            self._emoji_manager_initialized = True
-
-        # Perform orchestrator setup (database, cogs, etc.)
+        # Perform orchestrator setup (database, cache, emojis, cogs, etc.)
         try:
             with start_span("bot.setup", "Bot setup process") as span:
                 orchestrator = BotSetupOrchestrator(self)
@@ -359,6 +367,7 @@ class Tux(commands.Bot):
             if self.cache_service:
                 try:
                     logger.debug("Closing cache (Valkey) connections")
+                    await close_cache_backend(self)
                     await self.cache_service.close()
                     logger.debug("Cache connections closed")
                     span.set_data("connections.cache_closed", True)
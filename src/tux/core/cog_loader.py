@@ -7,7 +7,6 @@ configuration error handling with graceful skipping, and performance monitoring
 via Sentry. Follows discord.py's extension loading patterns.
 """
 
-import ast
 import asyncio
 import time
 import traceback
@@ -20,6 +19,7 @@ import aiofiles.os
 from discord.ext import commands
 from loguru import logger
 
+from tux.core.cog_manifest import CogManifest, cog_manifest
 from tux.services.sentry import capture_exception_safe
 from tux.services.sentry.metrics import record_cog_metric
 from tux.services.sentry.tracing import (
@@ -35,7 +35,10 @@ from tux.shared.constants import (
 )
 from tux.shared.exceptions import TuxCogLoadError, TuxConfigurationError
 
-__all__ = ["CogLoader"]
+__all__ = ["COG_FOLDERS", "CogLoader"]
+
+# Folders (relative to the tux package) loaded at startup, in load order
+COG_FOLDERS: tuple[str, ...] = ("services/handlers", "modules", "plugins")
 
 
 class CogLoader(commands.Cog):
@@ -56,6 +59,11 @@ class CogLoader(commands.Cog):
         Dictionary tracking load time for each cog (for performance monitoring).
     load_priorities : dict[str, int]
         Priority mapping for cog categories (higher = loads first).
+    discovered : dict[Path, list[tuple[int, Path]]]
+        Eligible cogs per folder found by :meth:`discover_folders` ahead of
+        loading; each entry is used once by the next load of that folder.
+    manifest : CogManifest
+        Persistent per-file cache of ``setup()`` detection and priority.
     """
 
     def __init__(self, bot: commands.Bot) -> None:
@@ -71,6 +79,18 @@ class CogLoader(commands.Cog):
         self.cog_ignore_list: set[str] = CONFIG.get_cog_ignore_list()
         self.load_times: defaultdict[str, float] = defaultdict(float)
         self.load_priorities = COG_PRIORITIES
+        self.discovered: dict[Path, list[tuple[int, Path]]] = {}
+        self.manifest: CogManifest = cog_manifest
+
+    def _passes_name_checks(self, filepath: Path) -> bool:
+        """Return whether a file's name allows loading it as a cog."""
+        cog_name = filepath.stem
+
+        if cog_name in self.cog_ignore_list:
+            logger.warning(f"Skipping {cog_name} as it is in the ignore list.")
+            return False
+
+        return filepath.suffix == ".py" and not cog_name.startswith("_")
 
     async def is_cog_eligible(self, filepath: Path) -> bool:
         """
@@ -78,6 +98,7 @@ class CogLoader(commands.Cog):
 
         Validates that the file is not in the ignore list, is a Python file,
         doesn't start with underscore, and contains a valid extension setup function.
+        The setup check is answered by the cog manifest unless the file changed.
 
         Parameters
         ----------
@@ -89,53 +110,13 @@ class CogLoader(commands.Cog):
         bool
             True if the file passes basic eligibility checks, False otherwise.
         """
-        cog_name = filepath.stem
-
-        if cog_name in self.cog_ignore_list:
-            logger.warning(f"Skipping {cog_name} as it is in the ignore list.")
-            return False
-
-        if (
-            filepath.suffix != ".py"
-            or cog_name.startswith("_")
-            or not await aiofiles.os.path.isfile(filepath)
+        if not self._passes_name_checks(filepath) or not await aiofiles.os.path.isfile(
+            filepath,
         ):
             return False
 
-        return await self._contains_cog_or_extension(filepath)
-
-    async def _contains_cog_or_extension(self, filepath: Path) -> bool:
-        """
-        Check if a Python file contains a valid extension setup function using AST.
-
-        A valid extension file must contain an async setup(bot) function.
-
-        Parameters
-        ----------
-        filepath : Path
-            The path to the Python file to analyze.
-
-        Returns
-        -------
-        bool
-            True if the file contains a valid extension setup function, False otherwise.
-        """
-        try:
-            async with aiofiles.open(filepath, encoding="utf-8") as f:
-                content = await f.read()
-
-            tree = ast.parse(content, filename=str(filepath))
-
-            return any(
-                isinstance(node, ast.AsyncFunctionDef)
-                and node.name == "setup"
-                and node.args.args
-                for node in ast.walk(tree)
-            )
-
-        except (SyntaxError, UnicodeDecodeError, OSError) as e:
-            logger.warning(f"Failed to parse {filepath} for cog validation: {e}")
-            return False
+        entry = (await self.manifest.scan([filepath])).get(filepath)
+        return entry is not None and entry.has_setup
 
     def _is_configuration_error(self, exception: Exception) -> bool:
         """
@@ -314,27 +295,6 @@ class CogLoader(commands.Cog):
             )
             raise TuxCogLoadError(error_msg) from e
 
-    def _get_cog_priority(self, path: Path) -> int:
-        """
-        Get the loading priority for a cog based on its parent directory category.
-
-        Priority determines load order within the cog system. Cogs with higher
-        priority values are loaded before cogs with lower priority values.
-        Priority is determined by the parent directory name, not the cog name.
-        Priorities are configured in COG_PRIORITIES constant.
-
-        Parameters
-        ----------
-        path : Path
-            The path to the cog file.
-
-        Returns
-        -------
-        int
-            The priority value (higher = loaded earlier), defaults to 0.
-        """
-        return self.load_priorities.get(path.parent.name, 0)
-
     @span("cog.load_group")
     async def _load_cog_group(self, cogs: Sequence[Path]) -> None:
         """
@@ -401,7 +361,9 @@ class CogLoader(commands.Cog):
 
         Recursively searches the directory for Python files, validates each as
         an eligible cog, assigns priorities based on parent directory, and
-        sorts by priority for sequential loading.
+        sorts by priority for sequential loading. Setup detection and
+        priorities come from the cog manifest; only files changed since they
+        were last seen are parsed, concurrently in worker threads.
 
         Parameters
         ----------
@@ -419,11 +381,13 @@ class CogLoader(commands.Cog):
 
         all_py_files = await asyncio.to_thread(_rglob_py, directory)
 
-        cog_paths: list[tuple[int, Path]] = []
-        for item in all_py_files:
-            if await self.is_cog_eligible(item):
-                priority = self._get_cog_priority(item)
-                cog_paths.append((priority, item))
+        candidates = [item for item in all_py_files if self._passes_name_checks(item)]
+        entries = await self.manifest.scan(candidates)
+        cog_paths: list[tuple[int, Path]] = [
+            (entry.priority, item)
+            for item in candidates
+            if (entry := entries.get(item)) is not None and entry.has_setup
+        ]
 
         cog_paths.sort(key=lambda x: x[0], reverse=True)
 
@@ -496,7 +460,9 @@ class CogLoader(commands.Cog):
         """
         set_span_attributes({"path.is_dir": True})
 
-        cog_paths = await self._discover_and_prioritize_cogs(path)
+        cog_paths = self.discovered.pop(path, None)
+        if cog_paths is None:
+            cog_paths = await self._discover_and_prioritize_cogs(path)
         set_span_attributes({"eligible_cog_count": len(cog_paths)})
         self._record_priority_distribution(cog_paths)
         await self._load_by_priority_groups(cog_paths)
@@ -532,6 +498,42 @@ class CogLoader(commands.Cog):
             msg = "Failed to load cogs"
             raise TuxCogLoadError(msg) from e
 
+    @staticmethod
+    def _folder_path(folder_name: str) -> Path:
+        """Return the path of a folder relative to the tux package."""
+        return Path(__file__).parent.parent / folder_name
+
+    async def discover_folders(
+        self,
+        folder_names: Sequence[str] = COG_FOLDERS,
+    ) -> int:
+        """Find the eligible cogs of several folders concurrently, without loading.
+
+        Discovery only reads files, so it can run while the database and
+        cache are still being set up. Results are kept in ``discovered``
+        and used by the next :meth:`load_cogs_from_folder` call per folder.
+
+        Parameters
+        ----------
+        folder_names : Sequence[str], optional
+            Folders relative to the tux package.
+
+        Returns
+        -------
+        int
+            Number of eligible cogs found.
+        """
+        paths = [
+            path
+            for path in map(self._folder_path, folder_names)
+            if await aiofiles.os.path.isdir(path)
+        ]
+        results = await asyncio.gather(
+            *(self._discover_and_prioritize_cogs(path) for path in paths),
+        )
+        self.discovered.update(zip(paths, results, strict=True))
+        return sum(len(cog_paths) for cog_paths in results)
+
     async def load_cogs_from_folder(self, folder_name: str) -> None:
         """Load cogs from a named folder relative to the tux package.
 
@@ -547,7 +549,7 @@ class CogLoader(commands.Cog):
             If an error occurs during folder loading.
         """
         start_time = time.perf_counter()
-        cog_path: Path = Path(__file__).parent.parent / folder_name
+        cog_path: Path = self._folder_path(folder_name)
 
         if not await aiofiles.os.path.exists(cog_path):
             logger.info(f"Folder {folder_name} does not exist, skipping")
@@ -610,13 +612,20 @@ class CogLoader(commands.Cog):
             raise TuxCogLoadError(msg) from e
 
     @classmethod
-    async def setup(cls, bot: commands.Bot) -> None:
+    async def setup(
+        cls,
+        bot: commands.Bot,
+        cog_loader: "CogLoader | None" = None,
+    ) -> None:
         """Initialize the cog loader and load all bot cogs in priority order.
 
         Parameters
         ----------
         bot : commands.Bot
             The bot instance to load cogs into.
+        cog_loader : CogLoader | None, optional
+            Loader to use, e.g. one that already ran :meth:`discover_folders`.
+            A new loader is created if omitted.
 
         Raises
         ------
@@ -624,12 +633,12 @@ class CogLoader(commands.Cog):
             If critical errors occur during cog loading.
         """
         start_time = time.perf_counter()
-        cog_loader = cls(bot)
+        if cog_loader is None:
+            cog_loader = cls(bot)
 
         try:
-            await cog_loader.load_cogs_from_folder(folder_name="services/handlers")
-            await cog_loader.load_cogs_from_folder(folder_name="modules")
-            await cog_loader.load_cogs_from_folder(folder_name="plugins")
+            for folder_name in COG_FOLDERS:
+                await cog_loader.load_cogs_from_folder(folder_name=folder_name)
 
             total_time = time.perf_counter() - start_time
 
@@ -643,6 +652,9 @@ class CogLoader(commands.Cog):
             await bot.add_cog(cog_loader)
 
             logger.info(f"Total cog loading time: {total_time * 1000:.0f}ms")
+            logger.debug("Cog manifest: {}", cog_loader.manifest.stats())
+            # Every cog folder was scanned, so entries not seen belong to removed files
+            await asyncio.to_thread(cog_loader.manifest.save, prune=True)
 
         except Exception as e:  # Catch-all: record metrics for any setup failure
             total_time = time.perf_counter() - start_time
@@ -0,0 +1,342 @@
+"""
+Persistent manifest of which source files define a cog ``setup``.
+
+Telling whether a file is a cog means reading it and parsing it for an
+``async def setup(bot)``. The manifest records that result, whether the file
+parsed at all, and the cog's load priority per file path, and is saved as
+JSON between runs. An entry is reused while the file's mtime and size are
+unchanged; if only the mtime moved (checkout, ``touch``) the content hash
+decides. Startup discovery and hot reload therefore only parse files that
+actually changed, and those parses are fanned out to worker threads.
+"""
+
+from __future__ import annotations
+
+import ast
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from tux.shared.cache_dir import resolve_cache_dir
+from tux.shared.constants import COG_PRIORITIES
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+__all__ = ["CogManifest", "CogManifestEntry", "cog_manifest"]
+
+# Docker sets COG_CACHE_DIR explicitly; bare metal falls back to XDG_CACHE_HOME
+CACHE_DIR: Path = resolve_cache_dir("COG_CACHE_DIR", "tux")
+MANIFEST_FILE_NAME = "cog_manifest.json"
+# Bump when the entry layout or the setup() detection rules change
+MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class CogManifestEntry:
+    """What is known about one source file at a given mtime, size and hash.
+
+    Attributes
+    ----------
+    mtime_ns : int
+        Modification time the entry was recorded at.
+    size : int
+        File size in bytes.
+    sha256 : str
+        Hex digest of the file contents.
+    valid : bool
+        Whether the file decoded and parsed.
+    has_setup : bool
+        Whether the file defines ``async def setup(bot)``.
+    priority : int
+        Load priority from the parent directory (higher loads first).
+    """
+
+    mtime_ns: int
+    size: int
+    sha256: str
+    valid: bool
+    has_setup: bool
+    priority: int
+
+
+def _parse_setup(source: bytes, filename: str) -> tuple[bool, bool]:
+    """Return ``(valid, has_setup)`` for a file's source."""
+    try:
+        tree = ast.parse(source.decode("utf-8"), filename=filename)
+    except (SyntaxError, UnicodeDecodeError, ValueError) as e:
+        logger.warning(f"Failed to parse {filename} for cog validation: {e}")
+        return False, False
+
+    has_setup = any(
+        isinstance(node, ast.AsyncFunctionDef)
+        and node.name == "setup"
+        and node.args.args
+        for node in ast.walk(tree)
+    )
+    return True, has_setup
+
+
+class CogManifest:
+    """
+    On-disk cache of cog eligibility and priority per source file.
+
+    :meth:`scan` serves the event loop and :meth:`lookup` the hot reload
+    watcher thread; both share the same entries under a lock.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        priorities: Mapping[str, int] = COG_PRIORITIES,
+    ) -> None:
+        """Initialize an empty manifest; entries are read on first use.
+
+        Parameters
+        ----------
+        path : Path | None, optional
+            Manifest file, ``CACHE_DIR / MANIFEST_FILE_NAME`` by default.
+        priorities : Mapping[str, int], optional
+            Priority per parent directory name. A saved manifest recorded
+            with different priorities is discarded.
+        """
+        self.path = path or CACHE_DIR / MANIFEST_FILE_NAME
+        self._priorities = dict(priorities)
+        self._entries: dict[str, CogManifestEntry] = {}
+        # Keys looked up since load; save(prune=True) drops the rest
+        self._seen: set[str] = set()
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+        self.hits = 0
+        self.rehashed = 0
+        self.parsed = 0
+
+    def load(self) -> None:
+        """Read the saved manifest, ignoring it if missing, corrupt or outdated."""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if (
+                    data.get("version") != MANIFEST_VERSION
+                    or data.get("priorities") != self._priorities
+                ):
+                    logger.debug("Cog manifest is outdated, rebuilding")
+                    return
+                self._entries = {
+                    key: CogManifestEntry(**entry)
+                    for key, entry in data["entries"].items()
+                }
+            except FileNotFoundError:
+                return
+            except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+                logger.warning(f"Ignoring unreadable cog manifest {self.path}: {e}")
+                return
+            logger.debug(f"Loaded cog manifest with {len(self._entries)} entries")
+
+    def save(self, *, prune: bool = False) -> bool:
+        """
+        Write the manifest if it changed since it was loaded or last saved.
+
+        Parameters
+        ----------
+        prune : bool, optional
+            Drop entries for files not looked up since load, e.g. after a
+            full discovery so deleted files don't linger.
+
+        Returns
+        -------
+        bool
+            True if the file was written.
+        """
+        with self._lock:
+            if prune and (stale := self._entries.keys() - self._seen):
+                for key in stale:
+                    del self._entries[key]
+                self._dirty = True
+            if not self._dirty:
+                return False
+
+            payload: dict[str, Any] = {
+                "version": MANIFEST_VERSION,
+                "priorities": self._priorities,
+                "entries": {key: asdict(entry) for key, entry in self._entries.items()},
+            }
+            tmp_path = self.path.with_suffix(".json.tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_text(
+                    json.dumps(payload, separators=(",", ":")),
+                    encoding="utf-8",
+                )
+                tmp_path.replace(self.path)
+            except OSError as e:
+                logger.warning(f"Failed to save cog manifest {self.path}: {e}")
+                return False
+            self._dirty = False
+            return True
+
+    def lookup(self, path: Path) -> CogManifestEntry | None:
+        """
+        Return the entry for a file, parsing it only if it changed.
+
+        Blocking; call from a worker thread or the hot reload watcher.
+
+        Parameters
+        ----------
+        path : Path
+            The source file.
+
+        Returns
+        -------
+        CogManifestEntry | None
+            The entry, or None if the file can't be read.
+        """
+        self.load()
+        key = self._key(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        if (entry := self._cached(key, stat)) is not None:
+            return entry
+        return self._refresh(path, key)
+
+    async def scan(self, paths: Iterable[Path]) -> dict[Path, CogManifestEntry]:
+        """
+        Return entries for many files, parsing changed ones concurrently.
+
+        Unchanged files cost one ``stat`` each, all done in a single worker
+        thread; every changed file is hashed and parsed in its own thread.
+
+        Parameters
+        ----------
+        paths : Iterable[Path]
+            The source files.
+
+        Returns
+        -------
+        dict[Path, CogManifestEntry]
+            Entries for the files that could be read.
+        """
+        paths = list(paths)
+        if not paths:
+            return {}
+
+        cached = await asyncio.to_thread(self._lookup_cached, paths)
+        results = {path: entry for path, entry in cached.items() if entry is not None}
+
+        if stale := [path for path, entry in cached.items() if entry is None]:
+            entries = await asyncio.gather(
+                *(asyncio.to_thread(self._refresh, path) for path in stale),
+            )
+            results.update(
+                (path, entry)
+                for path, entry in zip(stale, entries, strict=True)
+                if entry is not None
+            )
+        return results
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return lookup counters for logging.
+
+        Returns
+        -------
+        dict[str, int]
+            Entries, cache hits, hash-only revalidations and parses.
+        """
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "rehashed": self.rehashed,
+            "parsed": self.parsed,
+        }
+
+    def _lookup_cached(self, paths: list[Path]) -> dict[Path, CogManifestEntry | None]:
+        """Stat every path and return its entry if mtime and size still match."""
+        self.load()
+        results: dict[Path, CogManifestEntry | None] = {}
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                # Missing or unreadable now; _refresh() decides and logs
+                results[path] = None
+                continue
+            results[path] = self._cached(self._key(path), stat)
+        return results
+
+    def _cached(self, key: str, stat: os.stat_result) -> CogManifestEntry | None:
+        """Return the entry for a key if it matches the file's stat."""
+        with self._lock:
+            self._seen.add(key)
+            entry = self._entries.get(key)
+            if (
+                entry is None
+                or entry.mtime_ns != stat.st_mtime_ns
+                or entry.size != stat.st_size
+            ):
+                return None
+            self.hits += 1
+            return entry
+
+    def _refresh(self, path: Path, key: str | None = None) -> CogManifestEntry | None:
+        """Hash a changed file and parse it unless its contents are unchanged."""
+        key = key or self._key(path)
+        try:
+            # Stat first: a write racing the read leaves a newer mtime behind
+            stat = path.stat()
+            source = path.read_bytes()
+        except OSError as e:
+            logger.trace(f"Cog manifest skipping unreadable {path}: {e}")
+            return None
+
+        digest = hashlib.sha256(source).hexdigest()
+        priority = self._priorities.get(path.parent.name, 0)
+        with self._lock:
+            previous = self._entries.get(key)
+        if previous is not None and previous.sha256 == digest:
+            valid, has_setup = previous.valid, previous.has_setup
+            rehashed = True
+        else:
+            valid, has_setup = _parse_setup(source, str(path))
+            rehashed = False
+
+        entry = CogManifestEntry(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            sha256=digest,
+            valid=valid,
+            has_setup=has_setup,
+            priority=priority,
+        )
+        with self._lock:
+            self._seen.add(key)
+            self._entries[key] = entry
+            self._dirty = True
+            if rehashed:
+                self.rehashed += 1
+            else:
+                self.parsed += 1
+        return entry
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        """Return the manifest key of a path."""
+        return str(path.resolve())
+
+
+# Shared by the cog loader and the hot reload watcher
+cog_manifest = CogManifest()
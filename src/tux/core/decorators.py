@@ -10,7 +10,6 @@ default.
 
 from __future__ import annotations
 
-import asyncio
 import functools
 import inspect
 import time
@@ -112,7 +111,7 @@ def requires_command_permission(
             # Get command name for logging
             command_name = _get_command_name(ctx, interaction, func)
 
-            logger.debug(f"Permission check for command: {command_name}")
+            logger.debug("Permission check for command: {}", command_name)
 
             if ctx is None and interaction is None:
                 logger.error(
@@ -138,8 +137,11 @@ def requires_command_permission(
                 target = _get_param_value(func, allow_self_use_for_param, args, kwargs)
                 if target is not None and getattr(target, "id", None) == user_id:
                     logger.debug(
-                        f"Permission check skipped (self-use) for '{_get_command_name(ctx, interaction, func)}' "
-                        f"(guild {guild.id}, user {user_id})",
+                        "Permission check skipped (self-use) for '{}' "
+                        "(guild {}, user {})",
+                        command_name,
+                        guild.id,
+                        user_id,
                     )
                     return await func(*args, **kwargs)
 
@@ -149,11 +151,16 @@ def requires_command_permission(
                 try:
                     await interaction.response.defer(ephemeral=True)
                     logger.trace(
-                        f"Deferred interaction early for command: {command_name}",
+                        "Deferred interaction early for command: {}",
+                        command_name,
                     )
                 except Exception as e:
                     # If defer fails (already responded, etc.), continue anyway
-                    logger.debug(f"Could not defer interaction for {command_name}: {e}")
+                    logger.debug(
+                        "Could not defer interaction for {}: {}",
+                        command_name,
+                        e,
+                    )
 
             # Check bypasses first (bot owner, sysadmin, guild owner)
             if _should_bypass_permission_check(user_id, guild, command_name):
@@ -241,14 +248,18 @@ def _should_bypass_permission_check(
     # Bot owners and sysadmins bypass ALL permission checks
     if user_id == CONFIG.USER_IDS.BOT_OWNER_ID or user_id in CONFIG.USER_IDS.SYSADMINS:
         logger.debug(
-            f"Bot owner/sysadmin {user_id} bypassing permission check for '{command_name}'",
+            "Bot owner/sysadmin {} bypassing permission check for '{}'",
+            user_id,
+            command_name,
         )
         return True
 
     # Guild/Server owner bypass
     if guild and guild.owner_id == user_id:
         logger.debug(
-            f"Guild owner {user_id} bypassing permission check for '{command_name}'",
+            "Guild owner {} bypassing permission check for '{}'",
+            user_id,
+            command_name,
         )
         return True
 
@@ -269,36 +280,24 @@ async def _check_permissions(
     # Start timing permission check
     check_start = time.perf_counter()
 
-    # Run command permission and user rank lookups in parallel since they're independent
-    # This can significantly reduce total time when both need database queries.
-    # Race condition safety: Both operations are read-only, use separate cache keys,
-    # and use separate database sessions, so parallel execution is safe.
-    cmd_perm_task = permission_system.get_command_permission(guild.id, command_name)
-
-    # Prepare user rank lookup task
-    if ctx:
-        user_rank_task = permission_system.get_user_permission_rank(ctx)
-    elif interaction:
-        user_rank_task = _get_user_rank_from_interaction(
-            permission_system,
-            interaction,
-        )
-    else:
-        user_rank_task = None
-
-    # Execute both lookups in parallel
+    # Both lookups are answered from the guild's compiled permission index, so
+    # once it is built they are plain dict lookups that never suspend. Running
+    # them in order lets an unconfigured command skip the role lookup entirely.
     cmd_perm_start = time.perf_counter()
-    if user_rank_task is not None:
-        gathered = await asyncio.gather(
-            cmd_perm_task,
-            user_rank_task,
-            return_exceptions=False,
-        )
-        cmd_perm: PermissionCommand | None = gathered[0]
-        user_rank: int = gathered[1]
-    else:
-        cmd_perm = await cmd_perm_task
-        user_rank = 0
+    cmd_perm: PermissionCommand | None = await permission_system.get_command_permission(
+        guild.id,
+        command_name,
+    )
+
+    user_rank = 0
+    if cmd_perm is not None:
+        if ctx:
+            user_rank = await permission_system.get_user_permission_rank(ctx)
+        elif interaction:
+            user_rank = await _get_user_rank_from_interaction(
+                permission_system,
+                interaction,
+            )
     cmd_perm_time = (time.perf_counter() - cmd_perm_start) * 1000
 
     # If not configured, check if we should allow or deny
@@ -306,9 +305,13 @@ async def _check_permissions(
         if not allow_unconfigured:
             total_time = (time.perf_counter() - check_start) * 1000
             logger.debug(
-                f"Permission check denied (unconfigured) for '{command_name}' "
-                f"(guild {guild.id}, user {user_id}) - "
-                f"cmd_perm: {cmd_perm_time:.2f}ms, total: {total_time:.2f}ms",
+                "Permission check denied (unconfigured) for '{}' "
+                "(guild {}, user {}) - cmd_perm: {:.2f}ms, total: {:.2f}ms",
+                command_name,
+                guild.id,
+                user_id,
+                cmd_perm_time,
+                total_time,
             )
             raise TuxPermissionDeniedError(
                 required_rank=0,
@@ -318,9 +321,13 @@ async def _check_permissions(
         # Allow unconfigured commands
         total_time = (time.perf_counter() - check_start) * 1000
         logger.debug(
-            f"Permission check passed (unconfigured allowed) for '{command_name}' "
-            f"(guild {guild.id}, user {user_id}) - "
-            f"cmd_perm: {cmd_perm_time:.2f}ms, total: {total_time:.2f}ms",
+            "Permission check passed (unconfigured allowed) for '{}' "
+            "(guild {}, user {}) - cmd_perm: {:.2f}ms, total: {:.2f}ms",
+            command_name,
+            guild.id,
+            user_id,
+            cmd_perm_time,
+            total_time,
         )
         return
 
@@ -328,10 +335,15 @@ async def _check_permissions(
     if user_rank < cmd_perm.required_rank:
         total_time = (time.perf_counter() - check_start) * 1000
         logger.debug(
-            f"Permission check denied for '{command_name}' "
-            f"(guild {guild.id}, user {user_id}) - "
-            f"required: {cmd_perm.required_rank}, user: {user_rank} - "
-            f"cmd_perm: {cmd_perm_time:.2f}ms (parallel), total: {total_time:.2f}ms",
+            "Permission check denied for '{}' (guild {}, user {}) - "
+            "required: {}, user: {} - cmd_perm: {:.2f}ms, total: {:.2f}ms",
+            command_name,
+            guild.id,
+            user_id,
+            cmd_perm.required_rank,
+            user_rank,
+            cmd_perm_time,
+            total_time,
         )
         raise TuxPermissionDeniedError(
             cmd_perm.required_rank,
@@ -342,9 +354,14 @@ async def _check_permissions(
     # Permission check passed
     total_time = (time.perf_counter() - check_start) * 1000
     logger.debug(
-        f"Permission check passed for '{command_name}' "
-        f"(guild {guild.id}, user {user_id}, rank {user_rank}) - "
-        f"cmd_perm: {cmd_perm_time:.2f}ms (parallel), total: {total_time:.2f}ms",
+        "Permission check passed for '{}' (guild {}, user {}, rank {}) - "
+        "cmd_perm: {:.2f}ms, total: {:.2f}ms",
+        command_name,
+        guild.id,
+        user_id,
+        user_rank,
+        cmd_perm_time,
+        total_time,
     )
 
 
@@ -392,7 +409,9 @@ async def _get_user_rank_from_interaction(
                 member = await interaction.guild.fetch_member(user_id)
             except Exception as e:
                 logger.debug(
-                    f"Could not fetch member {user_id} for permission check: {e}",
+                    "Could not fetch member {} for permission check: {}",
+                    user_id,
+                    e,
                 )
                 # If we can't get member, return 0 (no permissions)
                 return 0
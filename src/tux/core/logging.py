@@ -6,6 +6,15 @@ structured logging helpers, third-party library log interception, and IDE-clicka
 file paths. Log level is determined in this order (highest to lowest): explicit
 level parameter (for testing), CONFIG.LOG_LEVEL from .env file, CONFIG.DEBUG=1
 sets DEBUG level, or default "INFO".
+
+Messages on hot paths should pass their values as loguru arguments
+(``logger.trace("Cache hit for {}", key)``) rather than f-strings: loguru drops
+records below the active level before formatting, so a disabled TRACE or DEBUG
+call costs a level comparison instead of building a string. The console sink
+inserts messages through the ``{message}`` field, so they are never parsed for
+format placeholders or color tags and need no escaping. Setting ``LOG_ENQUEUE``
+moves console writes to a background thread so a slow stderr can't stall the
+event loop.
 """
 
 from __future__ import annotations
@@ -178,6 +187,7 @@ def configure_logging(
     environment: str | None = None,  # Deprecated, kept for compatibility
     level: str | None = None,
     config: Config | None = None,
+    enqueue: bool | None = None,
 ) -> None:
     """
     Configure the global loguru logger for the Tux application.
@@ -194,6 +204,9 @@ def configure_logging(
         Explicit log level override (for testing). Highest priority.
     config : Config | None, optional
         Config instance with LOG_LEVEL and DEBUG from .env file.
+    enqueue : bool | None, optional
+        Write console logs from a background thread. Defaults to
+        config.LOG_ENQUEUE, or False without a config.
 
     Examples
     --------
@@ -216,13 +229,19 @@ def configure_logging(
     log_level = _determine_log_level(level, config)
 
     # Add console handler with custom formatting
-    _add_console_handler(log_level)
+    if enqueue is None:
+        enqueue = bool(config and config.LOG_ENQUEUE)
+    _add_console_handler(log_level, enqueue=enqueue)
 
     # Intercept third-party library logs and route to loguru
     _configure_third_party_logging()
 
     # Log configuration summary
-    logger.info(f"Logging configured at {log_level} level")
+    logger.info(
+        "Logging configured at {} level{}",
+        log_level,
+        " (enqueued)" if enqueue else "",
+    )
 
 
 def _configure_level_colors() -> None:
@@ -294,7 +313,7 @@ def _determine_log_level(level: str | None, config: Config | None) -> str:
     return "INFO"
 
 
-def _add_console_handler(log_level: str) -> None:
+def _add_console_handler(log_level: str, enqueue: bool = False) -> None:
     """
     Add console handler with custom formatting.
 
@@ -305,41 +324,14 @@ def _add_console_handler(log_level: str) -> None:
     ----------
     log_level : str
         The minimum log level to display.
+    enqueue : bool, optional
+        Hand formatted records to a background writer thread, by default False.
     """
 
     def stderr_sink(message: str) -> None:
         """Dynamically retrieve sys.stderr for robustness."""
         sys.stderr.write(message)
 
-    def safe_message_filter(record: Any) -> bool:
-        """
-        Filter that escapes special characters in log messages to prevent format errors.
-
-        Escapes:
-        - Curly braces ``{ }`` so dicts and strings are not interpreted as format
-          placeholders (avoids KeyError).
-        - ``<`` only (not ``>``) so strings like Discord mentions (e.g. ``<@&id>``)
-          or ``<locals>`` in tracebacks are not parsed as loguru color/tag directives,
-          avoiding 'ValueError: Tag "<...>" does not correspond to any known
-          color directive'. ``>`` is left as-is so ``->`` and ``=>`` stay readable.
-
-        Parameters
-        ----------
-        record : Any
-            The loguru Record object (dict-like) to process.
-
-        Returns
-        -------
-        bool
-            Always True to allow the log message through.
-        """
-        if isinstance(record["message"], str):
-            message = record["message"]
-            message = message.replace("{", "{{").replace("}", "}}")
-            message = message.replace("<", "\\<")
-            record["message"] = message
-        return True
-
     logger.add(
         stderr_sink,
         format=_format_record,
@@ -347,9 +339,8 @@ def _add_console_handler(log_level: str) -> None:
         colorize=True,
         backtrace=True,
         diagnose=True,  # Shows variable values in tracebacks
-        enqueue=False,  # Synchronous for console
+        enqueue=enqueue,  # Background writer thread when enabled
         catch=True,  # Catch errors in logging itself
-        filter=safe_message_filter,  # Automatically escape braces in all messages
     )
 
 
@@ -359,6 +350,9 @@ def _format_record(record: Any) -> str:
 
     For tux.* modules: shows clickable path (src/tux/core/app.py:167). For
     third-party: shows module:function (urllib3.connectionpool:_make_request:544).
+    Only the location is embedded; time, level, line and message are left as
+    fields, so the template is constant per call site (loguru caches its
+    colorized form) and messages are never parsed as format strings or tags.
 
     Parameters
     ----------
@@ -384,18 +378,18 @@ def _format_record(record: Any) -> str:
 
         # Escape special characters to prevent format string interpretation
         location = _escape_format_chars(location)
-
-        # Build formatted output
-        return (
-            f"<green>{record['time']:HH:mm:ss.SSS}</green> | "
-            f"<level>{record['level'].name: <8}</level> | "
-            f"<cyan>{location}</cyan>:<cyan>{record['line']}</cyan> | "
-            f"<level>{record['message']}</level>\n"
-        )
     except Exception:
         # Fallback if formatting fails
         return f"{record['time']} | {record['level'].name} | {record['name']} | Error formatting log\n"
 
+    # Build formatted output
+    return (
+        "<green>{time:HH:mm:ss.SSS}</green> | "
+        "<level>{level: <8}</level> | "
+        f"<cyan>{location}</cyan>:<cyan>{{line}}</cyan> | "
+        "<level>{message}</level>\n"
+    )
+
 
 def _get_relative_file_path(record: Any) -> str:
     """
@@ -495,11 +489,8 @@ def _configure_third_party_logging() -> None:
 
             # Route to loguru with original source information
             try:
-                # Get message and escape curly braces to prevent format string errors
+                # Passed without arguments, so loguru never formats the message
                 message = record.getMessage()
-                # Escape curly braces in message (e.g., JSON content) to prevent
-                # loguru from interpreting them as format placeholders
-                escaped_message = message.replace("{", "{{").replace("}", "}}")
 
                 logger.patch(
                     lambda r: r.update(
@@ -507,7 +498,7 @@ def _configure_third_party_logging() -> None:
                         function=record.funcName,  # e.g., "on_ready"
                         line=record.lineno,  # Line number
                     ),
-                ).opt(exception=record.exc_info).log(level, escaped_message)
+                ).opt(exception=record.exc_info).log(level, message)
             except Exception as e:
                 # Fallback if patching fails
                 safe_msg = getattr(record, "msg", None) or str(record)
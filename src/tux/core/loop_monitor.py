@@ -0,0 +1,263 @@
+"""Event loop lag sampling and slow-callback detection.
+
+A sampler task sleeps for a fixed interval and records how late it wakes up;
+that overshoot is the loop's scheduling lag. A watchdog thread watches the
+sampler's heartbeat: when the loop stops ticking for longer than the
+slow-callback threshold, the watchdog grabs the loop thread's current stack,
+which is the code blocking the loop. When the sampler wakes up again, the
+block is recorded against that stack's innermost Tux frame, giving a rolling
+report of the worst offenders.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from tux.services.sentry import record_event_loop_metric
+
+__all__ = ["LoopLagMonitor", "LoopLagReport", "SlowCallbackStats"]
+
+# Sampler sleep between heartbeats (seconds)
+SAMPLE_INTERVAL = 0.25
+# A loop stall longer than this counts as a slow callback (seconds)
+SLOW_CALLBACK_THRESHOLD = 0.1
+# Lag samples kept for percentiles (~1 minute at the default interval)
+LAG_WINDOW = 240
+# Distinct offenders kept; the least costly is dropped when full
+MAX_OFFENDERS = 50
+# Stack frames kept per offender
+STACK_DEPTH = 12
+
+_TUX_ROOT = str(Path(__file__).resolve().parents[1])
+
+
+@dataclass(slots=True)
+class SlowCallbackStats:
+    """Accumulated stalls attributed to one code location."""
+
+    location: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    stack: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class LoopLagReport:
+    """Summary of recent loop lag and the worst blocking locations."""
+
+    lag_p50_ms: float
+    lag_p99_ms: float
+    lag_max_ms: float
+    slow_callbacks: int
+    offenders: list[SlowCallbackStats]
+
+
+def _locate(frames: traceback.StackSummary) -> str:
+    """Return ``file:line in func`` for the innermost Tux frame (or innermost)."""
+    chosen = next(
+        (frame for frame in reversed(frames) if frame.filename.startswith(_TUX_ROOT)),
+        frames[-1] if frames else None,
+    )
+    if chosen is None:
+        return "<unknown>"
+    filename = chosen.filename.removeprefix(_TUX_ROOT).lstrip("/\\")
+    return f"{filename or chosen.filename}:{chosen.lineno} in {chosen.name}"
+
+
+class LoopLagMonitor:
+    """
+    Samples event loop lag and attributes loop stalls to the blocking code.
+
+    Attributes
+    ----------
+    interval : float
+        Sampler sleep between heartbeats, in seconds.
+    threshold : float
+        Stall length that counts as a slow callback, in seconds.
+    """
+
+    def __init__(
+        self,
+        interval: float = SAMPLE_INTERVAL,
+        threshold: float = SLOW_CALLBACK_THRESHOLD,
+        window: int = LAG_WINDOW,
+    ) -> None:
+        """Initialize a stopped monitor.
+
+        Parameters
+        ----------
+        interval : float, optional
+            Sampler sleep between heartbeats, in seconds.
+        threshold : float, optional
+            Stall length that counts as a slow callback, in seconds.
+        window : int, optional
+            Number of lag samples kept for percentiles.
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self._lags: deque[float] = deque(maxlen=window)
+        self._offenders: dict[str, SlowCallbackStats] = {}
+        self._slow_callbacks = 0
+        self._pushed_slow_callbacks = 0
+
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        # Stack captured by the watchdog during the current stall, if any
+        self._pending_stack: traceback.StackSummary | None = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return whether the sampler task is running."""
+        return self._sampler is not None and not self._sampler.done()
+
+    def start(self) -> None:
+        """Start the sampler task and watchdog thread on the running loop."""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._sampler = asyncio.create_task(self._sample(), name="tux-loop-lag")
+        self._watchdog = threading.Thread(
+            target=self._watch,
+            name="tux-loop-watchdog",
+            daemon=True,
+        )
+        self._watchdog.start()
+        logger.debug("Event loop lag monitor started")
+
+    async def stop(self) -> None:
+        """Stop the sampler task and watchdog thread."""
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sampler
+            self._sampler = None
+        self._watchdog = None
+
+    async def _sample(self) -> None:
+        """Measure wake-up lag forever and close out stalls the watchdog saw."""
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._heartbeat = now
+            self.record_lag(now - started - self.interval)
+
+    def record_lag(self, lag: float) -> None:
+        """
+        Record one lag sample, attributing it if it was a slow callback.
+
+        Parameters
+        ----------
+        lag : float
+            How late the sampler woke up, in seconds.
+        """
+        lag_ms = max(0.0, lag) * 1000
+        self._lags.append(lag_ms)
+
+        with self._lock:
+            stack, self._pending_stack = self._pending_stack, None
+        if lag < self.threshold:
+            return
+
+        self._slow_callbacks += 1
+        location = _locate(stack) if stack else "<not captured>"
+        offender = self._offenders.get(location)
+        if offender is None:
+            if len(self._offenders) >= MAX_OFFENDERS:
+                cheapest = min(self._offenders.values(), key=lambda o: o.total_ms)
+                del self._offenders[cheapest.location]
+            offender = self._offenders[location] = SlowCallbackStats(location)
+            logger.warning(
+                f"Event loop blocked for {lag_ms:.0f}ms at {location}",
+            )
+        offender.count += 1
+        offender.total_ms += lag_ms
+        offender.max_ms = max(offender.max_ms, lag_ms)
+        if stack:
+            offender.stack = "".join(stack.format())
+
+    def _watch(self) -> None:
+        """Watchdog thread: capture the loop thread's stack during a stall."""
+        poll = self.threshold / 2
+        while not self._stop.wait(poll):
+            stalled = time.monotonic() - self._heartbeat
+            if stalled < self.interval + self.threshold:
+                continue
+            with self._lock:
+                if self._pending_stack is not None:
+                    continue
+                frame = sys._current_frames().get(self._loop_thread_id or 0)
+                if frame is not None:
+                    self._pending_stack = traceback.extract_stack(
+                        frame,
+                        limit=STACK_DEPTH,
+                    )
+
+    def report(self, limit: int = 10) -> LoopLagReport:
+        """
+        Summarize recent lag and the worst offenders.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Maximum number of offenders, by default 10.
+
+        Returns
+        -------
+        LoopLagReport
+            Lag percentiles over the window and offenders by total stall time.
+        """
+        ordered = sorted(self._lags)
+
+        def percentile(q: float) -> float:
+            """Return the nearest-rank percentile of the lag window."""
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+        return LoopLagReport(
+            lag_p50_ms=percentile(0.50),
+            lag_p99_ms=percentile(0.99),
+            lag_max_ms=ordered[-1] if ordered else 0.0,
+            slow_callbacks=self._slow_callbacks,
+            offenders=sorted(
+                self._offenders.values(),
+                key=lambda o: o.total_ms,
+                reverse=True,
+            )[:limit],
+        )
+
+    def push_metrics(self) -> None:
+        """Report lag and new slow callbacks through the Sentry metric helpers."""
+        report = self.report(limit=0)
+        record_event_loop_metric(
+            report.lag_p99_ms,
+            report.lag_max_ms,
+            self._slow_callbacks - self._pushed_slow_callbacks,
+        )
+        self._pushed_slow_callbacks = self._slow_callbacks
+
+    def reset(self) -> None:
+        """Drop collected lag samples and offenders."""
+        self._lags.clear()
+        self._offenders.clear()
+        self._slow_callbacks = 0
+        self._pushed_slow_callbacks = 0
@@ -0,0 +1,336 @@
+"""Single on_message dispatch pipeline with a shared per-message context.
+
+Instead of every cog registering its own ``on_message`` listener (each one
+re-checking maintenance mode, re-resolving the guild prefix and sometimes
+calling ``bot.get_context``), cogs register *stages* with the bot's
+:class:`MessagePipeline`. The pipeline builds one :class:`MessageContext` per
+message, applies each stage's cheap pre-filters, resolves the prefix and
+command-ness at most once, and runs the matching stages concurrently with
+per-stage timing and error isolation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import discord
+from loguru import logger
+
+from tux.services.sentry import capture_exception_safe, record_task_metric
+from tux.shared.config import CONFIG
+
+if TYPE_CHECKING:
+    from tux.core.bot import Tux
+
+__all__ = ["MessageContext", "MessagePipeline", "MessageStage", "StageStats"]
+
+type MessageHandler = Callable[[MessageContext], Awaitable[None]]
+type MessagePredicate = Callable[[MessageContext], bool]
+
+
+@dataclass(slots=True)
+class MessageContext:
+    """
+    Facts about a message computed once and shared by every stage.
+
+    Attributes
+    ----------
+    message : discord.Message
+        The message being dispatched.
+    content_lower : str
+        ``message.content`` lowercased.
+    is_bot : bool
+        Whether the author is a bot (webhook messages count as bots).
+    is_webhook : bool
+        Whether the message was sent by a webhook.
+    in_guild : bool
+        Whether the message was sent in a guild.
+    maintenance : bool
+        Whether the bot was in maintenance mode when the message arrived.
+    prefix : str
+        The guild's command prefix (the default prefix in DMs).
+    is_command : bool
+        Whether the message invokes a valid prefix command. Only resolved when
+        a stage skips commands; False otherwise.
+    """
+
+    message: discord.Message
+    content_lower: str
+    is_bot: bool
+    is_webhook: bool
+    in_guild: bool
+    maintenance: bool
+    prefix: str = ""
+    is_command: bool = False
+
+    @property
+    def guild(self) -> discord.Guild | None:
+        """Return the message's guild, if any."""
+        return self.message.guild
+
+    @property
+    def author(self) -> discord.User | discord.Member:
+        """Return the message author."""
+        return self.message.author
+
+    @classmethod
+    def from_message(
+        cls,
+        message: discord.Message,
+        *,
+        maintenance: bool,
+    ) -> MessageContext:
+        """
+        Build the cheap part of a context; prefix and command-ness come later.
+
+        Returns
+        -------
+        MessageContext
+            Context with flags and lowered content filled in.
+        """
+        return cls(
+            message=message,
+            content_lower=message.content.lower(),
+            is_bot=message.author.bot,
+            is_webhook=message.webhook_id is not None,
+            in_guild=message.guild is not None,
+            maintenance=maintenance,
+        )
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Running timing totals for one stage."""
+
+    calls: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        """Return the mean stage duration in milliseconds."""
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+@dataclass(slots=True)
+class MessageStage:
+    """
+    A registered message handler and its pre-filters.
+
+    Attributes
+    ----------
+    name : str
+        Unique stage name, used for timing and unregistering.
+    handler : MessageHandler
+        Coroutine called with the shared context.
+    guild_only : bool
+        Skip messages outside guilds.
+    skip_bots : bool
+        Skip messages from bots and webhooks.
+    skip_commands : bool
+        Skip messages that invoke a valid prefix command.
+    run_in_maintenance : bool
+        Keep running while the bot is in maintenance mode.
+    predicate : MessagePredicate | None
+        Extra synchronous filter evaluated before the prefix is resolved.
+    """
+
+    name: str
+    handler: MessageHandler
+    guild_only: bool = True
+    skip_bots: bool = True
+    skip_commands: bool = False
+    run_in_maintenance: bool = False
+    predicate: MessagePredicate | None = None
+    stats: StageStats = field(default_factory=StageStats)
+
+    def accepts(self, ctx: MessageContext) -> bool:
+        """
+        Apply the cheap pre-filters (everything except command-ness).
+
+        Returns
+        -------
+        bool
+            True if the stage wants this message so far.
+        """
+        if ctx.maintenance and not self.run_in_maintenance:
+            return False
+        if self.guild_only and not ctx.in_guild:
+            return False
+        if self.skip_bots and ctx.is_bot:
+            return False
+        return self.predicate is None or self.predicate(ctx)
+
+
+class MessagePipeline:
+    """
+    Dispatches each message to registered stages with shared context.
+
+    The bot installs :meth:`dispatch` as its only cog-level ``on_message``
+    listener. Cogs call :meth:`register` in ``cog_load`` and
+    :meth:`unregister` in ``cog_unload``.
+    """
+
+    def __init__(self, bot: Tux) -> None:
+        """
+        Initialize an empty pipeline.
+
+        Parameters
+        ----------
+        bot : Tux
+            The bot whose messages are dispatched.
+        """
+        self.bot = bot
+        self._stages: dict[str, MessageStage] = {}
+
+    def register(
+        self,
+        name: str,
+        handler: MessageHandler,
+        *,
+        guild_only: bool = True,
+        skip_bots: bool = True,
+        skip_commands: bool = False,
+        run_in_maintenance: bool = False,
+        predicate: MessagePredicate | None = None,
+    ) -> MessageStage:
+        """
+        Register (or replace) a stage.
+
+        Parameters
+        ----------
+        name : str
+            Unique stage name.
+        handler : MessageHandler
+            Coroutine called with the shared context.
+        guild_only : bool, optional
+            Skip messages outside guilds, by default True.
+        skip_bots : bool, optional
+            Skip bot and webhook messages, by default True.
+        skip_commands : bool, optional
+            Skip valid prefix commands, by default False.
+        run_in_maintenance : bool, optional
+            Run during maintenance mode, by default False.
+        predicate : MessagePredicate | None, optional
+            Extra synchronous pre-filter.
+
+        Returns
+        -------
+        MessageStage
+            The registered stage.
+        """
+        stage = MessageStage(
+            name=name,
+            handler=handler,
+            guild_only=guild_only,
+            skip_bots=skip_bots,
+            skip_commands=skip_commands,
+            run_in_maintenance=run_in_maintenance,
+            predicate=predicate,
+        )
+        if name in self._stages:
+            logger.debug(f"Replacing message stage {name}")
+        self._stages[name] = stage
+        return stage
+
+    def unregister(self, name: str) -> None:
+        """Remove a stage if it is registered."""
+        self._stages.pop(name, None)
+
+    @property
+    def stages(self) -> list[MessageStage]:
+        """Return the registered stages in registration order."""
+        return list(self._stages.values())
+
+    def stats(self) -> dict[str, StageStats]:
+        """
+        Return per-stage timing totals.
+
+        Returns
+        -------
+        dict[str, StageStats]
+            Stage name to its running stats.
+        """
+        return {name: stage.stats for name, stage in self._stages.items()}
+
+    async def _resolve_prefix(self, ctx: MessageContext) -> str:
+        """Return the guild prefix, falling back to the configured default."""
+        prefix_manager = self.bot.prefix_manager
+        if prefix_manager is None:
+            return CONFIG.get_prefix()
+        return await prefix_manager.get_prefix(ctx.guild.id if ctx.guild else None)
+
+    async def dispatch(self, message: discord.Message) -> None:
+        """
+        Run every matching stage for a message.
+
+        The prefix is resolved only if some stage passed its pre-filters, and
+        ``get_context`` only when such a stage skips commands and the content
+        starts with the prefix.
+
+        Parameters
+        ----------
+        message : discord.Message
+            The incoming message.
+        """
+        if not self._stages:
+            return
+
+        ctx = MessageContext.from_message(
+            message,
+            maintenance=self.bot.maintenance_mode,
+        )
+        stages = [stage for stage in self._stages.values() if stage.accepts(ctx)]
+        if not stages:
+            return
+
+        ctx.prefix = await self._resolve_prefix(ctx)
+        if any(stage.skip_commands for stage in stages) and message.content.startswith(
+            ctx.prefix,
+        ):
+            ctx.is_command = (await self.bot.get_context(message)).valid
+            if ctx.is_command:
+                stages = [stage for stage in stages if not stage.skip_commands]
+
+        if len(stages) == 1:
+            await self._run_stage(stages[0], ctx)
+        else:
+            await asyncio.gather(*(self._run_stage(stage, ctx) for stage in stages))
+
+    async def _run_stage(self, stage: MessageStage, ctx: MessageContext) -> None:
+        """Run one stage, timing it and isolating its errors."""
+        start = time.perf_counter()
+        success = True
+        try:
+            async with self.bot.listener_profiler.track(f"on_message:{stage.name}"):
+                await stage.handler(ctx)
+        except Exception as e:
+            success = False
+            stage.stats.errors += 1
+            logger.exception(
+                f"Error in message stage {stage.name} for message {ctx.message.id}: {e}",
+            )
+            capture_exception_safe(
+                e,
+                extra_context={
+                    "operation": "message_stage",
+                    "stage": stage.name,
+                    "message_id": str(ctx.message.id),
+                },
+            )
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            stage.stats.calls += 1
+            stage.stats.total_ms += duration_ms
+            stage.stats.max_ms = max(stage.stats.max_ms, duration_ms)
+            record_task_metric(
+                stage.name,
+                duration_ms,
+                success=success,
+                task_type="message_stage",
+            )
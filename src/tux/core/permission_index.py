@@ -0,0 +1,110 @@
+"""Compiled per-guild permission index.
+
+Flattens a guild's permission ranks, role assignments and command overrides
+into two dictionaries so a permission check is a pure in-memory lookup:
+
+- ``role_ranks`` maps each assigned role ID to its effective rank.
+- ``commands`` maps each configured command name to its override; lookups
+  fall back to parent commands (``"config ranks init"`` -> ``"config ranks"``
+  -> ``"config"``) exactly like ``PermissionSystem.get_command_permission``.
+
+Each index is stamped with the guild's permission generation at build time
+(see ``tux.database.controllers.permissions.get_permission_generation``);
+the permission system discards it once the generation moves on.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from tux.database.models.models import PermissionCommand
+
+__all__ = ["PermissionIndex", "command_lookup_chain"]
+
+
+def command_lookup_chain(command_name: str) -> list[str]:
+    """
+    Return a command name followed by its parents, most specific first.
+
+    Returns
+    -------
+    list[str]
+        E.g. ``["config ranks init", "config ranks", "config"]``.
+    """
+    parts = command_name.split()
+    return [command_name, *(" ".join(parts[:i]) for i in range(len(parts) - 1, 0, -1))]
+
+
+@dataclass(frozen=True, slots=True)
+class PermissionIndex:
+    """
+    Immutable snapshot of a guild's permission configuration.
+
+    Attributes
+    ----------
+    guild_id : int
+        The guild this index was compiled for.
+    generation : int
+        Permission generation the index was built from.
+    role_ranks : Mapping[int, int]
+        Role ID to effective rank for every assigned role.
+    commands : Mapping[str, PermissionCommand]
+        Command name to its configured override.
+    """
+
+    guild_id: int
+    generation: int
+    role_ranks: Mapping[int, int] = field(default_factory=dict)
+    commands: Mapping[str, PermissionCommand] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        guild_id: int,
+        generation: int,
+        role_ranks: Mapping[int, int],
+        commands: Iterable[PermissionCommand],
+    ) -> PermissionIndex:
+        """
+        Compile an index from loaded rows.
+
+        Returns
+        -------
+        PermissionIndex
+            Read-only index over copies of the inputs.
+        """
+        return cls(
+            guild_id=guild_id,
+            generation=generation,
+            role_ranks=MappingProxyType(dict(role_ranks)),
+            commands=MappingProxyType({cmd.command_name: cmd for cmd in commands}),
+        )
+
+    def user_rank(self, role_ids: Iterable[int]) -> int:
+        """
+        Return the highest rank granted by any of the given roles.
+
+        Returns
+        -------
+        int
+            The highest rank, or 0 if none of the roles are assigned.
+        """
+        role_ranks = self.role_ranks
+        return max((role_ranks.get(role_id, 0) for role_id in role_ids), default=0)
+
+    def command_permission(self, command_name: str) -> PermissionCommand | None:
+        """
+        Return the override for a command, falling back to its parents.
+
+        Returns
+        -------
+        PermissionCommand | None
+            The most specific configured override, or None.
+        """
+        commands = self.commands
+        for name in command_lookup_chain(command_name):
+            if (perm := commands.get(name)) is not None:
+                return perm
+        return None
@@ -18,13 +18,12 @@ import discord
 import sqlalchemy.exc
 from discord.ext import commands
 from loguru import logger
-from sqlmodel import select
 
-from tux.cache.backend import get_cache_backend
+from tux.core.permission_index import PermissionIndex
 from tux.database.controllers import DatabaseCoordinator
 from tux.database.controllers.permissions import (
-    unwrap_optional_perm,
-    wrap_optional_perm,
+    bump_permission_generation,
+    get_permission_generation,
 )
 from tux.database.models.models import (
     PermissionAssignment,
@@ -36,10 +35,6 @@ from tux.shared.exceptions import TuxDatabaseError
 if TYPE_CHECKING:
     from tux.core.bot import Tux
 
-PERM_FALLBACK_KEY_PREFIX = "perm:command_permission_fallback:"
-# Command required rank: setup-once; invalidated when config changes.
-PERM_FALLBACK_TTL = 7200.0  # 2 hours
-
 __all__ = [
     # Constants
     "DEFAULT_RANKS",
@@ -118,6 +113,8 @@ class PermissionSystem:
         Database coordinator for permission storage and retrieval.
     _default_ranks : dict[int, RankDefinition]
         Default permission rank hierarchy (0-7).
+    _indexes : dict[int, PermissionIndex]
+        Compiled permission index per guild; checks are answered from these.
     """
 
     def __init__(self, bot: Tux, db: DatabaseCoordinator) -> None:
@@ -134,7 +131,8 @@ class PermissionSystem:
         self.bot = bot
         self.db = db
         self._default_ranks = DEFAULT_RANKS
-        self._cache_backend = get_cache_backend(bot)
+        self._indexes: dict[int, PermissionIndex] = {}
+        self._index_locks: dict[int, asyncio.Lock] = {}
 
     # ---------- Guild Initialization ----------
 
@@ -153,17 +151,19 @@ class PermissionSystem:
         guild_id : int
             The Discord guild ID to initialize.
         """
-        logger.debug(f"PermissionSystem.initialize_guild called for guild {guild_id}")
+        logger.debug("PermissionSystem.initialize_guild called for guild {}", guild_id)
 
         # Get existing ranks for this guild
-        logger.trace(f"Checking existing ranks for guild {guild_id}")
+        logger.trace("Checking existing ranks for guild {}", guild_id)
         try:
             existing_ranks = (
                 await self.db.permission_ranks.get_permission_ranks_by_guild(guild_id)
             )
             existing_rank_numbers = {r.rank for r in existing_ranks}
             logger.trace(
-                f"Found {len(existing_ranks)} existing ranks for guild {guild_id}",
+                "Found {} existing ranks for guild {}",
+                len(existing_ranks),
+                guild_id,
             )
         except (TuxDatabaseError, sqlalchemy.exc.SQLAlchemyError) as e:
             logger.error(
@@ -178,7 +178,11 @@ class PermissionSystem:
         for rank, default_data in DEFAULT_RANKS.items():
             if rank not in existing_rank_numbers:
                 ranks_to_create.append((rank, default_data))
-                logger.trace(f"Will create missing rank {rank}: {default_data['name']}")
+                logger.trace(
+                    "Will create missing rank {}: {}",
+                    rank,
+                    default_data["name"],
+                )
 
         if not ranks_to_create:
             logger.info(
@@ -205,7 +209,9 @@ class PermissionSystem:
         try:
             await self.db.permission_ranks.bulk_create_permission_ranks(bulk_data)
             logger.debug(
-                f"Successfully bulk created {len(ranks_to_create)} ranks for guild {guild_id}",
+                "Successfully bulk created {} ranks for guild {}",
+                len(ranks_to_create),
+                guild_id,
             )
         except (TuxDatabaseError, sqlalchemy.exc.SQLAlchemyError) as e:
             logger.error(
@@ -220,6 +226,96 @@ class PermissionSystem:
 
         logger.info(f"Initialized default permission ranks for guild {guild_id}")
 
+    # ---------- Permission Index ----------
+
+    def get_cached_index(self, guild_id: int) -> PermissionIndex | None:
+        """
+        Return the guild's compiled permission index if it is still current.
+
+        Parameters
+        ----------
+        guild_id : int
+            The Discord guild ID.
+
+        Returns
+        -------
+        PermissionIndex | None
+            The index, or None if it was never built or permissions changed since.
+        """
+        index = self._indexes.get(guild_id)
+        if index is None or index.generation != get_permission_generation(guild_id):
+            return None
+        return index
+
+    async def get_permission_index(self, guild_id: int) -> PermissionIndex:
+        """
+        Get the guild's compiled permission index, building it if needed.
+
+        Concurrent callers for the same guild share a single build. The new
+        index replaces the old one in a single assignment, so readers always
+        see a complete index.
+
+        Parameters
+        ----------
+        guild_id : int
+            The Discord guild ID.
+
+        Returns
+        -------
+        PermissionIndex
+            The current permission index.
+        """
+        if (index := self.get_cached_index(guild_id)) is not None:
+            return index
+
+        lock = self._index_locks.setdefault(guild_id, asyncio.Lock())
+        async with lock:
+            if (index := self.get_cached_index(guild_id)) is not None:
+                return index
+            index = await self._build_permission_index(guild_id)
+            self._indexes[guild_id] = index
+            return index
+
+    async def invalidate_permission_index(self, guild_id: int) -> None:
+        """
+        Discard the guild's permission index after an out-of-band change.
+
+        Controller writes already do this; call it after modifying the
+        permission tables any other way.
+
+        Parameters
+        ----------
+        guild_id : int
+            The Discord guild ID.
+        """
+        await bump_permission_generation(guild_id)
+        self._indexes.pop(guild_id, None)
+
+    async def _build_permission_index(self, guild_id: int) -> PermissionIndex:
+        """Load the guild's permission tables and compile them into an index.
+
+        Returns
+        -------
+        PermissionIndex
+            Index stamped with the generation read before loading, so a write
+            that lands mid-build makes it stale immediately.
+        """
+        generation = get_permission_generation(guild_id)
+        start = time.perf_counter()
+        role_ranks, command_perms = await asyncio.gather(
+            self.db.permission_assignments.get_role_ranks_by_guild(guild_id),
+            self.db.command_permissions.get_all_command_permissions(guild_id),
+        )
+        index = PermissionIndex.build(guild_id, generation, role_ranks, command_perms)
+        logger.trace(
+            "Built permission index for guild {} ({} roles, {} commands) in {:.2f}ms",
+            guild_id,
+            len(index.role_ranks),
+            len(index.commands),
+            (time.perf_counter() - start) * 1000,
+        )
+        return index
+
     # ---------- Permission Checking ----------
 
     async def get_user_permission_rank(self, ctx: commands.Context[Tux]) -> int:
@@ -245,17 +341,12 @@ class PermissionSystem:
         if not ctx.guild:
             return 0
 
-        # Extract role IDs from user's Discord roles
-        user_roles = []
-        if isinstance(ctx.author, discord.Member):
-            user_roles = [role.id for role in ctx.author.roles]
+        # Members carry their roles; plain users (e.g. uncached) have none
+        if not isinstance(ctx.author, discord.Member):
+            return 0
 
-        # Query database for highest rank among user's roles
-        return await self.db.permission_assignments.get_user_permission_rank(
-            ctx.guild.id,
-            ctx.author.id,
-            user_roles,
-        )
+        index = await self.get_permission_index(ctx.guild.id)
+        return index.user_rank(role.id for role in ctx.author.roles)
 
     async def get_user_permission_rank_from_interaction(
         self,
@@ -284,11 +375,10 @@ class PermissionSystem:
         int
             The highest permission rank (0-10) the user has, or 0 if none.
         """
-        return await self.db.permission_assignments.get_user_permission_rank(
-            guild_id,
-            user_id,
-            user_roles,
-        )
+        if not user_roles:
+            return 0
+        index = await self.get_permission_index(guild_id)
+        return index.user_rank(user_roles)
 
     # ---------- Role Assignment Management ----------
 
@@ -426,25 +516,6 @@ class PermissionSystem:
 
     # ---------- Command Permission Management ----------
 
-    async def _invalidate_command_fallback_cache(
-        self,
-        guild_id: int,
-        command_name: str,
-    ) -> None:
-        """Invalidate fallback cache for command and its parent commands."""
-        await self._cache_backend.delete(
-            f"{PERM_FALLBACK_KEY_PREFIX}{guild_id}:{command_name}",
-        )
-        parts = command_name.split()
-        for i in range(len(parts) - 1, 0, -1):
-            parent_name = " ".join(parts[:i])
-            await self._cache_backend.delete(
-                f"{PERM_FALLBACK_KEY_PREFIX}{guild_id}:{parent_name}",
-            )
-        logger.trace(
-            f"Invalidated command permission fallback cache for {command_name} (guild {guild_id})",
-        )
-
     async def set_command_permission(
         self,
         guild_id: int,
@@ -492,15 +563,13 @@ class PermissionSystem:
             error_msg = f"Required rank must be between 0 and 10, got {required_rank}"
             raise ValueError(error_msg)
 
-        # Set command permission in database (this will invalidate cache)
+        # Set command permission in database (this invalidates the index)
         command_perm = await self.db.command_permissions.set_command_permission(
             guild_id=guild_id,
             command_name=command_name,
             required_rank=required_rank,
         )
 
-        await self._invalidate_command_fallback_cache(guild_id, command_name)
-
         logger.info(
             f"Set command {command_name} to require rank {required_rank} in guild {guild_id}",
         )
@@ -512,12 +581,17 @@ class PermissionSystem:
         command_name: str,
     ) -> None:
         """
-        Invalidate the command permission fallback cache for a command and its parents.
+        Invalidate cached permission data for a command and its parents.
 
         Call after removing or changing a command permission outside set_command_permission
         (e.g. delete_where) so the next get_command_permission sees fresh data.
         """
-        await self._invalidate_command_fallback_cache(guild_id, command_name)
+        await self.invalidate_permission_index(guild_id)
+        logger.trace(
+            "Invalidated permission index for {} (guild {})",
+            command_name,
+            guild_id,
+        )
 
     # ---------- Query Methods ----------
 
@@ -545,74 +619,8 @@ class PermissionSystem:
         PermissionCommand | None
             The command permission record, or None if no override exists.
         """
-        backend_key = f"{PERM_FALLBACK_KEY_PREFIX}{guild_id}:{command_name}"
-        raw = await self._cache_backend.get(backend_key)
-        if raw is not None:
-            unwrapped = unwrap_optional_perm(raw)
-            logger.trace(
-                f"Cache hit for command permission with fallback {command_name} (guild {guild_id})",
-            )
-            return unwrapped
-
-        # For single-word commands (no parents), use direct query for efficiency
-        parts = command_name.split()
-        if len(parts) == 1:
-            result = await self.db.command_permissions.get_command_permission(
-                guild_id,
-                command_name,
-            )
-            await self._cache_backend.set(
-                backend_key,
-                wrap_optional_perm(result),
-                ttl_sec=PERM_FALLBACK_TTL,
-            )
-            return result
-
-        # For multi-word commands, build list of all possible command names to check
-        # e.g., "config ranks init" -> ["config ranks init", "config ranks", "config"]
-        command_names_to_check = [
-            command_name,
-            *(" ".join(parts[:i]) for i in range(len(parts) - 1, 0, -1)),
-        ]
-
-        # Batch query all possible command names at once
-        # This is much faster than sequential queries
-        async with self.db.command_permissions.db.session() as session:
-            stmt = (
-                select(PermissionCommand)
-                .where(PermissionCommand.guild_id == guild_id)
-                .where(
-                    PermissionCommand.command_name.in_(command_names_to_check),  # type: ignore[attr-defined]
-                )
-            )
-            result = await session.execute(stmt)
-            found_permissions = list(result.scalars().all())
-
-            # Expunge instances for use outside session
-            for perm in found_permissions:
-                session.expunge(perm)
-
-        # Return the first match in order of specificity (command itself, then parents)
-        perm_lookup = {perm.command_name: perm for perm in found_permissions}
-        result = None
-        for name in command_names_to_check:
-            if name in perm_lookup:
-                if name != command_name:
-                    logger.trace(
-                        f"Using parent command permission '{name}' for '{command_name}'",
-                    )
-                result = perm_lookup[name]
-                break
-
-        await self._cache_backend.set(
-            backend_key,
-            wrap_optional_perm(result),
-            ttl_sec=PERM_FALLBACK_TTL,
-        )
-        logger.trace(
-            f"Cached command permission with fallback for {command_name} (guild {guild_id})",
-        )
-        return result
+        index = await self.get_permission_index(guild_id)
+        return index.command_permission(command_name)
 
     async def batch_get_command_permissions(
         self,
@@ -622,9 +630,9 @@ class PermissionSystem:
         """
         Batch get command permissions for multiple commands at once.
 
-        This is much more efficient than calling get_command_permission multiple
-        times, as it batches all database queries. Used by the help system to
-        check permissions for multiple subcommands simultaneously.
+        All lookups are answered from the guild's permission index, so this
+        costs at most one index build. Used by the help system to check
+        permissions for multiple subcommands simultaneously.
 
         Parameters
         ----------
@@ -642,88 +650,8 @@ class PermissionSystem:
         if not command_names:
             return {}
 
-        cached_results: dict[str, PermissionCommand | None] = {}
-        uncached_commands: list[str] = []
-
-        # Fetch all cache entries concurrently (important for Valkey/network caches)
-        keys_and_names = [
-            (f"{PERM_FALLBACK_KEY_PREFIX}{guild_id}:{cmd}", cmd)
-            for cmd in command_names
-        ]
-        get_coros = [self._cache_backend.get(key) for key, _ in keys_and_names]
-        raw_values = await asyncio.gather(*get_coros)
-        for (_, command_name), raw in zip(keys_and_names, raw_values, strict=True):
-            if raw is not None:
-                cached_results[command_name] = unwrap_optional_perm(raw)
-            else:
-                uncached_commands.append(command_name)
-
-        # If all commands were cached, return early
-        if not uncached_commands:
-            return cached_results
-
-        # Build set of all command names to check (including parents) for uncached commands
-        all_names_to_check: set[str] = set()
-        command_to_parents: dict[str, list[str]] = {}
-
-        for command_name in uncached_commands:
-            parts = command_name.split()
-            command_names_to_check = [command_name]
-
-            # Add all parent command names (most specific to least)
-            for i in range(len(parts) - 1, 0, -1):
-                parent_name = " ".join(parts[:i])
-                command_names_to_check.append(parent_name)
-
-            all_names_to_check.update(command_names_to_check)
-            command_to_parents[command_name] = command_names_to_check
-
-        # Batch query all command permissions at once
-        async with self.db.command_permissions.db.session() as session:
-            stmt = (
-                select(PermissionCommand)
-                .where(PermissionCommand.guild_id == guild_id)
-                .where(
-                    PermissionCommand.command_name.in_(all_names_to_check),  # type: ignore[attr-defined]
-                )
-            )
-            result = await session.execute(stmt)
-            found_permissions = list(result.scalars().all())
-
-            # Expunge instances for use outside session
-            for perm in found_permissions:
-                session.expunge(perm)
-
-        # Create lookup dict for fast access
-        perm_lookup: dict[str, PermissionCommand] = {
-            perm.command_name: perm for perm in found_permissions
-        }
-
-        # Build result dict for uncached commands, checking each command and its parents
-        # Check command itself, then parents in order of specificity
-        for command_name in uncached_commands:
-            result = next(
-                (
-                    perm_lookup[name]
-                    for name in command_to_parents[command_name]
-                    if name in perm_lookup
-                ),
-                None,
-            )
-            cached_results[command_name] = result
-
-        # Write all cache entries concurrently (important for Valkey/network caches)
-        set_coros = [
-            self._cache_backend.set(
-                f"{PERM_FALLBACK_KEY_PREFIX}{guild_id}:{command_name}",
-                wrap_optional_perm(cached_results[command_name]),
-                ttl_sec=PERM_FALLBACK_TTL,
-            )
-            for command_name in uncached_commands
-        ]
-        await asyncio.gather(*set_coros)
-
-        return cached_results
+        index = await self.get_permission_index(guild_id)
+        return {name: index.command_permission(name) for name in command_names}
 
     async def get_guild_permission_ranks(self, guild_id: int) -> list[PermissionRank]:
         """
@@ -776,75 +704,22 @@ class PermissionSystem:
         """
         return await self.db.command_permissions.get_all_command_permissions(guild_id)
 
-    def _get_all_command_names(self) -> set[str]:
-        """
-        Get all command names from the bot, including subcommands.
-
-        Returns
-        -------
-        set[str]
-            Set of all command names (e.g., {"ping", "config", "config ranks", "config ranks init"}).
-        """
-        command_names: set[str] = set()
-
-        def collect_commands(
-            cmd: commands.Command[Any, Any, Any],
-            prefix: str = "",
-        ) -> None:
-            """Recursively collect command names including subcommands."""
-            full_name = f"{prefix} {cmd.name}".strip() if prefix else cmd.name
-            command_names.add(full_name)
-
-            # If it's a group, collect subcommands
-            if isinstance(cmd, commands.Group):
-                for subcmd in cmd.commands:
-                    collect_commands(subcmd, full_name)
-
-        # Collect all commands from the bot
-        for command in self.bot.walk_commands():
-            collect_commands(command)
-
-        return command_names
-
     async def prewarm_cache_for_guild(self, guild_id: int) -> None:
         """
         Pre-warm permission caches for a guild to avoid cold-start delays.
 
-        Loads all permission ranks, assignments, and command permissions into cache
-        so the first command doesn't need to hit the database.
+        Compiles the guild's permission index so the first command doesn't need
+        to hit the database.
 
         Parameters
         ----------
         guild_id : int
             The Discord guild ID to pre-warm caches for.
         """
-        logger.debug(f"Pre-warming permission cache for guild {guild_id}")
+        logger.debug("Pre-warming permission cache for guild {}", guild_id)
         try:
-            # Load ranks and assignments first (these are needed for command permission lookups)
-            await asyncio.gather(
-                self.db.permission_ranks.get_permission_ranks_by_guild(guild_id),
-                self.db.permission_assignments.get_assignments_by_guild(guild_id),
-                return_exceptions=True,
-            )
-
-            # Get all command names and pre-warm command permission cache
-            # This populates the fallback cache used by get_command_permission()
-            all_command_names = self._get_all_command_names()
-            logger.trace(
-                f"Pre-warming command permission cache for {len(all_command_names)} commands",
-            )
-
-            # Pre-warm command permissions in batches to avoid overwhelming the database
-            # Use batch_get_command_permissions for efficiency
-            command_list = list(all_command_names)
-            batch_size = 50  # Process 50 commands at a time
-
-            for i in range(0, len(command_list), batch_size):
-                batch = command_list[i : i + batch_size]
-                # This will populate the cache for all commands in the batch
-                await self.batch_get_command_permissions(guild_id, batch)
-
-            logger.trace(f"Pre-warmed permission cache for guild {guild_id}")
+            await self.get_permission_index(guild_id)
+            logger.trace("Pre-warmed permission cache for guild {}", guild_id)
         except Exception as e:
             # Don't fail startup if pre-warming fails
             logger.warning(
@@ -855,27 +730,83 @@ class PermissionSystem:
         """
         Pre-warm permission caches for all guilds the bot is in.
 
+        Loads ranks, role assignments and command permissions for every guild
+        in three streamed queries, compiles each guild's permission index in
+        memory, and writes the rank and assignment caches with pipelined
+        backend sets. Guilds whose permissions change while loading keep
+        their (already stale) index and are left out of the cache writes.
+
         This should be called after bot is ready and guilds are registered
         to avoid cold-start delays on the first command.
         """
-        if not self.bot.guilds:
+        guild_ids = [guild.id for guild in self.bot.guilds]
+        if not guild_ids:
             logger.debug("No guilds to pre-warm permission cache for")
             return
 
-        logger.info(
-            f"Pre-warming permission cache for {len(self.bot.guilds)} guilds...",
-        )
+        logger.info(f"Pre-warming permission cache for {len(guild_ids)} guilds...")
         start_time = time.perf_counter()
+        generations = {
+            guild_id: get_permission_generation(guild_id) for guild_id in guild_ids
+        }
 
-        # Pre-warm all guilds in parallel
-        await asyncio.gather(
-            *[self.prewarm_cache_for_guild(guild.id) for guild in self.bot.guilds],
-            return_exceptions=True,
+        try:
+            ranks, assignments, commands_by_guild = await asyncio.gather(
+                self.db.permission_ranks.get_permission_ranks_for_guilds(guild_ids),
+                self.db.permission_assignments.get_assignments_for_guilds(guild_ids),
+                self.db.command_permissions.get_command_permissions_for_guilds(
+                    guild_ids,
+                ),
+            )
+        except Exception as e:
+            # Don't fail startup; indexes are built on first use instead
+            logger.warning(f"Failed to load permissions for pre-warming: {e}")
+            return
+        loaded_at = time.perf_counter()
+        logger.debug(
+            "Loaded {} ranks, {} assignments and {} command permissions in {:.2f}ms",
+            sum(map(len, ranks.values())),
+            sum(map(len, assignments.values())),
+            sum(map(len, commands_by_guild.values())),
+            (loaded_at - start_time) * 1000,
         )
 
+        for guild_id in guild_ids:
+            rank_numbers = {rank.id: rank.rank for rank in ranks[guild_id]}
+            role_ranks = {
+                assignment.role_id: rank_numbers[assignment.permission_rank_id]
+                for assignment in assignments[guild_id]
+                if assignment.permission_rank_id in rank_numbers
+            }
+            self._indexes[guild_id] = PermissionIndex.build(
+                guild_id,
+                generations[guild_id],
+                role_ranks,
+                commands_by_guild[guild_id],
+            )
+
+        # Skip guilds written to mid-load so stale lists are not cached
+        current = [
+            guild_id
+            for guild_id in guild_ids
+            if get_permission_generation(guild_id) == generations[guild_id]
+        ]
+        try:
+            await asyncio.gather(
+                self.db.permission_ranks.prime_guild_ranks_cache(
+                    {guild_id: ranks[guild_id] for guild_id in current},
+                ),
+                self.db.permission_assignments.prime_assignments_cache(
+                    {guild_id: assignments[guild_id] for guild_id in current},
+                ),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write pre-warmed permission caches: {e}")
+
         elapsed = (time.perf_counter() - start_time) * 1000
         logger.success(
-            f"Pre-warmed permission cache for {len(self.bot.guilds)} guilds in {elapsed:.2f}ms",
+            f"Pre-warmed permission cache for {len(guild_ids)} guilds in {elapsed:.2f}ms "
+            f"(load {(loaded_at - start_time) * 1000:.2f}ms)",
         )
 
     # ---------- Configuration File Support ----------
@@ -17,8 +17,7 @@ This architecture ensures sub-millisecond prefix lookups after initial cache loa
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Coroutine
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
@@ -249,18 +248,13 @@ class PrefixManager:
                 )
 
                 backend = get_cache_backend(self.bot)
-                write_tasks: list[Coroutine[Any, Any, None]] = []
                 for config in all_configs:
                     self._prefix_cache[config.id] = config.prefix
-                    write_tasks.append(
-                        backend.set(
-                            f"prefix:{config.id}",
-                            config.prefix,
-                            ttl_sec=None,
-                        ),
-                    )
-                if write_tasks:
-                    await asyncio.gather(*write_tasks)
+                # One pipelined write instead of a round trip per guild
+                await backend.set_many(
+                    {f"prefix:{config.id}": config.prefix for config in all_configs},
+                    ttl_sec=None,
+                )
 
                 self._cache_loaded = True
                 logger.info(
@@ -281,8 +275,8 @@ class PrefixManager:
         """
         Invalidate prefix cache for a specific guild or all guilds.
 
-        When guild_id is None, in-memory cache is cleared and backend keys for
-        all cached guilds are removed (same as per-guild delete for each).
+        When guild_id is None, in-memory cache is cleared and every ``prefix:``
+        backend key is removed, including guilds this process never cached.
         When guild_id is set, both in-memory and backend state for that guild
         are invalidated.
 
@@ -299,11 +293,7 @@ class PrefixManager:
         """
         backend = get_cache_backend(self.bot)
         if guild_id is None:
-            keys_to_delete = list(self._prefix_cache.keys())
-            if keys_to_delete:
-                await asyncio.gather(
-                    *(backend.delete(f"prefix:{gid}") for gid in keys_to_delete),
-                )
+            await backend.delete_prefix("prefix:")
             self._prefix_cache.clear()
             self._cache_loaded = False
             logger.debug("All prefix cache invalidated")
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from loguru import logger
 
@@ -17,7 +18,18 @@ __all__ = ["BaseSetupService", "BotSetupService"]
 
 
 class BaseSetupService(ABC):
-    """Base class for all setup services with standardized patterns."""
+    """Base class for all setup services with standardized patterns.
+
+    Attributes
+    ----------
+    depends_on : tuple[str, ...]
+        Names of the services that must finish before this one starts. The
+        orchestrator runs services without pending dependencies concurrently.
+    duration_ms : float | None
+        Wall time of the last ``safe_setup`` run, or None if it has not run.
+    """
+
+    depends_on: ClassVar[tuple[str, ...]] = ()
 
     def __init__(self, name: str) -> None:
         """Initialize the base setup service.
@@ -28,6 +40,7 @@ class BaseSetupService(ABC):
             The name of the setup service for logging and tracing.
         """
         self.name = name
+        self.duration_ms: float | None = None
 
     @abstractmethod
     async def setup(self) -> None:
@@ -45,14 +58,20 @@ class BaseSetupService(ABC):
             True if setup succeeded, False if it failed.
         """
         with start_span(f"bot.setup_{self.name}", f"Setting up {self.name}") as span:
+            start = time.perf_counter()
             try:
                 logger.info(f"Setting up {self.name}...")
                 await self.setup()
-                logger.success(f"{self.name.title()} setup completed")
+                self.duration_ms = (time.perf_counter() - start) * 1000
+                logger.success(
+                    f"{self.name.title()} setup completed in {self.duration_ms:.0f}ms",
+                )
                 span.set_data("setup.status", "success")
+                span.set_data("setup.duration_ms", self.duration_ms)
             except KeyboardInterrupt:
                 raise
             except Exception as e:
+                self.duration_ms = (time.perf_counter() - start) * 1000
                 # Database errors are already logged with context by DatabaseService
                 if self.name != "database":
                     logger.exception(f"{self.name.title()} setup failed")
@@ -10,6 +10,7 @@ from tux.cache import (
     CacheService,
     GuildConfigCacheManager,
     JailStatusCache,
+    TieredBackend,
     get_cache_backend,
 )
 from tux.core.setup.base import BotSetupService
@@ -75,4 +76,6 @@ class CacheSetupService(BotSetupService):
         backend = get_cache_backend(self.bot)
         GuildConfigCacheManager().set_backend(backend)
         JailStatusCache().set_backend(backend)
+        if isinstance(backend, TieredBackend):
+            await backend.start()
         logger.debug("Cache backend wired: {}", type(backend).__name__)
@@ -0,0 +1,35 @@
+"""Cog discovery setup service for bot initialization."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from tux.core.cog_loader import CogLoader
+from tux.core.setup.base import BotSetupService
+
+if TYPE_CHECKING:
+    from tux.core.bot import Tux
+
+__all__ = ["CogDiscoverySetupService"]
+
+
+class CogDiscoverySetupService(BotSetupService):
+    """Finds eligible cog files ahead of loading, while other services run."""
+
+    def __init__(self, bot: Tux) -> None:
+        """Initialize the cog discovery setup service.
+
+        Parameters
+        ----------
+        bot : Tux
+            The Discord bot instance the cogs will be loaded into.
+        """
+        super().__init__(bot, "cog_discovery")
+        self.cog_loader = CogLoader(bot)
+
+    async def setup(self) -> None:
+        """Discover the cogs of every startup folder."""
+        count = await self.cog_loader.discover_folders()
+        logger.debug("Discovered {} eligible cogs", count)
@@ -12,6 +12,7 @@ from tux.core.setup.base import BotSetupService
 
 if TYPE_CHECKING:
     from tux.core.bot import Tux
+    from tux.core.setup.cog_discovery_setup import CogDiscoverySetupService
 
 __all__ = ["CogSetupService"]
 
@@ -19,15 +20,24 @@ __all__ = ["CogSetupService"]
 class CogSetupService(BotSetupService):
     """Handles cog loading and plugin setup during bot initialization."""
 
-    def __init__(self, bot: Tux) -> None:
+    depends_on = ("cog_discovery", "emoji", "prefix_manager")
+
+    def __init__(
+        self,
+        bot: Tux,
+        discovery: CogDiscoverySetupService | None = None,
+    ) -> None:
         """Initialize the cog setup service.
 
         Parameters
         ----------
         bot : Tux
             The Discord bot instance to load cogs for.
+        discovery : CogDiscoverySetupService | None, optional
+            Service whose loader already discovered the cog files.
         """
         super().__init__(bot, "cogs")
+        self.discovery = discovery
 
     async def setup(self) -> None:
         """Load all cogs and plugins."""
@@ -46,7 +56,10 @@ class CogSetupService(BotSetupService):
     async def _load_cogs(self) -> None:
         """Load all bot cogs using CogLoader."""
         logger.info("Loading cogs...")
-        await CogLoader.setup(self.bot)
+        await CogLoader.setup(
+            self.bot,
+            self.discovery.cog_loader if self.discovery is not None else None,
+        )
         logger.success("All cogs loaded")
 
     async def _load_hot_reload(self) -> None:
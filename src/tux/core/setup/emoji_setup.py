@@ -0,0 +1,38 @@
+"""Emoji manager setup service for bot initialization."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from tux.core.setup.base import BotSetupService
+
+if TYPE_CHECKING:
+    from tux.core.bot import Tux
+
+__all__ = ["EmojiSetupService"]
+
+
+class EmojiSetupService(BotSetupService):
+    """Loads the application emoji cache during bot setup."""
+
+    def __init__(self, bot: Tux) -> None:
+        """Initialize the emoji setup service.
+
+        Parameters
+        ----------
+        bot : Tux
+            The Discord bot instance whose emoji manager to initialize.
+        """
+        super().__init__(bot, "emoji")
+
+    async def setup(self) -> None:
+        """Fetch application emojis into the emoji manager cache."""
+        if self.bot._emoji_manager_initialized:  # type: ignore[reportPrivateUsage]
+            return
+
+        if not await self.bot.emoji_manager.init():
+            # Cogs fall back to plain text when an emoji is missing
+            logger.warning("Emoji manager not initialized; custom emojis unavailable")
+        self.bot._emoji_manager_initialized = True  # type: ignore[reportPrivateUsage]
@@ -1,9 +1,20 @@
-"""Bot setup orchestrator that coordinates all setup services."""
+"""Bot setup orchestrator that coordinates all setup services.
+
+Services declare the services they need in ``depends_on`` and run as a
+dependency graph: every service whose dependencies have finished starts
+immediately, so independent work (cache connection, emoji fetch, cog file
+discovery) overlaps with database migrations.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import time
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from loguru import logger
+
 from tux.services.sentry.tracing import DummySpan, set_setup_phase_tag
 from tux.shared.exceptions import (
     TuxDatabaseConnectionError,
@@ -11,11 +22,65 @@ from tux.shared.exceptions import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from typing import Any
 
     from tux.core.bot import Tux
 
-__all__ = ["BotSetupOrchestrator"]
+    from .base import BaseSetupService
+
+__all__ = ["BotSetupOrchestrator", "SetupPhase", "StartupReport"]
+
+
+@dataclass(frozen=True, slots=True)
+class SetupPhase:
+    """Timing of one setup service run.
+
+    Attributes
+    ----------
+    name : str
+        Service name.
+    depends_on : tuple[str, ...]
+        Services it waited for.
+    start_ms : float
+        Start offset from the beginning of setup.
+    duration_ms : float
+        Wall time of the service.
+    success : bool
+        Whether the service succeeded.
+    """
+
+    name: str
+    depends_on: tuple[str, ...]
+    start_ms: float
+    duration_ms: float
+    success: bool
+
+    @property
+    def end_ms(self) -> float:
+        """Return the end offset from the beginning of setup."""
+        return self.start_ms + self.duration_ms
+
+
+@dataclass(frozen=True, slots=True)
+class StartupReport:
+    """Per-phase timings of one orchestrated setup.
+
+    Attributes
+    ----------
+    phases : tuple[SetupPhase, ...]
+        Phases in start order.
+    total_ms : float
+        Wall time from the first service start to the last service end.
+    """
+
+    phases: tuple[SetupPhase, ...]
+    total_ms: float
+
+    @property
+    def sequential_ms(self) -> float:
+        """Return the summed phase time, i.e. the cost of running them in order."""
+        return sum(phase.duration_ms for phase in self.phases)
 
 
 class BotSetupOrchestrator:
@@ -32,53 +97,195 @@ class BotSetupOrchestrator:
         self.bot = bot
         # Lazy import to avoid circular imports
         from .cache_setup import CacheSetupService  # noqa: PLC0415
+        from .cog_discovery_setup import CogDiscoverySetupService  # noqa: PLC0415
         from .cog_setup import CogSetupService  # noqa: PLC0415
         from .database_setup import DatabaseSetupService  # noqa: PLC0415
+        from .emoji_setup import EmojiSetupService  # noqa: PLC0415
         from .permission_setup import PermissionSetupService  # noqa: PLC0415
         from .prefix_setup import PrefixSetupService  # noqa: PLC0415
 
-        self.services = [
+        discovery = CogDiscoverySetupService(bot)
+        self.services: list[BaseSetupService] = [
             DatabaseSetupService(bot.db_service),
             CacheSetupService(bot),
+            EmojiSetupService(bot),
+            discovery,
             PermissionSetupService(bot, bot.db_service),
             PrefixSetupService(bot),
-            CogSetupService(bot),
+            CogSetupService(bot, discovery),
         ]
+        self.report: StartupReport | None = None
+
+    @staticmethod
+    def validate(services: Sequence[BaseSetupService]) -> None:
+        """
+        Check that the services form an acyclic graph of known names.
+
+        Parameters
+        ----------
+        services : Sequence[BaseSetupService]
+            The services to check.
+
+        Raises
+        ------
+        TuxSetupError
+            If a dependency is unknown, a name is duplicated, or there is a cycle.
+        """
+        names = {service.name for service in services}
+        if len(names) != len(services):
+            msg = "Setup services have duplicate names"
+            raise TuxSetupError(msg)
+
+        for service in services:
+            if unknown := set(service.depends_on) - names:
+                msg = (
+                    f"{service.name.title()} setup depends on unknown {sorted(unknown)}"
+                )
+                raise TuxSetupError(msg)
+
+        # Kahn's algorithm: a cycle leaves services that never become ready
+        done: set[str] = set()
+        remaining = list(services)
+        while remaining:
+            ready = [s for s in remaining if done.issuperset(s.depends_on)]
+            if not ready:
+                msg = (
+                    f"Setup dependency cycle among {sorted(s.name for s in remaining)}"
+                )
+                raise TuxSetupError(msg)
+            done.update(s.name for s in ready)
+            remaining = [s for s in remaining if s.name not in done]
 
     async def setup(self, span: DummySpan | Any) -> None:
         """
-        Execute all setup steps with standardized error handling.
+        Execute all setup services as a dependency graph.
 
-        Performs setup in order: database (with migrations), permission system,
-        prefix manager, cogs, and task monitoring.
+        Services start as soon as their dependencies have finished. Per-phase
+        timings are recorded on ``span`` and kept in ``bot.startup_report``.
+        Task monitoring starts once every service has finished.
 
         Raises
         ------
         TuxDatabaseConnectionError
             If database setup fails.
         TuxSetupError
-            If any setup service fails.
+            If any setup service fails or the dependency graph is invalid.
         """
         set_setup_phase_tag(span, "starting")
+        self.validate(self.services)
+
+        start = time.perf_counter()
+        phases: list[SetupPhase] = []
+        failed = await self._run_services(span, start, phases)
+        self._record_report(span, phases, start)
+        if failed is not None:
+            self._raise_setup_failure(failed)
+
+        # Start monitoring
+        self.bot.task_monitor.start()
+        set_setup_phase_tag(span, "monitoring", "finished")
+
+    async def _run_services(
+        self,
+        span: DummySpan | Any,
+        start: float,
+        phases: list[SetupPhase],
+    ) -> BaseSetupService | None:
+        """Run the services in dependency order and return the first failure."""
+        pending = list(self.services)
+        done: set[str] = set()
+        running: dict[asyncio.Task[bool], tuple[BaseSetupService, float]] = {}
 
-        for service in self.services:
-            if not await service.safe_setup():
-                # The underlying error is already logged and captured by safe_setup()
-                msg = f"{service.name.title()} setup failed"
-
-                if service.name == "database":
-                    msg += (
-                        ". Check logs and Sentry for the underlying error. "
-                        "Common causes: database not running, incorrect connection "
-                        "string, network issues, or migration failures. "
-                        "Run migrations manually with 'uv run db push' if needed."
+        try:
+            while pending or running:
+                for service in [s for s in pending if done.issuperset(s.depends_on)]:
+                    pending.remove(service)
+                    task = asyncio.create_task(
+                        service.safe_setup(),
+                        name=f"bot_setup_{service.name}",
                     )
-                    raise TuxDatabaseConnectionError(msg)
+                    running[task] = (service, time.perf_counter())
 
-                raise TuxSetupError(msg)
+                finished, _ = await asyncio.wait(
+                    running,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                failed: BaseSetupService | None = None
+                for task in finished:
+                    service, started = running.pop(task)
+                    phase = self._record_phase(span, service, task, started - start)
+                    phases.append(phase)
+                    if phase.success:
+                        done.add(service.name)
+                    elif failed is None:
+                        failed = service
 
+                if failed is not None:
+                    # Let in-flight services (e.g. migrations) finish before failing
+                    await asyncio.gather(*running, return_exceptions=True)
+                    return failed
+        except BaseException:
+            # Setup itself was cancelled or crashed; don't leave services running
+            for task in running:
+                task.cancel()
+            raise
+        return None
+
+    @staticmethod
+    def _record_phase(
+        span: DummySpan | Any,
+        service: BaseSetupService,
+        task: asyncio.Task[bool],
+        start_offset: float,
+    ) -> SetupPhase:
+        """Build the timing of a finished service and record it on the span."""
+        phase = SetupPhase(
+            name=service.name,
+            depends_on=service.depends_on,
+            start_ms=start_offset * 1000,
+            duration_ms=service.duration_ms or 0.0,
+            success=task.result(),
+        )
+        span.set_data(f"setup.{service.name}.start_ms", phase.start_ms)
+        span.set_data(f"setup.{service.name}.duration_ms", phase.duration_ms)
+        if phase.success:
             set_setup_phase_tag(span, service.name, "finished")
+        return phase
 
-        # Start monitoring
-        self.bot.task_monitor.start()
-        set_setup_phase_tag(span, "monitoring", "finished")
+    def _record_report(
+        self,
+        span: DummySpan | Any,
+        phases: list[SetupPhase],
+        start: float,
+    ) -> None:
+        """Store the startup report on the bot and the setup span."""
+        report = StartupReport(
+            phases=tuple(sorted(phases, key=lambda phase: phase.start_ms)),
+            total_ms=(time.perf_counter() - start) * 1000,
+        )
+        self.report = report
+        self.bot.startup_report = report
+        span.set_data("setup.total_ms", report.total_ms)
+        span.set_data("setup.sequential_ms", report.sequential_ms)
+        logger.info(
+            "Setup services finished in {:.0f}ms ({:.0f}ms if run in sequence)",
+            report.total_ms,
+            report.sequential_ms,
+        )
+
+    @staticmethod
+    def _raise_setup_failure(service: BaseSetupService) -> None:
+        """Raise the setup error for a failed service."""
+        # The underlying error is already logged and captured by safe_setup()
+        msg = f"{service.name.title()} setup failed"
+
+        if service.name == "database":
+            msg += (
+                ". Check logs and Sentry for the underlying error. "
+                "Common causes: database not running, incorrect connection "
+                "string, network issues, or migration failures. "
+                "Run migrations manually with 'uv run db push' if needed."
+            )
+            raise TuxDatabaseConnectionError(msg)
+
+        raise TuxSetupError(msg)
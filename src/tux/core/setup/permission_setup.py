@@ -10,6 +10,7 @@ from tux.cache import get_cache_backend
 from tux.core.permission_system import init_permission_system
 from tux.core.setup.base import BotSetupService
 from tux.database.controllers import DatabaseCoordinator
+from tux.database.controllers.permissions import share_permission_generations
 
 if TYPE_CHECKING:
     from tux.core.bot import Tux
@@ -21,6 +22,8 @@ __all__ = ["PermissionSetupService"]
 class PermissionSetupService(BotSetupService):
     """Handles permission system initialization during bot setup."""
 
+    depends_on = ("database", "cache")
+
     def __init__(self, bot: Tux, db_service: DatabaseService) -> None:
         """Initialize the permission setup service.
 
@@ -39,6 +42,8 @@ class PermissionSetupService(BotSetupService):
         logger.info("Initializing permission system...")
 
         cache_backend = get_cache_backend(self.bot)
+        # Permission writes in other processes must invalidate our indexes too
+        share_permission_generations(cache_backend)
         db_coordinator = DatabaseCoordinator(
             self.db_service,
             cache_backend=cache_backend,
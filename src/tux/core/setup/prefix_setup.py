@@ -18,6 +18,9 @@ __all__ = ["PrefixSetupService"]
 class PrefixSetupService(BotSetupService):
     """Handles prefix manager initialization during bot setup."""
 
+    # Loads prefixes through the database coordinator wired by the permission setup
+    depends_on = ("permissions",)
+
     def __init__(self, bot: Tux) -> None:
         """Initialize the prefix manager setup service.
 
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING, Any
 from discord.ext import tasks
 from loguru import logger
 
+from tux.core.loop_monitor import LoopLagMonitor
 from tux.services.sentry import capture_exception_safe
 from tux.services.sentry.tracing import start_span
 
@@ -42,10 +43,13 @@ class TaskMonitor:
         self.bot = bot
         # Create the background monitor loop bound to this instance
         self._monitor_loop = tasks.loop(seconds=60)(self._monitor_tasks_loop_impl)
+        # Event loop lag sampler and slow-callback watchdog
+        self.loop_monitor = LoopLagMonitor()
 
     def start(self) -> None:
-        """Start the background task monitoring loop."""
+        """Start the background task monitoring loop and loop lag monitor."""
         self._monitor_loop.start()
+        self.loop_monitor.start()
         logger.debug("Task monitoring started")
 
     def stop(self) -> None:
@@ -71,6 +75,10 @@ class TaskMonitor:
 
                 await self._process_finished_tasks(tasks_by_type)
 
+                # Publish listener latency and loop lag gathered since the last pass
+                self.bot.listener_profiler.push_metrics()
+                self.loop_monitor.push_metrics()
+
             except Exception as e:  # Catch-all: monitoring loop must not crash the bot
                 logger.error(f"Task monitoring failed: {e}")
                 capture_exception_safe(e)
@@ -125,6 +133,7 @@ class TaskMonitor:
         with start_span("bot.cleanup_tasks", "Cleaning up running tasks"):
             try:
                 await self._stop_task_loops()
+                await self.loop_monitor.stop()
 
                 # Use generator expression since tasks are only iterated once
                 all_tasks = (
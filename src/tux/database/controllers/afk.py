@@ -11,6 +11,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from tux.database.controllers.base import BaseController
+from tux.database.controllers.base.filters import any_of
 from tux.database.models import AFK
 
 if TYPE_CHECKING:
@@ -288,3 +289,35 @@ class AfkController(BaseController[AFK]):
                 & (AFK.until < now)  # type: ignore[arg-type]
             ),
         )
+
+    async def get_expired_afk_members_for_guilds(
+        self,
+        guild_ids: list[int],
+    ) -> list[AFK]:
+        """
+        Get expired temporary AFK entries across many guilds in one query.
+
+        Parameters
+        ----------
+        guild_ids : list[int]
+            Guilds to include (``guild_id = ANY(:ids)``).
+
+        Returns
+        -------
+        list[AFK]
+            Expired AFK records.
+        """
+        if not guild_ids:
+            return []
+
+        # Database stores naive UTC datetimes, use naive for comparison
+        now = datetime.now(UTC).replace(tzinfo=None)
+
+        return await self.find_all(
+            filters=(
+                any_of(AFK.guild_id, guild_ids)
+                & (AFK.perm_afk == False)  # noqa: E712 - Temporary AFK only
+                & (AFK.until.is_not(None))  # type: ignore[attr-defined]
+                & (AFK.until < now)  # type: ignore[arg-type]
+            ),
+        )
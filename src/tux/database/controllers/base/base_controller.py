@@ -287,7 +287,11 @@ class BaseController[ModelT]:
     # Bulk Operations - Lazy-loaded
     # ------------------------------------------------------------------
 
-    async def bulk_create(self, items: list[dict[str, Any]]) -> list[ModelT]:
+    async def bulk_create(
+        self,
+        items: list[dict[str, Any]],
+        chunk_size: int | None = None,
+    ) -> list[ModelT]:
         """
         Create multiple records in bulk.
 
@@ -296,9 +300,13 @@ class BaseController[ModelT]:
         list[ModelT]
             List of created records.
         """
-        return await self._get_bulk().bulk_create(items)
+        return await self._get_bulk().bulk_create(items, chunk_size)
 
-    async def bulk_update(self, updates: list[tuple[Any, dict[str, Any]]]) -> int:
+    async def bulk_update(
+        self,
+        updates: list[tuple[Any, dict[str, Any]]],
+        chunk_size: int | None = None,
+    ) -> int:
         """
         Update multiple records in bulk.
 
@@ -307,9 +315,13 @@ class BaseController[ModelT]:
         int
             Number of records updated.
         """
-        return await self._get_bulk().bulk_update(updates)
+        return await self._get_bulk().bulk_update(updates, chunk_size)
 
-    async def bulk_delete(self, record_ids: list[Any]) -> int:
+    async def bulk_delete(
+        self,
+        record_ids: list[Any],
+        chunk_size: int | None = None,
+    ) -> int:
         """
         Delete multiple records in bulk.
 
@@ -318,7 +330,7 @@ class BaseController[ModelT]:
         int
             Number of records deleted.
         """
-        return await self._get_bulk().bulk_delete(record_ids)
+        return await self._get_bulk().bulk_delete(record_ids, chunk_size)
 
     async def update_where(self, filters: Any, values: dict[str, Any]) -> int:
         """
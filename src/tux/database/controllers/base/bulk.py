@@ -1,8 +1,21 @@
-"""Bulk operations for database controllers."""
+"""Bulk operations for database controllers.
 
+All operations are set-based and chunked: each chunk of ``chunk_size`` rows is
+one statement (and one round trip), and counts come from the database
+``rowcount`` rather than from the input size.
+
+- Creates use ``INSERT ... RETURNING`` with executemany batching.
+- Updates use a single ``UPDATE ... FROM (VALUES ...)`` per chunk and column set.
+- Deletes use ``DELETE ... WHERE pk IN (...)`` per chunk.
+"""
+
+from collections.abc import Sequence
+from itertools import batched
 from typing import Any, TypeVar
 
 from loguru import logger
+from sqlalchemy import column, insert, tuple_
+from sqlalchemy import values as values_clause
 from sqlmodel import SQLModel, delete, update
 
 from tux.database.service import DatabaseService
@@ -11,11 +24,19 @@ from .filters import build_filters_for_model
 
 ModelT = TypeVar("ModelT", bound=SQLModel)
 
+# Rows per statement; keeps bind parameter counts well under PostgreSQL's limit
+DEFAULT_BULK_CHUNK_SIZE = 1000
+
 
 class BulkOperationsController[ModelT]:
     """Handles bulk create, update, and delete operations."""
 
-    def __init__(self, model: type[ModelT], db: DatabaseService) -> None:
+    def __init__(
+        self,
+        model: type[ModelT],
+        db: DatabaseService,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> None:
         """Initialize the bulk operations controller.
 
         Parameters
@@ -24,62 +45,133 @@ class BulkOperationsController[ModelT]:
             The SQLModel to perform bulk operations on.
         db : DatabaseService
             The database service instance.
+        chunk_size : int, optional
+            Default number of rows per statement.
         """
         self.model = model
         self.db = db
+        self.chunk_size = chunk_size
+        self._table = model.__table__  # type: ignore[attr-defined]
+        self._pk_columns = list(self._table.primary_key.columns)
+
+    def _pk_clause(self, record_ids: Sequence[Any]) -> Any:
+        """Build ``pk IN (...)`` for single or composite primary keys.
+
+        Returns
+        -------
+        Any
+            SQLAlchemy boolean clause.
+        """
+        if len(self._pk_columns) == 1:
+            return self._pk_columns[0].in_(record_ids)
+        return tuple_(*self._pk_columns).in_(record_ids)
+
+    def _pk_values(self, record_id: Any) -> tuple[Any, ...]:
+        """Normalize a record ID to a tuple matching the primary key columns.
 
-    async def bulk_create(self, items: list[dict[str, Any]]) -> list[ModelT]:
+        Returns
+        -------
+        tuple[Any, ...]
+            Primary key values.
+        """
+        return record_id if len(self._pk_columns) > 1 else (record_id,)
+
+    async def bulk_create(
+        self,
+        items: list[dict[str, Any]],
+        chunk_size: int | None = None,
+    ) -> list[ModelT]:
         """
         Create multiple records in bulk.
 
         Returns
         -------
         list[ModelT]
-            List of created records.
+            List of created records, in input order.
         """
+        if not items:
+            return []
+
         logger.debug(f"Bulk creating {len(items)} {self.model.__name__} records")
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        instances: list[ModelT] = []
         async with self.db.session() as session:
-            instances = [self.model(**item) for item in items]
-            session.add_all(instances)
+            for chunk in batched(items, chunk_size or self.chunk_size, strict=False):
+                result = await session.scalars(stmt, list(chunk))
+                instances.extend(result.all())
             await session.commit()
-
-            # Refresh all instances to get generated IDs
+            # Expunge the instances so they can be used in other sessions
             for instance in instances:
-                await session.refresh(instance)
+                session.expunge(instance)
 
-            logger.success(
-                f"Bulk created {len(instances)} {self.model.__name__} records",
-            )
-            return instances
+        logger.success(f"Bulk created {len(instances)} {self.model.__name__} records")
+        return instances
 
-    async def bulk_update(self, updates: list[tuple[Any, dict[str, Any]]]) -> int:
+    async def bulk_update(
+        self,
+        updates: list[tuple[Any, dict[str, Any]]],
+        chunk_size: int | None = None,
+    ) -> int:
         """
         Update multiple records in bulk.
 
+        Updates are grouped by the set of columns they change; each group is
+        written with one ``UPDATE ... FROM (VALUES ...)`` per chunk.
+
+        Parameters
+        ----------
+        updates : list[tuple[Any, dict[str, Any]]]
+            ``(record_id, values)`` pairs. ``record_id`` is a tuple for
+            composite primary keys.
+        chunk_size : int | None, optional
+            Rows per statement; defaults to the controller's chunk size.
+
         Returns
         -------
         int
             Number of records updated.
         """
+        if not updates:
+            return 0
+
         logger.debug(f"Bulk updating {len(updates)} {self.model.__name__} records")
-        async with self.db.session() as session:
-            updated_count = 0
+        groups: dict[tuple[str, ...], list[tuple[Any, ...]]] = {}
+        for record_id, changes in updates:
+            names = tuple(sorted(changes))
+            groups.setdefault(names, []).append(
+                (*self._pk_values(record_id), *(changes[name] for name in names)),
+            )
 
-            for record_id, values in updates:
-                stmt = (
-                    update(self.model)
-                    .where(self.model.id == record_id)  # type: ignore[attr-defined]
-                    .values(**values)
+        updated_count = 0
+        async with self.db.session() as session:
+            for names, rows in groups.items():
+                if not names:
+                    continue
+                source = values_clause(
+                    *(column(c.name, c.type) for c in self._pk_columns),
+                    *(column(name, self._table.c[name].type) for name in names),
+                    name="v",
                 )
-                await session.execute(stmt)
-                # In SQLAlchemy 2.0+, rowcount is not available. Count affected rows differently
-                updated_count += 1  # Assume each update affects 1 row if successful
-
+                for chunk in batched(rows, chunk_size or self.chunk_size, strict=False):
+                    data = source.data(list(chunk))
+                    stmt = (
+                        update(self.model)
+                        .where(*(c == data.c[c.name] for c in self._pk_columns))
+                        .values({name: data.c[name] for name in names})
+                        .execution_options(synchronize_session=False)
+                    )
+                    result = await session.execute(stmt)
+                    updated_count += result.rowcount  # type: ignore[attr-defined]
             await session.commit()
-            logger.info(f"Bulk updated {updated_count} {self.model.__name__} records")
-            return updated_count
 
-    async def bulk_delete(self, record_ids: list[Any]) -> int:
+        logger.info(f"Bulk updated {updated_count} {self.model.__name__} records")
+        return updated_count
+
+    async def bulk_delete(
+        self,
+        record_ids: list[Any],
+        chunk_size: int | None = None,
+    ) -> int:
         """
         Delete multiple records in bulk.
 
@@ -88,14 +180,26 @@ class BulkOperationsController[ModelT]:
         int
             Number of records deleted.
         """
+        if not record_ids:
+            return 0
+
         logger.debug(f"Bulk deleting {len(record_ids)} {self.model.__name__} records")
+        deleted_count = 0
         async with self.db.session() as session:
-            stmt = delete(self.model).where(self.model.id.in_(record_ids))  # type: ignore[attr-defined]
-            await session.execute(stmt)
+            for chunk in batched(
+                record_ids, chunk_size or self.chunk_size, strict=False
+            ):
+                stmt = (
+                    delete(self.model)
+                    .where(self._pk_clause(chunk))
+                    .execution_options(synchronize_session=False)
+                )
+                result = await session.execute(stmt)
+                deleted_count += result.rowcount  # type: ignore[attr-defined]
             await session.commit()
-            # In SQLAlchemy 2.0+, rowcount is not available. Use len(record_ids) as approximation
-            logger.info(f"Bulk deleted {len(record_ids)} {self.model.__name__} records")
-            return len(record_ids)
+
+        logger.info(f"Bulk deleted {deleted_count} {self.model.__name__} records")
+        return deleted_count
 
     async def update_where(self, filters: Any, values: dict[str, Any]) -> int:
         """
@@ -113,10 +217,9 @@ class BulkOperationsController[ModelT]:
             if filter_expr is not None:
                 stmt = stmt.where(filter_expr)
 
-            await session.execute(stmt)
+            result = await session.execute(stmt)
             await session.commit()
-            # In SQLAlchemy 2.0+, rowcount is not available. Return 0 as placeholder
-            return 0
+            return result.rowcount  # type: ignore[attr-defined]
 
     async def delete_where(self, filters: Any) -> int:
         """
@@ -136,9 +239,4 @@ class BulkOperationsController[ModelT]:
 
             result = await session.execute(stmt)
             await session.commit()
-            # In SQLAlchemy 2.0+, we can get rowcount from the result
-            return getattr(
-                result,
-                "rowcount",
-                1,
-            )  # fallback to 1 if rowcount not available
+            return result.rowcount  # type: ignore[attr-defined]
@@ -1,8 +1,10 @@
 """Shared filter utilities for database controllers."""
 
+from collections.abc import Sequence
 from typing import Any
 
-from sqlalchemy import BinaryExpression, and_
+from sqlalchemy import BigInteger, BinaryExpression, and_, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
 
 
 def build_filters_for_model(
@@ -53,3 +55,18 @@ def build_filters(filters: Any) -> Any:
 
     # Return single filter expression as-is
     return filters
+
+
+def any_of(column: Any, ids: Sequence[int]) -> Any:
+    """
+    Build ``column = ANY(:ids)`` with the IDs bound as a single array parameter.
+
+    Unlike ``IN (...)``, the statement text does not change with the number of
+    IDs, so one prepared statement serves any guild count.
+
+    Returns
+    -------
+    Any
+        SQLAlchemy boolean clause.
+    """
+    return column == any_(bindparam(None, list(ids), type_=ARRAY(BigInteger)))
@@ -1,7 +1,23 @@
-"""Upsert operations for database controllers."""
-
-from typing import Any, TypeVar
-
+"""Upsert operations for database controllers.
+
+Upserts whose filter keys exactly match one of the model's unique keys
+(primary key, ``UniqueConstraint`` or unique ``Index``) are executed as a
+single ``INSERT ... ON CONFLICT (...) DO UPDATE ... RETURNING`` statement.
+This is atomic, race-free and costs one round trip. Filters that do not match
+a unique key fall back to the find-then-write path.
+
+Get-or-create is read-mostly, so it selects first and writes nothing when
+the row exists. On a miss it inserts with ``ON CONFLICT DO NOTHING``, which
+neither locks nor rewrites a row a concurrent writer inserted first; that
+row is then selected again.
+"""
+
+from collections.abc import Iterable
+from functools import cached_property
+from typing import Any, TypeVar, cast
+
+from sqlalchemy import Boolean, Index, UniqueConstraint, func, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import SQLModel
 
@@ -12,6 +28,9 @@ from .query import QueryController
 
 ModelT = TypeVar("ModelT", bound=SQLModel)
 
+# xmax is 0 for a freshly inserted tuple and non-zero when ON CONFLICT updated it
+_INSERTED = literal_column("(xmax = 0)", Boolean).label("inserted")
+
 
 class UpsertController[ModelT]:
     """Handles upsert and get-or-create operations."""
@@ -29,6 +48,187 @@ class UpsertController[ModelT]:
         self.model = model
         self.db = db
 
+    @cached_property
+    def unique_keys(self) -> tuple[frozenset[str], ...]:
+        """
+        Column sets that uniquely identify a row of the model.
+
+        Collected from the primary key, unique constraints, single-column
+        ``unique=True`` columns and non-partial unique indexes.
+
+        Returns
+        -------
+        tuple[frozenset[str], ...]
+            Unique column name sets, primary key first.
+        """
+        table = self.model.__table__  # type: ignore[attr-defined]
+        keys: list[frozenset[str]] = [
+            frozenset(column.name for column in table.primary_key.columns),
+        ]
+        keys.extend(
+            frozenset(column.name for column in constraint.columns)
+            for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint)
+        )
+        keys.extend(
+            frozenset({column.name}) for column in table.columns if column.unique
+        )
+        keys.extend(
+            frozenset(column.name for column in index.columns)
+            for index in cast(set[Index], table.indexes)
+            # Expression and partial indexes cannot be used as a plain conflict target
+            if index.unique
+            and len(index.columns) == len(index.expressions)
+            and index.dialect_options["postgresql"].get("where") is None
+        )
+        return tuple(dict.fromkeys(key for key in keys if key))
+
+    def conflict_target(self, keys: Iterable[str]) -> list[str] | None:
+        """
+        Resolve the ON CONFLICT target for a set of filter keys.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            Column names the caller filters on.
+
+        Returns
+        -------
+        list[str] | None
+            Sorted conflict columns, or None if the keys are not exactly a
+            unique key of the model.
+        """
+        wanted = frozenset(keys)
+        return sorted(wanted) if wanted in self.unique_keys else None
+
+    def upsert_statement(
+        self,
+        conflict_columns: list[str],
+        values: dict[str, Any],
+        update_columns: list[str] | None = None,
+    ) -> Any:
+        """
+        Build an ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING`` statement.
+
+        Parameters
+        ----------
+        conflict_columns : list[str]
+            Columns of a unique key used as the ON CONFLICT target.
+        values : dict[str, Any]
+            Column values for the inserted row.
+        update_columns : list[str] | None, optional
+            Columns overwritten from ``values`` when the row already exists.
+            When empty, the existing row is returned unchanged.
+
+        Returns
+        -------
+        Any
+            Statement returning the model row and an ``inserted`` flag.
+        """
+        stmt = pg_insert(self.model).values(**values)
+        updates = [c for c in update_columns or [] if c not in conflict_columns]
+        if updates:
+            set_: dict[str, Any] = {c: stmt.excluded[c] for c in updates}
+            if "updated_at" in stmt.excluded and "updated_at" not in set_:
+                set_["updated_at"] = func.now()
+        else:
+            # DO NOTHING returns no row on conflict; a no-op assignment does
+            set_ = {conflict_columns[0]: stmt.excluded[conflict_columns[0]]}
+        return stmt.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_=set_,
+        ).returning(self.model, _INSERTED)
+
+    def insert_missing_statement(
+        self,
+        conflict_columns: list[str],
+        values: dict[str, Any],
+    ) -> Any:
+        """
+        Build an ``INSERT ... ON CONFLICT DO NOTHING ... RETURNING`` statement.
+
+        Parameters
+        ----------
+        conflict_columns : list[str]
+            Columns of a unique key used as the ON CONFLICT target.
+        values : dict[str, Any]
+            Column values for the inserted row.
+
+        Returns
+        -------
+        Any
+            Statement returning the inserted row, or no row on conflict.
+        """
+        return (
+            pg_insert(self.model)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=conflict_columns)
+            .returning(self.model)
+        )
+
+    async def insert_if_missing(
+        self,
+        conflict_columns: list[str],
+        values: dict[str, Any],
+    ) -> ModelT | None:
+        """
+        Insert a row unless one with the same unique key exists.
+
+        Parameters
+        ----------
+        conflict_columns : list[str]
+            Columns of a unique key used as the ON CONFLICT target.
+        values : dict[str, Any]
+            Column values for the inserted row.
+
+        Returns
+        -------
+        ModelT | None
+            The inserted record, or None if the row already existed.
+        """
+        stmt = self.insert_missing_statement(conflict_columns, values)
+
+        async with self.db.session() as session:
+            instance = (await session.execute(stmt)).scalar_one_or_none()
+            await session.commit()
+            if instance is not None:
+                # Expunge the instance so it can be used in other sessions
+                session.expunge(instance)
+            return instance
+
+    async def insert_on_conflict(
+        self,
+        conflict_columns: list[str],
+        values: dict[str, Any],
+        update_columns: list[str] | None = None,
+    ) -> tuple[ModelT, bool]:
+        """
+        Insert a row or update the conflicting row in one statement.
+
+        Parameters
+        ----------
+        conflict_columns : list[str]
+            Columns of a unique key used as the ON CONFLICT target.
+        values : dict[str, Any]
+            Column values for the inserted row.
+        update_columns : list[str] | None, optional
+            Columns overwritten from ``values`` when the row already exists.
+
+        Returns
+        -------
+        tuple[ModelT, bool]
+            Tuple of (record, created) where created is True if new record was created.
+        """
+        stmt = self.upsert_statement(conflict_columns, values, update_columns)
+
+        async with self.db.session() as session:
+            row = (await session.execute(stmt)).one()
+            instance, created = row[0], bool(row[1])
+            await session.commit()
+            # Expunge the instance so it can be used in other sessions
+            session.expunge(instance)
+            return instance, created
+
     async def upsert_by_field(
         self,
         field_name: str,
@@ -44,33 +244,7 @@ class UpsertController[ModelT]:
         tuple[ModelT, bool]
             Tuple of (record, created) where created is True if new record was created.
         """
-        query_controller = QueryController(self.model, self.db)
-
-        # Try to find existing record
-        filters = {field_name: field_value}
-        existing = await query_controller.find_one(filters)
-
-        if existing:
-            # Update existing record
-            update_data = {**kwargs}
-            if defaults:
-                update_data |= defaults
-
-            async with self.db.session() as session:
-                for key, value in update_data.items():
-                    setattr(existing, key, value)
-                await session.commit()
-                await session.refresh(existing)
-                return existing, False
-
-        # Create new record
-        create_data = {field_name: field_value, **kwargs}
-        if defaults:
-            create_data |= defaults
-
-        crud_controller = CrudController(self.model, self.db)
-        new_instance = await crud_controller.create(**create_data)
-        return new_instance, True
+        return await self.upsert({field_name: field_value}, defaults, **kwargs)
 
     async def upsert_by_id(
         self,
@@ -85,36 +259,8 @@ class UpsertController[ModelT]:
         -------
         tuple[ModelT, bool]
             Tuple of (record, created) where created is True if new record was created.
-
-        Raises
-        ------
-        RuntimeError
-            If updating an existing record fails.
         """
-        crud_controller = CrudController(self.model, self.db)
-
-        # Try to get existing record
-        existing = await crud_controller.get_by_id(record_id)
-
-        if existing:
-            # Update existing record
-            update_data = {**kwargs}
-            if defaults:
-                update_data |= defaults
-
-            updated = await crud_controller.update_by_id(record_id, **update_data)
-            if updated is None:
-                msg = f"Failed to update record with ID {record_id}"
-                raise RuntimeError(msg)
-            return updated, False
-
-        # Create new record
-        create_data = {"id": record_id, **kwargs}
-        if defaults:
-            create_data |= defaults
-
-        new_instance = await crud_controller.create(**create_data)
-        return new_instance, True
+        return await self.upsert({"id": record_id}, defaults, **kwargs)
 
     async def get_or_create_by_field(
         self,
@@ -131,23 +277,8 @@ class UpsertController[ModelT]:
         tuple[ModelT, bool]
             Tuple of (record, created) where created is True if new record was created.
         """
-        query_controller = QueryController(self.model, self.db)
-
-        # Try to find existing record
-        filters = {field_name: field_value}
-        existing = await query_controller.find_one(filters)
-
-        if existing:
-            return existing, False
-
-        # Create new record
-        create_data = {field_name: field_value, **kwargs}
-        if defaults:
-            create_data |= defaults
-
-        crud_controller = CrudController(self.model, self.db)
-        new_instance = await crud_controller.create(**create_data)
-        return new_instance, True
+        create_defaults = kwargs | (defaults or {})
+        return await self.get_or_create(create_defaults, **{field_name: field_value})
 
     async def get_or_create(
         self,
@@ -175,6 +306,15 @@ class UpsertController[ModelT]:
         if defaults:
             create_data |= defaults
 
+        if (target := self.conflict_target(filters)) is not None:
+            created = await self.insert_if_missing(target, create_data)
+            if created is not None:
+                return created, True
+            # Race: another writer inserted the row after our find_one
+            existing = await query_controller.find_one(filters)
+            if existing is not None:
+                return existing, False
+
         crud_controller = CrudController(self.model, self.db)
         try:
             new_instance = await crud_controller.create(**create_data)
@@ -201,17 +341,21 @@ class UpsertController[ModelT]:
         tuple[ModelT, bool]
             Tuple of (record, created) where created is True if new record was created.
         """
+        update_data = kwargs | (defaults or {})
+
+        if (target := self.conflict_target(filters)) is not None:
+            return await self.insert_on_conflict(
+                target,
+                filters | update_data,
+                list(update_data),
+            )
+
         query_controller = QueryController(self.model, self.db)
 
         # Try to find existing record
         existing = await query_controller.find_one(filters)
 
         if existing:
-            # Update existing record
-            update_data = {**kwargs}
-            if defaults:
-                update_data |= defaults
-
             async with self.db.session() as session:
                 # Merge the detached instance into this session
                 existing = await session.merge(existing)
@@ -224,10 +368,6 @@ class UpsertController[ModelT]:
                 return existing, False
 
         # Create new record
-        create_data = filters | kwargs
-        if defaults:
-            create_data |= defaults
-
         crud_controller = CrudController(self.model, self.db)
-        new_instance = await crud_controller.create(**create_data)
+        new_instance = await crud_controller.create(**(filters | update_data))
         return new_instance, True
@@ -15,6 +15,7 @@ from sqlalchemy import or_, select
 from sqlalchemy.orm import noload
 
 from tux.database.controllers.base import BaseController
+from tux.database.controllers.base.filters import any_of
 from tux.database.models import Case, Guild
 from tux.database.models.enums import CaseType as DBCaseType
 
@@ -184,10 +185,12 @@ class CaseController(BaseController[Case]):
                 guild = Guild(id=guild_id, case_count=0)
                 session.add(guild)
                 await session.flush()
-                logger.debug(f"Created new guild {guild_id} with case_count=0")
+                logger.debug("Created new guild {} with case_count=0", guild_id)
             else:
                 logger.debug(
-                    f"Locked guild {guild_id} with case_count={guild.case_count}",
+                    "Locked guild {} with case_count={}",
+                    guild_id,
+                    guild.case_count,
                 )
 
             # Increment case count to get the next case number
@@ -216,11 +219,11 @@ class CaseController(BaseController[Case]):
                 logger.warning(
                     f"Ignoring 'id' in kwargs (id={kwargs['id']}) - database will auto-generate the ID",
                 )
-            logger.debug(f"Additional kwargs for case creation: {filtered_kwargs}")
+            logger.debug("Additional kwargs for case creation: {}", filtered_kwargs)
             case_data.update(filtered_kwargs)
 
             # Create the case
-            logger.trace(f"Creating Case object with data: {case_data}")
+            logger.trace("Creating Case object with data: {}", case_data)
             case = Case(**case_data)
             session.add(case)
             await session.flush()
@@ -591,13 +594,15 @@ class CaseController(BaseController[Case]):
             True if the case was updated, False if not found
         """
         logger.debug(
-            f"Marking tempban case {case_id} as processed (setting case_processed=True)",
+            "Marking tempban case {} as processed (setting case_processed=True)",
+            case_id,
         )
         result = await self.update_by_id(case_id, case_processed=True)
         success = result is not None
         if success:
             logger.debug(
-                f"Case {case_id} marked as processed (case_processed=True, case_status unchanged)",
+                "Case {} marked as processed (case_processed=True, case_status unchanged)",
+                case_id,
             )
         return success
 
@@ -613,7 +618,9 @@ class CaseController(BaseController[Case]):
         """
         now = datetime.now(UTC)
         logger.trace(
-            f"Checking for unprocessed expired tempbans in guild {guild_id}, current time: {now}",
+            "Checking for unprocessed expired tempbans in guild {}, current time: {}",
+            guild_id,
+            now,
         )
 
         # Find valid, unprocessed tempban cases where case_expires_at is in the past
@@ -636,17 +643,52 @@ class CaseController(BaseController[Case]):
             )
             for case in expired_cases:
                 logger.debug(
-                    f"Unprocessed expired tempban: case_id={case.id}, user={case.case_user_id}, "
-                    f"expires_at={case.case_expires_at}, processed={case.case_processed}",
+                    "Unprocessed expired tempban: case_id={}, user={}, expires_at={}, processed={}",
+                    case.id,
+                    case.case_user_id,
+                    case.case_expires_at,
+                    case.case_processed,
                 )
         else:
             # TRACE for routine checks that find nothing
-            logger.trace(
-                f"No unprocessed expired tempbans found in guild {guild_id}",
-            )
+            logger.trace("No unprocessed expired tempbans found in guild {}", guild_id)
 
         return expired_cases
 
+    async def get_expired_tempbans_for_guilds(
+        self,
+        guild_ids: list[int],
+    ) -> list[Case]:
+        """
+        Get expired, unprocessed tempban cases across many guilds in one query.
+
+        Parameters
+        ----------
+        guild_ids : list[int]
+            Guilds to include (``guild_id = ANY(:ids)``).
+
+        Returns
+        -------
+        list[Case]
+            Valid, unprocessed tempban cases whose case_expires_at is in the past.
+        """
+        if not guild_ids:
+            return []
+
+        now = datetime.now(UTC)
+        # Type ignore for SQLAlchemy comparison operators on nullable fields
+        return await self.find_all(
+            filters=(
+                any_of(Case.guild_id, guild_ids)
+                & (Case.case_type == DBCaseType.TEMPBAN.value)
+                & (Case.case_status == True)  # noqa: E712 - Valid cases only
+                & (Case.case_processed == False)  # noqa: E712 - Not yet processed
+                & (Case.case_expires_at.is_not(None))  # type: ignore[attr-defined]
+                & (Case.case_expires_at < now)  # type: ignore[arg-type]
+            ),
+            order_by=[Case.case_expires_at],
+        )
+
     async def get_case_count_by_user(self, user_id: int, guild_id: int) -> int:
         """
         Get the total number of cases for a specific user in a guild.
@@ -7,15 +7,22 @@ settings, providing methods for guild lifecycle management and configuration upd
 
 from __future__ import annotations
 
+from itertools import batched
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+from sqlalchemy import BigInteger, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import noload
 
+from tux.cache import GuildConfigCacheManager
 from tux.database.controllers.base import BaseController
+from tux.database.controllers.base.bulk import DEFAULT_BULK_CHUNK_SIZE
 from tux.database.models import Guild, GuildConfig
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from tux.database.service import DatabaseService
@@ -58,6 +65,50 @@ class GuildController(BaseController[Guild]):
         guild, _ = await self.get_or_create(id=guild_id)
         return guild
 
+    async def register_guilds(self, guild_ids: Iterable[int]) -> list[int]:
+        """
+        Ensure a guild row exists for every ID, creating only the missing ones.
+
+        Existing IDs are found with one ``SELECT ... WHERE id = ANY(...)``;
+        the rest are inserted with ``INSERT ... ON CONFLICT DO NOTHING`` in
+        chunks, so registering guilds that are all known is one round trip.
+
+        Parameters
+        ----------
+        guild_ids : Iterable[int]
+            Discord guild IDs to register.
+
+        Returns
+        -------
+        list[int]
+            IDs of the guilds that were created.
+        """
+        ids = sorted(set(guild_ids))
+        if not ids:
+            return []
+
+        existing_stmt = select(Guild.id).where(
+            Guild.id == any_(bindparam("guild_ids", ids, type_=ARRAY(BigInteger))),
+        )
+        insert_stmt = (
+            pg_insert(Guild).on_conflict_do_nothing(index_elements=[Guild.id])
+        ).returning(Guild.id)
+
+        created: list[int] = []
+        async with self.db.session() as session:
+            existing = set((await session.scalars(existing_stmt)).all())
+            missing = [guild_id for guild_id in ids if guild_id not in existing]
+            if not missing:
+                return []
+            for chunk in batched(missing, DEFAULT_BULK_CHUNK_SIZE, strict=False):
+                # A concurrent join may insert a row first; RETURNING skips it
+                result = await session.scalars(
+                    insert_stmt.values([{"id": guild_id} for guild_id in chunk]),
+                )
+                created.extend(result.all())
+            await session.commit()
+        return created
+
     async def create_guild(self, guild_id: int) -> Guild:
         """
         Create a new guild.
@@ -73,12 +124,20 @@ class GuildController(BaseController[Guild]):
         """
         Delete a guild by ID.
 
+        The guild's config row is deleted with it, so the guild is cached as
+        having no config.
+
         Returns
         -------
         bool
             True if deleted successfully, False otherwise.
         """
-        return await self.delete_by_id(guild_id)
+        cache = GuildConfigCacheManager()
+        async with await cache.write_lock(guild_id):
+            deleted = await self.delete_by_id(guild_id)
+            if deleted:
+                await cache.put_snapshot(guild_id, None)
+        return deleted
 
     # GuildConfig methods using with_session for cross-model operations
     async def get_guild_config(self, guild_id: int) -> GuildConfig | None:
@@ -118,6 +177,7 @@ class GuildController(BaseController[Guild]):
 
         Uses row-level locking to prevent race conditions when multiple
         coroutines update different fields concurrently.
+        The resulting row is written through to the guild config snapshot cache.
 
         Returns
         -------
@@ -159,7 +219,11 @@ class GuildController(BaseController[Guild]):
             await session.refresh(config)
             return config
 
-        return await self.with_session(_op)
+        cache = GuildConfigCacheManager()
+        async with await cache.write_lock(guild_id):
+            config = await self.with_session(_op)
+            await cache.put_snapshot(guild_id, config.model_dump(mode="json"))
+        return config
 
     async def get_all_guilds(self) -> list[Guild]:
         """
@@ -213,11 +277,11 @@ class GuildController(BaseController[Guild]):
 
     async def delete_guild_by_id(self, guild_id: int) -> bool:
         """
-        Delete a guild by ID.
+        Delete a guild by ID - alias for delete_guild.
 
         Returns
         -------
         bool
             True if deleted successfully, False otherwise.
         """
-        return await self.delete_by_id(guild_id)
+        return await self.delete_guild(guild_id)
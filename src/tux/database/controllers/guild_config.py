@@ -3,22 +3,38 @@ Guild configuration management controller.
 
 This controller manages Discord guild configuration settings, including bot
 preferences, moderation settings, and feature toggles for each guild.
+
+Reads are served from a full-row :class:`~tux.cache.GuildConfigSnapshot` per
+guild, primed in bulk at startup and replaced (write-through) by every update,
+so config lookups on event paths don't query the database once warm.
 """
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
+from sqlalchemy import BigInteger, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
 
-from tux.cache import GuildConfigCacheManager
+from tux.cache import GuildConfigCacheManager, GuildConfigSnapshot
 from tux.database.controllers.base import BaseController
 from tux.database.models import GuildConfig
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
     from tux.database.service import DatabaseService
 
 
+def _snapshot_values(config: GuildConfig) -> dict[str, Any]:
+    """Return a config row's column values in cacheable (JSON) form."""
+    return config.model_dump(mode="json")
+
+
 class GuildConfigController(BaseController[GuildConfig]):
     """Clean GuildConfig controller using the new BaseController pattern."""
 
@@ -32,7 +48,84 @@ class GuildConfigController(BaseController[GuildConfig]):
         """
         super().__init__(GuildConfig, db)
 
-    # Simple, clean methods that use BaseController's CRUD operations
+    async def get_config_snapshot(self, guild_id: int) -> GuildConfigSnapshot:
+        """
+        Get the cached full config row of a guild, loading it on a miss.
+
+        Parameters
+        ----------
+        guild_id : int
+            The guild ID.
+
+        Returns
+        -------
+        GuildConfigSnapshot
+            Immutable snapshot of the row (``exists`` is False without a row).
+        """
+        cache = GuildConfigCacheManager()
+        if (snapshot := await cache.get_snapshot(guild_id)) is not None:
+            return snapshot
+
+        version = cache.snapshot_version(guild_id)
+        config = await self.get_by_id(guild_id)
+        logger.trace("Guild config snapshot loaded from DB for guild {}", guild_id)
+        return await cache.fill_snapshot(
+            guild_id,
+            _snapshot_values(config) if config is not None else None,
+            version,
+        )
+
+    async def prime_cache(self, guild_ids: Iterable[int]) -> int:
+        """
+        Load the config snapshots of many guilds with one query.
+
+        Guilds without a config row are cached as missing, so later lookups
+        for them don't query the database either.
+
+        Parameters
+        ----------
+        guild_ids : Iterable[int]
+            Guild IDs to load, e.g. every guild the bot is in.
+
+        Returns
+        -------
+        int
+            Number of snapshots cached.
+        """
+        ids = list(dict.fromkeys(guild_ids))
+        if not ids:
+            return 0
+
+        cache = GuildConfigCacheManager()
+        versions = {guild_id: cache.snapshot_version(guild_id) for guild_id in ids}
+
+        async def _op(session: AsyncSession) -> list[GuildConfig]:
+            """Select the config rows of all requested guilds."""
+            stmt = select(GuildConfig).where(
+                GuildConfig.id  # type: ignore[arg-type]
+                == any_(bindparam("guild_ids", ids, type_=ARRAY(BigInteger))),
+            )
+            return list((await session.execute(stmt)).scalars().all())
+
+        start = time.perf_counter()
+        configs = {config.id: config for config in await self.with_session(_op)}
+        primed = await cache.fill_snapshots(
+            {
+                guild_id: _snapshot_values(config)
+                if (config := configs.get(guild_id)) is not None
+                else None
+                for guild_id in ids
+            },
+            versions,
+        )
+        logger.debug(
+            "Primed {} guild config snapshots ({} rows) in {:.1f}ms",
+            primed,
+            len(configs),
+            (time.perf_counter() - start) * 1000,
+        )
+        return primed
+
     async def get_config_by_guild_id(self, guild_id: int) -> GuildConfig | None:
         """
         Get guild configuration by guild ID.
@@ -40,9 +133,12 @@ class GuildConfigController(BaseController[GuildConfig]):
         Returns
         -------
         GuildConfig | None
-            The guild configuration if found, None otherwise.
+            A detached copy of the guild configuration if found, None otherwise.
         """
-        return await self.get_by_id(guild_id)
+        snapshot = await self.get_config_snapshot(guild_id)
+        if snapshot.values is None:
+            return None
+        return GuildConfig.model_validate(dict(snapshot.values))
 
     async def get_or_create_config(self, guild_id: int, **defaults: Any) -> GuildConfig:
         """
@@ -55,54 +151,50 @@ class GuildConfigController(BaseController[GuildConfig]):
         """
         # Note: Guild existence should be ensured at a higher level (service/application)
         # This method assumes the guild exists to avoid circular dependencies
-        config, _ = await self.get_or_create(defaults=defaults, id=guild_id)
+        cache = GuildConfigCacheManager()
+        version = cache.snapshot_version(guild_id)
+        config, created = await self.get_or_create(defaults=defaults, id=guild_id)
+        if created:
+            await cache.put_snapshot(guild_id, _snapshot_values(config))
+        else:
+            await cache.fill_snapshot(guild_id, _snapshot_values(config), version)
         return config
 
     async def update_config(self, guild_id: int, **updates: Any) -> GuildConfig | None:
         """
         Update guild configuration.
 
-        Automatically invalidates the guild config cache if log channel IDs are updated.
+        Writes the updated row through to the guild config snapshot cache.
 
         Returns
         -------
         GuildConfig | None
             The updated configuration, or None if not found.
         """
-        result = await self.update_by_id(guild_id, **updates)
-
-        # Invalidate cache if log channel IDs or jail config were updated
-        if result and any(
-            field in updates
-            for field in (
-                "audit_log_id",
-                "mod_log_id",
-                "join_log_id",
-                "private_log_id",
-                "report_log_id",
-                "dev_log_id",
-                "jail_role_id",
-                "jail_channel_id",
-            )
-        ):
-            await GuildConfigCacheManager().invalidate(guild_id)
-
+        cache = GuildConfigCacheManager()
+        # Serialize per guild so snapshots are replaced in commit order
+        async with await cache.write_lock(guild_id):
+            result = await self.update_by_id(guild_id, **updates)
+            if result is not None:
+                await cache.put_snapshot(guild_id, _snapshot_values(result))
         return result
 
     async def delete_config(self, guild_id: int) -> bool:
         """
         Delete guild configuration.
 
-        Automatically invalidates the guild config cache on successful deletion.
+        Caches the guild as having no config on successful deletion.
 
         Returns
         -------
         bool
             True if deleted successfully, False otherwise.
         """
-        result = await self.delete_by_id(guild_id)
-        if result:
-            await GuildConfigCacheManager().invalidate(guild_id)
+        cache = GuildConfigCacheManager()
+        async with await cache.write_lock(guild_id):
+            result = await self.delete_by_id(guild_id)
+            if result:
+                await cache.put_snapshot(guild_id, None)
         return result
 
     async def get_all_configs(self) -> list[GuildConfig]:
@@ -153,7 +245,7 @@ class GuildConfigController(BaseController[GuildConfig]):
         """
         Update a specific field in guild configuration.
 
-        Automatically invalidates the guild config cache if log channel IDs are updated.
+        Writes the updated row through to the guild config snapshot cache.
 
         Returns
         -------
@@ -176,7 +268,7 @@ class GuildConfigController(BaseController[GuildConfig]):
         GuildConfig | None
             The updated configuration, or None if not found.
         """
-        return await self.update_by_id(guild_id, onboarding_stage=stage)
+        return await self.update_config(guild_id, onboarding_stage=stage)
 
     async def mark_onboarding_completed(self, guild_id: int) -> GuildConfig | None:
         """
@@ -187,7 +279,7 @@ class GuildConfigController(BaseController[GuildConfig]):
         GuildConfig | None
             The updated configuration, or None if not found.
         """
-        return await self.update_by_id(
+        return await self.update_config(
             guild_id,
             onboarding_completed=True,
             onboarding_stage="completed",
@@ -202,7 +294,7 @@ class GuildConfigController(BaseController[GuildConfig]):
         GuildConfig | None
             The updated configuration, or None if not found.
         """
-        return await self.update_by_id(
+        return await self.update_config(
             guild_id,
             onboarding_completed=False,
             onboarding_stage="not_started",
@@ -217,9 +309,11 @@ class GuildConfigController(BaseController[GuildConfig]):
         tuple[bool, str | None]
             Tuple of (completed, stage) for the guild's onboarding status.
         """
-        config = await self.get_config_by_guild_id(guild_id)
-        if config:
-            return config.onboarding_completed, config.onboarding_stage
+        snapshot = await self.get_config_snapshot(guild_id)
+        if snapshot.exists:
+            return snapshot.get("onboarding_completed", False), snapshot.get(
+                "onboarding_stage",
+            )
         return False, None
 
     async def update_channel_field(
@@ -295,30 +389,18 @@ class GuildConfigController(BaseController[GuildConfig]):
         Any
             The field value, or None if configuration or field not found.
         """
-        config = await self.get_config_by_guild_id(guild_id)
-        return getattr(config, field_name, None) if config else None
+        return (await self.get_config_snapshot(guild_id)).get(field_name)
 
     async def get_jail_role_id(self, guild_id: int) -> int | None:
         """
         Get jail role ID for a guild.
 
-        Uses cache to avoid database queries when possible.
-
         Returns
         -------
         int | None
             The jail role ID, or None if not configured.
         """
-        # Check cache first
-        cached = await GuildConfigCacheManager().get(guild_id)
-        if cached is not None and "jail_role_id" in cached:
-            return cached["jail_role_id"]
-
-        # Cache miss - fetch from database
-        jail_role_id = await self.get_config_field(guild_id, "jail_role_id")
-        # Update cache (only jail_role_id, don't touch other fields)
-        await GuildConfigCacheManager().set(guild_id, jail_role_id=jail_role_id)
-        return jail_role_id
+        return await self.get_config_field(guild_id, "jail_role_id")
 
     # TODO: Remove/rename after investigation of use
     async def get_perm_level_role(self, guild_id: int, perm_level: str) -> int | None:
@@ -336,29 +418,16 @@ class GuildConfigController(BaseController[GuildConfig]):
         """
         Get jail channel ID for a guild.
 
-        Uses cache to avoid database queries when possible.
-
         Returns
         -------
         int | None
             The jail channel ID, or None if not configured.
         """
-        # Check cache first
-        cached = await GuildConfigCacheManager().get(guild_id)
-        if cached is not None and "jail_channel_id" in cached:
-            return cached["jail_channel_id"]
-
-        # Cache miss - fetch from database
-        jail_channel_id = await self.get_config_field(guild_id, "jail_channel_id")
-        # Update cache (only jail_channel_id, don't touch other fields)
-        await GuildConfigCacheManager().set(guild_id, jail_channel_id=jail_channel_id)
-        return jail_channel_id
+        return await self.get_config_field(guild_id, "jail_channel_id")
 
     async def get_jail_config(self, guild_id: int) -> tuple[int | None, int | None]:
         """
-        Get both jail role ID and jail channel ID in one query.
-
-        Uses cache to avoid database queries when possible.
+        Get both jail role ID and jail channel ID from one snapshot.
 
         Parameters
         ----------
@@ -370,27 +439,8 @@ class GuildConfigController(BaseController[GuildConfig]):
         tuple[int | None, int | None]
             A tuple of (jail_role_id, jail_channel_id).
         """
-        # Check cache first
-        cached = await GuildConfigCacheManager().get(guild_id)
-        if cached is not None:
-            jail_role_id = cached.get("jail_role_id")
-            jail_channel_id = cached.get("jail_channel_id")
-            # If both are in cache (even if None), return them
-            if "jail_role_id" in cached and "jail_channel_id" in cached:
-                return jail_role_id, jail_channel_id
-
-        # Cache miss - fetch from database in one query
-        config = await self.get_config_by_guild_id(guild_id)
-        jail_role_id = getattr(config, "jail_role_id", None) if config else None
-        jail_channel_id = getattr(config, "jail_channel_id", None) if config else None
-
-        # Update cache with both values
-        await GuildConfigCacheManager().set(
-            guild_id,
-            jail_role_id=jail_role_id,
-            jail_channel_id=jail_channel_id,
-        )
-        return jail_role_id, jail_channel_id
+        snapshot = await self.get_config_snapshot(guild_id)
+        return snapshot.get("jail_role_id"), snapshot.get("jail_channel_id")
 
     # Channel update methods for UI compatibility
     async def update_private_log_id(
@@ -618,12 +668,7 @@ class GuildConfigController(BaseController[GuildConfig]):
         guild_id: int,
     ) -> tuple[int | None, int | None]:
         """
-        Get both audit log and mod log channel IDs in a single query.
-
-        This method is more efficient than calling get_audit_log_id and
-        get_mod_log_id separately, as it fetches the entire config once.
-
-        Uses cache to avoid database queries when possible.
+        Get both audit log and mod log channel IDs from one snapshot.
 
         Parameters
         ----------
@@ -635,52 +680,8 @@ class GuildConfigController(BaseController[GuildConfig]):
         tuple[int | None, int | None]
             Tuple of (audit_log_id, mod_log_id).
         """
-        # Check cache first
-        cached = await GuildConfigCacheManager().get(guild_id)
-        if cached is not None:
-            # If cache exists, check if we have the log channel IDs
-            # They might be None (not configured), which is valid
-            audit_log_id = cached.get("audit_log_id")
-            mod_log_id = cached.get("mod_log_id")
-            # Return cached values if both keys exist (even if values are None)
-            # This handles the case where they're explicitly set to None (not configured)
-            if "audit_log_id" in cached and "mod_log_id" in cached:
-                logger.debug(
-                    f"get_log_channel_ids: Cache hit for guild {guild_id} "
-                    f"(audit_log_id={audit_log_id}, mod_log_id={mod_log_id}, "
-                    f"cache_keys={list(cached.keys())})",
-                )
-                return audit_log_id, mod_log_id
-
-        # Cache miss or partial cache - fetch from database in one query
-        # This ensures we always get fresh data from DB when cache is incomplete
-        config = await self.get_config_by_guild_id(guild_id)
-        if not config:
-            # No config exists - cache None values and return
-            await GuildConfigCacheManager().set(
-                guild_id,
-                audit_log_id=None,
-                mod_log_id=None,
-            )
-            return None, None
-
-        # Get values directly from config object
-        audit_log_id = config.audit_log_id
-        mod_log_id = config.mod_log_id
-
-        # Log for debugging
-        logger.debug(
-            f"get_log_channel_ids: Fetched from DB for guild {guild_id} "
-            f"(audit_log_id={audit_log_id}, mod_log_id={mod_log_id})",
-        )
-
-        # Update cache with both values (preserves existing jail fields if any)
-        await GuildConfigCacheManager().set(
-            guild_id,
-            audit_log_id=audit_log_id,
-            mod_log_id=mod_log_id,
-        )
-        return audit_log_id, mod_log_id
+        snapshot = await self.get_config_snapshot(guild_id)
+        return snapshot.get("audit_log_id"), snapshot.get("mod_log_id")
 
     async def get_private_log_id(self, guild_id: int) -> int | None:
         """
@@ -754,8 +755,8 @@ class GuildConfigController(BaseController[GuildConfig]):
         int | None
             The log channel ID for the specified type, or None if not found.
         """
-        config = await self.get_config_by_guild_id(guild_id)
-        if not config:
+        snapshot = await self.get_config_snapshot(guild_id)
+        if not snapshot.exists:
             return None
 
         # Map log types to config fields
@@ -769,8 +770,7 @@ class GuildConfigController(BaseController[GuildConfig]):
         }
 
         if log_type and log_type in log_type_mapping:
-            field_name = log_type_mapping[log_type]
-            return getattr(config, field_name, None)
+            return snapshot.get(log_type_mapping[log_type])
 
         # Default to mod_log_id
-        return getattr(config, "mod_log_id", None)
+        return snapshot.get("mod_log_id")
@@ -7,12 +7,15 @@ information for guilds, supporting features like leveling systems and leaderboar
 
 from __future__ import annotations
 
-import contextlib
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
 from tux.database.controllers.base import BaseController
 from tux.database.models import Levels
+from tux.database.xp_ledger import XpLedger
 
 if TYPE_CHECKING:
     from tux.database.service import DatabaseService
@@ -30,6 +33,8 @@ class LevelsController(BaseController[Levels]):
             The database service instance. If None, uses the default service.
         """
         super().__init__(Levels, db)
+        # Write-behind store for message XP grants (see tux.database.xp_ledger)
+        self.ledger = XpLedger(self)
 
     # Simple, clean methods that use BaseController's CRUD operations
     async def get_levels_by_member(
@@ -45,6 +50,8 @@ class LevelsController(BaseController[Levels]):
         Levels | None
             The levels record if found, None otherwise.
         """
+        # Make unflushed XP grants visible to readers
+        await self.ledger.flush_member(member_id, guild_id)
         return await self.find_one(
             filters=(Levels.member_id == member_id) & (Levels.guild_id == guild_id),
         )
@@ -58,17 +65,19 @@ class LevelsController(BaseController[Levels]):
         Levels
             The levels record for the member.
         """
-        levels = await self.get_levels_by_member(member_id, guild_id)
-        if levels is not None:
-            return levels
-        return await self.create(
+        # Make unflushed XP grants visible before reading the row
+        await self.ledger.flush_member(member_id, guild_id)
+        levels, _ = await self.get_or_create(
+            defaults={
+                "xp": 0.0,
+                "level": 0,
+                "blacklisted": False,
+                "last_message": datetime.now(UTC).replace(tzinfo=None),
+            },
             member_id=member_id,
             guild_id=guild_id,
-            xp=0.0,
-            level=0,
-            blacklisted=False,
-            last_message=datetime.now(UTC),
         )
+        return levels
 
     async def add_xp(self, member_id: int, guild_id: int, xp_amount: float) -> Levels:
         """
@@ -79,19 +88,20 @@ class LevelsController(BaseController[Levels]):
         Levels
             The updated levels record.
         """
-        levels = await self.get_or_create_levels(member_id, guild_id)
-        new_xp = levels.xp + xp_amount
-        new_level = int(new_xp**0.5)  # Simple level calculation
-
-        return (
-            await self.update_by_id(
-                levels.member_id,
-                xp=new_xp,
-                level=new_level,
-                last_message=datetime.now(UTC),
+        async with self.ledger.direct_write(member_id, guild_id):
+            levels = await self.get_or_create_levels(member_id, guild_id)
+            new_xp = levels.xp + xp_amount
+            new_level = int(new_xp**0.5)  # Simple level calculation
+
+            return (
+                await self.update_by_id(
+                    levels.member_id,
+                    xp=new_xp,
+                    level=new_level,
+                    last_message=datetime.now(UTC),
+                )
+                or levels
             )
-            or levels
-        )
 
     async def set_xp(self, member_id: int, guild_id: int, xp: float) -> Levels:
         """
@@ -102,18 +112,19 @@ class LevelsController(BaseController[Levels]):
         Levels
             The updated levels record.
         """
-        levels = await self.get_or_create_levels(member_id, guild_id)
-        new_level = int(xp**0.5)
-
-        return (
-            await self.update_by_id(
-                levels.member_id,
-                xp=xp,
-                level=new_level,
-                last_message=datetime.now(UTC),
+        async with self.ledger.direct_write(member_id, guild_id):
+            levels = await self.get_or_create_levels(member_id, guild_id)
+            new_level = int(xp**0.5)
+
+            return (
+                await self.update_by_id(
+                    levels.member_id,
+                    xp=xp,
+                    level=new_level,
+                    last_message=datetime.now(UTC),
+                )
+                or levels
             )
-            or levels
-        )
 
     async def set_level(self, member_id: int, guild_id: int, level: int) -> Levels:
         """
@@ -124,18 +135,19 @@ class LevelsController(BaseController[Levels]):
         Levels
             The updated levels record.
         """
-        levels = await self.get_or_create_levels(member_id, guild_id)
-        xp = level**2  # Reverse level calculation
-
-        return (
-            await self.update_by_id(
-                levels.member_id,
-                xp=xp,
-                level=level,
-                last_message=datetime.now(UTC),
+        async with self.ledger.direct_write(member_id, guild_id):
+            levels = await self.get_or_create_levels(member_id, guild_id)
+            xp = level**2  # Reverse level calculation
+
+            return (
+                await self.update_by_id(
+                    levels.member_id,
+                    xp=xp,
+                    level=level,
+                    last_message=datetime.now(UTC),
+                )
+                or levels
             )
-            or levels
-        )
 
     async def blacklist_member(self, member_id: int, guild_id: int) -> Levels:
         """
@@ -146,8 +158,9 @@ class LevelsController(BaseController[Levels]):
         Levels
             The updated levels record.
         """
-        levels = await self.get_or_create_levels(member_id, guild_id)
-        return await self.update_by_id(levels.member_id, blacklisted=True) or levels
+        async with self.ledger.direct_write(member_id, guild_id):
+            levels = await self.get_or_create_levels(member_id, guild_id)
+            return await self.update_by_id(levels.member_id, blacklisted=True) or levels
 
     async def unblacklist_member(self, member_id: int, guild_id: int) -> Levels:
         """
@@ -158,10 +171,13 @@ class LevelsController(BaseController[Levels]):
         Levels
             The updated levels record.
         """
-        levels = await self.get_levels_by_member(member_id, guild_id)
-        if levels is None:
-            return await self.get_or_create_levels(member_id, guild_id)
-        return await self.update_by_id(levels.member_id, blacklisted=False) or levels
+        async with self.ledger.direct_write(member_id, guild_id):
+            levels = await self.get_levels_by_member(member_id, guild_id)
+            if levels is None:
+                return await self.get_or_create_levels(member_id, guild_id)
+            return (
+                await self.update_by_id(levels.member_id, blacklisted=False) or levels
+            )
 
     async def get_top_members(self, guild_id: int, limit: int = 10) -> list[Levels]:
         """
@@ -172,6 +188,8 @@ class LevelsController(BaseController[Levels]):
         list[Levels]
             List of top members sorted by XP (highest first).
         """
+        # Leaderboards must include unflushed XP grants
+        await self.ledger.flush()
         # Use database-level sorting and limiting for better performance
         return await self.find_all(
             filters=Levels.guild_id == guild_id,
@@ -233,21 +251,56 @@ class LevelsController(BaseController[Levels]):
             error_msg = "xp_amount, new_level, and last_message are required"
             raise ValueError(error_msg)
 
-        # Single UPDATE; for new users the update affects 0 rows so we fall back to create
-        await self.update_where(
-            (Levels.member_id == member_id) & (Levels.guild_id == guild_id),
-            {"xp": xp_amount, "level": new_level, "last_message": last_message},
-        )
-        # Ensure record exists (no-op for existing users due to unique constraint)
-        with contextlib.suppress(Exception):
-            await self.create(
-                member_id=member_id,
-                guild_id=guild_id,
-                xp=xp_amount,
-                level=new_level,
-                last_message=last_message,
+        # Single INSERT ... ON CONFLICT DO UPDATE (creates the row for new users)
+        async with self.ledger.direct_write(member_id, guild_id):
+            await self.upsert_xp_batch(
+                [
+                    {
+                        "member_id": member_id,
+                        "guild_id": guild_id,
+                        "xp": xp_amount,
+                        "level": new_level,
+                        "blacklisted": False,
+                        "last_message": last_message,
+                    },
+                ],
             )
 
+    async def upsert_xp_batch(self, rows: list[dict[str, Any]]) -> int:
+        """
+        Write XP, level and last message for many members in one statement.
+
+        Existing rows keep their blacklist status; new rows are inserted with
+        the values given.
+
+        Parameters
+        ----------
+        rows : list[dict[str, Any]]
+            Rows with member_id, guild_id, xp, level, blacklisted and last_message.
+
+        Returns
+        -------
+        int
+            Number of rows inserted or updated.
+        """
+        if not rows:
+            return 0
+
+        stmt = pg_insert(Levels).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Levels.member_id, Levels.guild_id],
+            set_={
+                "xp": stmt.excluded.xp,
+                "level": stmt.excluded.level,
+                "last_message": stmt.excluded.last_message,
+                "updated_at": func.now(),
+            },
+        )
+        async with self.db.session() as session:
+            result = await session.execute(stmt)
+            await session.commit()
+            return result.rowcount  # type: ignore[attr-defined]
+
     async def reset_xp(self, member_id: int, guild_id: int) -> Levels:
         """
         Reset XP and level for a member.
@@ -258,10 +311,11 @@ class LevelsController(BaseController[Levels]):
             The updated levels record with XP and level reset to 0.
         """
         # Use composite key for update
-        await self.update_where(
-            (Levels.member_id == member_id) & (Levels.guild_id == guild_id),
-            {"xp": 0.0, "level": 0},
-        )
+        async with self.ledger.direct_write(member_id, guild_id):
+            await self.update_where(
+                (Levels.member_id == member_id) & (Levels.guild_id == guild_id),
+                {"xp": 0.0, "level": 0},
+            )
         # Return updated record
         return await self.get_or_create_levels(member_id, guild_id)
 
@@ -274,13 +328,14 @@ class LevelsController(BaseController[Levels]):
         bool
             The new blacklist status.
         """
-        levels = await self.get_or_create_levels(member_id, guild_id)
-        new_status = not levels.blacklisted
-        # Use composite key for update
-        await self.update_where(
-            (Levels.member_id == member_id) & (Levels.guild_id == guild_id),
-            {"blacklisted": new_status},
-        )
+        async with self.ledger.direct_write(member_id, guild_id):
+            levels = await self.get_or_create_levels(member_id, guild_id)
+            new_status = not levels.blacklisted
+            # Use composite key for update
+            await self.update_where(
+                (Levels.member_id == member_id) & (Levels.guild_id == guild_id),
+                {"blacklisted": new_status},
+            )
         return new_status
 
     # Additional methods that module files expect
@@ -355,6 +410,8 @@ class LevelsController(BaseController[Levels]):
         if levels is None or levels.blacklisted:
             return -1
 
+        # Rank against unflushed XP of other members too
+        await self.ledger.flush()
         # Count members with higher XP
         higher_count = await self.count(
             filters=(Levels.guild_id == guild_id)
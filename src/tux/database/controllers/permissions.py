@@ -7,13 +7,18 @@ servers to customize their permission levels and role assignments.
 
 from __future__ import annotations
 
+import contextlib
+from collections import Counter
+from collections.abc import Collection
 from typing import TYPE_CHECKING, Any, cast
 
 import discord
 from loguru import logger
-from sqlmodel import select
+from sqlalchemy import BigInteger, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlmodel import SQLModel, select
 
-from tux.cache import TTLCache
+from tux.cache import TieredBackend, TTLCache
 from tux.database.controllers.base import BaseController
 from tux.database.models.models import (
     PermissionAssignment,
@@ -31,6 +36,127 @@ PERM_KEY_PREFIX = "perm:"
 PERM_RANKS_TTL = 7200.0  # 2 hours
 # User rank (derived from roles); invalidated when assignments change.
 PERM_USER_RANK_TTL = 7200.0  # 2 hours
+# Rows fetched per round trip when streaming permission tables for many guilds
+PERM_STREAM_BATCH_SIZE = 1000
+
+# Shared counter per guild, bumped with every write to the permission tables
+PERM_GENERATION_KEY_PREFIX = f"{PERM_KEY_PREFIX}generation:"
+
+
+class _PermissionGenerations:
+    """Per-guild permission generations as seen by this process."""
+
+    __slots__ = ("backend", "epoch", "guilds")
+
+    def __init__(self) -> None:
+        """Start every guild at generation 0 with no shared backend."""
+        self.epoch = 0
+        self.guilds: Counter[int] = Counter()
+        self.backend: TieredBackend | None = None
+
+    def on_remote_invalidation(
+        self, keys: list[str], prefixes: tuple[str, ...]
+    ) -> None:
+        """Apply generation bumps published by other processes."""
+        if any(PERM_GENERATION_KEY_PREFIX.startswith(prefix) for prefix in prefixes):
+            # Every guild may have changed (e.g. missed messages)
+            self.epoch += 1
+        for key in keys:
+            if key.startswith(PERM_GENERATION_KEY_PREFIX):
+                with contextlib.suppress(ValueError):
+                    self.guilds[int(key.removeprefix(PERM_GENERATION_KEY_PREFIX))] += 1
+
+
+# In-memory indexes compiled from an older generation are discarded; bumps
+# are published through the shared cache so every process sees them.
+_permission_generations = _PermissionGenerations()
+
+
+def get_permission_generation(guild_id: int) -> int:
+    """
+    Return the current permission generation for a guild.
+
+    Returns
+    -------
+    int
+        Counter that grows with every permission change, local or published
+        by another process; 0 until the guild's permissions first change.
+    """
+    return _permission_generations.epoch + _permission_generations.guilds[guild_id]
+
+
+async def bump_permission_generation(guild_id: int) -> int:
+    """
+    Mark a guild's permission data as changed, here and in other processes.
+
+    Returns
+    -------
+    int
+        The new local generation.
+    """
+    _permission_generations.guilds[guild_id] += 1
+    if (backend := _permission_generations.backend) is not None:
+        try:
+            await backend.incr(f"{PERM_GENERATION_KEY_PREFIX}{guild_id}")
+        except Exception as e:
+            # Other processes catch up when their indexes are rebuilt
+            logger.warning(
+                f"Failed to publish permission change for guild {guild_id}: {e}",
+            )
+    return get_permission_generation(guild_id)
+
+
+def share_permission_generations(backend: AsyncCacheBackendProtocol) -> None:
+    """
+    Share permission generations with other bot processes through a backend.
+
+    Only a :class:`~tux.cache.TieredBackend` reaches other processes; with an
+    in-memory backend generations stay process-local, which is all a single
+    process needs.
+
+    Parameters
+    ----------
+    backend : AsyncCacheBackendProtocol
+        The bot's cache backend.
+    """
+    if not isinstance(backend, TieredBackend):
+        return
+    _permission_generations.backend = backend
+    backend.add_invalidation_listener(_permission_generations.on_remote_invalidation)
+
+
+async def _load_by_guild[ModelT: SQLModel](
+    controller: BaseController[ModelT],
+    guild_ids: Collection[int],
+    *order_by: Any,
+) -> dict[int, list[ModelT]]:
+    """
+    Stream a permission table for many guilds in one query, grouped by guild.
+
+    Returns
+    -------
+    dict[int, list[ModelT]]
+        Rows per guild ID; every requested guild is present, possibly empty.
+    """
+    model = cast(Any, controller.model)
+    grouped: dict[int, list[ModelT]] = {guild_id: [] for guild_id in guild_ids}
+    if not grouped:
+        return grouped
+
+    stmt = (
+        select(model)
+        .where(
+            model.guild_id
+            == any_(bindparam("guild_ids", list(grouped), type_=ARRAY(BigInteger))),
+        )
+        .order_by(model.guild_id, *order_by)
+        .execution_options(yield_per=PERM_STREAM_BATCH_SIZE)
+    )
+    async with controller.db.session() as session:
+        result = await session.stream_scalars(stmt)
+        async for row in result:
+            grouped[row.guild_id].append(row)
+    return grouped
 
 
 class PermissionRankController(BaseController[PermissionRank]):
@@ -74,7 +200,10 @@ class PermissionRankController(BaseController[PermissionRank]):
             The newly created permission rank.
         """
         logger.debug(
-            f"Creating permission rank: guild_id={guild_id}, rank={rank}, name={name}",
+            "Creating permission rank: guild_id={}, rank={}, name={}",
+            guild_id,
+            rank,
+            name,
         )
         try:
             result = await self.create(
@@ -83,6 +212,7 @@ class PermissionRankController(BaseController[PermissionRank]):
                 name=name,
                 description=description,
             )
+            await bump_permission_generation(guild_id)
             # Invalidate cache for this guild
             if self._backend is not None:
                 await self._backend.delete(
@@ -96,7 +226,7 @@ class PermissionRankController(BaseController[PermissionRank]):
                 self._guild_ranks_cache.invalidate(f"permission_ranks:{guild_id}")
                 if result.id:
                     self._ranks_cache.invalidate(f"permission_rank:{result.id}")
-            logger.trace(f"Invalidated permission rank cache for guild {guild_id}")
+            logger.trace("Invalidated permission rank cache for guild {}", guild_id)
         except Exception as e:
             logger.error(
                 f"Error creating permission rank {rank} for guild {guild_id}: {e}",
@@ -113,7 +243,9 @@ class PermissionRankController(BaseController[PermissionRank]):
             raise
         else:
             logger.debug(
-                f"Successfully created permission rank {rank} for guild {guild_id}",
+                "Successfully created permission rank {} for guild {}",
+                rank,
+                guild_id,
             )
             return result
 
@@ -133,14 +265,14 @@ class PermissionRankController(BaseController[PermissionRank]):
         if self._backend is not None:
             raw = await self._backend.get(backend_key)
             if raw is not None and isinstance(raw, list):
-                logger.trace(f"Cache hit for permission ranks (guild {guild_id})")
+                logger.trace("Cache hit for permission ranks (guild {})", guild_id)
                 items = cast(list[dict[str, Any]], raw)
                 return [PermissionRank.model_validate(d) for d in items]
         else:
             cache_key = f"permission_ranks:{guild_id}"
             cached = self._guild_ranks_cache.get(cache_key)
             if cached is not None:
-                logger.trace(f"Cache hit for permission ranks (guild {guild_id})")
+                logger.trace("Cache hit for permission ranks (guild {})", guild_id)
                 return cached
 
         result = await self.find_all(
@@ -155,9 +287,58 @@ class PermissionRankController(BaseController[PermissionRank]):
             )
         else:
             self._guild_ranks_cache.set(f"permission_ranks:{guild_id}", result)
-        logger.trace(f"Cached permission ranks for guild {guild_id}")
+        logger.trace("Cached permission ranks for guild {}", guild_id)
         return result
 
+    async def get_permission_ranks_for_guilds(
+        self,
+        guild_ids: Collection[int],
+    ) -> dict[int, list[PermissionRank]]:
+        """
+        Get the permission ranks of many guilds in one streamed query.
+
+        Bypasses the caches; used to pre-warm them.
+
+        Parameters
+        ----------
+        guild_ids : Collection[int]
+            The guild IDs to load.
+
+        Returns
+        -------
+        dict[int, list[PermissionRank]]
+            Ranks per guild, ordered by rank value.
+        """
+        return await _load_by_guild(self, guild_ids, PermissionRank.rank)
+
+    async def prime_guild_ranks_cache(
+        self,
+        ranks_by_guild: dict[int, list[PermissionRank]],
+    ) -> None:
+        """
+        Store already-loaded guild rank lists in the cache.
+
+        With a backend, all guilds are written in one pipelined ``set_many``.
+
+        Parameters
+        ----------
+        ranks_by_guild : dict[int, list[PermissionRank]]
+            Ranks per guild, as returned by get_permission_ranks_for_guilds.
+        """
+        if self._backend is not None:
+            await self._backend.set_many(
+                {
+                    f"{PERM_KEY_PREFIX}permission_ranks:{guild_id}": [
+                        m.model_dump() for m in ranks
+                    ]
+                    for guild_id, ranks in ranks_by_guild.items()
+                },
+                ttl_sec=PERM_RANKS_TTL,
+            )
+        else:
+            for guild_id, ranks in ranks_by_guild.items():
+                self._guild_ranks_cache.set(f"permission_ranks:{guild_id}", ranks)
+
     async def get_permission_rank(
         self,
         guild_id: int,
@@ -224,7 +405,7 @@ class PermissionRankController(BaseController[PermissionRank]):
             self._guild_ranks_cache.invalidate(f"permission_ranks:{guild_id}")
             if record.id:
                 self._ranks_cache.invalidate(f"permission_rank:{record.id}")
-        logger.trace(f"Invalidated permission rank cache for guild {guild_id}")
+        logger.trace("Invalidated permission rank cache for guild {}", guild_id)
         return result
 
     async def bulk_create_permission_ranks(
@@ -244,51 +425,33 @@ class PermissionRankController(BaseController[PermissionRank]):
         list[PermissionRank]
             List of created permission rank instances
         """
-        logger.debug(f"Bulk creating {len(ranks_data)} permission ranks")
+        logger.debug("Bulk creating {} permission ranks", len(ranks_data))
         try:
-            async with self.db.session() as session:
-                instances: list[PermissionRank] = []
-                for data in ranks_data:
-                    instance = self.model(**data)
-                    session.add(instance)
-                    instances.append(instance)
-
-                await session.commit()
-
-                # Refresh all instances to get auto-generated fields
-                for instance in instances:
-                    try:
-                        await session.refresh(instance)
-                    except Exception as e:
-                        logger.warning(f"Refresh failed for {self.model.__name__}: {e}")
-
-                # Expunge all instances
-                for instance in instances:
-                    session.expunge(instance)
-
-                # Invalidate cache for all affected guilds
-                affected_guild_ids = {instance.guild_id for instance in instances}
-                if self._backend is not None:
-                    for guild_id in affected_guild_ids:
-                        await self._backend.delete(
-                            f"{PERM_KEY_PREFIX}permission_ranks:{guild_id}",
-                        )
-                        logger.trace(
-                            f"Invalidated permission ranks cache for guild {guild_id}",
-                        )
-                else:
-                    for guild_id in affected_guild_ids:
-                        self._guild_ranks_cache.invalidate(
-                            f"permission_ranks:{guild_id}",
-                        )
-                        logger.trace(
-                            f"Invalidated permission ranks cache for guild {guild_id}",
-                        )
-
-                logger.debug(
-                    f"Successfully bulk created {len(instances)} permission ranks",
+            # One INSERT ... RETURNING per chunk instead of a refresh per row
+            instances = await self.bulk_create(ranks_data)
+
+            # Invalidate cache for all affected guilds
+            affected_guild_ids = {instance.guild_id for instance in instances}
+            for guild_id in affected_guild_ids:
+                await bump_permission_generation(guild_id)
+            if self._backend is not None:
+                await self._backend.delete_many(
+                    f"{PERM_KEY_PREFIX}permission_ranks:{guild_id}"
+                    for guild_id in affected_guild_ids
                 )
-                return instances
+                logger.trace(
+                    "Invalidated permission ranks cache for {} guilds",
+                    len(affected_guild_ids),
+                )
+            else:
+                for guild_id in affected_guild_ids:
+                    self._guild_ranks_cache.invalidate(
+                        f"permission_ranks:{guild_id}",
+                    )
+                    logger.trace(
+                        "Invalidated permission ranks cache for guild {}",
+                        guild_id,
+                    )
 
         except Exception as e:
             logger.error(f"Error bulk creating permission ranks: {e}")
@@ -300,6 +463,12 @@ class PermissionRankController(BaseController[PermissionRank]):
                 },
             )
             raise
+        else:
+            logger.debug(
+                "Successfully bulk created {} permission ranks",
+                len(instances),
+            )
+            return instances
 
     async def delete_permission_rank(self, guild_id: int, rank: int) -> bool:
         """
@@ -320,6 +489,8 @@ class PermissionRankController(BaseController[PermissionRank]):
             & (PermissionRank.rank == rank),
         )
         if deleted_count > 0:
+            # Assignments to the rank are removed by ON DELETE CASCADE
+            await bump_permission_generation(guild_id)
             if self._backend is not None:
                 await self._backend.delete(
                     f"{PERM_KEY_PREFIX}permission_ranks:{guild_id}",
@@ -332,7 +503,7 @@ class PermissionRankController(BaseController[PermissionRank]):
                 self._guild_ranks_cache.invalidate(f"permission_ranks:{guild_id}")
                 if record and record.id:
                     self._ranks_cache.invalidate(f"permission_rank:{record.id}")
-            logger.trace(f"Invalidated permission rank cache for guild {guild_id}")
+            logger.trace("Invalidated permission rank cache for guild {}", guild_id)
         return deleted_count > 0
 
 
@@ -379,6 +550,7 @@ class PermissionAssignmentController(BaseController[PermissionAssignment]):
             permission_rank_id=permission_rank_id,
             role_id=role_id,
         )
+        await bump_permission_generation(guild_id)
         if self._backend is not None:
             await self._backend.delete(
                 f"{PERM_KEY_PREFIX}permission_assignments:{guild_id}",
@@ -387,7 +559,7 @@ class PermissionAssignmentController(BaseController[PermissionAssignment]):
             self._assignments_cache.invalidate(
                 f"permission_assignments:{guild_id}",
             )
-        logger.trace(f"Invalidated permission assignment cache for guild {guild_id}")
+        logger.trace("Invalidated permission assignment cache for guild {}", guild_id)
         return result
 
     async def get_assignments_by_guild(
@@ -407,7 +579,8 @@ class PermissionAssignmentController(BaseController[PermissionAssignment]):
             raw = await self._backend.get(backend_key)
             if raw is not None and isinstance(raw, list):
                 logger.trace(
-                    f"Cache hit for permission assignments (guild {guild_id})",
+                    "Cache hit for permission assignments (guild {})",
+                    guild_id,
                 )
                 items = cast(list[dict[str, Any]], raw)
                 return [PermissionAssignment.model_validate(d) for d in items]
@@ -422,7 +595,8 @@ class PermissionAssignmentController(BaseController[PermissionAssignment]):
             cached = self._assignments_cache.get(cache_key)
             if cached is not None:
                 logger.trace(
-                    f"Cache hit for permission assignments (guild {guild_id})",
+                    "Cache hit for permission assignments (guild {})",
+                    guild_id,
                 )
                 return cached
 
@@ -435,9 +609,85 @@ class PermissionAssignmentController(BaseController[PermissionAssignment]):
             )
         else:
             self._assignments_cache.set(cache_key, result)
-        logger.trace(f"Cached permission assignments for guild {guild_id}")
+        logger.trace("Cached permission assignments for guild {}", guild_id)
         return result
 
+    async def get_assignments_for_guilds(
+        self,
+        guild_ids: Collection[int],
+    ) -> dict[int, list[PermissionAssignment]]:
+        """
+        Get the permission assignments of many guilds in one streamed query.
+
+        Bypasses the caches; used to pre-warm them.
+
+        Parameters
+        ----------
+        guild_ids : Collection[int]
+            The guild IDs to load.
+
+        Returns
+        -------
+        dict[int, list[PermissionAssignment]]
+            Assignments per guild.
+        """
+        return await _load_by_guild(self, guild_ids, PermissionAssignment.role_id)
+
+    async def prime_assignments_cache(
+        self,
+        assignments_by_guild: dict[int, list[PermissionAssignment]],
+    ) -> None:
+        """
+        Store already-loaded guild assignment lists in the cache.
+
+        With a backend, all guilds are written in one pipelined ``set_many``.
+
+        Parameters
+        ----------
+        assignments_by_guild : dict[int, list[PermissionAssignment]]
+            Assignments per guild, as returned by get_assignments_for_guilds.
+        """
+        if self._backend is not None:
+            await self._backend.set_many(
+                {
+                    f"{PERM_KEY_PREFIX}permission_assignments:{guild_id}": [
+                        m.model_dump() for m in assignments
+                    ]
+                    for guild_id, assignments in assignments_by_guild.items()
+                },
+                ttl_sec=PERM_RANKS_TTL,
+            )
+        else:
+            for guild_id, assignments in assignments_by_guild.items():
+                self._assignments_cache.set(
+                    f"permission_assignments:{guild_id}",
+                    assignments,
+                )
+
+    async def get_role_ranks_by_guild(self, guild_id: int) -> dict[int, int]:
+        """
+        Get the effective rank of every assigned role in a guild.
+
+        Joins assignments to their ranks in one query; used to compile the
+        in-memory permission index, so it bypasses the caches.
+
+        Returns
+        -------
+        dict[int, int]
+            Mapping of role ID to rank number.
+        """
+        async with self.db.session() as session:
+            stmt = (
+                select(PermissionAssignment.role_id, PermissionRank.rank)
+                .join(
+                    PermissionRank,
+                    PermissionRank.id == PermissionAssignment.permission_rank_id,  # type: ignore[arg-type]
+                )
+                .where(PermissionAssignment.guild_id == guild_id)
+            )
+            result = await session.execute(stmt)
+            return {int(role_id): int(rank) for role_id, rank in result.all()}
+
     async def remove_role_assignment(self, guild_id: int, role_id: int) -> bool:
         """
         Remove a permission level assignment from a role.
@@ -452,6 +702,7 @@ class PermissionAssignmentController(BaseController[PermissionAssignment]):
             & (PermissionAssignment.role_id == role_id),
         )
         if deleted_count > 0:
+            await bump_permission_generation(guild_id)
             if self._backend is not None:
                 await self._backend.delete(
                     f"{PERM_KEY_PREFIX}permission_assignments:{guild_id}",
@@ -461,7 +712,8 @@ class PermissionAssignmentController(BaseController[PermissionAssignment]):
                     f"permission_assignments:{guild_id}",
                 )
             logger.trace(
-                f"Invalidated permission assignment cache for guild {guild_id}",
+                "Invalidated permission assignment cache for guild {}",
+                guild_id,
             )
         return deleted_count > 0
 
@@ -492,6 +744,7 @@ class PermissionAssignmentController(BaseController[PermissionAssignment]):
             & (PermissionAssignment.role_id.in_(role_ids)),  # type: ignore[attr-defined]
         )
         if deleted_count > 0:
+            await bump_permission_generation(guild_id)
             if self._backend is not None:
                 await self._backend.delete(
                     f"{PERM_KEY_PREFIX}permission_assignments:{guild_id}",
@@ -501,7 +754,8 @@ class PermissionAssignmentController(BaseController[PermissionAssignment]):
                     f"permission_assignments:{guild_id}",
                 )
             logger.trace(
-                f"Invalidated permission assignment cache for guild {guild_id}",
+                "Invalidated permission assignment cache for guild {}",
+                guild_id,
             )
         return deleted_count
 
@@ -540,14 +794,18 @@ class PermissionAssignmentController(BaseController[PermissionAssignment]):
             raw = await self._backend.get(backend_key)
             if raw is not None and isinstance(raw, int):
                 logger.trace(
-                    f"Cache hit for user permission rank (guild {guild_id}, user {user_id})",
+                    "Cache hit for user permission rank (guild {}, user {})",
+                    guild_id,
+                    user_id,
                 )
                 return raw
         else:
             cached = self._user_rank_cache.get(cache_key)
             if cached is not None:
                 logger.trace(
-                    f"Cache hit for user permission rank (guild {guild_id}, user {user_id})",
+                    "Cache hit for user permission rank (guild {}, user {})",
+                    guild_id,
+                    user_id,
                 )
                 return cached
 
@@ -616,7 +874,10 @@ class PermissionAssignmentController(BaseController[PermissionAssignment]):
         else:
             self._user_rank_cache.set(cache_key, max_rank)
         logger.trace(
-            f"Cached user permission rank {max_rank} for guild {guild_id}, user {user_id}",
+            "Cached user permission rank {} for guild {}, user {}",
+            max_rank,
+            guild_id,
+            user_id,
         )
         return max_rank
 
@@ -684,16 +945,13 @@ class PermissionCommandController(BaseController[PermissionCommand]):
             required_rank=required_rank,
             description=description,
         )
+        await bump_permission_generation(guild_id)
         if self._backend is not None:
-            await self._backend.delete(
-                f"{PERM_KEY_PREFIX}command_permission:{guild_id}:{command_name}",
-            )
             parts = command_name.split()
-            for i in range(len(parts) - 1, 0, -1):
-                parent_name = " ".join(parts[:i])
-                await self._backend.delete(
-                    f"{PERM_KEY_PREFIX}command_permission:{guild_id}:{parent_name}",
-                )
+            await self._backend.delete_many(
+                f"{PERM_KEY_PREFIX}command_permission:{guild_id}:{' '.join(parts[:i])}"
+                for i in range(len(parts), 0, -1)
+            )
         else:
             cache_key = f"command_permission:{guild_id}:{command_name}"
             self._command_permissions_cache.invalidate(cache_key)
@@ -703,7 +961,9 @@ class PermissionCommandController(BaseController[PermissionCommand]):
                 parent_cache_key = f"command_permission:{guild_id}:{parent_name}"
                 self._command_permissions_cache.invalidate(parent_cache_key)
         logger.trace(
-            f"Invalidated command permission cache for {command_name} (guild {guild_id})",
+            "Invalidated command permission cache for {} (guild {})",
+            command_name,
+            guild_id,
         )
         return result[0]  # upsert returns (record, created)
 
@@ -720,22 +980,17 @@ class PermissionCommandController(BaseController[PermissionCommand]):
 
         Notes
         -----
-        This invalidates only the controller cache (PERM_KEY_PREFIX). Callers that
-        use PermissionSystem.get_command_permission must also call
-        PermissionSystem.invalidate_command_permission_cache so the fallback cache
-        (PERM_FALLBACK_KEY_PREFIX) is cleared; both layers must be invalidated
-        together after a database change.
+        This clears the controller cache (PERM_KEY_PREFIX) and bumps the guild's
+        permission generation, which makes PermissionSystem discard its compiled
+        permission index on the next check.
         """
+        await bump_permission_generation(guild_id)
         if self._backend is not None:
-            await self._backend.delete(
-                f"{PERM_KEY_PREFIX}command_permission:{guild_id}:{command_name}",
-            )
             parts = command_name.split()
-            for i in range(len(parts) - 1, 0, -1):
-                parent_name = " ".join(parts[:i])
-                await self._backend.delete(
-                    f"{PERM_KEY_PREFIX}command_permission:{guild_id}:{parent_name}",
-                )
+            await self._backend.delete_many(
+                f"{PERM_KEY_PREFIX}command_permission:{guild_id}:{' '.join(parts[:i])}"
+                for i in range(len(parts), 0, -1)
+            )
         else:
             cache_key = f"command_permission:{guild_id}:{command_name}"
             self._command_permissions_cache.invalidate(cache_key)
@@ -745,7 +1000,9 @@ class PermissionCommandController(BaseController[PermissionCommand]):
                 parent_cache_key = f"command_permission:{guild_id}:{parent_name}"
                 self._command_permissions_cache.invalidate(parent_cache_key)
         logger.trace(
-            f"Invalidated command permission cache for {command_name} (guild {guild_id})",
+            "Invalidated command permission cache for {} (guild {})",
+            command_name,
+            guild_id,
         )
 
     async def get_command_permission(
@@ -767,14 +1024,18 @@ class PermissionCommandController(BaseController[PermissionCommand]):
             raw = await self._backend.get(backend_key)
             if raw is not None:
                 logger.trace(
-                    f"Cache hit for command permission {command_name} (guild {guild_id})",
+                    "Cache hit for command permission {} (guild {})",
+                    command_name,
+                    guild_id,
                 )
                 return unwrap_optional_perm(raw)
         else:
             cached = self._command_permissions_cache.get(cache_key)
             if cached is not None:
                 logger.trace(
-                    f"Cache hit for command permission {command_name} (guild {guild_id})",
+                    "Cache hit for command permission {} (guild {})",
+                    command_name,
+                    guild_id,
                 )
                 return unwrap_optional_perm(cached)
 
@@ -791,7 +1052,11 @@ class PermissionCommandController(BaseController[PermissionCommand]):
             )
         else:
             self._command_permissions_cache.set(cache_key, wrapped)
-        logger.trace(f"Cached command permission for {command_name} (guild {guild_id})")
+        logger.trace(
+            "Cached command permission for {} (guild {})",
+            command_name,
+            guild_id,
+        )
         return result
 
     async def get_all_command_permissions(
@@ -810,3 +1075,22 @@ class PermissionCommandController(BaseController[PermissionCommand]):
             filters=PermissionCommand.guild_id == guild_id,
             order_by=PermissionCommand.command_name,
         )
+
+    async def get_command_permissions_for_guilds(
+        self,
+        guild_ids: Collection[int],
+    ) -> dict[int, list[PermissionCommand]]:
+        """
+        Get the command permissions of many guilds in one streamed query.
+
+        Parameters
+        ----------
+        guild_ids : Collection[int]
+            The guild IDs to load.
+
+        Returns
+        -------
+        dict[int, list[PermissionCommand]]
+            Command permissions per guild, ordered by name.
+        """
+        return await _load_by_guild(self, guild_ids, PermissionCommand.command_name)
@@ -10,6 +10,8 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from sqlalchemy import tuple_
+
 from tux.database.controllers.base import BaseController
 from tux.database.models import Reminder
 
@@ -132,6 +134,60 @@ class ReminderController(BaseController[Reminder]):
             filters=Reminder.reminder_expires_at <= datetime.now(UTC),
         )
 
+    async def get_pending_reminders_page(
+        self,
+        after: tuple[datetime, int] | None,
+        until: datetime,
+        limit: int,
+    ) -> list[Reminder]:
+        """
+        Get the next page of unsent reminders in expiry order.
+
+        Keyset-paginated on ``(reminder_expires_at, id)`` so it walks the
+        ``idx_reminder_expires_at`` index instead of scanning the table.
+
+        Parameters
+        ----------
+        after : tuple[datetime, int] | None
+            ``(expires_at, id)`` of the last reminder already loaded, or None
+            to start from the earliest reminder.
+        until : datetime
+            Inclusive upper bound on ``reminder_expires_at`` (naive UTC).
+        limit : int
+            Maximum number of reminders to return.
+
+        Returns
+        -------
+        list[Reminder]
+            Reminders ordered by expiry then ID.
+        """
+        filters = (Reminder.reminder_sent == False) & (  # noqa: E712
+            Reminder.reminder_expires_at <= until
+        )
+        if after is not None:
+            filters &= tuple_(Reminder.reminder_expires_at, Reminder.id) > tuple_(
+                *after,
+            )
+        return await self.find_all(
+            filters=filters,
+            order_by=[Reminder.reminder_expires_at, Reminder.id],
+            limit=limit,
+        )
+
+    async def delete_sent_reminders(self) -> int:
+        """
+        Delete reminders already marked as sent.
+
+        These are left behind when the bot stops between sending a reminder
+        and deleting it.
+
+        Returns
+        -------
+        int
+            The number of reminders deleted.
+        """
+        return await self.delete_where(Reminder.reminder_sent == True)  # noqa: E712
+
     async def get_active_reminders(self, guild_id: int) -> list[Reminder]:
         """
         Get all active (non-expired) reminders in a guild.
@@ -9,14 +9,32 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import desc
+from sqlalchemy import (
+    ColumnElement,
+    bindparam,
+    desc,
+    func,
+    literal,
+    or_,
+    select,
+    update,
+)
 
 from tux.database.controllers.base import BaseController
 from tux.database.models import Snippet
+from tux.database.snippet_cache import SnippetCache
 
 if TYPE_CHECKING:
     from tux.database.service import DatabaseService
 
+# Content matches count for less than name matches when ranking search results
+CONTENT_MATCH_WEIGHT = 0.5
+
+
+def _escape_like(term: str) -> str:
+    """Escape LIKE wildcards so the term matches literally."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 
 class SnippetController(BaseController[Snippet]):
     """Clean Snippet controller using the new BaseController pattern."""
@@ -30,6 +48,8 @@ class SnippetController(BaseController[Snippet]):
             The database service instance. If None, uses the default service.
         """
         super().__init__(Snippet, db)
+        # Hot lookups and write-behind use counts (see tux.database.snippet_cache)
+        self.cache = SnippetCache(self)
 
     async def get_snippet_by_id(self, snippet_id: int) -> Snippet | None:
         """
@@ -128,7 +148,7 @@ class SnippetController(BaseController[Snippet]):
         Snippet
             The newly created snippet.
         """
-        return await self.create(
+        snippet = await self.create(
             snippet_name=snippet_name,
             snippet_content=snippet_content,
             guild_id=guild_id,
@@ -138,6 +158,8 @@ class SnippetController(BaseController[Snippet]):
             locked=False,
             **kwargs,
         )
+        self.cache.invalidate_guild(guild_id)
+        return snippet
 
     async def update_snippet_by_id(
         self,
@@ -159,7 +181,9 @@ class SnippetController(BaseController[Snippet]):
         Snippet | None
             The updated snippet, or None if not found.
         """
-        return await self.update_by_id(snippet_id, **kwargs)
+        snippet = await self.update_by_id(snippet_id, **kwargs)
+        self._invalidate(snippet_id, snippet)
+        return snippet
 
     async def delete_snippet_by_id(self, snippet_id: int) -> bool:
         """
@@ -175,7 +199,10 @@ class SnippetController(BaseController[Snippet]):
         bool
             True if deleted successfully, False otherwise.
         """
-        return await self.delete_by_id(snippet_id)
+        deleted = await self.delete_by_id(snippet_id)
+        self.cache.invalidate_snippet(snippet_id)
+        self.cache.discard_uses(snippet_id)
+        return deleted
 
     async def get_snippets_by_creator(
         self,
@@ -202,13 +229,45 @@ class SnippetController(BaseController[Snippet]):
             & (Snippet.guild_id == guild_id),
         )
 
-    async def search_snippets(self, guild_id: int, search_term: str) -> list[Snippet]:
+    @staticmethod
+    def _search_filter(
+        guild_id: int,
+        search_term: str,
+        creator_id: int | None = None,
+    ) -> ColumnElement[bool]:
         """
-        Search snippets by name or content in a guild.
+        Build the WHERE clause for a snippet search.
 
-        Uses Python-side filtering for case-insensitive search.
-        For production use with large datasets, consider implementing
-        database-level ILIKE queries via custom SQL.
+        Names and content match on case-insensitive substrings, and names
+        also match fuzzily through the ``pg_trgm`` similarity operator; all
+        three are served by the trigram GIN indexes.
+
+        Returns
+        -------
+        ColumnElement[bool]
+            The filter expression.
+        """
+        pattern = f"%{_escape_like(search_term)}%"
+        condition = (Snippet.guild_id == guild_id) & or_(
+            Snippet.snippet_name.ilike(pattern, escape="\\"),  # type: ignore[attr-defined]
+            Snippet.snippet_content.ilike(pattern, escape="\\"),  # type: ignore[union-attr]
+            Snippet.snippet_name.op("%")(search_term),  # type: ignore[attr-defined]
+        )
+        if creator_id is not None:
+            condition &= Snippet.snippet_user_id == creator_id
+        return condition
+
+    async def search_snippets_ranked(
+        self,
+        guild_id: int,
+        search_term: str,
+        *,
+        creator_id: int | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[tuple[Snippet, float]]:
+        """
+        Search snippets by name or content, best matches first.
 
         Parameters
         ----------
@@ -216,25 +275,115 @@ class SnippetController(BaseController[Snippet]):
             The ID of the guild to search in.
         search_term : str
             The search term to match against snippet names and content.
+        creator_id : int | None, optional
+            Only search snippets created by this user.
+        limit : int | None, optional
+            Maximum number of results.
+        offset : int, optional
+            Number of results to skip, for pagination.
+
+        Returns
+        -------
+        list[tuple[Snippet, float]]
+            Snippets with their similarity score (0-1), best first; ties are
+            broken by usage count, then name.
+        """
+        term = literal(search_term)
+        score = func.greatest(
+            func.similarity(Snippet.snippet_name, term),
+            func.word_similarity(term, Snippet.snippet_name),
+            func.word_similarity(term, func.coalesce(Snippet.snippet_content, ""))
+            * CONTENT_MATCH_WEIGHT,
+        ).label("score")
+        stmt = (
+            select(Snippet, score)
+            .where(self._search_filter(guild_id, search_term, creator_id))
+            .order_by(
+                desc(score),
+                desc(Snippet.__table__.c.uses),  # type: ignore[attr-defined]
+                Snippet.snippet_name,
+            )
+            .offset(offset)
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        async with self.db.session() as session:
+            result = await session.execute(stmt)
+            rows = [(snippet, float(rank)) for snippet, rank in result.all()]
+            for snippet, _ in rows:
+                session.expunge(snippet)
+            return rows
+
+    async def search_snippets(
+        self,
+        guild_id: int,
+        search_term: str,
+        *,
+        creator_id: int | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[Snippet]:
+        """
+        Search snippets by name or content in a guild, best matches first.
+
+        Matching and ranking run in PostgreSQL using the ``pg_trgm`` indexes
+        on name and content; see :meth:`search_snippets_ranked`.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild to search in.
+        search_term : str
+            The search term to match against snippet names and content.
+        creator_id : int | None, optional
+            Only search snippets created by this user.
+        limit : int | None, optional
+            Maximum number of results.
+        offset : int, optional
+            Number of results to skip, for pagination.
 
         Returns
         -------
         list[Snippet]
             List of snippets matching the search term.
         """
-        all_snippets = await self.get_snippets_by_guild(guild_id)
-        search_lower = search_term.lower()
-        return [
-            snippet
-            for snippet in all_snippets
-            if (
-                search_lower in snippet.snippet_name.lower()
-                or (
-                    snippet.snippet_content
-                    and search_lower in snippet.snippet_content.lower()
-                )
-            )
-        ]
+        ranked = await self.search_snippets_ranked(
+            guild_id,
+            search_term,
+            creator_id=creator_id,
+            limit=limit,
+            offset=offset,
+        )
+        return [snippet for snippet, _ in ranked]
+
+    async def count_search_matches(
+        self,
+        guild_id: int,
+        search_term: str,
+        *,
+        creator_id: int | None = None,
+    ) -> int:
+        """
+        Count snippets matching a search, for pagination totals.
+
+        Parameters
+        ----------
+        guild_id : int
+            The ID of the guild to search in.
+        search_term : str
+            The search term to match against snippet names and content.
+        creator_id : int | None, optional
+            Only count snippets created by this user.
+
+        Returns
+        -------
+        int
+            The number of matching snippets.
+        """
+        return await self.count(
+            filters=self._search_filter(guild_id, search_term, creator_id),
+        )
 
     async def get_snippet_count_by_guild(self, guild_id: int) -> int:
         """
@@ -278,7 +427,7 @@ class SnippetController(BaseController[Snippet]):
             raise ValueError(error_msg)
 
         # Create alias with same content but different name
-        return await self.create(
+        alias = await self.create(
             snippet_name=alias_name,
             snippet_content=original.snippet_content,
             snippet_user_id=original.snippet_user_id,
@@ -287,6 +436,8 @@ class SnippetController(BaseController[Snippet]):
             locked=original.locked,
             alias=original_name,  # Reference to original
         )
+        self.cache.invalidate_guild(guild_id)
+        return alias
 
     async def get_snippet_count_by_creator(self, creator_id: int, guild_id: int) -> int:
         """
@@ -326,7 +477,9 @@ class SnippetController(BaseController[Snippet]):
         snippet = await self.get_snippet_by_id(snippet_id)
         if snippet is None:
             return None
-        return await self.update_by_id(snippet_id, locked=not snippet.locked)
+        updated = await self.update_by_id(snippet_id, locked=not snippet.locked)
+        self._invalidate(snippet_id, updated)
+        return updated
 
     async def increment_snippet_uses(self, snippet_id: int) -> Snippet | None:
         """
@@ -347,6 +500,47 @@ class SnippetController(BaseController[Snippet]):
             return None
         return await self.update_by_id(snippet_id, uses=snippet.uses + 1)
 
+    async def add_snippet_uses_batch(self, uses: dict[int, int]) -> int:
+        """
+        Add use counts to many snippets in one batched UPDATE.
+
+        Parameters
+        ----------
+        uses : dict[int, int]
+            Snippet ID to the number of uses to add.
+
+        Returns
+        -------
+        int
+            Number of snippet rows updated.
+        """
+        if not uses:
+            return 0
+
+        table = Snippet.__table__  # type: ignore[attr-defined]
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("snippet_id"))
+            .values(uses=table.c.uses + bindparam("added_uses"))
+        )
+        params = [
+            {"snippet_id": snippet_id, "added_uses": count}
+            for snippet_id, count in uses.items()
+        ]
+        async with self.db.session() as session:
+            result = await session.execute(stmt, params)
+            await session.commit()
+            # Some drivers report -1 for executemany
+            rowcount = result.rowcount  # type: ignore[attr-defined]
+            return rowcount if rowcount >= 0 else len(params)
+
+    def _invalidate(self, snippet_id: int, snippet: Snippet | None) -> None:
+        """Drop cached lookups affected by a write to a snippet."""
+        if snippet is not None:
+            self.cache.invalidate_guild(snippet.guild_id)
+        else:
+            self.cache.invalidate_snippet(snippet_id)
+
     async def get_popular_snippets(
         self,
         guild_id: int,
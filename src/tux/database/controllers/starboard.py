@@ -55,10 +55,8 @@ class StarboardController(BaseController[Starboard]):
         Starboard
             The starboard configuration (existing or newly created).
         """
-        starboard = await self.get_starboard_by_guild(guild_id)
-        if starboard is not None:
-            return starboard
-        return await self.create(guild_id=guild_id, **defaults)
+        starboard, _ = await self.get_or_create(defaults=defaults, id=guild_id)
+        return starboard
 
     async def update_starboard(self, guild_id: int, **updates: Any) -> Starboard | None:
         """
@@ -122,15 +120,8 @@ class StarboardController(BaseController[Starboard]):
         Starboard
             The starboard configuration (created or updated).
         """
-        existing = await self.get_starboard_by_guild(guild_id)
-        if existing:
-            # Update existing
-            for key, value in kwargs.items():
-                setattr(existing, key, value)
-            updated = await self.update_by_id(guild_id, **kwargs)
-            return updated if updated is not None else existing
-        # Create new
-        return await self.create(guild_id=guild_id, **kwargs)
+        starboard, _ = await self.upsert(filters={"id": guild_id}, **kwargs)
+        return starboard
 
     async def delete_starboard_by_guild_id(self, guild_id: int) -> bool:
         """
@@ -341,19 +332,10 @@ class StarboardMessageController(BaseController[StarboardMessage]):
         StarboardMessage
             The starboard message (created or updated).
         """
-        # Check if message already exists
-        if "id" in kwargs and "message_guild_id" in kwargs:
-            existing = await self.get_message_by_original(
-                kwargs["id"],
-                kwargs["message_guild_id"],
-            )
-            if existing:
-                # Update existing
-                for key, value in kwargs.items():
-                    if hasattr(existing, key):
-                        setattr(existing, key, value)
-                updated = await self.update_by_id(existing.id, **kwargs)
-                return updated if updated is not None else existing
-
-        # Create new
-        return await self.create(**kwargs)
+        # Keyed on (id, message_guild_id): a single INSERT ... ON CONFLICT
+        keys = ("id", "message_guild_id")
+        filters = {key: kwargs.pop(key) for key in keys if key in kwargs}
+        if not filters:
+            return await self.create(**kwargs)
+        message, _ = await self.upsert(filters=filters, **kwargs)
+        return message
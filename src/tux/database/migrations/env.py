@@ -120,6 +120,12 @@ _keep_refs = (
     StarboardMessage,
 )
 
+# Indexes that depend on PostgreSQL extensions (pg_trgm) and are created only by
+# migrations; autogenerate must not propose dropping them
+MIGRATION_ONLY_INDEXES = frozenset(
+    {"idx_snippet_name_trgm", "idx_snippet_content_trgm"}
+)
+
 
 # =============================================================================
 # MIGRATION HOOKS AND CALLBACKS
@@ -170,6 +176,8 @@ def include_object(
     - Could exclude alembic_version table if needed
     - Could exclude temporary or external tables
     """
+    if type_ == "index" and name in MIGRATION_ONLY_INDEXES:
+        return False
     # Exclude views from autogenerate (mark with __table_args__ = {'info': {'is_view': True}})
     return not (
         type_ == "table" and hasattr(obj, "info") and obj.info.get("is_view", False)
@@ -0,0 +1,48 @@
+"""
+Revision ID: 5f2c8e1a9d47
+Revises: b83284093e38
+Create Date: 2026-10-16 12:00:00.000000+00:00
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5f2c8e1a9d47"
+down_revision: Union[str, None] = "b83284093e38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Trigram GIN indexes back ILIKE '%term%' and similarity search on snippets.
+    # They need the pg_trgm extension, so they live here rather than in the model.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.batch_alter_table("snippet", schema=None) as batch_op:
+        batch_op.create_index(
+            "idx_snippet_name_trgm",
+            ["snippet_name"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"snippet_name": "gin_trgm_ops"},
+        )
+        batch_op.create_index(
+            "idx_snippet_content_trgm",
+            ["snippet_content"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"snippet_content": "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("snippet", schema=None) as batch_op:
+        batch_op.drop_index("idx_snippet_content_trgm", postgresql_using="gin")
+        batch_op.drop_index("idx_snippet_name_trgm", postgresql_using="gin")
+    # pg_trgm is left installed; other objects may depend on it
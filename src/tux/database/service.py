@@ -31,6 +31,7 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlmodel import SQLModel
 
+from tux.services.listener_profiler import instrument_engine
 from tux.services.sentry.metrics import record_database_metric
 from tux.shared.config import CONFIG
 
@@ -96,6 +97,8 @@ class DatabaseService:
                 echo=self._echo,
                 **kwargs,
             )
+            # Time statements for the listener profiler's per-listener DB wait
+            instrument_engine(self._engine.sync_engine)
 
             self._session_factory = async_sessionmaker(
                 self._engine,
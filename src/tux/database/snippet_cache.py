@@ -0,0 +1,372 @@
+"""
+Read-through snippet cache with write-behind use counters.
+
+Keeps recently used snippets per guild in memory together with their
+resolved alias target (or the fact that the name does not exist), so a
+snippet invocation needs no database round trip once warm. Use counts are
+accumulated in memory and written back in one batched ``UPDATE`` on a timer
+(driven by the snippet cog), when enough uses are pending, and at shutdown.
+
+Any write through :class:`~tux.database.controllers.snippet.SnippetController`
+(create, edit, delete, lock, alias) drops the affected guild's entries, since
+an edit to one snippet changes what its aliases resolve to.
+
+Loss bound: a crash can lose at most the uses counted since the last
+successful flush, i.e. at most ``SNIPPET_USES_FLUSH_INTERVAL_SEC`` seconds
+while the database is reachable. Failed flushes keep their counts pending,
+and threshold flushes back off for ``FAILED_FLUSH_BACKOFF_SEC`` instead of
+retrying on every use.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from tux.services.sentry.metrics import record_batch_metric
+
+if TYPE_CHECKING:
+    from tux.database.controllers.snippet import SnippetController
+    from tux.database.models import Snippet
+
+__all__ = [
+    "SNIPPET_USES_FLUSH_INTERVAL_SEC",
+    "SnippetCache",
+    "SnippetCacheEntry",
+]
+
+# Timer interval for the periodic use-count flush (seconds)
+SNIPPET_USES_FLUSH_INTERVAL_SEC = 30.0
+# Pending uses that trigger an early flush
+MAX_PENDING_USES = 500
+# Pause before another threshold flush after a failed one (seconds)
+FAILED_FLUSH_BACKOFF_SEC = 30.0
+# Cached names per guild; least recently used are evicted first
+MAX_ENTRIES_PER_GUILD = 1000
+
+
+@dataclass(slots=True)
+class SnippetCacheEntry:
+    """Cached lookup result for one snippet name in one guild.
+
+    Attributes
+    ----------
+    snippet : Snippet | None
+        The snippet with that name, or None if no such snippet exists.
+    target : Snippet | None
+        The snippet whose content is shown: the snippet itself, the alias
+        target, or None for an alias whose target no longer exists.
+    suggestions : tuple[str, ...] | None
+        Names close to a missing snippet's name, once searched for.
+    """
+
+    snippet: Snippet | None
+    target: Snippet | None
+    suggestions: tuple[str, ...] | None = None
+
+    @property
+    def is_alias(self) -> bool:
+        """Return whether the cached snippet is an alias."""
+        return self.snippet is not None and bool(self.snippet.alias)
+
+
+class SnippetCache:
+    """
+    Per-guild cache of resolved snippets plus pending use counts.
+
+    Cached ``Snippet`` objects are detached copies and must be treated as
+    read-only, except for ``uses`` which the cache itself keeps current.
+    """
+
+    def __init__(
+        self,
+        controller: SnippetController,
+        *,
+        max_entries_per_guild: int = MAX_ENTRIES_PER_GUILD,
+        max_pending: int = MAX_PENDING_USES,
+    ) -> None:
+        """Initialize the cache.
+
+        Parameters
+        ----------
+        controller : SnippetController
+            Controller used to load snippets and write flushed use counts.
+        max_entries_per_guild : int, optional
+            Cached names per guild before least recently used are evicted.
+        max_pending : int, optional
+            Pending uses that trigger an early background flush.
+        """
+        self._controller = controller
+        self._max_entries = max_entries_per_guild
+        self._max_pending = max_pending
+        self._guilds: dict[int, OrderedDict[str, SnippetCacheEntry]] = {}
+        # snippet ID -> guild ID for every cached snippet or target, with the
+        # number of cached entries referring to it (an alias entry and its
+        # target's own entry both do)
+        self._snippet_guilds: dict[int, int] = {}
+        self._snippet_refs: Counter[int] = Counter()
+        # Bumped on invalidation so loads that raced with a write are not cached
+        self._generations: Counter[int] = Counter()
+        self._pending_uses: Counter[int] = Counter()
+        self._lock = asyncio.Lock()
+        self._flush_task: asyncio.Task[int] | None = None
+        # No threshold flush before this time.monotonic() value after a failure
+        self._backoff_until = 0.0
+        self._hits = 0
+        self._misses = 0
+        self._flush_count = 0
+        self._uses_flushed = 0
+
+    async def get(self, name: str, guild_id: int) -> SnippetCacheEntry:
+        """
+        Return the cached lookup for a snippet name, loading it on a miss.
+
+        Parameters
+        ----------
+        name : str
+            The snippet name.
+        guild_id : int
+            Discord guild ID.
+
+        Returns
+        -------
+        SnippetCacheEntry
+            The snippet and its resolved target (both None if not found).
+        """
+        entries = self._guilds.get(guild_id)
+        if entries is not None and (entry := entries.get(name)) is not None:
+            entries.move_to_end(name)
+            self._hits += 1
+            return entry
+
+        self._misses += 1
+        generation = self._generations[guild_id]
+        snippet = await self._controller.get_snippet_by_name_and_guild_id(
+            name,
+            guild_id,
+        )
+        target = snippet
+        if snippet is not None and snippet.alias:
+            target = await self._controller.get_snippet_by_name_and_guild_id(
+                snippet.alias,
+                guild_id,
+            )
+        entry = SnippetCacheEntry(snippet=snippet, target=target)
+
+        # Don't cache a result that a write during the awaits may have made stale
+        if self._generations[guild_id] == generation:
+            self._store(guild_id, name, entry)
+        return entry
+
+    async def suggest(self, name: str, guild_id: int, limit: int) -> tuple[str, ...]:
+        """
+        Return snippet names close to a missing name.
+
+        The search result is kept on the cached miss, so repeated lookups of
+        the same unknown name run the trigram search once until the guild's
+        snippets change.
+
+        Parameters
+        ----------
+        name : str
+            The snippet name that was not found.
+        guild_id : int
+            Discord guild ID.
+        limit : int
+            Maximum number of suggestions.
+
+        Returns
+        -------
+        tuple[str, ...]
+            Suggested names, best match first.
+        """
+        entries = self._guilds.get(guild_id)
+        entry = entries.get(name) if entries is not None else None
+        if entry is not None and entry.suggestions is not None:
+            return entry.suggestions[:limit]
+
+        generation = self._generations[guild_id]
+        found = await self._controller.search_snippets(guild_id, name, limit=limit)
+        suggestions = tuple(snippet.snippet_name for snippet in found)
+        if (
+            entry is not None
+            and entry.snippet is None
+            and self._generations[guild_id] == generation
+        ):
+            entry.suggestions = suggestions
+        return suggestions
+
+    def record_use(self, snippet: Snippet) -> None:
+        """
+        Count one use of a snippet in memory.
+
+        Parameters
+        ----------
+        snippet : Snippet
+            The invoked snippet (the alias itself when invoked by alias).
+        """
+        if snippet.id is None:
+            return
+        snippet.uses += 1
+        self._pending_uses[snippet.id] += 1
+
+        if (
+            self._pending_uses.total() >= self._max_pending
+            and (self._flush_task is None or self._flush_task.done())
+            and time.monotonic() >= self._backoff_until
+        ):
+            self._flush_task = asyncio.create_task(
+                self.flush(),
+                name="snippet_uses_threshold_flush",
+            )
+
+    def invalidate_guild(self, guild_id: int) -> None:
+        """
+        Drop every cached lookup for a guild.
+
+        Parameters
+        ----------
+        guild_id : int
+            Discord guild ID.
+        """
+        self._generations[guild_id] += 1
+        for entry in self._guilds.pop(guild_id, {}).values():
+            self._forget(entry)
+
+    def invalidate_snippet(self, snippet_id: int) -> None:
+        """
+        Drop cached lookups for the guild a snippet belongs to, if cached.
+
+        Parameters
+        ----------
+        snippet_id : int
+            The snippet ID.
+        """
+        if (guild_id := self._snippet_guilds.get(snippet_id)) is not None:
+            self.invalidate_guild(guild_id)
+
+    def pending_uses(self, snippet_id: int) -> int:
+        """
+        Return uses of a snippet counted but not yet written.
+
+        Parameters
+        ----------
+        snippet_id : int
+            The snippet ID.
+
+        Returns
+        -------
+        int
+            The number of pending uses.
+        """
+        return self._pending_uses.get(snippet_id, 0)
+
+    def discard_uses(self, snippet_id: int) -> None:
+        """
+        Forget pending uses of a snippet, e.g. because it was deleted.
+
+        Parameters
+        ----------
+        snippet_id : int
+            The snippet ID.
+        """
+        self._pending_uses.pop(snippet_id, None)
+
+    async def flush(self) -> int:
+        """
+        Write pending use counts to the database in one batch.
+
+        Returns
+        -------
+        int
+            Number of snippet rows updated.
+        """
+        async with self._lock:
+            if not self._pending_uses:
+                return 0
+            batch = dict(self._pending_uses)
+            self._pending_uses.clear()
+
+            start = time.perf_counter()
+            try:
+                written = await self._controller.add_snippet_uses_batch(batch)
+            except Exception as e:
+                # Put the counts back so the next flush retries them
+                self._pending_uses.update(batch)
+                self._backoff_until = time.monotonic() + FAILED_FLUSH_BACKOFF_SEC
+                logger.error(f"Snippet use flush failed for {len(batch)} rows: {e}")
+                record_batch_metric(
+                    "snippet_uses_flush",
+                    0,
+                    (time.perf_counter() - start) * 1000,
+                    success=False,
+                    error_type=type(e).__name__,
+                )
+                return 0
+
+            self._backoff_until = 0.0
+            duration_ms = (time.perf_counter() - start) * 1000
+            self._flush_count += 1
+            self._uses_flushed += sum(batch.values())
+            record_batch_metric("snippet_uses_flush", written, duration_ms)
+            logger.debug(
+                f"Snippet uses flushed for {written} snippets in {duration_ms:.1f}ms",
+            )
+            return written
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return cache statistics for monitoring.
+
+        Returns
+        -------
+        dict[str, Any]
+            Entry counts, hit rate and flush totals.
+        """
+        lookups = self._hits + self._misses
+        return {
+            "guilds": len(self._guilds),
+            "entries": sum(len(entries) for entries in self._guilds.values()),
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "pending_uses": self._pending_uses.total(),
+            "flushes": self._flush_count,
+            "uses_flushed": self._uses_flushed,
+        }
+
+    def _store(self, guild_id: int, name: str, entry: SnippetCacheEntry) -> None:
+        """Cache an entry, folding in pending uses and evicting LRU names."""
+        entries = self._guilds.setdefault(guild_id, OrderedDict())
+        # Concurrent misses for one name may both store; keep refcounts exact
+        if (previous := entries.pop(name, None)) is not None:
+            self._forget(previous)
+        for snippet_id in self._snippet_ids(entry):
+            self._snippet_guilds[snippet_id] = guild_id
+            self._snippet_refs[snippet_id] += 1
+        # Loaded rows lag behind uses counted since the last flush
+        if entry.snippet is not None and entry.snippet.id is not None:
+            entry.snippet.uses += self.pending_uses(entry.snippet.id)
+        entries[name] = entry
+        while len(entries) > self._max_entries:
+            self._forget(entries.popitem(last=False)[1])
+
+    def _forget(self, entry: SnippetCacheEntry) -> None:
+        """Release a removed entry's snippet -> guild mappings."""
+        for snippet_id in self._snippet_ids(entry):
+            self._snippet_refs[snippet_id] -= 1
+            if self._snippet_refs[snippet_id] <= 0:
+                del self._snippet_refs[snippet_id]
+                self._snippet_guilds.pop(snippet_id, None)
+
+    @staticmethod
+    def _snippet_ids(entry: SnippetCacheEntry) -> set[int]:
+        """Return the IDs of the snippets an entry refers to."""
+        return {
+            snippet.id
+            for snippet in (entry.snippet, entry.target)
+            if snippet is not None and snippet.id is not None
+        }
@@ -0,0 +1,494 @@
+"""
+Write-behind XP ledger for the leveling system.
+
+Keeps hot ``(member_id, guild_id)`` level rows resident in memory so XP grants
+from messages are applied without database round trips. Dirty rows are written
+back in batched ``INSERT ... ON CONFLICT DO UPDATE`` statements on a timer
+(driven by the levels cog), when the dirty set grows past a threshold, and at
+shutdown.
+
+Loss bound: a crash can lose at most the XP granted since the last successful
+flush, i.e. ``XP_LEDGER_FLUSH_INTERVAL_SEC`` seconds of grants while the
+database is healthy. Failed flushes keep their rows dirty for the next attempt,
+so during an outage pending rows accumulate; they are capped at
+``MAX_UNFLUSHED_ENTRIES``, beyond which the least recently updated rows are
+dropped with a warning. Threshold flushes back off for
+``FAILED_FLUSH_BACKOFF_SEC`` after a failure instead of retrying on every grant.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+from sqlalchemy.exc import IntegrityError
+
+from tux.database.models import Levels
+from tux.services.sentry.metrics import record_batch_metric
+
+if TYPE_CHECKING:
+    from tux.database.controllers.levels import LevelsController
+
+__all__ = [
+    "MAX_DIRTY_ENTRIES",
+    "MAX_UNFLUSHED_ENTRIES",
+    "XP_LEDGER_FLUSH_INTERVAL_SEC",
+    "XpLedger",
+    "XpLedgerEntry",
+]
+
+# Timer interval for the periodic flush (seconds)
+XP_LEDGER_FLUSH_INTERVAL_SEC = 30.0
+# Dirty rows that trigger an early flush, bounding loss on busy guilds
+MAX_DIRTY_ENTRIES = 500
+# Dirty rows kept while flushes fail; the least recently updated are dropped beyond it
+MAX_UNFLUSHED_ENTRIES = 10000
+# Pause before another threshold flush after a failed one (seconds)
+FAILED_FLUSH_BACKOFF_SEC = 30.0
+# Resident rows kept in memory; clean rows are evicted least-recently-used first
+MAX_RESIDENT_ENTRIES = 10000
+# Rows per INSERT statement during a flush
+FLUSH_CHUNK_SIZE = 500
+
+type LedgerKey = tuple[int, int]
+
+
+@dataclass(slots=True)
+class XpLedgerEntry:
+    """Resident level state for one member in one guild.
+
+    Attributes
+    ----------
+    xp : float
+        Current XP including unflushed grants.
+    level : int
+        Current level including unflushed level-ups.
+    blacklisted : bool
+        Whether the member is blacklisted from gaining XP.
+    last_message : datetime
+        Naive UTC timestamp of the last XP grant.
+    version : int
+        Incremented on every in-memory change; used to detect writes that
+        raced with a flush.
+    """
+
+    xp: float
+    level: int
+    blacklisted: bool
+    last_message: datetime
+    version: int = 0
+
+
+class XpLedger:
+    """
+    In-process write-behind store for member XP and levels.
+
+    Reads load a row once and keep it resident; writes mutate the resident
+    entry and mark it dirty. :meth:`flush` persists dirty entries in chunks.
+    Direct controller writes (admin commands) must go through
+    :meth:`direct_write` so resident state never overwrites them.
+    """
+
+    def __init__(
+        self,
+        controller: LevelsController,
+        *,
+        max_resident: int = MAX_RESIDENT_ENTRIES,
+        max_dirty: int = MAX_DIRTY_ENTRIES,
+        max_unflushed: int = MAX_UNFLUSHED_ENTRIES,
+    ) -> None:
+        """Initialize the ledger.
+
+        Parameters
+        ----------
+        controller : LevelsController
+            Controller used to load rows and write flushed batches.
+        max_resident : int, optional
+            Maximum resident entries before clean entries are evicted.
+        max_dirty : int, optional
+            Dirty entries that trigger an early background flush.
+        max_unflushed : int, optional
+            Dirty entries kept while flushes fail before the oldest are dropped.
+        """
+        self._controller = controller
+        self._max_resident = max_resident
+        self._max_dirty = max_dirty
+        self._max_unflushed = max_unflushed
+        self._entries: OrderedDict[LedgerKey, XpLedgerEntry] = OrderedDict()
+        self._dirty: set[LedgerKey] = set()
+        # Serializes flushes with direct writes so a flush never lands after them
+        self._lock = asyncio.Lock()
+        # Keys with a direct write in progress; loads wait for the event
+        self._direct_writes: dict[LedgerKey, asyncio.Event] = {}
+        # Direct writes started so far; a load that spans one reloads the row
+        self._direct_write_count = 0
+        self._flush_task: asyncio.Task[int] | None = None
+        # No threshold flush before this time.monotonic() value after a failure
+        self._backoff_until = 0.0
+        # Rows dropped over the cap: since the last successful flush, and in total
+        self._dropping = 0
+        self._dropped = 0
+        self._flush_count = 0
+        self._rows_flushed = 0
+        self._last_flush_ms = 0.0
+
+    async def get(self, member_id: int, guild_id: int) -> XpLedgerEntry:
+        """
+        Return the resident entry for a member, loading it on first access.
+
+        Parameters
+        ----------
+        member_id : int
+            Discord user ID.
+        guild_id : int
+            Discord guild ID.
+
+        Returns
+        -------
+        XpLedgerEntry
+            The resident entry (a fresh zeroed entry if no row exists yet).
+        """
+        key = (member_id, guild_id)
+        if (entry := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+            return entry
+
+        while True:
+            # Grants must build on the row a direct write leaves behind
+            while (writing := self._direct_writes.get(key)) is not None:
+                await writing.wait()
+            direct_writes = self._direct_write_count
+            row = await self._controller.find_one(
+                filters=(Levels.member_id == member_id) & (Levels.guild_id == guild_id),
+            )
+
+            # Another coroutine may have loaded the same key while we awaited
+            if (entry := self._entries.get(key)) is not None:
+                return entry
+            if self._direct_write_count == direct_writes:
+                break
+
+        entry = (
+            XpLedgerEntry(
+                xp=row.xp,
+                level=row.level,
+                blacklisted=row.blacklisted,
+                last_message=row.last_message,
+            )
+            if row is not None
+            else XpLedgerEntry(
+                xp=0.0,
+                level=0,
+                blacklisted=False,
+                last_message=datetime.now(UTC).replace(tzinfo=None),
+            )
+        )
+        self._entries[key] = entry
+        self._evict()
+        return entry
+
+    def record(
+        self,
+        member_id: int,
+        guild_id: int,
+        *,
+        xp: float,
+        level: int,
+        last_message: datetime,
+    ) -> None:
+        """
+        Apply new XP and level for a member in memory and mark it dirty.
+
+        Parameters
+        ----------
+        member_id : int
+            Discord user ID.
+        guild_id : int
+            Discord guild ID.
+        xp : float
+            New total XP.
+        level : int
+            New level.
+        last_message : datetime
+            Naive UTC timestamp of the grant.
+        """
+        key = (member_id, guild_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = XpLedgerEntry(
+                xp=xp,
+                level=level,
+                blacklisted=False,
+                last_message=last_message,
+            )
+            self._entries[key] = entry
+        else:
+            entry.xp = xp
+            entry.level = level
+            entry.last_message = last_message
+            self._entries.move_to_end(key)
+        entry.version += 1
+        self._dirty.add(key)
+        if len(self._dirty) > self._max_unflushed:
+            self._drop_oldest_dirty()
+
+        if (
+            len(self._dirty) >= self._max_dirty
+            and (self._flush_task is None or self._flush_task.done())
+            and time.monotonic() >= self._backoff_until
+        ):
+            self._flush_task = asyncio.create_task(
+                self.flush(),
+                name="xp_ledger_threshold_flush",
+            )
+
+    async def flush(self) -> int:
+        """
+        Write all dirty entries to the database.
+
+        Returns
+        -------
+        int
+            Number of rows written.
+        """
+        async with self._lock:
+            return await self._flush_keys(list(self._dirty))
+
+    async def flush_member(self, member_id: int, guild_id: int) -> None:
+        """
+        Write a single member's pending changes, if any.
+
+        Parameters
+        ----------
+        member_id : int
+            Discord user ID.
+        guild_id : int
+            Discord guild ID.
+        """
+        key = (member_id, guild_id)
+        if key not in self._dirty:
+            return
+        async with self._lock:
+            await self._flush_keys([key])
+
+    @asynccontextmanager
+    async def direct_write(
+        self,
+        member_id: int,
+        guild_id: int,
+    ) -> AsyncGenerator[None]:
+        """
+        Bracket a direct database write to a member's level row.
+
+        Pending XP is flushed first and the resident entry is dropped, so the
+        next access reloads the row. Loads of that member wait until the
+        write is done, so grants during the write build on the written row
+        and are kept rather than dropped with the entry.
+
+        Parameters
+        ----------
+        member_id : int
+            Discord user ID.
+        guild_id : int
+            Discord guild ID.
+
+        Yields
+        ------
+        None
+            Control returns to the caller to perform its write.
+        """
+        key = (member_id, guild_id)
+        while (writing := self._direct_writes.get(key)) is not None:
+            await writing.wait()
+        done = self._direct_writes[key] = asyncio.Event()
+        self._direct_write_count += 1
+        try:
+            async with self._lock:
+                if key in self._dirty:
+                    await self._flush_keys([key])
+                self._entries.pop(key, None)
+            yield
+        finally:
+            del self._direct_writes[key]
+            done.set()
+            # A grant recorded meanwhile already builds on the written row
+            if key not in self._dirty:
+                self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return ledger statistics for monitoring.
+
+        Returns
+        -------
+        dict[str, Any]
+            Resident/dirty counts and flush totals.
+        """
+        return {
+            "resident": len(self._entries),
+            "dirty": len(self._dirty),
+            "dropped": self._dropped,
+            "flushes": self._flush_count,
+            "rows_flushed": self._rows_flushed,
+            "last_flush_ms": round(self._last_flush_ms, 2),
+        }
+
+    def _evict(self) -> None:
+        """Evict least-recently-used clean entries above the residency bound."""
+        overflow = len(self._entries) - self._max_resident
+        if overflow <= 0:
+            return
+        victims: list[LedgerKey] = []
+        for key in self._entries:
+            if len(victims) >= overflow:
+                break
+            if key not in self._dirty:
+                victims.append(key)
+        for key in victims:
+            del self._entries[key]
+
+    def _drop_oldest_dirty(self) -> None:
+        """Drop the least recently updated dirty entries above the unflushed cap."""
+        excess = len(self._dirty) - self._max_unflushed
+        victims = list(
+            itertools.islice(
+                (key for key in self._entries if key in self._dirty),
+                excess,
+            ),
+        )
+        if not self._dropping:
+            logger.warning(
+                f"XP ledger has {len(self._dirty)} unflushed rows; dropping the "
+                "least recently updated until a flush succeeds",
+            )
+        for key in victims:
+            del self._entries[key]
+            self._dirty.discard(key)
+        self._dropping += len(victims)
+        self._dropped += len(victims)
+
+    async def _flush_keys(self, keys: list[LedgerKey]) -> int:
+        """Write the given dirty keys in chunks (caller holds the lock).
+
+        Returns
+        -------
+        int
+            Number of rows written.
+        """
+        if not keys:
+            return 0
+
+        start = time.perf_counter()
+        written = 0
+        success = True
+        error_type: str | None = None
+
+        for i in range(0, len(keys), FLUSH_CHUNK_SIZE):
+            chunk = keys[i : i + FLUSH_CHUNK_SIZE]
+            snapshot = [
+                (key, entry, entry.version)
+                for key in chunk
+                if (entry := self._entries.get(key)) is not None
+            ]
+            rows = [self._row(key, entry) for key, entry, _ in snapshot]
+            try:
+                await self._controller.upsert_xp_batch(rows)
+            except IntegrityError:
+                # One bad row (e.g. guild not registered) must not poison the batch
+                written += await self._flush_rows_individually(snapshot)
+                continue
+            except Exception as e:
+                # Leave the chunk dirty so the next flush retries it
+                success = False
+                error_type = type(e).__name__
+                logger.error(f"XP ledger flush failed for {len(rows)} rows: {e}")
+                continue
+            self._mark_clean(snapshot)
+            written += len(rows)
+
+        if success:
+            self._backoff_until = 0.0
+            if self._dropping:
+                logger.warning(
+                    f"XP ledger flush recovered; {self._dropping} rows were dropped "
+                    "while flushes were failing",
+                )
+                self._dropping = 0
+        else:
+            self._backoff_until = time.monotonic() + FAILED_FLUSH_BACKOFF_SEC
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        self._flush_count += 1
+        self._rows_flushed += written
+        self._last_flush_ms = duration_ms
+        record_batch_metric(
+            "xp_ledger_flush",
+            written,
+            duration_ms,
+            success=success,
+            error_type=error_type,
+        )
+        logger.debug(
+            f"XP ledger flushed {written}/{len(keys)} rows in {duration_ms:.1f}ms",
+        )
+        return written
+
+    async def _flush_rows_individually(
+        self,
+        snapshot: list[tuple[LedgerKey, XpLedgerEntry, int]],
+    ) -> int:
+        """Write rows one by one, dropping rows that violate constraints.
+
+        Returns
+        -------
+        int
+            Number of rows written.
+        """
+        written = 0
+        for key, entry, version in snapshot:
+            try:
+                await self._controller.upsert_xp_batch([self._row(key, entry)])
+            except IntegrityError as e:
+                logger.warning(f"Dropping unwritable XP ledger row {key}: {e}")
+                self._entries.pop(key, None)
+                self._dirty.discard(key)
+            else:
+                self._mark_clean([(key, entry, version)])
+                written += 1
+        return written
+
+    def _mark_clean(
+        self,
+        snapshot: list[tuple[LedgerKey, XpLedgerEntry, int]],
+    ) -> None:
+        """Clear dirty flags for entries not modified since the snapshot."""
+        for key, entry, version in snapshot:
+            if entry.version == version:
+                self._dirty.discard(key)
+
+    @staticmethod
+    def _row(key: LedgerKey, entry: XpLedgerEntry) -> dict[str, Any]:
+        """Build an upsert row for an entry.
+
+        Returns
+        -------
+        dict[str, Any]
+            Column values for the levels table.
+        """
+        member_id, guild_id = key
+        return {
+            "member_id": member_id,
+            "guild_id": guild_id,
+            "xp": entry.xp,
+            "level": entry.level,
+            "blacklisted": entry.blacklisted,
+            "last_message": entry.last_message,
+        }
@@ -604,6 +604,149 @@ class Dev(BaseCog):
             await ctx.send(f"❌ Unexpected error reloading cog `{resolved_cog}`: {e}")
             logger.error(f"Unexpected error reloading cog {resolved_cog}: {e}")
 
+    @dev.command(
+        name="listeners",
+        aliases=["lp", "profile"],
+    )
+    @commands.guild_only()
+    @requires_command_permission()
+    async def listeners(
+        self,
+        ctx: commands.Context[Tux],
+        limit: int = 10,
+        reset: bool = False,
+    ) -> None:
+        """
+        Show the slowest event listeners by p99 wall time.
+
+        Parameters
+        ----------
+        ctx : commands.Context
+            The context in which the command is being invoked.
+        limit : int
+            Number of listeners to show.
+        reset : bool
+            Clear the collected stats after showing them.
+        """
+        snapshots = self.bot.listener_profiler.report(limit=max(1, min(limit, 25)))
+        if not snapshots:
+            await ctx.send("No listener invocations recorded yet.", ephemeral=True)
+            return
+
+        lines = [
+            f"{'listener':<36} {'calls':>7} {'p50':>7} {'p95':>7} {'p99':>7} {'db':>6} {'rest':>6}",
+        ]
+        lines.extend(
+            f"{s.name[:36]:<36} {s.calls:>7} {s.p50_ms:>7.1f} {s.p95_ms:>7.1f} "
+            f"{s.p99_ms:>7.1f} {s.db_ms:>6.1f} {s.rest_ms:>6.1f}"
+            for s in snapshots
+        )
+        embed = discord.Embed(
+            title="Listener Latency",
+            description="```\n" + "\n".join(lines) + "\n```",
+            color=discord.Color.blue(),
+        )
+        embed.set_footer(
+            text="Times in ms; db/rest are mean wait per call over all calls",
+        )
+        await ctx.send(embed=embed, ephemeral=True)
+
+        if reset:
+            self.bot.listener_profiler.reset()
+
+    @dev.command(
+        name="loop",
+        aliases=["lag"],
+    )
+    @commands.guild_only()
+    @requires_command_permission()
+    async def loop_lag(
+        self,
+        ctx: commands.Context[Tux],
+        limit: int = 5,
+        reset: bool = False,
+    ) -> None:
+        """
+        Show event loop lag and the code that blocked the loop the longest.
+
+        Parameters
+        ----------
+        ctx : commands.Context
+            The context in which the command is being invoked.
+        limit : int
+            Number of offenders to show.
+        reset : bool
+            Clear the collected samples after showing them.
+        """
+        monitor = self.bot.task_monitor.loop_monitor
+        report = monitor.report(limit=max(1, min(limit, 10)))
+
+        embed = discord.Embed(
+            title="Event Loop Lag",
+            description=(
+                f"p50 **{report.lag_p50_ms:.1f}ms** • p99 **{report.lag_p99_ms:.1f}ms** "
+                f"• max **{report.lag_max_ms:.1f}ms**\n"
+                f"Slow callbacks (>{monitor.threshold * 1000:.0f}ms): "
+                f"**{report.slow_callbacks}**"
+            ),
+            color=discord.Color.blue(),
+        )
+        for offender in report.offenders:
+            stack_tail = "".join(offender.stack.splitlines(keepends=True)[-6:])
+            embed.add_field(
+                name=(
+                    f"{offender.count}x • total {offender.total_ms:.0f}ms "
+                    f"• max {offender.max_ms:.0f}ms"
+                ),
+                value=f"`{offender.location}`\n```py\n{stack_tail[-800:]}```",
+                inline=False,
+            )
+        if not report.offenders:
+            embed.add_field(name="Offenders", value="No slow callbacks recorded.")
+        await ctx.send(embed=embed, ephemeral=True)
+
+        if reset:
+            monitor.reset()
+
+    @dev.command(
+        name="startup",
+        aliases=["boot"],
+    )
+    @commands.guild_only()
+    @requires_command_permission()
+    async def startup(self, ctx: commands.Context[Tux]) -> None:
+        """
+        Show how long each setup service took during startup.
+
+        Parameters
+        ----------
+        ctx : commands.Context
+            The context in which the command is being invoked.
+        """
+        report = self.bot.startup_report
+        if report is None:
+            await ctx.send("No startup report recorded.", ephemeral=True)
+            return
+
+        lines = [f"{'service':<16} {'start':>7} {'took':>7} {'end':>7}  after"]
+        lines.extend(
+            f"{p.name[:16]:<16} {p.start_ms:>7.0f} {p.duration_ms:>7.0f} "
+            f"{p.end_ms:>7.0f}  {', '.join(p.depends_on) or '-'}"
+            + ("" if p.success else "  FAILED")
+            for p in report.phases
+        )
+        embed = discord.Embed(
+            title="Startup Report",
+            description=(
+                f"Setup took **{report.total_ms:.0f}ms** "
+                f"({report.sequential_ms:.0f}ms if run in sequence)\n"
+                "```\n" + "\n".join(lines) + "\n```"
+            ),
+            color=discord.Color.blue(),
+        )
+        embed.set_footer(text="Times in ms from the start of setup")
+        await ctx.send(embed=embed, ephemeral=True)
+
     @dev.command(
         name="stop",
         aliases=["shutdown"],
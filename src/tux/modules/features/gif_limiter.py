@@ -10,13 +10,16 @@ from collections import defaultdict
 from time import time
 
 import discord
-from discord.ext import commands, tasks
-from loguru import logger
+from discord.ext import tasks
 
 from tux.core.base_cog import BaseCog
 from tux.core.bot import Tux
+from tux.core.message_pipeline import MessageContext
 from tux.shared.config import CONFIG
 
+# Message pipeline stage name
+GIF_STAGE = "gif_limiter"
+
 
 class GifLimiter(BaseCog):
     """
@@ -61,23 +64,35 @@ class GifLimiter(BaseCog):
 
         self.old_gif_remover.start()
 
-    async def _should_process_message(self, message: discord.Message) -> bool:
+    async def cog_load(self) -> None:
+        """Register the GIF limiter message stage."""
+        # Bot and DM messages were always counted; keep that behaviour
+        self.bot.message_pipeline.register(
+            GIF_STAGE,
+            self.gif_stage,
+            guild_only=False,
+            skip_bots=False,
+            predicate=self._should_process_message,
+        )
+
+    def _should_process_message(self, ctx: MessageContext) -> bool:
         """
         Check if a message contains a GIF and was not sent in a blacklisted channel.
 
         Parameters
         ----------
-        message : discord.Message
-            The message to check.
+        ctx : MessageContext
+            The shared message context.
 
         Returns
         -------
         bool
             True if the message contains a GIF and was not sent in a blacklisted channel, False otherwise.
         """
+        message = ctx.message
         return not (
             not message.embeds
-            or "gif" not in message.content.lower()
+            or "gif" not in ctx.content_lower
             or message.channel.id in self.gif_limit_exclude
         )
 
@@ -131,27 +146,16 @@ class GifLimiter(BaseCog):
             delete_after=3,
         )
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
+    async def gif_stage(self, ctx: MessageContext) -> None:
         """
-        Check for GIFs in every sent message.
+        Enforce GIF rate limits on a message that contains a GIF.
 
         Parameters
         ----------
-        message : discord.Message
-            The message to check.
+        ctx : MessageContext
+            The shared message context.
         """
-        try:
-            # Skip GIF limiting during maintenance mode
-            if getattr(self.bot, "maintenance_mode", False):
-                return
-
-            if await self._should_process_message(message):
-                await self._handle_gif_message(message)
-        except Exception as e:
-            logger.exception(
-                f"Error in GIF limiter listener for message {message.id}: {e}",
-            )
+        await self._handle_gif_message(ctx.message)
 
     @tasks.loop(seconds=20, name="old_gif_remover")
     async def old_gif_remover(self) -> None:
@@ -188,7 +192,8 @@ class GifLimiter(BaseCog):
         await self.bot.wait_until_ready()
 
     async def cog_unload(self) -> None:
-        """Cancel the background task when the cog is unloaded."""
+        """Cancel the background task and unregister the message stage."""
+        self.bot.message_pipeline.unregister(GIF_STAGE)
         self.old_gif_remover.cancel()
 
 
@@ -10,12 +10,14 @@ import datetime
 import time
 
 import discord
-from discord.ext import commands
+from discord.ext import tasks
 from loguru import logger
 
 from tux.core.base_cog import BaseCog
 from tux.core.bot import Tux
+from tux.core.message_pipeline import MessageContext
 from tux.database.models import Levels
+from tux.database.xp_ledger import XP_LEDGER_FLUSH_INTERVAL_SEC, XpLedgerEntry
 from tux.shared.config import CONFIG
 from tux.ui.embeds import EmbedCreator
 
@@ -25,6 +27,9 @@ from tux.ui.embeds import EmbedCreator
 # rejoin role restore in EventHandler.on_member_join.
 LEVEL_XP_LEVEL_MISMATCH_RECONCILE_THRESHOLD: int = 1
 
+# Message pipeline stage name for XP gain
+XP_STAGE = "levels.xp"
+
 
 class LevelsService(BaseCog):
     """Service for managing user levels and XP in Discord guilds."""
@@ -62,85 +67,110 @@ class LevelsService(BaseCog):
         # Avoids DB queries for users still on cooldown (majority of messages)
         self._xp_cooldowns: dict[tuple[int, int], float] = {}
 
-    @commands.Cog.listener("on_message")
-    async def xp_listener(self, message: discord.Message) -> None:
+    async def cog_load(self) -> None:
+        """Start the XP ledger flush loop and register the XP message stage."""
+        self.flush_xp_ledger.start()
+        if self._unload_task is None:
+            self.bot.message_pipeline.register(
+                XP_STAGE,
+                self.xp_stage,
+                skip_commands=True,
+                predicate=self._wants_xp,
+            )
+
+    async def cog_unload(self) -> None:
+        """Stop the flush loop and write any pending XP before unloading."""
+        self.bot.message_pipeline.unregister(XP_STAGE)
+        self.flush_xp_ledger.cancel()
+        try:
+            await self.db.levels.ledger.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush XP ledger on unload: {e}")
+
+    @tasks.loop(seconds=XP_LEDGER_FLUSH_INTERVAL_SEC, name="xp_ledger_flush")
+    async def flush_xp_ledger(self) -> None:
+        """Periodically write dirty XP ledger entries to the database."""
+        await self.db.levels.ledger.flush()
+
+    @flush_xp_ledger.error
+    async def on_flush_xp_ledger_error(self, error: BaseException) -> None:
+        """Handle errors in the XP ledger flush loop."""
+        logger.error(f"Error in XP ledger flush loop: {error}")
+
+        if isinstance(error, Exception):
+            self.bot.sentry_manager.capture_exception(error)
+        else:
+            raise error
+
+    def _wants_xp(self, ctx: MessageContext) -> bool:
         """
-        Listen for messages to process XP gain.
+        Cheap pre-filter: skip blacklisted channels and members on cooldown.
+
+        Returns
+        -------
+        bool
+            True if the message may earn XP.
+        """
+        message = ctx.message
+        if message.channel.id in CONFIG.XP_CONFIG.XP_BLACKLIST_CHANNELS:
+            return False
+        # In-memory cooldown check — avoids DB hit for most messages
+        assert message.guild is not None
+        last_grant = self._xp_cooldowns.get((message.author.id, message.guild.id))
+        return not last_grant or (time.time() - last_grant) >= self.xp_cooldown
+
+    async def xp_stage(self, ctx: MessageContext) -> None:
+        """
+        Process XP gain for a non-command guild message.
 
         Parameters
         ----------
-        message : discord.Message
-            The message object.
+        ctx : MessageContext
+            The shared message context.
         """
-        try:
-            # Skip XP processing during maintenance mode
-            if getattr(self.bot, "maintenance_mode", False):
-                return
-
-            if (
-                message.author.bot
-                or not message.guild
-                or message.channel.id in CONFIG.XP_CONFIG.XP_BLACKLIST_CHANNELS
-            ):
-                return
-
-            # In-memory cooldown check — avoids DB hit for most messages
-            key = (message.author.id, message.guild.id)
-            now = time.time()
-            last_grant = self._xp_cooldowns.get(key)
-            if last_grant and (now - last_grant) < self.xp_cooldown:
-                return
-
-            # Pre-filter: only call expensive get_context if message might be a command
-            prefix = (
-                await self.bot.prefix_manager.get_prefix(message.guild.id)
-                if self.bot.prefix_manager
-                else CONFIG.get_prefix()
-            )
-            if message.content.startswith(prefix):
-                ctx = await self.bot.get_context(message)
-                if ctx.valid:
-                    return
-
-            # Fetch member object
-            member = message.guild.get_member(message.author.id)
-            if not member:
-                return
-
-            # Fetch all user level data in one query to minimize DB calls
-            user_level_data = await self.db.levels.get_user_level_data(
-                member.id,
-                message.guild.id,
-            )
+        message = ctx.message
+        assert message.guild is not None
 
-            # Check if the user is blacklisted
-            if user_level_data and user_level_data.blacklisted:
-                return
+        # Fetch member object
+        member = message.guild.get_member(message.author.id)
+        if not member:
+            return
 
-            # Process XP gain with the already fetched data
-            await self.process_xp_gain(member, message.guild, user_level_data)
+        # Resident ledger entry; only the first grant for a member hits the DB
+        user_level_data = await self.db.levels.ledger.get(
+            member.id,
+            message.guild.id,
+        )
 
-            # Update in-memory cooldown after successful XP grant
-            self._xp_cooldowns[key] = now
-        except Exception as e:
-            logger.exception(f"Error in XP listener for message {message.id}: {e}")
+        # Check if the user is blacklisted
+        if user_level_data.blacklisted:
+            return
+
+        # Process XP gain with the already fetched data
+        await self.process_xp_gain(member, message.guild, user_level_data)
+
+        # Update in-memory cooldown after successful XP grant
+        self._xp_cooldowns[(message.author.id, message.guild.id)] = time.time()
 
     async def process_xp_gain(
         self,
         member: discord.Member,
         guild: discord.Guild,
-        user_level_data: Levels | None,
+        user_level_data: Levels | XpLedgerEntry | None,
     ) -> None:
         """
         Process XP gain for a member.
 
+        The new XP and level are recorded in the XP ledger and written to the
+        database by the next flush.
+
         Parameters
         ----------
         member : discord.Member
             The member gaining XP.
         guild : discord.Guild
             The guild where the member is gaining XP.
-        user_level_data : Levels | None
+        user_level_data : Levels | XpLedgerEntry | None
             The existing level data for the user.
         """
         current_xp = user_level_data.xp if user_level_data else 0.0
@@ -181,7 +211,7 @@ class LevelsService(BaseCog):
             tz=datetime.UTC,
         ).replace(tzinfo=None)
 
-        await self.db.levels.update_xp_and_level(
+        self.db.levels.ledger.record(
             member.id,
             guild.id,
             xp=new_xp,
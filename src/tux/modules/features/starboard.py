@@ -18,14 +18,21 @@ from tux.core.bot import Tux
 from tux.core.checks import requires_command_permission
 from tux.core.converters import get_channel_safe
 from tux.services.sentry import capture_exception_safe
+from tux.services.starboard_tally import (
+    ChannelRestBudget,
+    MessageTally,
+    StarboardAction,
+    StarboardSettings,
+    StarboardTally,
+)
 from tux.ui.embeds import EmbedCreator, EmbedType
 
 # TTL for starboard entries: message_expires_at = original_message.created_at + this.
 # Used for future cleanup jobs; must satisfy starboard_message.message_expires_at NOT NULL.
 STARBOARD_MESSAGE_TTL_DAYS = 365
 
-# Debounce window (seconds) for reaction add/remove to avoid Discord rate limits
-# (Get Message is ~5 req / 5 s per channel). One fetch per message per window.
+# Debounce window (seconds) for reaction add/remove. Counts are tallied in memory
+# immediately; the window only coalesces the REST edits to the starboard post.
 STARBOARD_DEBOUNCE_SECONDS = 2.0
 
 
@@ -48,29 +55,20 @@ class Starboard(BaseCog):
         # Pending debounce tasks keyed by (guild_id, channel_id, message_id)
         self._debounce_tasks: dict[tuple[int, int, int], asyncio.Task[None]] = {}
         self._cleanup_task: asyncio.Task[None] | None = None
+        self._tally = StarboardTally()
+        self._rest_budget = ChannelRestBudget()
         # Usage is auto-generated by BaseCog
 
-    def _debounce_key(
+    def _schedule_sync(
         self,
-        payload: discord.RawReactionActionEvent,
-    ) -> tuple[int, int, int]:
-        """Return cache key for debouncing: (guild_id, channel_id, message_id)."""
-        return (payload.guild_id or 0, payload.channel_id, payload.message_id)
-
-    async def _run_debounced(self, payload: discord.RawReactionActionEvent) -> None:
-        """Run after debounce delay: remove task and process reaction once."""
-        key = self._debounce_key(payload)
-        self._debounce_tasks.pop(key, None)
-        await self.handle_starboard_reaction(payload)
-
-    def _schedule_debounced(self, payload: discord.RawReactionActionEvent) -> None:
-        """Cancel any pending task for this message and schedule one after delay."""
-        key = self._debounce_key(payload)
+        key: tuple[int, int, int],
+        delay: float = STARBOARD_DEBOUNCE_SECONDS,
+    ) -> None:
+        """Cancel any pending sync for this message and schedule one after delay."""
         if existing := self._debounce_tasks.pop(key, None):
             existing.cancel()
             self._cleanup_task = asyncio.create_task(self._await_cancelled(existing))
-        task = asyncio.create_task(self._run_debounced_after(payload))
-        self._debounce_tasks[key] = task
+        self._debounce_tasks[key] = asyncio.create_task(self._sync_after(key, delay))
 
     @staticmethod
     async def _await_cancelled(task: asyncio.Task[None]) -> None:
@@ -78,13 +76,11 @@ class Starboard(BaseCog):
         with contextlib.suppress(asyncio.CancelledError):
             await task
 
-    async def _run_debounced_after(
-        self,
-        payload: discord.RawReactionActionEvent,
-    ) -> None:
-        """Wait for debounce window then run handler (one fetch per message per window)."""
-        await asyncio.sleep(STARBOARD_DEBOUNCE_SECONDS)
-        await self._run_debounced(payload)
+    async def _sync_after(self, key: tuple[int, int, int], delay: float) -> None:
+        """Wait for the debounce window, then bring the starboard post up to date."""
+        await asyncio.sleep(delay)
+        self._debounce_tasks.pop(key, None)
+        await self.sync_starboard_message(*key)
 
     async def cog_unload(self) -> None:
         """Cancel pending debounce tasks when cog is unloaded."""
@@ -206,7 +202,7 @@ class Starboard(BaseCog):
         if getattr(self.bot, "maintenance_mode", False):
             return
 
-        self._schedule_debounced(payload)
+        await self.handle_starboard_reaction(payload, added=True)
 
     @commands.Cog.listener("on_raw_reaction_remove")
     async def starboard_on_reaction_remove(
@@ -224,7 +220,7 @@ class Starboard(BaseCog):
         if getattr(self.bot, "maintenance_mode", False):
             return
 
-        self._schedule_debounced(payload)
+        await self.handle_starboard_reaction(payload, added=False)
 
     @commands.Cog.listener("on_raw_reaction_clear")
     async def starboard_on_reaction_clear(
@@ -335,6 +331,7 @@ class Starboard(BaseCog):
                 starboard_emoji=emoji,
                 starboard_threshold=threshold,
             )
+            self._tally.invalidate_settings(ctx.guild.id)
 
             embed = EmbedCreator.create_embed(
                 bot=self.bot,
@@ -391,6 +388,7 @@ class Starboard(BaseCog):
 
         try:
             result = await self.db.starboard.delete_starboard_by_guild_id(ctx.guild.id)
+            self._tally.invalidate_settings(ctx.guild.id)
 
             embed = (
                 EmbedCreator.create_embed(
@@ -433,214 +431,341 @@ class Starboard(BaseCog):
             )
             await self._send_embed(ctx, error_embed)
 
-    async def get_existing_starboard_message(
-        self,
-        starboard_channel: discord.TextChannel,
-        original_message: discord.Message,
-    ) -> discord.Message | None:
+    async def _get_settings(self, guild_id: int) -> StarboardSettings | None:
         """
-        Get the existing starboard message for a given original message.
+        Return the guild's starboard settings, loading them once from the database.
 
         Parameters
         ----------
-        starboard_channel : discord.TextChannel
-            The starboard channel.
-        original_message : discord.Message`
-            The original message.
+        guild_id : int
+            The guild ID.
 
         Returns
         -------
-        discord.Message | None
-            The existing starboard message or None if it does not exist.
+        StarboardSettings | None
+            The settings, or None if the guild has no starboard.
         """
-        assert original_message.guild
+        if self._tally.has_settings(guild_id):
+            return self._tally.get_settings(guild_id)
 
-        try:
-            starboard_message = (
-                await self.db.starboard_message.get_starboard_message_by_id(
-                    original_message.id,
-                )
+        starboard = await self.db.starboard.get_starboard_by_guild_id(guild_id)
+        settings = (
+            StarboardSettings(
+                channel_id=starboard.starboard_channel_id,
+                emoji=starboard.starboard_emoji,
+                threshold=starboard.starboard_threshold,
             )
+            if starboard
+            else None
+        )
+        self._tally.set_settings(guild_id, settings)
+        return settings
 
-            return (
-                await starboard_channel.fetch_message(
-                    starboard_message.starboard_message_id,
-                )
-                if starboard_message
-                else None
-            )
+    @staticmethod
+    async def _author_reacted(reaction: discord.Reaction, author_id: int) -> bool:
+        """
+        Return whether the message author is among a reaction's users.
 
-        except Exception as e:
-            logger.error(f"Error while fetching starboard message: {e}")
-            capture_exception_safe(
-                e,
-                extra_context={
-                    "operation": "get_existing_starboard_message",
-                    "original_message_id": str(original_message.id)
-                    if original_message
-                    else None,
-                },
+        Asks for the first reactor with an ID at or above the author's, which
+        is one request instead of paging through every reactor.
+
+        Returns
+        -------
+        bool
+            True if the author added this reaction.
+        """
+        async for user in reaction.users(
+            limit=1,
+            after=discord.Object(id=author_id - 1),
+        ):
+            return user.id == author_id
+        return False
+
+    async def _remove_self_star(
+        self,
+        channel_id: int,
+        message_id: int,
+        emoji: str,
+        author_id: int,
+    ) -> None:
+        """Remove the author's own star from their message (best effort)."""
+        channel = await get_channel_safe(self.bot, channel_id)
+        if channel is None:
+            return
+        with contextlib.suppress(Exception):
+            await channel.get_partial_message(message_id).remove_reaction(
+                emoji,
+                discord.Object(id=author_id),
             )
 
-        return None
+    async def _seed_tally(
+        self,
+        settings: StarboardSettings,
+        guild_id: int,
+        channel_id: int,
+        message_id: int,
+    ) -> MessageTally | None:
+        """
+        Fetch a message once and start tallying its stars.
 
-    async def create_or_update_starboard_message(
+        Returns
+        -------
+        MessageTally | None
+            The new tally, or None if the channel is not a text channel.
+        """
+        channel = await get_channel_safe(self.bot, channel_id)
+        if channel is None:
+            return None
+
+        message: discord.Message = await channel.fetch_message(message_id)
+        reaction = discord.utils.get(message.reactions, emoji=settings.emoji)
+        count = reaction.count if reaction else 0
+
+        if reaction and await self._author_reacted(reaction, message.author.id):
+            count -= 1
+            with contextlib.suppress(Exception):
+                await message.remove_reaction(settings.emoji, message.author)
+
+        record = await self.db.starboard_message.get_starboard_message_by_id(
+            message_id,
+        )
+        return self._tally.seed(
+            MessageTally(
+                guild_id=guild_id,
+                channel_id=channel_id,
+                message_id=message_id,
+                author_id=message.author.id,
+                count=count,
+                author_name=message.author.display_name,
+                author_avatar_url=message.author.avatar.url
+                if message.author.avatar
+                else None,
+                content=message.content,
+                image_url=message.attachments[0].url if message.attachments else None,
+                jump_url=message.jump_url,
+                created_at=message.created_at,
+                starboard_message_id=record.starboard_message_id if record else None,
+                displayed_count=record.star_count if record else None,
+            ),
+        )
+
+    def _build_embed(
+        self,
+        tally: MessageTally,
+        settings: StarboardSettings,
+    ) -> discord.Embed:
+        """Build the starboard embed from a tally's message snapshot.
+
+        Returns
+        -------
+        discord.Embed
+            The embed showing the message and its current star count.
+        """
+        embed = EmbedCreator.create_embed(
+            embed_type=EmbedType.INFO,
+            description=tally.content,
+            custom_color=discord.Color.gold(),
+            message_timestamp=tally.created_at,
+            custom_author_text=tally.author_name,
+            custom_author_icon_url=tally.author_avatar_url,
+            custom_footer_text=f"{tally.count} {settings.emoji}",
+            image_url=tally.image_url,
+        )
+        embed.add_field(
+            name="Source",
+            value=f"[Jump to message]({tally.jump_url})",
+        )
+        return embed
+
+    async def _publish_tally(
         self,
         starboard_channel: discord.TextChannel,
-        original_message: discord.Message,
-        reaction_count: int,
+        tally: MessageTally,
+        settings: StarboardSettings,
     ) -> None:
         """
-        Create or update a starboard message.
+        Post or edit the starboard message for a tally and persist it.
 
         Parameters
         ----------
         starboard_channel : discord.TextChannel
             The starboard channel.
-        original_message : discord.Message
-            The original message.
-        reaction_count : int
-            The number of reactions on the original message.
+        tally : MessageTally
+            The tally to display.
+        settings : StarboardSettings
+            The guild's starboard settings.
+        """
+        embed = self._build_embed(tally, settings)
+
+        if tally.starboard_message_id is not None:
+            try:
+                await starboard_channel.get_partial_message(
+                    tally.starboard_message_id,
+                ).edit(embed=embed)
+            except discord.NotFound:
+                # Post was deleted by hand; repost below
+                tally.starboard_message_id = None
+
+        if tally.starboard_message_id is None:
+            starboard_message = await starboard_channel.send(embed=embed)
+            tally.starboard_message_id = starboard_message.id
+        tally.displayed_count = tally.count
+
+        # message_expires_at is NOT NULL; use created_at and naive UTC.
+        base = tally.created_at or datetime.now(UTC)
+        naive = base.replace(tzinfo=None) if base.tzinfo else base
+        message_expires_at = naive + timedelta(days=STARBOARD_MESSAGE_TTL_DAYS)
+
+        await self.db.starboard_message.create_or_update_starboard_message(
+            id=tally.message_id,
+            message_content=tally.content or "",
+            message_channel_id=tally.channel_id,
+            message_user_id=tally.author_id,
+            message_guild_id=tally.guild_id,
+            message_expires_at=message_expires_at,
+            star_count=tally.count,
+            starboard_message_id=tally.starboard_message_id,
+        )
+
+    async def _delete_starboard_post(
+        self,
+        starboard_channel: discord.TextChannel,
+        starboard_message_id: int,
+    ) -> None:
+        """Delete a starboard post without fetching it first."""
+        with contextlib.suppress(discord.NotFound):
+            await starboard_channel.get_partial_message(starboard_message_id).delete()
+
+    async def handle_starboard_reaction(
+        self,
+        payload: discord.RawReactionActionEvent,
+        *,
+        added: bool,
+    ) -> None:
+        """
+        Apply a star add or remove to the tally and schedule a starboard sync.
+
+        Tracked messages are updated in memory; untracked ones are seeded by
+        the debounced sync. Stars from the message author are never counted.
+
+        Parameters
+        ----------
+        payload : discord.RawReactionActionEvent
+            The raw reaction event payload.
+        added : bool
+            True for a reaction add, False for a remove.
         """
-        if not original_message.guild:
-            logger.error("Original message has no guild")
+        if not payload.guild_id:
             return
 
         try:
-            starboard = await self.db.starboard.get_starboard_by_guild_id(
-                original_message.guild.id,
-            )
-            if not starboard:
+            settings = await self._get_settings(payload.guild_id)
+            if settings is None or str(payload.emoji) != settings.emoji:
                 return
 
-            embed = EmbedCreator.create_embed(
-                embed_type=EmbedType.INFO,
-                description=original_message.content,
-                custom_color=discord.Color.gold(),
-                message_timestamp=original_message.created_at,
-                custom_author_text=original_message.author.display_name,
-                custom_author_icon_url=original_message.author.avatar.url
-                if original_message.author.avatar
-                else None,
-                custom_footer_text=f"{reaction_count} {starboard.starboard_emoji}",
-                image_url=original_message.attachments[0].url
-                if original_message.attachments
-                else None,
-            )
-            embed.add_field(
-                name="Source",
-                value=f"[Jump to message]({original_message.jump_url})",
-            )
-
-            starboard_message = await self.get_existing_starboard_message(
-                starboard_channel,
-                original_message,
-            )
-
-            if starboard_message:
-                if starboard_message.embeds:
-                    existing_embed = starboard_message.embeds[0]
-                    if existing_embed.footer != embed.footer:
-                        await starboard_message.edit(embed=embed)
-                    else:
-                        return
+            if added:
+                counted = self._tally.apply_add(payload.message_id, payload.user_id)
+                tally = self._tally.get(payload.message_id)
+                if not counted and tally is not None:
+                    # Self-star on a tracked message: undo it, nothing changed
+                    await self._remove_self_star(
+                        payload.channel_id,
+                        payload.message_id,
+                        settings.emoji,
+                        tally.author_id,
+                    )
+                    return
             else:
-                starboard_message = await starboard_channel.send(embed=embed)
-
-            # message_expires_at is NOT NULL; use created_at with fallback and naive UTC.
-            base = getattr(original_message, "created_at", None) or datetime.now(UTC)
-            naive = base.replace(tzinfo=None) if base.tzinfo else base
-            message_expires_at = naive + timedelta(days=STARBOARD_MESSAGE_TTL_DAYS)
-
-            await self.db.starboard_message.create_or_update_starboard_message(
-                id=original_message.id,
-                message_content=original_message.content or "",
-                message_channel_id=original_message.channel.id,
-                message_user_id=original_message.author.id,
-                message_guild_id=original_message.guild.id,
-                message_expires_at=message_expires_at,
-                star_count=reaction_count,
-                starboard_message_id=starboard_message.id,
+                self._tally.apply_remove(payload.message_id, payload.user_id)
+
+            self._schedule_sync(
+                (payload.guild_id, payload.channel_id, payload.message_id),
             )
 
         except Exception as e:
-            logger.error(
-                "Error while creating or updating starboard message: {}",
-                str(e),
-            )
+            logger.error(f"Unexpected error in handle_starboard_reaction: {e}")
             capture_exception_safe(
                 e,
                 extra_context={
-                    "operation": "create_or_update_starboard_message",
-                    "channel_id": str(starboard_channel.id)
-                    if starboard_channel
-                    else None,
+                    "operation": "handle_starboard_reaction",
+                    "guild_id": str(payload.guild_id) if payload.guild_id else None,
+                    "message_id": str(payload.message_id),
                 },
             )
 
-    async def handle_starboard_reaction(
+    async def sync_starboard_message(
         self,
-        payload: discord.RawReactionActionEvent,
+        guild_id: int,
+        channel_id: int,
+        message_id: int,
     ) -> None:
-        """Handle starboard reaction add or remove."""
-        if not payload.guild_id:
-            return
+        """
+        Bring a message's starboard post in line with its tally.
 
-        starboard = await self.db.starboard.get_starboard_by_guild_id(payload.guild_id)
-        if not starboard or str(payload.emoji) != starboard.starboard_emoji:
-            return
-
-        channel = await get_channel_safe(self.bot, payload.channel_id)
-        if channel is None:
-            return
+        Seeds the tally on first use, then only calls the REST API when the
+        threshold is crossed or the displayed count changed. If a channel's
+        REST budget is spent, the sync is rescheduled instead of sent.
 
+        Parameters
+        ----------
+        guild_id : int
+            The guild ID.
+        channel_id : int
+            The original message's channel ID.
+        message_id : int
+            The original message ID.
+        """
+        key = (guild_id, channel_id, message_id)
         try:
-            message: discord.Message = await channel.fetch_message(payload.message_id)
-            reaction = discord.utils.get(
-                message.reactions,
-                emoji=starboard.starboard_emoji,
-            )
-            reaction_count = reaction.count if reaction else 0
-
-            if reaction:
-                async for user in reaction.users():
-                    if user.id == message.author.id:
-                        reaction_count -= 1
-                        with contextlib.suppress(Exception):
-                            await message.remove_reaction(
-                                starboard.starboard_emoji,
-                                message.author,
-                            )
-
-            starboard_channel = channel.guild.get_channel(
-                starboard.starboard_channel_id,
-            )
-            if not isinstance(starboard_channel, discord.TextChannel):
+            settings = await self._get_settings(guild_id)
+            if settings is None:
                 return
 
-            if reaction_count >= starboard.starboard_threshold:
-                await self.create_or_update_starboard_message(
-                    starboard_channel,
-                    message,
-                    reaction_count,
+            tally = self._tally.get(message_id)
+            if tally is None:
+                if (wait := self._rest_budget.acquire(channel_id)) > 0:
+                    self._schedule_sync(key, delay=wait)
+                    return
+                tally = await self._seed_tally(
+                    settings,
+                    guild_id,
+                    channel_id,
+                    message_id,
                 )
+                if tally is None:
+                    return
 
-            else:
-                existing_starboard_message = await self.get_existing_starboard_message(
+            action = tally.pending_action(settings.threshold)
+            if action is None:
+                return
+
+            starboard_channel = self.bot.get_channel(settings.channel_id)
+            if not isinstance(starboard_channel, discord.TextChannel):
+                return
+
+            if (wait := self._rest_budget.acquire(settings.channel_id)) > 0:
+                self._schedule_sync(key, delay=wait)
+                return
+
+            if action is StarboardAction.DELETE:
+                assert tally.starboard_message_id is not None
+                await self._delete_starboard_post(
                     starboard_channel,
-                    message,
+                    tally.starboard_message_id,
                 )
-                if existing_starboard_message:
-                    await existing_starboard_message.delete()
+                tally.starboard_message_id = None
+                tally.displayed_count = None
+            else:
+                await self._publish_tally(starboard_channel, tally, settings)
 
         except Exception as e:
-            logger.error(f"Unexpected error in handle_starboard_reaction: {e}")
+            logger.error(f"Error while syncing starboard message: {e}")
             capture_exception_safe(
                 e,
                 extra_context={
-                    "operation": "handle_starboard_reaction",
-                    "guild_id": str(payload.guild_id) if payload.guild_id else None,
-                    "message_id": str(payload.message_id),
+                    "operation": "sync_starboard_message",
+                    "guild_id": str(guild_id),
+                    "message_id": str(message_id),
                 },
             )
 
@@ -663,30 +788,26 @@ class Starboard(BaseCog):
             return
 
         try:
-            channel = self.bot.get_channel(payload.channel_id)
-            if not isinstance(channel, discord.TextChannel):
-                return
-
-            message: discord.Message = await channel.fetch_message(payload.message_id)
-            starboard = await self.db.starboard.get_starboard_by_guild_id(
-                payload.guild_id,
-            )
-
-            if not starboard or (emoji and str(emoji) != starboard.starboard_emoji):
+            settings = await self._get_settings(payload.guild_id)
+            if settings is None or (emoji and str(emoji) != settings.emoji):
                 return
 
-            starboard_channel = channel.guild.get_channel(
-                starboard.starboard_channel_id,
-            )
-            if not isinstance(starboard_channel, discord.TextChannel):
+            if self._tally.apply_clear(payload.message_id) is not None:
+                self._schedule_sync(
+                    (payload.guild_id, payload.channel_id, payload.message_id),
+                )
                 return
 
-            starboard_message = await self.get_existing_starboard_message(
-                starboard_channel,
-                message,
+            # Untracked message: delete its post (if any) without fetching it
+            record = await self.db.starboard_message.get_starboard_message_by_id(
+                payload.message_id,
             )
-            if starboard_message:
-                await starboard_message.delete()
+            starboard_channel = self.bot.get_channel(settings.channel_id)
+            if record and isinstance(starboard_channel, discord.TextChannel):
+                await self._delete_starboard_post(
+                    starboard_channel,
+                    record.starboard_message_id,
+                )
 
         except Exception as e:
             logger.error(f"Error in handle_reaction_clear: {e}")
@@ -6,6 +6,8 @@ latest comic, random comics, and specific comics by ID. Comics are displayed
 with interactive buttons for navigation to the comic's explanation and original page.
 """
 
+import asyncio
+import contextlib
 from typing import Any
 
 import discord
@@ -37,6 +39,31 @@ class Xkcd(BaseCog):
         """
         super().__init__(bot)
         self.client = xkcd.Client()
+        self._prefetch_task: asyncio.Task[None] | None = None
+
+    async def cog_load(self) -> None:
+        """Load the comic store and start filling it in the background."""
+        await self.client.store.load()
+        self._prefetch_task = asyncio.create_task(
+            self._prefetch_comics(),
+            name="xkcd_prefetch",
+        )
+
+    async def cog_unload(self) -> None:
+        """Stop the prefetch and persist whatever was fetched."""
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._prefetch_task
+        await self.client.store.save()
+
+    async def _prefetch_comics(self) -> None:
+        """Fetch comics missing from the store so lookups stay local."""
+        await self.bot.wait_until_ready()
+        try:
+            await self.client.prefetch()
+        except Exception as e:
+            logger.warning(f"xkcd prefetch stopped early: {e}")
 
     @commands.hybrid_group(
         name="xkcd",
@@ -160,12 +187,13 @@ class Xkcd(BaseCog):
             Tuple of (embed, view, success_flag).
         """
         try:
+            # The embed links image_url, so the image itself is never downloaded
             if latest:
-                comic = self.client.get_latest_comic(raw_comic_image=True)
+                comic = await self.client.get_latest_comic()
             elif number:
-                comic = self.client.get_comic(number, raw_comic_image=True)
+                comic = await self.client.get_comic(number)
             else:
-                comic = self.client.get_random_comic(raw_comic_image=True)
+                comic = await self.client.get_random_comic()
 
             embed = EmbedCreator.create_embed(
                 bot=self.bot,
@@ -138,6 +138,18 @@ class TempBan(ModerationCogBase):
             )
             return 1, 0
 
+    async def _handle_expired_tempban(self, case: Case) -> bool:
+        """
+        Expiry sweep handler for a single expired tempban case.
+
+        Returns
+        -------
+        bool
+            True if the case was processed successfully.
+        """
+        processed, _ = await self._process_tempban_case(case)
+        return processed == 1
+
     @tasks.loop(minutes=1, name="tempban_checker")
     async def check_tempbans(self) -> None:
         """Check for expired tempbans and unbans the user."""
@@ -151,39 +163,12 @@ class TempBan(ModerationCogBase):
 
         self._processing_tempbans = True
         try:
-            # Collect expired tempbans from all guilds
-            all_expired_cases: list[Case] = []
-            for guild in self.bot.guilds:
-                expired_cases: list[Case] = await self.db.case.get_expired_tempbans(
-                    guild.id,
-                )
-                if expired_cases:
-                    logger.info(
-                        f"Found {len(expired_cases)} expired tempbans in {guild.name}",
-                    )
-                    all_expired_cases.extend(expired_cases)
-
-            if not all_expired_cases:
-                return
-
-            logger.info(
-                f"Processing {len(all_expired_cases)} expired tempban cases.",
+            # One query across all guilds; unbans run concurrently (bounded)
+            await self.bot.expiry_sweeper.sweep(
+                "tempban",
+                self.db.case.get_expired_tempbans_for_guilds,
+                self._handle_expired_tempban,
             )
-
-            # Process all expired cases
-            processed = 0
-            failed = 0
-
-            for case in all_expired_cases:
-                proc, fail = await self._process_tempban_case(case)
-                processed += proc
-                failed += fail
-
-            if processed or failed:
-                logger.info(
-                    f"Finished processing tempbans. Processed: {processed}, Failed: {failed}.",
-                )
-
         finally:
             self._processing_tempbans = False
 
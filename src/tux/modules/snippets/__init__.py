@@ -15,6 +15,7 @@ from tux.core.bot import Tux
 from tux.core.permission_system import get_permission_system
 from tux.database.models import Snippet
 from tux.shared.config import CONFIG
+from tux.shared.constants import SNIPPET_SUGGESTION_LIMIT
 from tux.ui.embeds import EmbedCreator, EmbedType
 
 
@@ -189,6 +190,9 @@ class SnippetsBaseCog(BaseCog):
     ) -> Snippet | None:
         """Fetch a snippet by name and guild, sending an error embed if not found.
 
+        Lookups go through the snippet cache. The error suggests the closest
+        snippet names, searched once per missing name and cached with the miss.
+
         Parameters
         ----------
         ctx : commands.Context[Tux]
@@ -202,12 +206,18 @@ class SnippetsBaseCog(BaseCog):
             The fetched Snippet object, or None if not found.
         """
         assert ctx.guild
-        snippet = await self.db.snippet.get_snippet_by_name_and_guild_id(
-            name,
-            ctx.guild.id,
-        )
+        snippet = (await self.db.snippet.cache.get(name, ctx.guild.id)).snippet
         if snippet is None:
-            await self.send_snippet_error(ctx, description="Snippet not found.")
+            suggestions = await self.db.snippet.cache.suggest(
+                name,
+                ctx.guild.id,
+                SNIPPET_SUGGESTION_LIMIT,
+            )
+            description = "Snippet not found."
+            if suggestions:
+                names = ", ".join(f"`{suggestion}`" for suggestion in suggestions)
+                description += f" Did you mean: {names}?"
+            await self.send_snippet_error(ctx, description=description)
             return None
         return snippet
 
@@ -264,6 +274,9 @@ class SnippetsBaseCog(BaseCog):
     ) -> tuple[Snippet | None, bool]:
         """Resolve a snippet alias to its target snippet.
 
+        The target is resolved once per cached lookup, so repeated alias
+        invocations do not query the database.
+
         Parameters
         ----------
         snippet : Snippet
@@ -280,14 +293,9 @@ class SnippetsBaseCog(BaseCog):
         if not snippet.alias:
             return snippet, False
 
-        # Fetch the target snippet
-        target = await self.db.snippet.get_snippet_by_name_and_guild_id(
-            snippet.alias,
-            guild_id,
-        )
-
-        # Return target if found, None if broken alias
-        return (target, True) if target is not None else (None, True)
+        # Target is None for a broken alias
+        entry = await self.db.snippet.cache.get(snippet.snippet_name, guild_id)
+        return entry.target, True
 
     def _format_snippet_message(
         self,
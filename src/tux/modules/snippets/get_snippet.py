@@ -8,11 +8,12 @@ existing code snippets from Discord guilds.
 from typing import Final
 
 from discord import AllowedMentions, Message
-from discord.ext import commands
+from discord.ext import commands, tasks
 from loguru import logger
 from reactionmenu import ViewButton, ViewMenu
 
 from tux.core.bot import Tux
+from tux.database.snippet_cache import SNIPPET_USES_FLUSH_INTERVAL_SEC
 
 from . import SnippetsBaseCog
 
@@ -33,6 +34,33 @@ class Snippet(SnippetsBaseCog):
         """
         super().__init__(bot)
 
+    async def cog_load(self) -> None:
+        """Start the snippet use-count flush loop."""
+        self.flush_snippet_uses.start()
+
+    async def cog_unload(self) -> None:
+        """Stop the flush loop and write any pending use counts."""
+        self.flush_snippet_uses.cancel()
+        try:
+            await self.db.snippet.cache.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush snippet uses on unload: {e}")
+
+    @tasks.loop(seconds=SNIPPET_USES_FLUSH_INTERVAL_SEC, name="snippet_uses_flush")
+    async def flush_snippet_uses(self) -> None:
+        """Periodically write pending snippet use counts to the database."""
+        await self.db.snippet.cache.flush()
+
+    @flush_snippet_uses.error
+    async def on_flush_snippet_uses_error(self, error: BaseException) -> None:
+        """Handle errors in the snippet use flush loop."""
+        logger.error(f"Error in snippet use flush loop: {error}")
+
+        if isinstance(error, Exception):
+            self.bot.sentry_manager.capture_exception(error)
+        else:
+            raise error
+
     @commands.command(
         name="snippet",
         aliases=["s"],
@@ -58,10 +86,10 @@ class Snippet(SnippetsBaseCog):
         if not snippet:
             return
 
-        # Increment uses before potentially resolving alias
+        # Count the use in memory; the flush loop writes it back in batches
         try:
             snippet_id = self._require_snippet_id(snippet)
-            await self.db.snippet.increment_snippet_uses(snippet_id)
+            self.db.snippet.cache.record_use(snippet)
         except ValueError:
             await self.send_snippet_error(ctx, description="Snippet ID is invalid.")
             return
@@ -13,7 +13,7 @@ from sqlalchemy import desc
 from tux.core.bot import Tux
 from tux.core.converters import FlexibleUserConverter
 from tux.database.models import Snippet
-from tux.shared.constants import SNIPPET_PAGINATION_LIMIT
+from tux.shared.constants import SNIPPET_PAGINATION_LIMIT, SNIPPET_SEARCH_RESULT_LIMIT
 
 from . import SnippetsBaseCog
 
@@ -47,7 +47,8 @@ class ListSnippets(SnippetsBaseCog):
         """List snippets, optionally filtering by a search query.
 
         Displays snippets in a paginated embed, sorted by usage count (descending).
-        The search query filters by snippet name or content (case-insensitive).
+        A search query matches snippet names and content in the database and
+        shows the best matches first.
 
         Parameters
         ----------
@@ -58,12 +59,18 @@ class ListSnippets(SnippetsBaseCog):
         """
         assert ctx.guild
 
+        total_matches: int | None = None
         if search_query:
             filtered_snippets = await self.db.snippet.search_snippets(
                 ctx.guild.id,
                 search_query,
+                limit=SNIPPET_SEARCH_RESULT_LIMIT,
             )
-            filtered_snippets.sort(key=lambda s: s.uses, reverse=True)
+            if len(filtered_snippets) == SNIPPET_SEARCH_RESULT_LIMIT:
+                total_matches = await self.db.snippet.count_search_matches(
+                    ctx.guild.id,
+                    search_query,
+                )
         else:
             filtered_snippets = await self.db.snippet.get_all_snippets_by_guild_id(
                 ctx.guild.id,
@@ -83,6 +90,7 @@ class ListSnippets(SnippetsBaseCog):
             ctx,
             filtered_snippets,
             search_query=search_query,
+            total_snippets=total_matches,
         )
 
     @commands.command(
@@ -119,20 +127,26 @@ class ListSnippets(SnippetsBaseCog):
             )
             return
 
-        filtered_snippets = await self.db.snippet.get_snippets_by_creator(
-            member.id,
-            ctx.guild.id,
-        )
-        filtered_snippets.sort(key=lambda s: s.uses, reverse=True)
-
+        total_matches: int | None = None
         if search_query:
-            sq = search_query.lower()
-            filtered_snippets = [
-                s
-                for s in filtered_snippets
-                if sq in s.snippet_name.lower()
-                or (s.snippet_content is not None and sq in s.snippet_content.lower())
-            ]
+            filtered_snippets = await self.db.snippet.search_snippets(
+                ctx.guild.id,
+                search_query,
+                creator_id=member.id,
+                limit=SNIPPET_SEARCH_RESULT_LIMIT,
+            )
+            if len(filtered_snippets) == SNIPPET_SEARCH_RESULT_LIMIT:
+                total_matches = await self.db.snippet.count_search_matches(
+                    ctx.guild.id,
+                    search_query,
+                    creator_id=member.id,
+                )
+        else:
+            filtered_snippets = await self.db.snippet.get_snippets_by_creator(
+                member.id,
+                ctx.guild.id,
+            )
+            filtered_snippets.sort(key=lambda s: s.uses, reverse=True)
 
         if not filtered_snippets:
             await self.send_snippet_error(
@@ -148,6 +162,7 @@ class ListSnippets(SnippetsBaseCog):
             filtered_snippets,
             search_query=search_query,
             member=member,
+            total_snippets=total_matches,
         )
 
     async def _send_snippets_menu(
@@ -156,13 +171,18 @@ class ListSnippets(SnippetsBaseCog):
         snippets: list[Snippet],
         search_query: str | None = None,
         member: discord.User | None = None,
+        total_snippets: int | None = None,
     ) -> None:
-        """Build and start a paginated ViewMenu for a list of snippets."""
+        """Build and start a paginated ViewMenu for a list of snippets.
+
+        ``total_snippets`` overrides the shown total when ``snippets`` is a
+        truncated page of search results.
+        """
         menu = ViewMenu(ctx, menu_type=ViewMenu.TypeEmbed, show_page_director=False)
 
-        total_snippets = len(snippets)
+        total_snippets = total_snippets or len(snippets)
 
-        for i in range(0, total_snippets, SNIPPET_PAGINATION_LIMIT):
+        for i in range(0, len(snippets), SNIPPET_PAGINATION_LIMIT):
             page_snippets = snippets[i : i + SNIPPET_PAGINATION_LIMIT]
             embed = self._create_snippets_list_embed(
                 ctx,
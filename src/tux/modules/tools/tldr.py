@@ -70,13 +70,16 @@ class Tldr(BaseCog):
             languages_to_check = {normalized_lang, "en"}
 
             for lang_code in languages_to_check:
+                # Map whatever corpus is on disk so lookups work during the update
+                index = await TldrClient.load_index(lang_code)
+                logger.debug(
+                    f"Loaded TLDR index for '{lang_code}' ({len(index)} pages)"
+                )
+
                 if TldrClient.cache_needs_update(lang_code):
                     logger.info(f"Cache for '{lang_code}' needs update")
                     try:
-                        result_msg = await asyncio.to_thread(
-                            TldrClient.update_tldr_cache,
-                            lang_code,
-                        )
+                        result_msg = await TldrClient.update_tldr_cache(lang_code)
                         if result_msg.startswith("Failed"):
                             logger.error(
                                 f"Cache update for '{lang_code}': {result_msg}",
@@ -152,24 +155,15 @@ class Tldr(BaseCog):
         final_language = language_value or self.default_language
         final_platform_for_list = platform_value or TldrClient.detect_platform()
 
-        commands_to_show = TldrClient.list_tldr_commands(
+        completions = TldrClient.command_completions(
             language=final_language,
             platform_filter=final_platform_for_list,
         )
 
-        # Filter commands based on current input
-        if not current:
-            filtered_commands = [
-                app_commands.Choice(name=cmd, value=cmd) for cmd in commands_to_show
-            ]
-        else:
-            filtered_commands = [
-                app_commands.Choice(name=cmd, value=cmd)
-                for cmd in commands_to_show
-                if current.lower() in cmd.lower()
-            ]
-
-        return filtered_commands[:25]
+        return [
+            app_commands.Choice(name=cmd, value=cmd)
+            for cmd in completions.search(current)
+        ]
 
     async def platform_autocomplete(
         self,
@@ -325,7 +319,7 @@ class Tldr(BaseCog):
         chosen_language = language or self.default_language
         languages_to_try = TldrClient.get_language_priority(chosen_language)
 
-        if result := TldrClient.fetch_tldr_page(
+        if result := await TldrClient.fetch_tldr_page(
             command_norm,
             languages_to_try,
             platform,
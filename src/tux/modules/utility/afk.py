@@ -16,9 +16,9 @@ from loguru import logger
 
 from tux.core.base_cog import BaseCog
 from tux.core.bot import Tux
+from tux.core.message_pipeline import MessageContext
 from tux.database.models import AFK as AFKMODEL
 from tux.modules.utility import add_afk, del_afk
-from tux.shared.config import CONFIG
 from tux.shared.constants import (
     AFK_ALLOWED_MENTIONS,
     AFK_REASON_MAX_LENGTH,
@@ -26,6 +26,10 @@ from tux.shared.constants import (
     TRUNCATION_SUFFIX,
 )
 
+# Message pipeline stage names
+AFK_REMOVE_STAGE = "afk.remove"
+AFK_MENTION_STAGE = "afk.mentions"
+
 
 class Afk(BaseCog):
     """Discord cog for managing AFK status functionality."""
@@ -49,8 +53,22 @@ class Afk(BaseCog):
         # when a user sets AFK status.
         self._non_afk_cache: set[tuple[int, int]] = set()
 
+    async def cog_load(self) -> None:
+        """Register the AFK message stages."""
+        pipeline = self.bot.message_pipeline
+        pipeline.register(AFK_REMOVE_STAGE, self.remove_afk, predicate=self._may_be_afk)
+        # Mention notices keep working during maintenance, as before
+        pipeline.register(
+            AFK_MENTION_STAGE,
+            self.check_afk,
+            run_in_maintenance=True,
+            predicate=lambda ctx: bool(ctx.message.mentions),
+        )
+
     async def cog_unload(self) -> None:
-        """Cancel the background task when the cog is unloaded."""
+        """Cancel the background task and unregister the message stages."""
+        self.bot.message_pipeline.unregister(AFK_REMOVE_STAGE)
+        self.bot.message_pipeline.unregister(AFK_MENTION_STAGE)
         self.handle_afk_expiration.cancel()
 
     @commands.Cog.listener("on_member_update")
@@ -252,194 +270,168 @@ class Afk(BaseCog):
         """
         return await self.db.afk.get_afk_member(member_id, guild_id)
 
-    @commands.Cog.listener("on_message")
-    async def remove_afk(self, message: discord.Message) -> None:
+    def _may_be_afk(self, ctx: MessageContext) -> bool:
+        """Skip the DB lookup for authors known not to be AFK."""
+        assert ctx.message.guild is not None
+        return (ctx.message.author.id, ctx.message.guild.id) not in self._non_afk_cache
+
+    async def remove_afk(self, ctx: MessageContext) -> None:
         """
         Remove the AFK status of a member when they send a message.
 
         Parameters
         ----------
-        message : discord.Message
-            The message to check.
+        ctx : MessageContext
+            The shared message context.
         """
-        try:
-            # Skip AFK processing during maintenance mode
-            if (
-                getattr(self.bot, "maintenance_mode", False)
-                or self.bot.maintenance_mode
-            ):
-                return
+        message = ctx.message
+        assert message.guild is not None
+        key = (message.author.id, message.guild.id)
 
-            if not message.guild or message.author.bot:
-                return
-
-            # Fast path: skip DB query if user is known to not be AFK
-            key = (message.author.id, message.guild.id)
-            if key in self._non_afk_cache:
-                return
+        assert isinstance(message.author, discord.Member)
 
-            assert isinstance(message.author, discord.Member)
+        entry = await self._get_afk_entry(message.author.id, message.guild.id)
 
-            entry = await self._get_afk_entry(message.author.id, message.guild.id)
+        if not entry:
+            # User confirmed not AFK — cache this
+            self._non_afk_cache.add(key)
+            return
 
-            if not entry:
-                # User confirmed not AFK — cache this
-                self._non_afk_cache.add(key)
-                return
+        if entry.since + timedelta(seconds=10) > datetime.now(UTC).replace(
+            tzinfo=None,
+        ):
+            return
 
-            if entry.since + timedelta(seconds=10) > datetime.now(UTC).replace(
-                tzinfo=None,
-            ):
-                return
+        if await self.db.afk.is_perm_afk(
+            message.author.id,
+            guild_id=message.guild.id,
+        ):
+            return
 
-            if await self.db.afk.is_perm_afk(
-                message.author.id,
-                guild_id=message.guild.id,
-            ):
-                return
+        # Restore nickname first before removing from database
+        # This ensures if nickname restore fails, AFK entry still exists
+        nickname_restored = False
+        with contextlib.suppress(discord.Forbidden):
+            await message.author.edit(nick=entry.nickname)
+            nickname_restored = True
+            logger.debug(
+                f"Nickname restored for {message.author.id}: {entry.nickname}",
+            )
 
-            # Restore nickname first before removing from database
-            # This ensures if nickname restore fails, AFK entry still exists
-            nickname_restored = False
+        # Only remove from database after nickname is restored (or attempted)
+        # Re-check entry exists to avoid race condition with expiration handler
+        current_entry = await self._get_afk_entry(
+            message.author.id,
+            message.guild.id,
+        )
+        if current_entry is not None:
+            await self.db.afk.remove_afk(message.author.id, message.guild.id)
+            # User is no longer AFK — add to non-AFK cache
+            self._non_afk_cache.add(key)
+            logger.info(
+                f"✅ AFK status removed: {message.author.name} ({message.author.id}) returned to {message.guild.name}",
+            )
+            await message.reply("Welcome back!", delete_after=5)
+        # Entry was already removed (likely by expiration handler)
+        # If nickname wasn't restored, try to restore it now
+        elif not nickname_restored:
             with contextlib.suppress(discord.Forbidden):
                 await message.author.edit(nick=entry.nickname)
-                nickname_restored = True
                 logger.debug(
-                    f"Nickname restored for {message.author.id}: {entry.nickname}",
+                    f"Nickname restored for {message.author.id} after race condition: {entry.nickname}",
                 )
 
-            # Only remove from database after nickname is restored (or attempted)
-            # Re-check entry exists to avoid race condition with expiration handler
-            current_entry = await self._get_afk_entry(
-                message.author.id,
-                message.guild.id,
-            )
-            if current_entry is not None:
-                await self.db.afk.remove_afk(message.author.id, message.guild.id)
-                # User is no longer AFK — add to non-AFK cache
-                self._non_afk_cache.add(key)
-                logger.info(
-                    f"✅ AFK status removed: {message.author.name} ({message.author.id}) returned to {message.guild.name}",
-                )
-                await message.reply("Welcome back!", delete_after=5)
-            # Entry was already removed (likely by expiration handler)
-            # If nickname wasn't restored, try to restore it now
-            elif not nickname_restored:
-                with contextlib.suppress(discord.Forbidden):
-                    await message.author.edit(nick=entry.nickname)
-                    logger.debug(
-                        f"Nickname restored for {message.author.id} after race condition: {entry.nickname}",
-                    )
-        except Exception as e:
-            logger.exception(
-                f"Error in remove_afk listener for message {message.id}: {e}",
-            )
-
-    @commands.Cog.listener("on_message")
-    async def check_afk(self, message: discord.Message) -> None:
+    async def check_afk(self, ctx: MessageContext) -> None:
         """
         Check if a message mentions an AFK member.
 
         Parameters
         ----------
-        message : discord.Message
-            The message to check.
+        ctx : MessageContext
+            The shared message context.
         """
-        try:
-            if not message.guild or message.author.bot:
-                return
+        message = ctx.message
+        assert message.guild is not None
 
-            # Check if the message is a self-timeout command (prefix or slash).
-            # if it is, the member is probably trying to upgrade to a self-timeout, so AFK status should not be removed.
-            prefix = (
-                await self.bot.prefix_manager.get_prefix(message.guild.id)
-                if self.bot.prefix_manager
-                else CONFIG.get_prefix()
-            )
-            # Check for prefix commands
-            if message.content.startswith(f"{prefix}sto"):
-                return
-            # Check for slash command invocations (interaction_metadata only; message.interaction is deprecated)
-            command_name: str | None = (
-                getattr(message.interaction_metadata, "name", None)
-                if message.interaction_metadata
-                else None
+        # Check if the message is a self-timeout command (prefix or slash).
+        # if it is, the member is probably trying to upgrade to a self-timeout, so AFK status should not be removed.
+        if message.content.startswith(f"{ctx.prefix}sto"):
+            return
+        # Check for slash command invocations (interaction_metadata only; message.interaction is deprecated)
+        command_name: str | None = (
+            getattr(message.interaction_metadata, "name", None)
+            if message.interaction_metadata
+            else None
+        )
+        if command_name and command_name in (
+            "self_timeout",
+            "sto",
+            "stimeout",
+            "selftimeout",
+        ):
+            logger.debug(
+                "Ignoring self_timeout command response from %s",
+                message.author.id,
             )
-            if command_name and command_name in (
-                "self_timeout",
-                "sto",
-                "stimeout",
-                "selftimeout",
-            ):
-                logger.debug(
-                    "Ignoring self_timeout command response from %s",
-                    message.author.id,
-                )
-                return
+            return
 
-            afks_mentioned: list[tuple[discord.Member, AFKMODEL]] = []
-
-            for mentioned in message.mentions:
-                entry = await self._get_afk_entry(mentioned.id, message.guild.id)
-                if entry:
-                    # Check if entry has expired
-                    if entry.until is not None:
-                        until_naive = (
-                            entry.until.replace(tzinfo=None)
-                            if entry.until.tzinfo
-                            else entry.until
+        afks_mentioned: list[tuple[discord.Member, AFKMODEL]] = []
+
+        for mentioned in message.mentions:
+            entry = await self._get_afk_entry(mentioned.id, message.guild.id)
+            if entry:
+                # Check if entry has expired
+                if entry.until is not None:
+                    until_naive = (
+                        entry.until.replace(tzinfo=None)
+                        if entry.until.tzinfo
+                        else entry.until
+                    )
+                    now_naive = datetime.now(UTC).replace(tzinfo=None)
+                    if until_naive < now_naive:
+                        # Entry has expired - clean it up immediately
+                        logger.info(
+                            f"Cleaning up expired AFK entry for {mentioned.name} ({mentioned.id}) on mention",
                         )
-                        now_naive = datetime.now(UTC).replace(tzinfo=None)
-                        if until_naive < now_naive:
-                            # Entry has expired - clean it up immediately
-                            logger.info(
-                                f"Cleaning up expired AFK entry for {mentioned.name} ({mentioned.id}) on mention",
-                            )
-                            await del_afk(
-                                self.db,
-                                cast(discord.Member, mentioned),
-                                entry.nickname,
-                            )
-                            continue
-                    afks_mentioned.append((cast(discord.Member, mentioned), entry))
-
-            if not afks_mentioned:
-                return
+                        await del_afk(
+                            self.db,
+                            cast(discord.Member, mentioned),
+                            entry.nickname,
+                        )
+                        continue
+                afks_mentioned.append((cast(discord.Member, mentioned), entry))
 
-            logger.debug(
-                f"AFK notification: {len(afks_mentioned)} AFK users mentioned in {message.guild.name}",
-            )
+        if not afks_mentioned:
+            return
 
-            msgs: list[str] = []
-            for mentioned, afk in afks_mentioned:
-                # Database stores naive UTC datetimes, convert to aware for timestamp calculation
-                # All database datetimes are stored as naive UTC
-                since = (
-                    afk.since.replace(tzinfo=UTC)
-                    if afk.since.tzinfo is None
-                    else afk.since
-                )
-                until_str = ""
-                if afk.until is not None:
-                    until = (
-                        afk.until.replace(tzinfo=UTC)
-                        if afk.until.tzinfo is None
-                        else afk.until
-                    )
-                    until_str = f"until <t:{int(until.timestamp())}:f>"
-                msgs.append(
-                    f'{mentioned.mention} is currently AFK {until_str}: "{afk.reason}" [<t:{int(since.timestamp())}:R>]',
-                )
+        logger.debug(
+            f"AFK notification: {len(afks_mentioned)} AFK users mentioned in {message.guild.name}",
+        )
 
-            await message.reply(
-                content="\n".join(msgs),
-                allowed_mentions=AFK_ALLOWED_MENTIONS,
+        msgs: list[str] = []
+        for mentioned, afk in afks_mentioned:
+            # Database stores naive UTC datetimes, convert to aware for timestamp calculation
+            # All database datetimes are stored as naive UTC
+            since = (
+                afk.since.replace(tzinfo=UTC) if afk.since.tzinfo is None else afk.since
             )
-        except Exception as e:
-            logger.exception(
-                f"Error in check_afk listener for message {message.id}: {e}",
+            until_str = ""
+            if afk.until is not None:
+                until = (
+                    afk.until.replace(tzinfo=UTC)
+                    if afk.until.tzinfo is None
+                    else afk.until
+                )
+                until_str = f"until <t:{int(until.timestamp())}:f>"
+            msgs.append(
+                f'{mentioned.mention} is currently AFK {until_str}: "{afk.reason}" [<t:{int(since.timestamp())}:R>]',
             )
 
+        await message.reply(
+            content="\n".join(msgs),
+            allowed_mentions=AFK_ALLOWED_MENTIONS,
+        )
+
     @tasks.loop(seconds=60, name="afk_expiration_handler")
     async def handle_afk_expiration(self) -> None:
         """Check AFK database at a regular interval, remove AFK from users with an entry that has expired."""
@@ -447,41 +439,47 @@ class Afk(BaseCog):
         if self.bot.maintenance_mode:
             return
 
-        for guild in self.bot.guilds:
-            expired_entries = await self._get_expired_afk_entries(guild.id)
+        # One query across all guilds; entries are expired concurrently (bounded)
+        await self.bot.expiry_sweeper.sweep(
+            "afk",
+            self.db.afk.get_expired_afk_members_for_guilds,
+            self._expire_afk_entry,
+        )
 
-            if expired_entries:
-                logger.info(
-                    f"Processing {len(expired_entries)} expired AFK entries in {guild.name}",
-                )
+    async def _expire_afk_entry(self, entry: AFKMODEL) -> bool:
+        """
+        Expiry sweep handler for a single expired AFK entry.
 
-            for entry in expired_entries:
-                # Re-check if entry still exists (could have been removed by user message)
-                current_entry = await self._get_afk_entry(entry.member_id, guild.id)
-                if current_entry is None:
-                    # Entry was already removed, skip
-                    logger.debug(
-                        f"AFK entry for {entry.member_id} already removed in {guild.name}",
-                    )
-                    continue
+        Parameters
+        ----------
+        entry : AFKMODEL
+            The expired AFK entry.
 
-                member = guild.get_member(entry.member_id)
+        Returns
+        -------
+        bool
+            True once the entry has been handled.
+        """
+        guild = self.bot.get_guild(entry.guild_id)
+        member = guild.get_member(entry.member_id) if guild else None
 
-                if member is None:
-                    # Handles the edge case of a user leaving the guild while still temp-AFK
-                    logger.debug(
-                        f"Removing AFK for departed member {entry.member_id} from {guild.name}",
-                    )
-                    await self.db.afk.remove_afk(entry.member_id, guild.id)
-                else:
-                    logger.debug(
-                        f"Expiring AFK status for {member.name} ({member.id}) in {guild.name}",
-                    )
-                    # Note: Discord timeout is automatically removed by Discord when it expires
-                    # The on_member_update listener handles immediate cleanup when timeout is removed
-                    # This handler is a safety net for entries that weren't caught by the listener
-                    # Use current_entry to ensure we have the latest nickname
-                    await del_afk(self.db, member, current_entry.nickname)
+        if member is None:
+            # Handles the edge case of a user leaving the guild while still temp-AFK
+            logger.debug(
+                f"Removing AFK for departed member {entry.member_id} from guild {entry.guild_id}",
+            )
+            await self.db.afk.remove_afk(entry.member_id, entry.guild_id)
+        else:
+            logger.debug(
+                f"Expiring AFK status for {member.name} ({member.id}) in {member.guild.name}",
+            )
+            # Note: Discord timeout is automatically removed by Discord when it expires
+            # The on_member_update listener handles immediate cleanup when timeout is removed
+            # This handler is a safety net for entries that weren't caught by the listener
+            # If a message already removed the entry, del_afk finds no AFK prefix
+            # to strip and the delete is a no-op, so no re-fetch is needed
+            await del_afk(self.db, member, entry.nickname)
+        return True
 
     @handle_afk_expiration.before_loop
     async def before_handle_afk_expiration(self) -> None:
@@ -498,22 +496,6 @@ class Afk(BaseCog):
         else:
             raise error
 
-    async def _get_expired_afk_entries(self, guild_id: int) -> list[AFKMODEL]:
-        """
-        Get all expired AFK entries for a guild.
-
-        Parameters
-        ----------
-        guild_id : int
-            The ID of the guild to check.
-
-        Returns
-        -------
-        list[AFKMODEL]
-            A list of expired AFK entries.
-        """
-        return await self.db.afk.get_expired_afk_members(guild_id)
-
 
 async def setup(bot: Tux) -> None:
     """Set up the Afk cog.
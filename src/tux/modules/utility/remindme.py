@@ -1,6 +1,5 @@
 """Reminder cog for Tux Bot."""
 
-import asyncio
 import contextlib
 import datetime
 
@@ -11,6 +10,7 @@ from loguru import logger
 from tux.core.base_cog import BaseCog
 from tux.core.bot import Tux
 from tux.database.models import Reminder
+from tux.services.reminder_scheduler import ReminderScheduler
 from tux.shared.functions import convert_to_seconds
 from tux.ui.embeds import EmbedCreator
 
@@ -29,6 +29,11 @@ class RemindMe(BaseCog):
         """
         super().__init__(bot)
         self._initialized = False
+        self.scheduler = ReminderScheduler(self.db.reminder, self.send_reminder)
+
+    async def cog_unload(self) -> None:
+        """Stop the reminder scheduler when the cog is unloaded."""
+        await self.scheduler.stop()
 
     async def send_reminder(self, reminder: Reminder) -> None:
         """Send a reminder to a user.
@@ -117,46 +122,15 @@ class RemindMe(BaseCog):
 
             self._initialized = True
 
-            # Get reminders from all guilds since this is on_ready
-            reminders = await self.db.reminder.find_all()
-            dt_now = datetime.datetime.now(datetime.UTC)
-
-            for reminder in reminders:
-                # hotfix for an issue where old reminders from the old system would all send at once
-                if reminder.reminder_sent:
-                    try:
-                        if reminder.id is not None:
-                            await self.db.reminder.delete_reminder_by_id(reminder.id)
-                    except Exception as e:
-                        logger.error(f"Failed to delete reminder: {e}")
-
-                    continue
-
-                expires_at = reminder.reminder_expires_at
-                # Ensure timezone-aware for comparison (DB may return naive UTC)
-                if expires_at.tzinfo is None:
-                    expires_at = expires_at.replace(tzinfo=datetime.UTC)
-
-                seconds = (expires_at - dt_now).total_seconds()
-
-                if seconds <= 0:
-                    try:
-                        await self.send_reminder(reminder)
-                    except Exception as e:
-                        logger.exception(
-                            "RemindMe.on_ready: send_reminder failed for reminder %s: %s",
-                            reminder.id,
-                            e,
-                        )
-                    continue
-
-                # Create coroutine only when the timer fires; creating it at schedule
-                # time causes "coroutine was never awaited" if the bot shuts down first.
-                self.bot.loop.call_later(
-                    seconds,
-                    lambda r: asyncio.create_task(self.send_reminder(r)),
-                    reminder,
-                )
+            # Hotfix for an issue where old reminders from the old system would
+            # all send at once: rows marked sent but never deleted are dropped
+            try:
+                await self.db.reminder.delete_sent_reminders()
+            except Exception as e:
+                logger.error(f"Failed to delete sent reminders: {e}")
+
+            # Overdue reminders are dispatched by the scheduler's first batches
+            await self.scheduler.start()
         except Exception:
             logger.exception("RemindMe.on_ready failed (cog=RemindMe)")
             raise
@@ -217,13 +191,7 @@ class RemindMe(BaseCog):
                 guild_id=ctx.guild.id if ctx.guild else 0,
             )
 
-            # Create coroutine only when the timer fires; creating it at schedule
-            # time causes "coroutine was never awaited" if the bot shuts down first.
-            self.bot.loop.call_later(
-                seconds,
-                lambda r: asyncio.create_task(self.send_reminder(r)),
-                reminder_obj,
-            )
+            self.scheduler.add(reminder_obj)
 
             embed = EmbedCreator.create_embed(
                 bot=self.bot,
@@ -14,6 +14,7 @@ from loguru import logger
 
 from tux.core.base_cog import BaseCog
 from tux.core.bot import Tux
+from tux.core.message_pipeline import MessageContext
 from tux.shared.config.settings import CONFIG
 from tux.shared.functions import strip_formatting
 
@@ -42,6 +43,9 @@ FORMAT_COMMANDS = r"mkfs\..*\s+/dev/([hs]d[a-z]|nvme\d+n\d+)"
 
 # -- DO NOT CHANGE ANYTHING BELOW THIS LINE --
 
+# Message pipeline stage name
+HARMFUL_STAGE = "harmful_commands"
+
 
 class HarmfulCommands(BaseCog):
     """Discord cog for detecting and warning about harmful shell commands."""
@@ -56,6 +60,25 @@ class HarmfulCommands(BaseCog):
         """
         self.bot = bot
 
+    async def cog_load(self) -> None:
+        """Register the harmful command message stage."""
+        # Users and the IRC bridge are checked everywhere, maintenance included
+        self.bot.message_pipeline.register(
+            HARMFUL_STAGE,
+            self.harmful_stage,
+            guild_only=False,
+            skip_bots=False,
+            run_in_maintenance=True,
+            predicate=lambda ctx: (
+                not ctx.is_bot
+                or ctx.message.webhook_id in CONFIG.IRC_CONFIG.BRIDGE_WEBHOOK_IDS
+            ),
+        )
+
+    async def cog_unload(self) -> None:
+        """Unregister the harmful command message stage."""
+        self.bot.message_pipeline.unregister(HARMFUL_STAGE)
+
     def is_harmful(self, command: str) -> str | None:
         # sourcery skip: assign-if-exp, boolean-if-exp-identity, reintroduce-else
         """
@@ -143,15 +166,9 @@ class HarmfulCommands(BaseCog):
                 f"Error in harmful commands on_message_edit listener for message {after.id}: {e}",
             )
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
-        """Handle new messages to check for harmful content."""
-        try:
-            await self.handle_harmful_message(message)
-        except Exception as e:
-            logger.exception(
-                f"Error in harmful commands listener for message {message.id}: {e}",
-            )
+    async def harmful_stage(self, ctx: MessageContext) -> None:
+        """Check a new message for harmful content."""
+        await self.handle_harmful_message(ctx.message)
 
 
 async def setup(bot: Tux) -> None:
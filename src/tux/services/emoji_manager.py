@@ -250,7 +250,7 @@ class EmojiManager:
             )
 
             # Avoid deadlocks: Do not call init() here directly.
-            # Rely on the initial setup_hook call.
+            # Rely on the EmojiSetupService call during bot setup.
             return None
 
         return self.cache.get(name)
@@ -417,7 +417,7 @@ class EmojiManager:
             "Operation called before cache was initialized. Call await manager.init() first.",
         )
         # Attempting init() again might lead to issues/deadlocks depending on context.
-        # Force initialization in setup_hook.
+        # Force initialization in EmojiSetupService during bot setup.
         return False
 
     async def _delete_discord_emoji(self, name: str) -> bool:
@@ -0,0 +1,159 @@
+"""
+Expiry Sweep Service for Tux Bot.
+
+Periodic expiry checks (tempbans, temporary AFK) used to issue one query per
+guild per tick, almost always returning nothing. The sweeper instead runs a
+single indexed query per entity type across every guild the bot is in
+(``guild_id = ANY(:ids)``) and processes the expired rows concurrently under a
+shared bounded semaphore, recording the sweep duration per type.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from tux.services.sentry import capture_exception_safe, record_task_metric
+
+if TYPE_CHECKING:
+    from tux.core.bot import Tux
+
+__all__ = ["ExpirySweeper", "SweepResult"]
+
+# Expired rows processed concurrently across all sweeps (Discord API calls)
+SWEEP_CONCURRENCY = 10
+
+
+@dataclass(slots=True)
+class SweepResult:
+    """Outcome of one expiry sweep.
+
+    Attributes
+    ----------
+    kind : str
+        Entity type swept (e.g. ``"tempban"``).
+    found : int
+        Expired rows returned by the query.
+    processed : int
+        Rows handled successfully.
+    failed : int
+        Rows whose handler failed or raised.
+    duration_ms : float
+        Wall time of the whole sweep in milliseconds.
+    """
+
+    kind: str
+    found: int = 0
+    processed: int = 0
+    failed: int = 0
+    duration_ms: float = 0.0
+
+
+class ExpirySweeper:
+    """Runs cross-guild expiry sweeps with bounded concurrency."""
+
+    def __init__(self, bot: Tux, concurrency: int = SWEEP_CONCURRENCY) -> None:
+        """Initialize the sweeper.
+
+        Parameters
+        ----------
+        bot : Tux
+            The bot instance; its guilds define which rows are swept.
+        concurrency : int, optional
+            Maximum expired rows processed at once across all sweeps.
+        """
+        self.bot = bot
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._last: dict[str, SweepResult] = {}
+
+    async def sweep[T](
+        self,
+        kind: str,
+        fetch: Callable[[list[int]], Awaitable[Sequence[T]]],
+        handle: Callable[[T], Awaitable[bool]],
+    ) -> SweepResult:
+        """
+        Fetch expired rows for all guilds in one query and handle them.
+
+        Parameters
+        ----------
+        kind : str
+            Entity type, used in logs and metrics.
+        fetch : Callable[[list[int]], Awaitable[Sequence[T]]]
+            Returns expired rows for the given guild IDs in a single query.
+        handle : Callable[[T], Awaitable[bool]]
+            Processes one expired row; returns False on a handled failure.
+
+        Returns
+        -------
+        SweepResult
+            Counts and duration of the sweep.
+        """
+        start = time.perf_counter()
+        result = SweepResult(kind=kind)
+
+        if guild_ids := [guild.id for guild in self.bot.guilds]:
+            rows = await fetch(guild_ids)
+            result.found = len(rows)
+            if rows:
+                logger.info(f"Processing {len(rows)} expired {kind} entries")
+                outcomes = await asyncio.gather(
+                    *(self._handle_one(kind, handle, row) for row in rows),
+                )
+                result.processed = sum(outcomes)
+                result.failed = result.found - result.processed
+
+        result.duration_ms = (time.perf_counter() - start) * 1000
+        self._last[kind] = result
+        record_task_metric(
+            f"{kind}_expiry_sweep",
+            result.duration_ms,
+            success=result.failed == 0,
+            task_type="periodic",
+        )
+        if result.found:
+            logger.info(
+                f"Finished {kind} expiry sweep in {result.duration_ms:.1f}ms. "
+                f"Processed: {result.processed}, Failed: {result.failed}.",
+            )
+        return result
+
+    def stats(self) -> dict[str, SweepResult]:
+        """
+        Return the most recent sweep result per entity type.
+
+        Returns
+        -------
+        dict[str, SweepResult]
+            Last sweep result keyed by kind.
+        """
+        return dict(self._last)
+
+    async def _handle_one[T](
+        self,
+        kind: str,
+        handle: Callable[[T], Awaitable[bool]],
+        row: T,
+    ) -> bool:
+        """Run a handler under the semaphore, isolating its failures.
+
+        Returns
+        -------
+        bool
+            True if the row was handled successfully.
+        """
+        async with self._semaphore:
+            try:
+                return await handle(row)
+            except Exception as e:
+                logger.error(f"Error processing expired {kind} entry: {e}")
+                capture_exception_safe(
+                    e,
+                    extra_context={"operation": f"{kind}_expiry_sweep"},
+                )
+                return False
@@ -1,18 +1,25 @@
 """Event handlers for Tux Bot such as on ready, on guild join, on guild remove, on member join (level role restore), on message and on guild channel create."""
 
+import time
+
 import discord
 from discord.ext import commands
 from loguru import logger
 
 from tux.core.base_cog import BaseCog
 from tux.core.bot import Tux
+from tux.core.message_pipeline import MessageContext
 from tux.core.permission_system import get_permission_system
 from tux.modules.features.levels import (
     LEVEL_XP_LEVEL_MISMATCH_RECONCILE_THRESHOLD,
     LevelsService,
 )
+from tux.services.sentry.metrics import record_batch_metric
 from tux.shared.config import CONFIG
 
+# Message pipeline stage name
+IRC_BRIDGE_STAGE = "irc_bridge"
+
 
 class EventHandler(BaseCog):
     """Event handlers for on_ready, guild join/remove, member join (level role restore), on_message, and guild channel create."""
@@ -29,6 +36,22 @@ class EventHandler(BaseCog):
         super().__init__(bot)
         self._guilds_registered = False
 
+    async def cog_load(self) -> None:
+        """Register the IRC bridge message stage."""
+        # Allow the IRC bridge to use the snippet command only
+        self.bot.message_pipeline.register(
+            IRC_BRIDGE_STAGE,
+            self.irc_bridge_stage,
+            guild_only=False,
+            skip_bots=False,
+            run_in_maintenance=True,
+            predicate=self._is_bridged_snippet,
+        )
+
+    async def cog_unload(self) -> None:
+        """Unregister the IRC bridge message stage."""
+        self.bot.message_pipeline.unregister(IRC_BRIDGE_STAGE)
+
     @commands.Cog.listener()
     async def on_ready(self) -> None:
         """Register all guilds the bot is in on startup and reconnections."""
@@ -46,46 +69,21 @@ class EventHandler(BaseCog):
             logger.info("Bot ready, registering guilds...")
 
             # Always register guilds on ready - Discord.py can reconnect and guilds may change
-            logger.info("Registering all guilds in database...")
-            registered_count = 0
-            skipped_count = 0
-
-            for guild in self.bot.guilds:
-                try:
-                    logger.debug(
-                        f"Attempting to register guild {guild.id} ({guild.name})",
-                    )
-                    result, created = await self.db.guild.get_or_create(id=guild.id)
-                    if created:
-                        registered_count += 1
-                        logger.info(
-                            f"Successfully registered guild {guild.id} ({guild.name}) - id {result.id}",
-                        )
-                    else:
-                        skipped_count += 1
-                        logger.debug(
-                            f"Guild {guild.id} ({guild.name}) already exists - skipped",
-                        )
-                except Exception as e:
-                    # This shouldn't happen with get_or_create, but log if it does
-                    skipped_count += 1
-                    logger.error(
-                        f"Unexpected error registering guild {guild.id} ({guild.name}): {e}",
-                    )
-                    logger.debug(
-                        f"Guild registration error details: {e}",
-                        exc_info=True,
-                    )
-
-            logger.info(
-                f"Registered {registered_count} guilds, skipped {skipped_count} existing guilds in database",
-            )
+            await self._register_guilds()
 
             # Mark first ready (only on first on_ready event, not reconnects)
             if not self.bot.first_ready:
                 self.bot.first_ready = True
                 logger.debug("First on_ready event completed")
 
+                # Load every guild's config row so event paths never miss the cache
+                try:
+                    await self.db.guild_config.prime_cache(
+                        guild.id for guild in self.bot.guilds
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to pre-warm guild config cache: {e}")
+
                 # Pre-warm permission caches to avoid cold-start delays on first commands
                 try:
                     permission_system = get_permission_system()
@@ -104,6 +102,34 @@ class EventHandler(BaseCog):
             logger.exception("EventHandler.on_ready failed (cog=EventHandler)")
             raise
 
+    async def _register_guilds(self) -> None:
+        """Create database rows for any guilds the bot is in but has not stored."""
+        guilds = {guild.id: guild for guild in self.bot.guilds}
+        logger.info(f"Registering {len(guilds)} guilds in database...")
+
+        start = time.perf_counter()
+        try:
+            created = await self.db.guild.register_guilds(guilds.keys())
+        except Exception as e:
+            record_batch_metric(
+                "guild_registration",
+                0,
+                (time.perf_counter() - start) * 1000,
+                success=False,
+                error_type=type(e).__name__,
+            )
+            logger.error(f"Failed to register guilds: {e}")
+            return
+        duration_ms = (time.perf_counter() - start) * 1000
+        record_batch_metric("guild_registration", len(created), duration_ms)
+
+        for guild_id in created:
+            logger.info(f"Registered guild {guild_id} ({guilds[guild_id].name})")
+        logger.info(
+            f"Registered {len(created)} guilds, skipped {len(guilds) - len(created)} "
+            f"existing guilds in database ({duration_ms:.1f}ms)",
+        )
+
     @commands.Cog.listener()
     async def on_guild_join(self, guild: discord.Guild) -> None:
         """On guild join event handler."""
@@ -182,32 +208,18 @@ class EventHandler(BaseCog):
         """On guild remove event handler."""
         await self.db.guild.delete_guild_by_id(guild.id)
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
-        """On message event handler."""
-        try:
-            # Skip event processing during maintenance mode (except IRC bridge)
-            if getattr(self.bot, "maintenance_mode", False):
-                # Still allow IRC bridge during maintenance
-                if message.webhook_id in CONFIG.IRC_CONFIG.BRIDGE_WEBHOOK_IDS and (
-                    message.content.startswith(f"{CONFIG.get_prefix()}s ")
-                    or message.content.startswith(f"{CONFIG.get_prefix()}snippet ")
-                ):
-                    ctx = await self.bot.get_context(message)
-                    await self.bot.invoke(ctx)
-                return
-
-            # Allow the IRC bridge to use the snippet command only
-            if message.webhook_id in CONFIG.IRC_CONFIG.BRIDGE_WEBHOOK_IDS and (
-                message.content.startswith(f"{CONFIG.get_prefix()}s ")
-                or message.content.startswith(f"{CONFIG.get_prefix()}snippet ")
-            ):
-                ctx = await self.bot.get_context(message)
-                await self.bot.invoke(ctx)
-        except Exception as e:
-            logger.exception(
-                f"Error in event handler on_message listener for message {message.id}: {e}",
-            )
+    @staticmethod
+    def _is_bridged_snippet(ctx: MessageContext) -> bool:
+        """Return whether a message is a snippet command sent by the IRC bridge."""
+        if ctx.message.webhook_id not in CONFIG.IRC_CONFIG.BRIDGE_WEBHOOK_IDS:
+            return False
+        prefix = CONFIG.get_prefix()
+        return ctx.message.content.startswith((f"{prefix}s ", f"{prefix}snippet "))
+
+    async def irc_bridge_stage(self, ctx: MessageContext) -> None:
+        """Invoke a snippet command sent by the IRC bridge webhook."""
+        command_ctx = await self.bot.get_context(ctx.message)
+        await self.bot.invoke(command_ctx)
 
     @commands.Cog.listener()
     async def on_guild_channel_create(self, channel: discord.abc.GuildChannel) -> None:
@@ -1,6 +1,5 @@
 """File utilities for hot reload system."""
 
-import ast
 import hashlib
 import importlib
 import sys
@@ -9,6 +8,8 @@ from pathlib import Path
 
 from loguru import logger
 
+from tux.core.cog_manifest import cog_manifest
+
 from .config import ModuleReloadError
 
 
@@ -37,6 +38,9 @@ def get_extension_from_path(file_path: Path, base_dir: Path) -> str | None:  # n
     - src/tux/modules/admin/ban.py → tux.modules.admin.ban
     - src/tux/plugins/atl/deepfry.py → tux.plugins.atl.deepfry
 
+    Whether the file itself defines ``setup`` comes from the cog manifest, so
+    the module is only imported when the manifest can't read the file.
+
     Returns
     -------
     str | None
@@ -59,11 +63,16 @@ def get_extension_from_path(file_path: Path, base_dir: Path) -> str | None:  # n
     logger.trace(f"Checking if {module_name} is a loadable extension")
 
     # Check if this module has a setup function (it's a cog)
-    with suppress(ImportError, AttributeError):
-        module = importlib.import_module(module_name)
-        if hasattr(module, "setup") and callable(module.setup):
-            logger.trace(f"Found cog with setup: {module_name}")
-            return module_name
+    entry = cog_manifest.lookup(file_path)
+    if entry is not None and entry.has_setup:
+        logger.trace(f"Found cog with setup: {module_name}")
+        return module_name
+    if entry is None:
+        with suppress(ImportError, AttributeError):
+            module = importlib.import_module(module_name)
+            if hasattr(module, "setup") and callable(module.setup):
+                logger.trace(f"Found cog with setup: {module_name}")
+                return module_name
 
     # Check parent directory for cog (for supporting files in subdirs)
     if len(parts) > 1:
@@ -103,23 +112,22 @@ def validate_python_syntax(file_path: Path) -> bool:
     """
     Validate Python syntax of a file.
 
+    The parse result is shared with the cog manifest, so an unchanged file
+    is not parsed again.
+
     Returns
     -------
     bool
         True if syntax is valid, False otherwise.
     """
-    try:
-        with file_path.open(encoding="utf-8") as f:
-            source = f.read()
-        ast.parse(source, filename=str(file_path))
-    except (SyntaxError, UnicodeDecodeError) as e:
-        logger.warning(f"Syntax error in {file_path}: {e}")
+    entry = cog_manifest.lookup(file_path)
+    if entry is None:
+        logger.error(f"Error validating syntax for {file_path}: file is unreadable")
         return False
-    except Exception as e:
-        logger.error(f"Error validating syntax for {file_path}: {e}")
-        return False
-    else:
-        return True
+    if not entry.valid:
+        # The manifest already logged the parse error itself
+        logger.warning(f"Syntax error in {file_path}")
+    return entry.valid
 
 
 @contextmanager
@@ -10,6 +10,8 @@ import watchdog.events
 import watchdog.observers
 from loguru import logger
 
+from tux.core.cog_manifest import cog_manifest
+
 from .config import FileWatchError, HotReloadConfig
 from .file_utils import FileHashTracker, get_extension_from_path, validate_python_syntax
 
@@ -119,7 +121,10 @@ class CogWatcher(watchdog.events.FileSystemEventHandler):
             return
 
         # Get extension name
-        if extension := get_extension_from_path(file_path, self.base_dir):
+        extension = get_extension_from_path(file_path, self.base_dir)
+        # Keep what was learned about the edited file for the next startup
+        cog_manifest.save()
+        if extension:
             # If we have an event loop reference, use run_coroutine_threadsafe
             if self.event_loop and self.event_loop.is_running():
                 try:
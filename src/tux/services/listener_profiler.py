@@ -0,0 +1,379 @@
+"""Per-listener latency profiling for cog event handlers.
+
+Every ``commands.Cog.listener`` on a :class:`~tux.core.base_cog.BaseCog` is
+wrapped by :meth:`ListenerProfiler.wrap`, and message pipeline stages run
+inside :meth:`ListenerProfiler.track`. Each invocation records its wall time
+plus the time it spent executing database statements and Discord REST
+requests, attributed through a context variable so concurrent listeners
+never mix up their numbers.
+
+Stats are kept twice: cumulative since startup for :meth:`ListenerProfiler.report`,
+and per reporting interval for :meth:`ListenerProfiler.push_metrics`, which
+sends the interval's percentiles and mean waits to Sentry and starts a new
+interval. Both keep durations in a bounded window for percentiles.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from sqlalchemy import event
+
+from tux.services.sentry import record_listener_metric
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection, Engine
+
+__all__ = [
+    "ListenerProfiler",
+    "ListenerSnapshot",
+    "ListenerStats",
+    "instrument_engine",
+    "measure_wait",
+]
+
+# Durations kept per listener for percentile estimates
+SAMPLE_WINDOW = 1024
+# Connection.info key holding the start time of the running statement
+_STATEMENT_START_KEY = "tux_statement_start"
+
+type WaitKind = Literal["db", "rest"]
+
+
+@dataclass(slots=True)
+class _Invocation:
+    """Wait time accumulated by one running listener invocation."""
+
+    db_ms: float = 0.0
+    rest_ms: float = 0.0
+
+
+_current: ContextVar[_Invocation | None] = ContextVar(
+    "tux_listener_invocation",
+    default=None,
+)
+
+
+def _add_wait(kind: WaitKind, elapsed_ms: float) -> None:
+    """Add wait time to the running listener invocation, if any."""
+    invocation = _current.get()
+    if invocation is None:
+        return
+    if kind == "db":
+        invocation.db_ms += elapsed_ms
+    else:
+        invocation.rest_ms += elapsed_ms
+
+
+@contextmanager
+def measure_wait(kind: WaitKind) -> Iterator[None]:
+    """
+    Attribute the wrapped block's wall time to the running listener.
+
+    Outside a profiled listener this only costs a context variable lookup.
+
+    Parameters
+    ----------
+    kind : WaitKind
+        ``"db"`` for database work, ``"rest"`` for Discord REST calls.
+
+    Yields
+    ------
+    None
+        Control to the measured block.
+    """
+    if _current.get() is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _add_wait(kind, (time.perf_counter() - start) * 1000)
+
+
+def _statement_started(conn: Connection, *_args: Any) -> None:
+    """Remember when a statement was sent (``before_cursor_execute``)."""
+    conn.info[_STATEMENT_START_KEY] = time.perf_counter()
+
+
+def _statement_finished(conn: Connection, *_args: Any) -> None:
+    """Attribute a finished statement to the listener (``after_cursor_execute``)."""
+    if (start := conn.info.pop(_STATEMENT_START_KEY, None)) is not None:
+        _add_wait("db", (time.perf_counter() - start) * 1000)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Attribute time spent executing SQL statements to the running listener.
+
+    Only the statements themselves are timed, so work a caller does while
+    holding a session is not counted and nested sessions are not counted
+    twice. The hooks run in the awaiting task's context, since SQLAlchemy's
+    async layer carries context variables into its greenlets.
+
+    Parameters
+    ----------
+    engine : Engine
+        The synchronous engine behind an ``AsyncEngine`` (``.sync_engine``).
+    """
+    event.listen(engine, "before_cursor_execute", _statement_started)
+    event.listen(engine, "after_cursor_execute", _statement_finished)
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+@dataclass(frozen=True, slots=True)
+class ListenerSnapshot:
+    """Point-in-time summary of one listener's latency."""
+
+    name: str
+    calls: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    total_ms: float
+    db_ms: float
+    rest_ms: float
+
+
+class ListenerStats:
+    """Running counters and a bounded duration window for one listener."""
+
+    __slots__ = ("calls", "db_ms", "durations", "errors", "rest_ms", "total_ms")
+
+    def __init__(self, window: int = SAMPLE_WINDOW) -> None:
+        """Initialize empty stats.
+
+        Parameters
+        ----------
+        window : int, optional
+            Number of recent durations kept for percentiles.
+        """
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.db_ms = 0.0
+        self.rest_ms = 0.0
+        self.durations: deque[float] = deque(maxlen=window)
+
+    def record(
+        self,
+        duration_ms: float,
+        invocation: _Invocation,
+        *,
+        failed: bool,
+    ) -> None:
+        """Add one finished invocation."""
+        self.calls += 1
+        self.errors += failed
+        self.total_ms += duration_ms
+        self.db_ms += invocation.db_ms
+        self.rest_ms += invocation.rest_ms
+        self.durations.append(duration_ms)
+
+    def snapshot(self, name: str) -> ListenerSnapshot:
+        """
+        Summarize the stats.
+
+        Returns
+        -------
+        ListenerSnapshot
+            Percentiles over the recent window; DB and REST time are per-call
+            means over all recorded calls.
+        """
+        ordered = sorted(self.durations)
+        calls = self.calls or 1
+        return ListenerSnapshot(
+            name=name,
+            calls=self.calls,
+            errors=self.errors,
+            p50_ms=_percentile(ordered, 0.50),
+            p95_ms=_percentile(ordered, 0.95),
+            p99_ms=_percentile(ordered, 0.99),
+            max_ms=ordered[-1] if ordered else 0.0,
+            total_ms=self.total_ms,
+            db_ms=self.db_ms / calls,
+            rest_ms=self.rest_ms / calls,
+        )
+
+
+class ListenerProfiler:
+    """
+    Collects latency stats for every profiled listener of a bot.
+
+    Attributes
+    ----------
+    stats : dict[str, ListenerStats]
+        Listener name to its stats since startup (or the last :meth:`reset`).
+    """
+
+    def __init__(self, window: int = SAMPLE_WINDOW) -> None:
+        """Initialize an empty profiler.
+
+        Parameters
+        ----------
+        window : int, optional
+            Number of recent durations kept per listener.
+        """
+        self._window = window
+        self.stats: dict[str, ListenerStats] = {}
+        # Stats since the last push_metrics(), so every push covers one interval
+        self._interval: dict[str, ListenerStats] = {}
+
+    def _stats_for(self, name: str) -> ListenerStats:
+        """Return the stats for a listener, creating them on first use."""
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = ListenerStats(self._window)
+        return stats
+
+    def _interval_stats_for(self, name: str) -> ListenerStats:
+        """Return the current interval's stats for a listener."""
+        stats = self._interval.get(name)
+        if stats is None:
+            stats = self._interval[name] = ListenerStats(self._window)
+        return stats
+
+    @asynccontextmanager
+    async def track(self, name: str) -> AsyncIterator[None]:
+        """
+        Profile the wrapped block as one invocation of ``name``.
+
+        Parameters
+        ----------
+        name : str
+            Listener or stage name.
+
+        Yields
+        ------
+        None
+            Control to the profiled block.
+        """
+        invocation = _Invocation()
+        token = _current.set(invocation)
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except Exception:
+            failed = True
+            raise
+        finally:
+            _current.reset(token)
+            duration_ms = (time.perf_counter() - start) * 1000
+            self._stats_for(name).record(duration_ms, invocation, failed=failed)
+            self._interval_stats_for(name).record(
+                duration_ms,
+                invocation,
+                failed=failed,
+            )
+
+    def wrap[**P](
+        self,
+        name: str,
+        callback: Callable[P, Awaitable[Any]],
+    ) -> Callable[P, Awaitable[Any]]:
+        """
+        Return a coroutine function that profiles ``callback`` under ``name``.
+
+        Returns
+        -------
+        Callable[P, Awaitable[Any]]
+            The profiled listener, suitable for ``bot.add_listener``.
+        """
+
+        @functools.wraps(callback)
+        async def profiled(*args: P.args, **kwargs: P.kwargs) -> Any:
+            async with self.track(name):
+                return await callback(*args, **kwargs)
+
+        return profiled
+
+    def instrument_http(self, http: Any) -> None:
+        """
+        Attribute time spent in Discord REST requests to the running listener.
+
+        Parameters
+        ----------
+        http : Any
+            The bot's ``discord.http.HTTPClient``; its ``request`` is wrapped
+            on the instance.
+        """
+        request = http.request
+
+        @functools.wraps(request)
+        async def timed_request(*args: Any, **kwargs: Any) -> Any:
+            with measure_wait("rest"):
+                return await request(*args, **kwargs)
+
+        http.request = timed_request
+
+    def report(
+        self,
+        limit: int | None = None,
+        sort_by: str = "p99_ms",
+    ) -> list[ListenerSnapshot]:
+        """
+        Return listener snapshots, worst first.
+
+        Parameters
+        ----------
+        limit : int | None, optional
+            Maximum number of snapshots to return.
+        sort_by : str, optional
+            Snapshot field to sort by, by default ``"p99_ms"``.
+
+        Returns
+        -------
+        list[ListenerSnapshot]
+            Snapshots sorted descending by ``sort_by``.
+        """
+        snapshots = sorted(
+            (stats.snapshot(name) for name, stats in self.stats.items()),
+            key=lambda snapshot: getattr(snapshot, sort_by),
+            reverse=True,
+        )
+        return snapshots[:limit] if limit is not None else snapshots
+
+    def push_metrics(self) -> None:
+        """
+        Report every listener called since the last push to Sentry.
+
+        Each push covers only the interval since the previous one: counts,
+        percentiles and mean waits are computed from that interval's calls,
+        and a new interval starts afterwards.
+        """
+        interval, self._interval = self._interval, {}
+        for name, stats in interval.items():
+            snapshot = stats.snapshot(name)
+            record_listener_metric(
+                name,
+                calls=snapshot.calls,
+                errors=snapshot.errors,
+                p50_ms=snapshot.p50_ms,
+                p95_ms=snapshot.p95_ms,
+                p99_ms=snapshot.p99_ms,
+                db_ms=snapshot.db_ms,
+                rest_ms=snapshot.rest_ms,
+            )
+
+    def reset(self) -> None:
+        """Drop all collected stats."""
+        self.stats.clear()
+        self._interval.clear()
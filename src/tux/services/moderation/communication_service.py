@@ -240,9 +240,10 @@ class CommunicationService:
         guild_id: int,
     ) -> tuple[int | None, int | None]:
         """
-        Get audit log and mod log channel IDs for a guild with caching.
+        Get audit log and mod log channel IDs for a guild.
 
-        Uses batch fetching to get both values in a single database query.
+        Served from the guild config snapshot cache, so warm lookups don't
+        query the database.
 
         Parameters
         ----------
@@ -254,37 +255,7 @@ class CommunicationService:
         tuple[int | None, int | None]
             Tuple of (audit_log_id, mod_log_id).
         """
-        # Check cache first
-        cached = await self._guild_config_cache.get(guild_id)
-        # Only return cached values if both keys exist in cache
-        # (even if values are None, that means they were explicitly cached as not configured)
-        if cached is not None and "audit_log_id" in cached and "mod_log_id" in cached:
-            audit_log_id = cached.get("audit_log_id")
-            mod_log_id = cached.get("mod_log_id")
-            logger.trace(
-                f"Cache hit for guild config: {guild_id} "
-                f"(audit_log_id={audit_log_id}, mod_log_id={mod_log_id})",
-            )
-            return audit_log_id, mod_log_id
-
-        # Cache miss or partial cache - batch fetch from database (single query)
-        logger.trace(
-            f"Cache miss/partial for guild config: {guild_id}, fetching from DB",
-        )
-        audit_log_id, mod_log_id = await self.bot.db.guild_config.get_log_channel_ids(
-            guild_id,
-        )
-
-        logger.debug(
-            f"_get_guild_log_channels: Fetched from DB for guild {guild_id} "
-            f"(audit_log_id={audit_log_id}, mod_log_id={mod_log_id})",
-        )
-
-        # Cache the result (get_log_channel_ids already caches, but this ensures consistency)
-        # Use async_set to prevent race conditions when multiple coroutines update cache concurrently
-        await self._guild_config_cache.async_set(guild_id, audit_log_id, mod_log_id)
-
-        return audit_log_id, mod_log_id
+        return await self.bot.db.guild_config.get_log_channel_ids(guild_id)
 
     async def invalidate_guild_config_cache(self, guild_id: int) -> None:
         """
@@ -0,0 +1,319 @@
+"""
+Reminder Scheduler Service for Tux Bot.
+
+Keeps only reminders due within a rolling window resident in a min-heap and
+pages later ones in from the database as the window advances, walking the
+``idx_reminder_expires_at`` index in expiry order. A single runner task sleeps
+until the next reminder is due (or the window needs refilling) and dispatches
+due reminders in bounded batches, so memory use and timer count do not grow
+with the number of far-future reminders.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from tux.services.sentry import capture_exception_safe, record_queue_metric
+
+if TYPE_CHECKING:
+    from tux.database.controllers.reminder import ReminderController
+    from tux.database.models import Reminder
+
+__all__ = ["ReminderScheduler"]
+
+# --- Configuration Constants ---
+
+# How far ahead reminders are kept in memory
+REMINDER_WINDOW = timedelta(hours=6)
+# Reminders loaded per database page
+REMINDER_PAGE_SIZE = 500
+# Upper bound on resident reminders, regardless of window
+MAX_RESIDENT_REMINDERS = 5000
+# Reminders dispatched concurrently per batch
+REMINDER_DISPATCH_BATCH = 25
+# Longest the runner sleeps without re-checking the queue (seconds)
+MAX_IDLE_SECONDS = 300.0
+# Backoff after an unexpected runner error (seconds)
+ERROR_BACKOFF_SECONDS = 30.0
+
+# Cursor ID meaning "every reminder at this timestamp is loaded"
+_MAX_ID = 2**63 - 1
+
+type HeapKey = tuple[datetime, int]
+
+
+def _utcnow() -> datetime:
+    """Return the current time as naive UTC, matching the database column."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Normalize a datetime to naive UTC.
+
+    Returns
+    -------
+    datetime
+        The same instant without tzinfo.
+    """
+    return value.astimezone(UTC).replace(tzinfo=None) if value.tzinfo else value
+
+
+class ReminderScheduler:
+    """
+    Min-heap reminder scheduler with a rolling database window.
+
+    Invariant: every unsent reminder whose ``(expires_at, id)`` is at or before
+    the cursor is in the heap (or already dispatched); everything after the
+    cursor is still only in the database and is paged in by :meth:`_refill`.
+    """
+
+    def __init__(
+        self,
+        controller: ReminderController,
+        dispatch: Callable[[Reminder], Awaitable[None]],
+        *,
+        window: timedelta = REMINDER_WINDOW,
+        page_size: int = REMINDER_PAGE_SIZE,
+        max_resident: int = MAX_RESIDENT_REMINDERS,
+        batch_size: int = REMINDER_DISPATCH_BATCH,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Parameters
+        ----------
+        controller : ReminderController
+            Controller used to page reminders from the database.
+        dispatch : Callable[[Reminder], Awaitable[None]]
+            Coroutine function that delivers one reminder.
+        window : timedelta, optional
+            How far ahead reminders are kept in memory.
+        page_size : int, optional
+            Reminders loaded per database query.
+        max_resident : int, optional
+            Upper bound on resident reminders.
+        batch_size : int, optional
+            Reminders dispatched concurrently per batch.
+        """
+        self._controller = controller
+        self._dispatch = dispatch
+        self._window = window
+        self._page_size = page_size
+        self._max_resident = max_resident
+        self._batch_size = batch_size
+
+        self._heap: list[HeapKey] = []
+        self._entries: dict[int, Reminder] = {}
+        # None until the first refill; afterwards the last (expires_at, id) loaded
+        self._cursor: HeapKey | None = None
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+        self._dispatched = 0
+        self._last_lag_ms = 0.0
+        self._max_lag_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether the runner task is active."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Load the first window and start the runner task."""
+        if self.running:
+            return
+        await self._refill()
+        self._task = asyncio.create_task(self._run(), name="reminder_scheduler")
+        logger.info(
+            f"Reminder scheduler started with {len(self._entries)} reminders "
+            f"due before {self._horizon():%Y-%m-%d %H:%M} UTC",
+        )
+
+    async def stop(self) -> None:
+        """Stop the runner task and drop resident reminders."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._heap.clear()
+        self._entries.clear()
+        self._cursor = None
+
+    def add(self, reminder: Reminder) -> None:
+        """
+        Schedule a newly created reminder.
+
+        Reminders beyond the loaded window are left to be paged in later.
+
+        Parameters
+        ----------
+        reminder : Reminder
+            The persisted reminder (must have an ID).
+        """
+        if reminder.id is None or self._cursor is None:
+            return
+        key = (_naive_utc(reminder.reminder_expires_at), reminder.id)
+        if key <= self._cursor:
+            self._push(key, reminder)
+            self._wakeup.set()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return scheduler statistics for monitoring.
+
+        Returns
+        -------
+        dict[str, Any]
+            Queue depth, window horizon, dispatch count and lag figures.
+        """
+        return {
+            "depth": len(self._entries),
+            "horizon": self._horizon(),
+            "dispatched": self._dispatched,
+            "last_lag_ms": round(self._last_lag_ms, 2),
+            "max_lag_ms": round(self._max_lag_ms, 2),
+        }
+
+    def _horizon(self) -> datetime | None:
+        """Return the timestamp up to which reminders are resident.
+
+        Returns
+        -------
+        datetime | None
+            The cursor timestamp, or None before the first refill.
+        """
+        return self._cursor[0] if self._cursor is not None else None
+
+    def _push(self, key: HeapKey, reminder: Reminder) -> None:
+        """Add a reminder to the heap unless it is already resident."""
+        if key[1] in self._entries:
+            return
+        self._entries[key[1]] = reminder
+        heapq.heappush(self._heap, key)
+
+    async def _refill(self) -> None:
+        """Page reminders into memory until the window is covered."""
+        target = _utcnow() + self._window
+        while len(self._entries) < self._max_resident and (
+            self._cursor is None or self._cursor[0] < target
+        ):
+            rows = await self._controller.get_pending_reminders_page(
+                self._cursor,
+                until=target,
+                limit=self._page_size,
+            )
+            for row in rows:
+                if row.id is not None:
+                    self._push((_naive_utc(row.reminder_expires_at), row.id), row)
+
+            if len(rows) < self._page_size:
+                self._cursor = (target, _MAX_ID)
+                break
+            last = rows[-1]
+            self._cursor = (_naive_utc(last.reminder_expires_at), last.id or 0)
+
+        record_queue_metric("reminders", len(self._entries))
+
+    def _pop_due(self, now: datetime) -> list[tuple[HeapKey, Reminder]]:
+        """Pop up to one batch of reminders due at ``now``.
+
+        Returns
+        -------
+        list[tuple[HeapKey, Reminder]]
+            Due reminders with their heap keys, earliest first.
+        """
+        due: list[tuple[HeapKey, Reminder]] = []
+        while self._heap and len(due) < self._batch_size:
+            if self._heap[0][0] > now:
+                break
+            key = heapq.heappop(self._heap)
+            due.append((key, self._entries.pop(key[1])))
+        return due
+
+    async def _dispatch_batch(
+        self,
+        now: datetime,
+        due: list[tuple[HeapKey, Reminder]],
+    ) -> None:
+        """Deliver a batch of due reminders concurrently."""
+        lag_ms = (now - due[0][0][0]).total_seconds() * 1000
+        results = await asyncio.gather(
+            *(self._dispatch(reminder) for _, reminder in due),
+            return_exceptions=True,
+        )
+        for (key, _), result in zip(due, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to dispatch reminder {key[1]}: {result}")
+                capture_exception_safe(
+                    result,
+                    extra_context={"operation": "reminder_dispatch"},
+                )
+
+        self._dispatched += len(due)
+        self._last_lag_ms = lag_ms
+        self._max_lag_ms = max(self._max_lag_ms, lag_ms)
+        record_queue_metric("reminders", len(self._entries), lag_ms)
+
+    def _needs_refill(self, now: datetime) -> bool:
+        """Whether the window is half consumed and there is room to page more.
+
+        Returns
+        -------
+        bool
+            True if :meth:`_refill` should run.
+        """
+        if len(self._entries) >= self._max_resident:
+            return False
+        return self._cursor is None or now + self._window / 2 >= self._cursor[0]
+
+    def _seconds_until_next_event(self, now: datetime) -> float:
+        """Return how long the runner may sleep before it has work to do.
+
+        Returns
+        -------
+        float
+            Seconds until the next due reminder or window refill.
+        """
+        timeout = MAX_IDLE_SECONDS
+        if self._heap:
+            timeout = min(timeout, (self._heap[0][0] - now).total_seconds())
+        if self._cursor is not None and len(self._entries) < self._max_resident:
+            refill_at = self._cursor[0] - self._window / 2
+            timeout = min(timeout, (refill_at - now).total_seconds())
+        return max(timeout, 0.0)
+
+    async def _run(self) -> None:
+        """Runner loop: refill the window, dispatch due batches, then sleep."""
+        while True:
+            # Clear first so an add() during this iteration is not missed
+            self._wakeup.clear()
+            try:
+                now = _utcnow()
+                if self._needs_refill(now):
+                    await self._refill()
+
+                if due := self._pop_due(now):
+                    await self._dispatch_batch(now, due)
+                    continue
+
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._wakeup.wait(),
+                        timeout=self._seconds_until_next_event(now),
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Reminder scheduler iteration failed: {e}")
+                capture_exception_safe(
+                    e,
+                    extra_context={"operation": "reminder_scheduler"},
+                )
+                await asyncio.sleep(ERROR_BACKOFF_SECONDS)
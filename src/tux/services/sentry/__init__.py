@@ -61,10 +61,14 @@ sentry_sdk.set_user(None)
 
 from .metrics import (
     record_api_metric,
+    record_batch_metric,
     record_cache_metric,
     record_cog_metric,
     record_command_metric,
     record_database_metric,
+    record_event_loop_metric,
+    record_listener_metric,
+    record_queue_metric,
     record_task_metric,
 )
 from .utils import (
@@ -114,10 +118,14 @@ __all__ = [
     "track_command_start",
     # Metrics functions
     "record_api_metric",
+    "record_batch_metric",
     "record_cache_metric",
     "record_cog_metric",
     "record_command_metric",
     "record_database_metric",
+    "record_event_loop_metric",
+    "record_listener_metric",
+    "record_queue_metric",
     "record_task_metric",
 ]
 
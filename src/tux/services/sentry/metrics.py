@@ -20,6 +20,10 @@ __all__ = [
     "record_cog_metric",
     "record_cache_metric",
     "record_task_metric",
+    "record_batch_metric",
+    "record_queue_metric",
+    "record_listener_metric",
+    "record_event_loop_metric",
 ]
 
 
@@ -451,3 +455,198 @@ def record_task_metric(
             1,
             attributes=attributes,
         )
+
+
+def record_batch_metric(
+    batch_name: str,
+    size: int,
+    duration_ms: float,
+    *,
+    success: bool = True,
+    error_type: str | None = None,
+) -> None:
+    """Record batched write/flush metrics.
+
+    Parameters
+    ----------
+    batch_name : str
+        The name of the batch operation (e.g., "xp_ledger_flush").
+    size : int
+        Number of rows/items in the batch.
+    duration_ms : float
+        Batch execution duration in milliseconds.
+    success : bool, optional
+        Whether the batch succeeded, by default True.
+    error_type : str | None, optional
+        The type of error if the batch failed, by default None.
+    """
+    attributes: dict[str, str | bool | float | int] = {
+        "batch": batch_name,
+        "success": success,
+    }
+
+    if error_type:
+        attributes["error_type"] = error_type
+
+    # Record batch size
+    _safe_metric_call(
+        sentry_sdk.metrics.distribution,
+        "bot.batch.size",
+        float(size),
+        attributes=attributes,
+    )
+
+    # Record batch latency
+    _safe_metric_call(
+        sentry_sdk.metrics.distribution,
+        "bot.batch.duration",
+        duration_ms,
+        unit="millisecond",
+        attributes=attributes,
+    )
+
+    # Record failures
+    if not success:
+        _safe_metric_call(
+            sentry_sdk.metrics.count,
+            "bot.batch.failures",
+            1,
+            attributes=attributes,
+        )
+
+
+def record_queue_metric(
+    queue_name: str,
+    depth: int,
+    lag_ms: float | None = None,
+) -> None:
+    """Record in-memory queue depth and dispatch lag.
+
+    Parameters
+    ----------
+    queue_name : str
+        The name of the queue (e.g., "reminders").
+    depth : int
+        Number of items currently queued.
+    lag_ms : float | None, optional
+        How late the last dispatched item was, in milliseconds.
+    """
+    attributes: dict[str, str | bool | float | int] = {"queue": queue_name}
+
+    _safe_metric_call(
+        sentry_sdk.metrics.gauge,
+        "bot.queue.depth",
+        float(depth),
+        attributes=attributes,
+    )
+
+    if lag_ms is not None:
+        _safe_metric_call(
+            sentry_sdk.metrics.distribution,
+            "bot.queue.lag",
+            lag_ms,
+            unit="millisecond",
+            attributes=attributes,
+        )
+
+
+def record_listener_metric(
+    listener: str,
+    *,
+    calls: int,
+    errors: int,
+    p50_ms: float,
+    p95_ms: float,
+    p99_ms: float,
+    db_ms: float,
+    rest_ms: float,
+) -> None:
+    """Record event listener latency for one reporting interval.
+
+    Parameters
+    ----------
+    listener : str
+        The listener name (e.g., "EventHandler.on_member_join").
+    calls : int
+        Invocations since the previous report.
+    errors : int
+        Failed invocations since the previous report.
+    p50_ms : float
+        Median wall time in milliseconds over the interval's calls.
+    p95_ms : float
+        95th percentile wall time in milliseconds.
+    p99_ms : float
+        99th percentile wall time in milliseconds.
+    db_ms : float
+        Mean time per call spent executing database statements, in milliseconds.
+    rest_ms : float
+        Mean time per call spent awaiting Discord REST, in milliseconds.
+    """
+    attributes: dict[str, str | bool | float | int] = {"listener": listener}
+
+    _safe_metric_call(
+        sentry_sdk.metrics.count,
+        "bot.listener.invocations",
+        calls,
+        attributes=attributes,
+    )
+
+    if errors:
+        _safe_metric_call(
+            sentry_sdk.metrics.count,
+            "bot.listener.failures",
+            errors,
+            attributes=attributes,
+        )
+
+    for name, value in (
+        ("bot.listener.p50", p50_ms),
+        ("bot.listener.p95", p95_ms),
+        ("bot.listener.p99", p99_ms),
+        ("bot.listener.db_time", db_ms),
+        ("bot.listener.rest_time", rest_ms),
+    ):
+        _safe_metric_call(
+            sentry_sdk.metrics.gauge,
+            name,
+            value,
+            unit="millisecond",
+            attributes=attributes,
+        )
+
+
+def record_event_loop_metric(
+    lag_p99_ms: float,
+    lag_max_ms: float,
+    slow_callbacks: int,
+) -> None:
+    """Record event loop lag and slow callbacks for one reporting interval.
+
+    Parameters
+    ----------
+    lag_p99_ms : float
+        99th percentile scheduling lag in milliseconds over the recent window.
+    lag_max_ms : float
+        Worst scheduling lag in milliseconds over the recent window.
+    slow_callbacks : int
+        Callbacks that blocked the loop past the threshold since the last report.
+    """
+    _safe_metric_call(
+        sentry_sdk.metrics.gauge,
+        "bot.event_loop.lag_p99",
+        lag_p99_ms,
+        unit="millisecond",
+    )
+    _safe_metric_call(
+        sentry_sdk.metrics.gauge,
+        "bot.event_loop.lag_max",
+        lag_max_ms,
+        unit="millisecond",
+    )
+
+    if slow_callbacks:
+        _safe_metric_call(
+            sentry_sdk.metrics.count,
+            "bot.event_loop.slow_callbacks",
+            slow_callbacks,
+        )
@@ -0,0 +1,272 @@
+"""
+Starboard Reaction Tally Engine for Tux Bot.
+
+Maintains per-message star counts incrementally from raw reaction events so
+the starboard only needs the REST API when the displayed count must change.
+Each message is seeded once (one Get Message call); later add/remove/clear
+events adjust the count in memory. Guild starboard settings are cached until
+they are changed through the starboard commands, and a per-channel token
+bucket keeps REST calls inside Discord's per-channel message rate limits.
+
+This module holds state and decisions only; the Starboard cog performs the
+Discord and database I/O.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+__all__ = [
+    "ChannelRestBudget",
+    "MessageTally",
+    "StarboardAction",
+    "StarboardSettings",
+    "StarboardTally",
+]
+
+# --- Configuration Constants ---
+
+# Tallies kept in memory; least recently touched messages are reseeded on demand
+MAX_TRACKED_MESSAGES = 10_000
+# Per-channel REST budget: Get Message / message edits are ~5 req per 5 s
+REST_BUDGET_CALLS = 5
+REST_BUDGET_PERIOD_SECONDS = 5.0
+
+
+@dataclass(frozen=True, slots=True)
+class StarboardSettings:
+    """A guild's starboard configuration."""
+
+    channel_id: int
+    emoji: str
+    threshold: int
+
+
+class StarboardAction(Enum):
+    """REST work a tally needs to bring the starboard post up to date."""
+
+    POST = "post"
+    EDIT = "edit"
+    DELETE = "delete"
+
+
+@dataclass(slots=True)
+class MessageTally:
+    """
+    Star state for one original message.
+
+    ``count`` excludes the author's own star. ``displayed_count`` is the count
+    shown on the starboard post (None when there is no post), so comparing the
+    two tells whether any REST call is needed. The remaining fields snapshot
+    the original message at seed time so the starboard embed can be rebuilt
+    without fetching it again.
+    """
+
+    guild_id: int
+    channel_id: int
+    message_id: int
+    author_id: int
+    count: int
+    author_name: str
+    author_avatar_url: str | None
+    content: str
+    image_url: str | None
+    jump_url: str
+    created_at: datetime
+    starboard_message_id: int | None = None
+    displayed_count: int | None = None
+
+    def pending_action(self, threshold: int) -> StarboardAction | None:
+        """
+        Return the REST action needed for the current count, if any.
+
+        Parameters
+        ----------
+        threshold : int
+            Stars required for a message to be on the starboard.
+
+        Returns
+        -------
+        StarboardAction | None
+            None when the starboard already reflects the count.
+        """
+        if self.count >= threshold:
+            if self.starboard_message_id is None:
+                return StarboardAction.POST
+            if self.displayed_count != self.count:
+                return StarboardAction.EDIT
+            return None
+        if self.starboard_message_id is not None:
+            return StarboardAction.DELETE
+        return None
+
+
+class ChannelRestBudget:
+    """
+    Token bucket per channel for REST calls.
+
+    Each channel gets ``calls`` tokens that refill continuously over
+    ``period`` seconds. Callers that are refused are told how long to wait.
+    """
+
+    __slots__ = ("_buckets", "_calls", "_period")
+
+    def __init__(
+        self,
+        calls: int = REST_BUDGET_CALLS,
+        period: float = REST_BUDGET_PERIOD_SECONDS,
+    ) -> None:
+        """Initialize the budget.
+
+        Parameters
+        ----------
+        calls : int, optional
+            Burst size per channel.
+        period : float, optional
+            Seconds to refill a full burst.
+        """
+        self._calls = calls
+        self._period = period
+        # channel_id -> (tokens, last refill timestamp)
+        self._buckets: dict[int, tuple[float, float]] = {}
+
+    def acquire(self, channel_id: int) -> float:
+        """
+        Take one token for a channel.
+
+        Returns
+        -------
+        float
+            0.0 if the call may proceed now, otherwise seconds until a token
+            is available (no token is taken in that case).
+        """
+        now = time.monotonic()
+        tokens, last = self._buckets.get(channel_id, (float(self._calls), now))
+        rate = self._calls / self._period
+        tokens = min(float(self._calls), tokens + (now - last) * rate)
+        if tokens >= 1.0:
+            self._buckets[channel_id] = (tokens - 1.0, now)
+            return 0.0
+        self._buckets[channel_id] = (tokens, now)
+        return (1.0 - tokens) / rate
+
+
+class StarboardTally:
+    """
+    In-memory starboard state: cached guild settings and per-message tallies.
+
+    Tallies live in an LRU map bounded by ``max_messages``; an evicted message
+    is simply reseeded the next time it is reacted to.
+    """
+
+    def __init__(self, max_messages: int = MAX_TRACKED_MESSAGES) -> None:
+        """Initialize empty state.
+
+        Parameters
+        ----------
+        max_messages : int, optional
+            Maximum number of message tallies kept in memory.
+        """
+        self._max_messages = max_messages
+        self._settings: dict[int, StarboardSettings | None] = {}
+        self._tallies: OrderedDict[int, MessageTally] = OrderedDict()
+
+    # ---------- Settings ----------
+
+    def has_settings(self, guild_id: int) -> bool:
+        """Return True if the guild's settings (or their absence) are cached."""
+        return guild_id in self._settings
+
+    def get_settings(self, guild_id: int) -> StarboardSettings | None:
+        """Return cached settings, or None if the guild has no starboard."""
+        return self._settings.get(guild_id)
+
+    def set_settings(self, guild_id: int, settings: StarboardSettings | None) -> None:
+        """Cache a guild's settings; None records that it has no starboard."""
+        self._settings[guild_id] = settings
+
+    def invalidate_settings(self, guild_id: int) -> None:
+        """Drop a guild's cached settings and tallies after a config change."""
+        self._settings.pop(guild_id, None)
+        for message_id in [
+            mid for mid, tally in self._tallies.items() if tally.guild_id == guild_id
+        ]:
+            del self._tallies[message_id]
+
+    # ---------- Tallies ----------
+
+    def get(self, message_id: int) -> MessageTally | None:
+        """Return the tally for a message, marking it recently used."""
+        tally = self._tallies.get(message_id)
+        if tally is not None:
+            self._tallies.move_to_end(message_id)
+        return tally
+
+    def seed(self, tally: MessageTally) -> MessageTally:
+        """
+        Start tracking a message, evicting the least recently used if full.
+
+        Returns
+        -------
+        MessageTally
+            The stored tally (an existing one wins if seeding raced).
+        """
+        if (existing := self.get(tally.message_id)) is not None:
+            return existing
+        self._tallies[tally.message_id] = tally
+        if len(self._tallies) > self._max_messages:
+            self._tallies.popitem(last=False)
+        return tally
+
+    def apply_add(self, message_id: int, user_id: int) -> bool:
+        """
+        Count a star added to a tracked message.
+
+        Returns
+        -------
+        bool
+            False if the message is untracked (seed it) or the star is the
+            author's own (which is never counted).
+        """
+        tally = self.get(message_id)
+        if tally is None or user_id == tally.author_id:
+            return False
+        tally.count += 1
+        return True
+
+    def apply_remove(self, message_id: int, user_id: int) -> bool:
+        """
+        Uncount a star removed from a tracked message.
+
+        Returns
+        -------
+        bool
+            False if the message is untracked or the star was the author's.
+        """
+        tally = self.get(message_id)
+        if tally is None or user_id == tally.author_id:
+            return False
+        tally.count = max(0, tally.count - 1)
+        return True
+
+    def apply_clear(self, message_id: int) -> MessageTally | None:
+        """
+        Reset a tracked message's count after its reactions were cleared.
+
+        Returns
+        -------
+        MessageTally | None
+            The tally, or None if the message is untracked.
+        """
+        tally = self.get(message_id)
+        if tally is not None:
+            tally.count = 0
+        return tally
+
+    def __len__(self) -> int:
+        """Return the number of tracked messages."""
+        return len(self._tallies)
@@ -4,33 +4,47 @@ TLDR Pages Client Wrapper.
 A pure Python implementation of the TLDR client specification v2.3,
 providing command documentation lookup with proper caching, localization, and platform support.
 This wrapper contains no Discord dependencies and can be used independently.
+
+Each language's page archive is streamed to disk and packed into a single
+corpus file plus a ``command -> platform -> (offset, length)`` index. The
+corpus is memory-mapped when the index is opened, so page lookups are a dict
+lookup and a slice with no filesystem probing; the network is only used for
+pages the index does not have.
 """
 
-import contextlib
+import asyncio
+import json
+import mmap
 import os
 import re
 import shutil
 import time
 import zipfile
 from functools import lru_cache
-from io import BytesIO
-from pathlib import Path
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from tux.services.http_client import http_client
+from tux.shared.autocomplete import AutocompleteIndex
+from tux.shared.cache_dir import resolve_cache_dir
 
 # Configuration constants following 12-factor app principles
 # Docker sets TLDR_CACHE_DIR explicitly; bare metal falls back to XDG_CACHE_HOME
-_cache_dir = os.getenv("TLDR_CACHE_DIR") or str(
-    Path(os.getenv("XDG_CACHE_HOME", "")) / "tldr"
-    if os.getenv("XDG_CACHE_HOME")
-    else Path.home() / ".cache" / "tldr",
-)
-CACHE_DIR: Path = (
-    Path(_cache_dir) if Path(_cache_dir).is_absolute() else Path(_cache_dir).resolve()
-)
+CACHE_DIR: Path = resolve_cache_dir("TLDR_CACHE_DIR", "tldr")
 MAX_CACHE_AGE_HOURS: int = int(os.getenv("TLDR_CACHE_AGE_HOURS", "168"))
 REQUEST_TIMEOUT_SECONDS: int = int(os.getenv("TLDR_REQUEST_TIMEOUT", "10"))
 ARCHIVE_DOWNLOAD_TIMEOUT_SECONDS: int = 30
+# Archive download chunk size; the zip is streamed to disk, never held in memory
+ARCHIVE_CHUNK_SIZE: int = 64 * 1024
+# How long a page missing from the index and upstream is not looked up again
+MISS_CACHE_SECONDS: float = 3600.0
+# Remembered misses are keyed by user input; the oldest are dropped past this
+MISS_CACHE_MAX_SIZE: int = 1024
+# Upstream pages requested at once for an unindexed command, in priority order
+REMOTE_FETCH_BATCH_SIZE: int = 4
 DISCORD_EMBED_MAX_LENGTH: int = 4000
 
 # TLDR API endpoints
@@ -56,6 +70,249 @@ PLATFORM_MAPPINGS = {
 SUPPORTED_PLATFORMS = sorted([*set(PLATFORM_MAPPINGS.values()), "common"])
 
 
+# Per-language indexes, opened once and swapped after a cache update. Only
+# English and languages loaded by load_index() get one, never raw user input.
+_indexes: dict[str, "TldrIndex"] = {}
+# (command, languages, platform preference) -> when upstream last had no page
+_misses: dict[tuple[str, tuple[str, ...], str | None], float] = {}
+# (language, platform filter) -> command name autocomplete, kept in step with _indexes
+_completions: dict[tuple[str, str | None], AutocompleteIndex] = {}
+
+
+def _language_key(language: str) -> str:
+    """Collapse English variants to ``en``, the archive without a suffix."""
+    return "en" if language.startswith("en") else language
+
+
+def _is_known_language(key: str) -> bool:
+    """Return whether a language key may be given an index and completions."""
+    return key == "en" or key in _indexes
+
+
+def _listing_platforms(platform_filter: str | None) -> list[str]:
+    """Return the platforms whose commands are listed for a platform filter."""
+    # When no filter specified, search linux + common
+    if platform_filter is None:
+        return ["linux", "common"]
+    # Always include common unless it was explicitly requested
+    if platform_filter == "common":
+        return ["common"]
+    return [platform_filter, "common"]
+
+
+def _pages_dir_name(language: str) -> str:
+    """Return the upstream pages directory name for a language."""
+    key = _language_key(language)
+    return "pages" if key == "en" else f"pages.{key}"
+
+
+class TldrIndex:
+    """
+    Memory-mapped page corpus for one language.
+
+    Pages from the archive are stored back to back in ``<pages>.corpus`` and
+    located through ``<pages>.index.json``. Pages fetched from the network
+    after the index was built are kept in memory alongside it.
+    """
+
+    def __init__(
+        self,
+        language: str,
+        pages: dict[str, dict[str, list[int]]] | None = None,
+        corpus: mmap.mmap | None = None,
+    ) -> None:
+        """
+        Initialize an index over an already opened corpus.
+
+        Parameters
+        ----------
+        language : str
+            Language code the index serves.
+        pages : dict[str, dict[str, list[int]]] | None, optional
+            ``command -> platform -> [offset, length]`` into the corpus.
+        corpus : mmap.mmap | None, optional
+            The mapped corpus, or None for an empty index.
+        """
+        self.language = _language_key(language)
+        self._pages = pages or {}
+        self._corpus = corpus
+        self._fetched: dict[tuple[str, str], str] = {}
+
+    @staticmethod
+    def paths(language: str) -> tuple[Path, Path]:
+        """
+        Return the corpus and index file paths for a language.
+
+        Returns
+        -------
+        tuple[Path, Path]
+            ``(corpus_path, index_path)`` under ``CACHE_DIR``.
+        """
+        name = _pages_dir_name(language)
+        return CACHE_DIR / f"{name}.corpus", CACHE_DIR / f"{name}.index.json"
+
+    @classmethod
+    def open(cls, language: str) -> "TldrIndex":
+        """
+        Open the on-disk index for a language.
+
+        Parameters
+        ----------
+        language : str
+            Language code to open.
+
+        Returns
+        -------
+        TldrIndex
+            The mapped index, or an empty one if it is missing or inconsistent.
+        """
+        corpus_path, index_path = cls.paths(language)
+        try:
+            meta: dict[str, Any] = json.loads(index_path.read_bytes())
+            with corpus_path.open("rb") as corpus_file:
+                size = os.fstat(corpus_file.fileno()).st_size
+                if size != meta["corpus_size"]:
+                    logger.warning(f"TLDR corpus for '{language}' is inconsistent")
+                    return cls(language)
+                corpus = (
+                    mmap.mmap(corpus_file.fileno(), 0, access=mmap.ACCESS_READ)
+                    if size
+                    else None
+                )
+        except (OSError, ValueError, KeyError):
+            return cls(language)
+        return cls(language, meta["pages"], corpus)
+
+    @classmethod
+    def build(cls, language: str, archive_path: Path) -> int:
+        """
+        Pack a downloaded pages archive into the corpus and index files.
+
+        Both files are written next to their targets and swapped in, so an
+        open index keeps serving the previous corpus until it is reopened.
+
+        Parameters
+        ----------
+        language : str
+            Language code of the archive.
+        archive_path : Path
+            Path of the downloaded zip archive.
+
+        Returns
+        -------
+        int
+            Number of pages indexed.
+
+        Raises
+        ------
+        zipfile.BadZipFile
+            If the archive is not a valid zip file.
+        """
+        corpus_path, index_path = cls.paths(language)
+        corpus_tmp = corpus_path.with_name(f"{corpus_path.name}.tmp")
+        index_tmp = index_path.with_name(f"{index_path.name}.tmp")
+        pages: dict[str, dict[str, list[int]]] = {}
+        offset = 0
+        count = 0
+
+        with zipfile.ZipFile(archive_path) as archive, corpus_tmp.open("wb") as corpus:
+            for info in archive.infolist():
+                parts = PurePosixPath(info.filename).parts
+                if info.is_dir() or len(parts) < 2 or not parts[-1].endswith(".md"):
+                    continue
+                platform, command = parts[-2], parts[-1].removesuffix(".md")
+                data = archive.read(info)
+                corpus.write(data)
+                pages.setdefault(command, {})[platform] = [offset, len(data)]
+                offset += len(data)
+                count += 1
+
+        index_tmp.write_text(
+            json.dumps({"corpus_size": offset, "pages": pages}, separators=(",", ":")),
+            encoding="utf-8",
+        )
+        corpus_tmp.replace(corpus_path)
+        index_tmp.replace(index_path)
+
+        # Per-page files extracted by older versions are no longer read
+        shutil.rmtree(CACHE_DIR / _pages_dir_name(language), ignore_errors=True)
+        return count
+
+    def get(self, command: str, platform: str) -> str | None:
+        """
+        Return a page if the index has it.
+
+        Parameters
+        ----------
+        command : str
+            Normalized command name.
+        platform : str
+            Platform directory name.
+
+        Returns
+        -------
+        str | None
+            The page content, or None if the index has no such page.
+        """
+        if (page := self._fetched.get((command, platform))) is not None:
+            return page
+        location = self._pages.get(command, {}).get(platform)
+        if location is None or self._corpus is None:
+            return None
+        offset, length = location
+        return self._corpus[offset : offset + length].decode("utf-8")
+
+    def add(self, command: str, platform: str, page: str) -> None:
+        """
+        Remember a page fetched from the network until the next rebuild.
+
+        Parameters
+        ----------
+        command : str
+            Normalized command name.
+        platform : str
+            Platform directory name.
+        page : str
+            The page content.
+        """
+        self._fetched[command, platform] = page
+
+    def commands(self, platforms: list[str]) -> list[str]:
+        """
+        List commands that have a page on any of the given platforms.
+
+        Parameters
+        ----------
+        platforms : list[str]
+            Platform directory names.
+
+        Returns
+        -------
+        list[str]
+            Sorted command names.
+        """
+        wanted = set(platforms)
+        found = {
+            command
+            for command, available in self._pages.items()
+            if not wanted.isdisjoint(available)
+        }
+        found.update(
+            command for command, platform in self._fetched if platform in wanted
+        )
+        return sorted(found)
+
+    def __len__(self) -> int:
+        """Return the number of indexed commands."""
+        return len(self._pages)
+
+    def close(self) -> None:
+        """Unmap the corpus."""
+        if self._corpus is not None:
+            self._corpus.close()
+            self._corpus = None
+
+
 class TldrClient:
     """
     Core TLDR client functionality for fetching and managing pages.
@@ -89,115 +346,128 @@ class TldrClient:
         return "-".join(name.lower().strip().split())
 
     @staticmethod
-    def get_cache_file_path(command: str, platform: str, language: str) -> Path:
+    async def get_index(language: str) -> TldrIndex | None:
         """
-        Generate the file system path for a cached TLDR page.
+        Return the index for a language, opening it on first use.
+
+        English is opened in a worker thread on first use; other languages
+        only have an index once :meth:`load_index` has opened one, so
+        arbitrary user input never opens files or grows ``_indexes``.
 
         Parameters
         ----------
-        command : str
-            Normalized command name.
-        platform : str
-            Target platform (linux, osx, windows, etc.).
         language : str
-            Language code (en, es, fr, etc.).
+            Language code.
 
         Returns
         -------
-        Path
-            Full path to the cached page file.
+        TldrIndex | None
+            The open index, empty if no corpus has been built yet, or None
+            for a language that was never loaded.
         """
-        pages_dir = f"pages{f'.{language}' if language != 'en' else ''}"
-        return CACHE_DIR / pages_dir / platform / f"{command}.md"
+        key = _language_key(language)
+        if (index := _indexes.get(key)) is not None or key != "en":
+            return index
+        index = await asyncio.to_thread(TldrIndex.open, key)
+        # Another lookup may have opened it while this one was in the thread
+        if (opened := _indexes.get(key)) is not None:
+            index.close()
+            return opened
+        _indexes[key] = index
+        return index
 
     @staticmethod
-    def have_recent_cache(command: str, platform: str, language: str) -> bool:
+    async def load_index(language: str) -> TldrIndex:
         """
-        Check if a recent cached version of a page exists.
+        (Re)open the on-disk index for a language, replacing any open one.
+
+        The corpus is mapped and the command lists for live autocompletes are
+        built in a worker thread. The swap, closing the previous index and the
+        autocomplete updates happen on the event loop, so lookups never see
+        an unmapped corpus or a half-updated completion index.
 
         Parameters
         ----------
-        command : str
-            Command name to check.
-        platform : str
-            Platform to check.
         language : str
-            Language to check.
+            Language code.
 
         Returns
         -------
-        bool
-            True if cached file exists and is within MAX_CACHE_AGE_HOURS.
+        TldrIndex
+            The freshly opened index.
         """
-        try:
-            cache_file_path = TldrClient.get_cache_file_path(
-                command,
-                platform,
-                language,
-            )
-            if not cache_file_path.exists():
-                return False
-            last_modified = cache_file_path.stat().st_mtime
-            hours_passed = (time.time() - last_modified) / 3600
-        except OSError:
-            return False
-        else:
-            return hours_passed <= MAX_CACHE_AGE_HOURS
+        key = _language_key(language)
+        platform_filters = [
+            platform_filter
+            for language_key, platform_filter in _completions
+            if language_key == key
+        ]
+
+        def open_index() -> tuple[TldrIndex, dict[str | None, list[str]]]:
+            index = TldrIndex.open(key)
+            commands = {
+                platform_filter: index.commands(_listing_platforms(platform_filter))
+                for platform_filter in platform_filters
+            }
+            return index, commands
+
+        index, commands = await asyncio.to_thread(open_index)
+
+        if (previous := _indexes.get(key)) is not None:
+            previous.close()
+        _indexes[key] = index
+        TldrClient.list_tldr_commands.cache_clear()
+
+        # Apply only the added and removed commands to live autocompletes
+        for completion_key in [k for k in _completions if k[0] == key]:
+            if (names := commands.get(completion_key[1])) is not None:
+                _completions[completion_key].update(names)
+            else:
+                # Created while the index was opening; rebuilt on next use
+                del _completions[completion_key]
+        return index
 
     @staticmethod
-    def load_page_from_cache(command: str, platform: str, language: str) -> str | None:
+    def command_completions(
+        language: str = "en",
+        platform_filter: str | None = "linux",
+    ) -> AutocompleteIndex:
         """
-        Load a TLDR page from local cache.
+        Return the command name autocomplete index for a language and platform.
 
         Parameters
         ----------
-        command : str
-            Command name.
-        platform : str
-            Platform name.
         language : str
             Language code.
+        platform_filter : str | None
+            Platform to filter by. If None, covers linux + common platforms.
 
         Returns
         -------
-        str | None
-            Page content if available, None if not found or on error.
+        AutocompleteIndex
+            Index built on first use and updated as the cache changes; an
+            empty, unshared one for an unknown language or platform.
         """
-        with contextlib.suppress(OSError):
-            cache_path = TldrClient.get_cache_file_path(command, platform, language)
-            if cache_path.exists():
-                return cache_path.read_text(encoding="utf-8")
-        return None
+        key = (_language_key(language), platform_filter)
+        if not _is_known_language(key[0]) or (
+            platform_filter is not None and platform_filter not in SUPPORTED_PLATFORMS
+        ):
+            return AutocompleteIndex()
+        if (completions := _completions.get(key)) is None:
+            completions = _completions[key] = AutocompleteIndex(
+                TldrClient.list_tldr_commands(language, platform_filter),
+            )
+        return completions
 
     @staticmethod
-    def store_page_to_cache(
-        page: str,
-        command: str,
-        platform: str,
-        language: str,
-    ) -> None:
-        """
-        Store a TLDR page to local cache.
-
-        Parameters
-        ----------
-        page : str
-            Page content to store.
-        command : str
-            Command name.
-        platform : str
-            Platform name.
-        language : str
-            Language code.
-        """
-        with contextlib.suppress(OSError):
-            cache_file_path = TldrClient.get_cache_file_path(
-                command,
-                platform,
-                language,
-            )
-            cache_file_path.parent.mkdir(parents=True, exist_ok=True)
-            cache_file_path.write_text(page, encoding="utf-8")
+    def _remember_page(language: str, command: str, platform: str, page: str) -> None:
+        """Keep a page fetched from the network and offer it in autocomplete."""
+        key = _language_key(language)
+        if (index := _indexes.get(key)) is not None:
+            index.add(command, platform, page)
+        for (language_key, platform_filter), completions in _completions.items():
+            if language_key == key and platform in _listing_platforms(platform_filter):
+                completions.add(command)
 
     @staticmethod
     def detect_platform() -> str:
@@ -282,7 +552,7 @@ class TldrClient:
         return platforms_to_try
 
     @staticmethod
-    def fetch_tldr_page(
+    async def fetch_tldr_page(
         command: str,
         languages: list[str],
         platform_preference: str | None = None,
@@ -307,41 +577,83 @@ class TldrClient:
         Notes
         -----
         Follows TLDR spec priority: platform takes precedence over language.
-        Tries cache first, then remote fetch with automatic caching.
+        Pages are served from the local index; only when no language/platform
+        combination is indexed are combinations fetched upstream, a few at a
+        time in priority order, and the highest-priority hit is kept in the
+        index.
         """
         platforms_to_try = TldrClient.get_platform_priority(platform_preference)
+        candidates = [
+            (language, platform)
+            for language in languages
+            for platform in platforms_to_try
+        ]
+
+        indexes = {
+            language: await TldrClient.get_index(language) for language in languages
+        }
+        for language, platform in candidates:
+            if (index := indexes[language]) is not None and (
+                page := index.get(command, platform)
+            ) is not None:
+                return (page, platform)
+
+        miss_key = (command, tuple(languages), platform_preference)
+        if (missed_at := _misses.get(miss_key)) is not None:
+            if time.monotonic() - missed_at < MISS_CACHE_SECONDS:
+                return None
+            del _misses[miss_key]
+
+        # Small batches in priority order: the first hit ends the search
+        for start in range(0, len(candidates), REMOTE_FETCH_BATCH_SIZE):
+            batch = candidates[start : start + REMOTE_FETCH_BATCH_SIZE]
+            remote_pages = await asyncio.gather(
+                *(
+                    TldrClient._fetch_remote_page(command, platform, language)
+                    for language, platform in batch
+                ),
+            )
+            for (language, platform), page in zip(batch, remote_pages, strict=True):
+                if page is not None:
+                    TldrClient._remember_page(language, command, platform, page)
+                    return (page, platform)
+
+        _misses[miss_key] = time.monotonic()
+        # Dicts keep insertion order, so the first key is the oldest miss
+        while len(_misses) > MISS_CACHE_MAX_SIZE:
+            del _misses[next(iter(_misses))]
+        return None
 
-        for language in languages:
-            for platform in platforms_to_try:
-                # Check cache first
-                if TldrClient.have_recent_cache(command, platform, language) and (
-                    cache_content := TldrClient.load_page_from_cache(
-                        command,
-                        platform,
-                        language,
-                    )
-                ):
-                    return (cache_content, platform)
-
-                # Fetch from remote
-                suffix = f".{language}" if language != "en" else ""
-                url = f"{PAGES_SOURCE_URL}{suffix}/{platform}/{command}.md"
+    @staticmethod
+    async def _fetch_remote_page(
+        command: str,
+        platform: str,
+        language: str,
+    ) -> str | None:
+        """
+        Fetch one page from the upstream repository.
 
-                try:
-                    req = Request(url, headers={"User-Agent": "tldr-python-client"})
-                    with urlopen(req, timeout=REQUEST_TIMEOUT_SECONDS) as resp:
-                        page_content = resp.read().decode("utf-8")
-                        TldrClient.store_page_to_cache(
-                            page_content,
-                            command,
-                            platform,
-                            language,
-                        )
-                        return (page_content, platform)
-                except (HTTPError, URLError):
-                    continue  # Try next platform/language combination
+        Parameters
+        ----------
+        command : str
+            Normalized command name.
+        platform : str
+            Platform directory name.
+        language : str
+            Language code.
 
-        return None
+        Returns
+        -------
+        str | None
+            The page content, or None if it does not exist or the request failed.
+        """
+        suffix = "" if _language_key(language) == "en" else f".{language}"
+        url = f"{PAGES_SOURCE_URL}{suffix}/{platform}/{command}.md"
+        try:
+            response = await http_client.get(url, timeout=REQUEST_TIMEOUT_SECONDS)
+        except httpx.HTTPError:
+            return None
+        return response.text
 
     @staticmethod
     @lru_cache(maxsize=128)
@@ -362,47 +674,12 @@ class TldrClient:
         Returns
         -------
         list[str]
-            Sorted list of available command names.
+            Sorted list of available command names; empty until the
+            language's index has been opened.
         """
-        commands_set: set[str] = set()
-
-        normalized_lang_for_dir = "en" if language.startswith("en") else language
-        pages_dir_name = (
-            f"pages.{normalized_lang_for_dir}"
-            if normalized_lang_for_dir != "en"
-            else "pages"
-        )
-
-        # Handle platform filtering logic
-        if platform_filter is None:
-            # When no filter specified, search linux + common
-            platforms_to_scan = ["linux", "common"]
-        else:
-            # Use the specified platform
-            platforms_to_scan = [platform_filter]
-            # Always include common unless it was explicitly requested
-            if platform_filter != "common":
-                platforms_to_scan.append("common")
-
-        unique_platforms_to_scan = list(dict.fromkeys(platforms_to_scan))
-
-        for platform in unique_platforms_to_scan:
-            path: Path = CACHE_DIR / pages_dir_name / platform
-
-            try:
-                # Skip if path doesn't exist
-                if not path.exists() or not path.is_dir():
-                    continue
-
-                # Collect all .md files
-                found_in_platform: set[str] = {
-                    file.stem for file in path.iterdir() if file.suffix == ".md"
-                }
-                commands_set.update(found_in_platform)
-            except OSError:
-                continue
-
-        return sorted(commands_set)
+        if (index := _indexes.get(_language_key(language))) is None:
+            return []
+        return index.commands(_listing_platforms(platform_filter))
 
     @staticmethod
     def parse_placeholders(
@@ -674,7 +951,7 @@ class TldrClient:
         return f"No TLDR page found for `{command}`.\n[Request it on GitHub]({url})"
 
     @staticmethod
-    def update_tldr_cache(language: str = "en") -> str:
+    async def update_tldr_cache(language: str = "en") -> str:
         """
         Update the TLDR cache for a specific language.
 
@@ -690,58 +967,37 @@ class TldrClient:
 
         Notes
         -----
-        Downloads from GitHub releases following TLDR spec v2.3.
-        Replaces existing cache completely to ensure consistency.
+        Downloads from GitHub releases following TLDR spec v2.3. The archive
+        is streamed to a temporary file and packed into the corpus, with all
+        file writes off the event loop, and the new index replaces the open
+        one.
         """
-        suffix = "" if language.startswith("en") else f".{language}"
-        pages_dir_name = "pages" if language.startswith("en") else f"pages.{language}"
-
+        key = _language_key(language)
+        suffix = "" if key == "en" else f".{key}"
         url = ARCHIVE_URL_TEMPLATE.format(suffix=suffix)
+        archive_path = CACHE_DIR / f"{_pages_dir_name(key)}.zip.part"
 
         try:
-            req = Request(
+            await asyncio.to_thread(CACHE_DIR.mkdir, parents=True, exist_ok=True)
+            client = await http_client.get_client()
+            async with client.stream(
+                "GET",
                 url,
-                headers={
-                    "User-Agent": "tldr-python-client",
-                    "Accept": "application/zip",
-                },
-            )
-
-            with urlopen(req, timeout=ARCHIVE_DOWNLOAD_TIMEOUT_SECONDS) as resp:
-                content = resp.read()
-
-                if content.strip().lower().startswith((b"<!doctype html", b"<html>")):
-                    return f"Failed to update cache for '{language}': Invalid content received"
-
-                target_path = CACHE_DIR / pages_dir_name
-
-                if target_path.exists():
-                    try:
-                        shutil.rmtree(target_path)
-                    except OSError:
-                        for item in target_path.rglob("*"):
-                            try:
-                                if item.is_file():
-                                    item.unlink()
-                                elif item.is_dir():
-                                    item.rmdir()
-                            except OSError:
-                                continue
-                        with contextlib.suppress(OSError):
-                            target_path.rmdir()
-
-                target_path.mkdir(parents=True, exist_ok=True)
-
-                with zipfile.ZipFile(BytesIO(content)) as archive:
-                    archive.extractall(target_path)
-
-                # Invalidate command listing cache so autocomplete reflects new data
-                TldrClient.list_tldr_commands.cache_clear()
-
-                return f"Cache updated for language `{language}` from {url}"
-
-        except HTTPError as e:
-            if e.code == 404:
+                headers={"Accept": "application/zip"},
+                timeout=ARCHIVE_DOWNLOAD_TIMEOUT_SECONDS,
+            ) as response:
+                response.raise_for_status()
+                archive = await asyncio.to_thread(archive_path.open, "wb")
+                try:
+                    async for chunk in response.aiter_bytes(ARCHIVE_CHUNK_SIZE):
+                        await asyncio.to_thread(archive.write, chunk)
+                finally:
+                    await asyncio.to_thread(archive.close)
+
+            page_count = await asyncio.to_thread(TldrIndex.build, key, archive_path)
+            await TldrClient.load_index(key)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
                 return (
                     f"Failed to update cache for '{language}': Archive not found (404)"
                 )
@@ -750,6 +1006,12 @@ class TldrClient:
             return f"Failed to update cache for '{language}': Invalid zip file"
         except Exception as e:
             return f"Failed to update cache for '{language}': {e}"
+        finally:
+            archive_path.unlink(missing_ok=True)
+
+        return (
+            f"Cache updated for language `{language}` from {url} ({page_count} pages)"
+        )
 
     @staticmethod
     def cache_needs_update(language: str = "en") -> bool:
@@ -764,18 +1026,14 @@ class TldrClient:
         Returns
         -------
         bool
-            True if cache is missing or older than MAX_CACHE_AGE_HOURS.
+            True if the index is missing or older than MAX_CACHE_AGE_HOURS.
         """
-        pages_dir_name = "pages" if language.startswith("en") else f"pages.{language}"
-        cache_dir = CACHE_DIR / pages_dir_name
-
-        if not cache_dir.exists():
-            return True
+        _, index_path = TldrIndex.paths(language)
 
         try:
-            last_modified = cache_dir.stat().st_mtime
+            last_modified = index_path.stat().st_mtime
             hours_passed = (time.time() - last_modified) / 3600
-        except (FileNotFoundError, PermissionError):
+        except OSError:
             return True
         else:
             return hours_passed > MAX_CACHE_AGE_HOURS
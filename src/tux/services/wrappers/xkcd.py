@@ -4,23 +4,47 @@ xkcd Comics API Wrapper for Tux Bot.
 This module provides integration with the xkcd webcomic API,
 allowing the bot to fetch and display xkcd comics with full metadata
 and image processing capabilities.
+
+Requests go through the shared async ``http_client`` pool. Published comics
+never change, so their metadata is kept in a :class:`ComicStore` (memory plus
+a JSON file on disk) and never refetched; only the latest comic ID is
+refreshed, at most every ``LATEST_TTL_SECONDS``. A background prefetch fills
+the store so random comics are served locally.
 """
 
+import asyncio
 import datetime
 import json
 import random
+import time
 from io import BytesIO
+from pathlib import Path
 from typing import Any
 
 import httpx
+from loguru import logger
 from PIL import Image, UnidentifiedImageError
 
+from tux.services.http_client import http_client
+from tux.shared.cache_dir import resolve_cache_dir
+from tux.shared.constants import HTTP_NOT_FOUND
 from tux.shared.exceptions import (
     TuxAPIConnectionError,
     TuxAPIRequestError,
     TuxAPIResourceNotFoundError,
 )
 
+# Docker sets XKCD_CACHE_DIR explicitly; bare metal falls back to XDG_CACHE_HOME
+CACHE_DIR: Path = resolve_cache_dir("XKCD_CACHE_DIR", "xkcd")
+STORE_FILE_NAME = "comics.json"
+# How long the latest comic ID is trusted before info.0.json is fetched again
+LATEST_TTL_SECONDS: float = 600.0
+# Concurrent requests and store flush interval during background prefetch
+PREFETCH_CONCURRENCY = 4
+PREFETCH_SAVE_EVERY = 200
+# Comic 404 deliberately does not exist
+MISSING_COMIC_IDS = frozenset({404})
+
 
 class HttpError(Exception):
     """Exception raised for HTTP-related errors in xkcd API calls."""
@@ -141,6 +165,85 @@ class Comic:
         return f"Comic({self.title})"
 
 
+class ComicStore:
+    """
+    Metadata of published comics, kept in memory and persisted as JSON.
+
+    Comics are immutable once published, so entries never expire. Disk I/O
+    runs in a worker thread and failures only cost a refetch later.
+    """
+
+    def __init__(self, path: Path | None = None, *, persist: bool = True) -> None:
+        """Initialize an empty store.
+
+        Parameters
+        ----------
+        path : Path | None, optional
+            JSON file backing the store, by default ``CACHE_DIR/comics.json``.
+        persist : bool, optional
+            Whether to read and write the file at all, by default True.
+        """
+        self.path = path if path is not None else CACHE_DIR / STORE_FILE_NAME
+        self._comics: dict[int, dict[str, Any]] = {}
+        self._dirty = False
+        self._persist = persist
+
+    def __contains__(self, comic_id: int) -> bool:
+        """Return whether a comic's metadata is stored."""
+        return comic_id in self._comics
+
+    def __len__(self) -> int:
+        """Return the number of stored comics."""
+        return len(self._comics)
+
+    def get(self, comic_id: int) -> dict[str, Any] | None:
+        """Return a comic's API metadata, if stored."""
+        return self._comics.get(comic_id)
+
+    def put(self, xkcd_dict: dict[str, Any]) -> None:
+        """Store a comic's API metadata (keyed by its ``num``)."""
+        comic_id = int(xkcd_dict["num"])
+        if comic_id not in self._comics:
+            self._comics[comic_id] = xkcd_dict
+            self._dirty = True
+
+    def _read(self) -> dict[int, dict[str, Any]]:
+        """Read the store file (worker thread)."""
+        raw: dict[str, dict[str, Any]] = json.loads(self.path.read_text("utf-8"))
+        return {int(comic_id): data for comic_id, data in raw.items()}
+
+    def _write(self, comics: dict[int, dict[str, Any]]) -> None:
+        """Atomically write the store file (worker thread)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(comics, separators=(",", ":")), "utf-8")
+        tmp.replace(self.path)
+
+    async def load(self) -> None:
+        """Load stored comics from disk, keeping any already in memory."""
+        if not self._persist or not self.path.exists():
+            return
+        try:
+            loaded = await asyncio.to_thread(self._read)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read xkcd comic store {self.path}: {e}")
+            return
+        loaded.update(self._comics)
+        self._comics = loaded
+        logger.debug(f"Loaded {len(self._comics)} xkcd comics from {self.path}")
+
+    async def save(self) -> None:
+        """Write the store to disk if it changed since the last save."""
+        if not self._persist or not self._dirty:
+            return
+        self._dirty = False
+        try:
+            await asyncio.to_thread(self._write, dict(self._comics))
+        except OSError as e:
+            self._dirty = True
+            logger.warning(f"Could not write xkcd comic store {self.path}: {e}")
+
+
 class Client:
     """xkcd API client for fetching and managing comics."""
 
@@ -148,6 +251,7 @@ class Client:
         self,
         api_url: str = "https://xkcd.com",
         explanation_wiki_url: str = "https://www.explainxkcd.com/wiki/index.php/",
+        store: ComicStore | None = None,
     ) -> None:
         """
         Initialize the Client.
@@ -158,9 +262,15 @@ class Client:
             The URL of the xkcd API, by default "https://xkcd.com"
         explanation_wiki_url : str, optional
             The URL of the xkcd explanation wiki, by default "https://www.explainxkcd.com/wiki/index.php/"
+        store : ComicStore | None, optional
+            Comic metadata store, by default one backed by ``CACHE_DIR``.
         """
         self._api_url = api_url
         self._explanation_wiki_url = explanation_wiki_url
+        self.store = store if store is not None else ComicStore()
+        self._latest_id: int | None = None
+        self._latest_fetched_at = 0.0
+        self._latest_lock = asyncio.Lock()
 
     def latest_comic_url(self) -> str:
         """
@@ -189,55 +299,73 @@ class Client:
         """
         return f"{self._api_url}/{comic_id}/info.0.json"
 
-    def _parse_response(self, response_text: str) -> Comic:
+    def _build_comic(self, xkcd_dict: dict[str, Any]) -> Comic:
         """
-        Parse the response text into a Comic object.
+        Build a Comic object from API metadata.
 
         Parameters
         ----------
-        response_text : str
-            The response text to parse.
+        xkcd_dict : dict[str, Any]
+            The comic metadata.
 
         Returns
         -------
         Comic
-            The parsed comic object.
+            The comic, with page and explanation URLs filled in.
         """
-        response_dict: dict[str, Any] = json.loads(response_text)
-        comic_url: str = f"{self._api_url}/{response_dict['num']}/"
-        explanation_url: str = f"{self._explanation_wiki_url}{response_dict['num']}"
-
         return Comic(
-            response_dict,
-            comic_url=comic_url,
-            explanation_url=explanation_url,
+            xkcd_dict,
+            comic_url=f"{self._api_url}/{xkcd_dict['num']}/",
+            explanation_url=f"{self._explanation_wiki_url}{xkcd_dict['num']}",
         )
 
-    def _fetch_comic(self, comic_id: int, raw_comic_image: bool) -> Comic:
+    async def _with_image(self, comic: Comic, raw_comic_image: bool) -> Comic:
+        """Download the comic's image into it when requested.
+
+        Returns
+        -------
+        Comic
+            The same comic.
         """
-        Fetch a comic from the xkcd API.
+        if raw_comic_image:
+            comic.update_raw_image(await self._request_raw_image(comic.image_url))
+        return comic
 
-        Parameters
-        ----------
-        comic_id : int
-            The ID of the comic to fetch.
-        raw_comic_image : bool
-            Whether to fetch the raw image data.
+    async def latest_comic_id(self) -> int:
+        """
+        Return the latest comic ID, refreshing it at most every TTL.
 
         Returns
         -------
-        Comic
-            The fetched comic.
+        int
+            The ID of the newest published comic.
         """
-        comic = self._parse_response(self._request_comic(comic_id))
+        async with self._latest_lock:
+            if (
+                self._latest_id is None
+                or time.monotonic() - self._latest_fetched_at > LATEST_TTL_SECONDS
+            ):
+                xkcd_dict = await self._request_comic(0)
+                self.store.put(xkcd_dict)
+                self._latest_id = int(xkcd_dict["num"])
+                self._latest_fetched_at = time.monotonic()
+            return self._latest_id
 
-        if raw_comic_image:
-            raw_image = self._request_raw_image(comic.image_url)
-            comic.update_raw_image(raw_image)
+    async def _comic_dict(self, comic_id: int) -> dict[str, Any]:
+        """
+        Return a comic's metadata from the store, fetching it once if missing.
 
-        return comic
+        Returns
+        -------
+        dict[str, Any]
+            The comic metadata.
+        """
+        if (xkcd_dict := self.store.get(comic_id)) is None:
+            xkcd_dict = await self._request_comic(comic_id)
+            self.store.put(xkcd_dict)
+        return xkcd_dict
 
-    def get_latest_comic(self, raw_comic_image: bool = False) -> Comic:
+    async def get_latest_comic(self, raw_comic_image: bool = False) -> Comic:
         """
         Get the latest xkcd comic.
 
@@ -251,9 +379,11 @@ class Client:
         Comic
             The latest xkcd comic.
         """
-        return self._fetch_comic(0, raw_comic_image)
+        latest_id = await self.latest_comic_id()
+        comic = self._build_comic(await self._comic_dict(latest_id))
+        return await self._with_image(comic, raw_comic_image)
 
-    def get_comic(self, comic_id: int, raw_comic_image: bool = False) -> Comic:
+    async def get_comic(self, comic_id: int, raw_comic_image: bool = False) -> Comic:
         """
         Get a specific xkcd comic.
 
@@ -269,12 +399,15 @@ class Client:
         Comic
             The fetched xkcd comic.
         """
-        return self._fetch_comic(comic_id, raw_comic_image)
+        comic = self._build_comic(await self._comic_dict(comic_id))
+        return await self._with_image(comic, raw_comic_image)
 
-    def get_random_comic(self, raw_comic_image: bool = False) -> Comic:
+    async def get_random_comic(self, raw_comic_image: bool = False) -> Comic:
         """
         Get a random xkcd comic.
 
+        Once the store is warm this needs no network request at all.
+
         Parameters
         ----------
         raw_comic_image : bool, optional
@@ -285,12 +418,86 @@ class Client:
         Comic
             The random xkcd comic.
         """
-        latest_comic_id: int = self._parse_response(self._request_comic(0)).id or 0
-        random_id: int = random.randint(1, latest_comic_id)
+        latest_id = await self.latest_comic_id()
+        random_id = random.randint(1, latest_id)
+        while random_id in MISSING_COMIC_IDS:
+            random_id = random.randint(1, latest_id)
+        return await self.get_comic(random_id, raw_comic_image)
+
+    async def prefetch(self, concurrency: int = PREFETCH_CONCURRENCY) -> int:
+        """
+        Fetch every published comic missing from the store.
+
+        A fixed set of workers in one task group takes comics from a shared
+        queue, so cancelling the prefetch cancels every request in flight.
+        Comics the API answers with an error are skipped; a connection
+        failure stops the prefetch.
+
+        Parameters
+        ----------
+        concurrency : int, optional
+            Maximum requests in flight.
+
+        Returns
+        -------
+        int
+            Number of comics fetched.
+
+        Raises
+        ------
+        TuxAPIConnectionError
+            If the xkcd API cannot be reached.
+        """
+        latest_id = await self.latest_comic_id()
+        missing = [
+            comic_id
+            for comic_id in range(1, latest_id + 1)
+            if comic_id not in self.store and comic_id not in MISSING_COMIC_IDS
+        ]
+        if not missing:
+            return 0
+
+        queue = iter(missing)
+        fetched = 0
+        skipped = 0
+        connection_error: TuxAPIConnectionError | None = None
+
+        async def worker() -> None:
+            nonlocal fetched, skipped, connection_error
+            for comic_id in queue:
+                if connection_error is not None:
+                    return
+                try:
+                    self.store.put(await self._request_comic(comic_id))
+                except TuxAPIResourceNotFoundError:
+                    continue
+                except TuxAPIRequestError as e:
+                    skipped += 1
+                    logger.debug(f"xkcd prefetch skipped comic {comic_id}: {e}")
+                    continue
+                except TuxAPIConnectionError as e:
+                    connection_error = e
+                    return
+                fetched += 1
+                if fetched % PREFETCH_SAVE_EVERY == 0:
+                    await self.store.save()
 
-        return self._fetch_comic(random_id, raw_comic_image)
+        try:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(min(concurrency, len(missing))):
+                    group.create_task(worker())
+        finally:
+            await self.store.save()
+        if connection_error is not None:
+            raise connection_error
+
+        logger.info(
+            f"Prefetched {fetched} xkcd comics ({len(self.store)} stored, "
+            f"{skipped} skipped)",
+        )
+        return fetched
 
-    def _request_comic(self, comic_id: int) -> str:
+    async def _request_comic(self, comic_id: int) -> dict[str, Any]:
         """
         Request the comic data from the xkcd API.
 
@@ -301,8 +508,8 @@ class Client:
 
         Returns
         -------
-        str
-            The response text.
+        dict[str, Any]
+            The comic metadata.
 
         Raises
         ------
@@ -318,11 +525,10 @@ class Client:
         )
 
         try:
-            response = httpx.get(comic_url)
-            response.raise_for_status()
+            response = await http_client.get(comic_url)
 
         except httpx.HTTPStatusError as exc:
-            if exc.response.status_code == 404:
+            if exc.response.status_code == HTTP_NOT_FOUND:
                 raise TuxAPIResourceNotFoundError(
                     service_name="xkcd",
                     resource_identifier=str(comic_id),
@@ -338,10 +544,10 @@ class Client:
                 original_error=exc,
             ) from exc
 
-        return response.text
+        return response.json()
 
     @staticmethod
-    def _request_raw_image(raw_image_url: str | None) -> bytes:
+    async def _request_raw_image(raw_image_url: str | None) -> bytes:
         """
         Request the raw image data from the xkcd API.
 
@@ -371,11 +577,10 @@ class Client:
             )
 
         try:
-            response = httpx.get(raw_image_url)
-            response.raise_for_status()
+            response = await http_client.get(raw_image_url)
 
         except httpx.HTTPStatusError as exc:
-            if exc.response.status_code == 404:
+            if exc.response.status_code == HTTP_NOT_FOUND:
                 raise TuxAPIResourceNotFoundError(
                     service_name="xkcd",
                     resource_identifier=raw_image_url,
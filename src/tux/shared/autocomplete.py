@@ -0,0 +1,208 @@
+"""
+Ranked autocomplete index over a set of names.
+
+Prefix matches come from a trie walked breadth-first, so shorter names rank
+first and ties are alphabetical. When prefixes run out, names containing the
+query elsewhere are found through an inverted index of every substring up
+to the gram length, and ranked by match position, then length. Lookups cost
+time proportional to the names matching the query, not the number of names,
+and the index is updated in place when the name set changes.
+
+The index is not thread-safe: build one anywhere, but only mutate an index
+that is being searched from the same thread (the event loop).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+__all__ = ["AutocompleteIndex"]
+
+# Discord accepts at most 25 autocomplete choices
+DEFAULT_LIMIT = 25
+# Longest substring indexed; longer queries intersect these grams
+NGRAM_SIZE = 3
+
+
+@dataclass(slots=True)
+class _TrieNode:
+    """One character step in the prefix trie."""
+
+    children: dict[str, _TrieNode] = field(default_factory=dict)
+    name: str | None = None
+
+
+class AutocompleteIndex:
+    """
+    Prefix trie with an n-gram substring fallback.
+
+    Matching is case-insensitive; results are returned as originally added.
+    """
+
+    def __init__(self, names: Iterable[str] = (), *, ngram: int = NGRAM_SIZE) -> None:
+        """
+        Initialize the index.
+
+        Parameters
+        ----------
+        names : Iterable[str], optional
+            Initial names to index.
+        ngram : int, optional
+            Gram length for the substring index, by default 3.
+        """
+        self._ngram = ngram
+        self._root = _TrieNode()
+        # casefolded key -> name as added
+        self._names: dict[str, str] = {}
+        self._grams: dict[str, set[str]] = {}
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        """Return the number of indexed names."""
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        """Return whether a name is indexed (case-insensitive)."""
+        return isinstance(name, str) and name.casefold() in self._names
+
+    def _key_grams(self, key: str) -> set[str]:
+        """Return every substring of a key up to the gram length."""
+        return {
+            key[i : i + size]
+            for size in range(1, min(self._ngram, len(key)) + 1)
+            for i in range(len(key) - size + 1)
+        }
+
+    def add(self, name: str) -> None:
+        """
+        Add a name to the index.
+
+        Parameters
+        ----------
+        name : str
+            The name to add; re-adding replaces its display form.
+        """
+        key = name.casefold()
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+        node.name = name
+        if key in self._names:
+            self._names[key] = name
+            return
+        self._names[key] = name
+        for gram in self._key_grams(key):
+            self._grams.setdefault(gram, set()).add(key)
+
+    def remove(self, name: str) -> None:
+        """
+        Remove a name from the index; unknown names are ignored.
+
+        Parameters
+        ----------
+        name : str
+            The name to remove.
+        """
+        key = name.casefold()
+        if self._names.pop(key, None) is None:
+            return
+
+        path = [self._root]
+        for char in key:
+            path.append(path[-1].children[char])
+        path[-1].name = None
+        # Prune nodes left without names or children
+        for depth in range(len(key), 0, -1):
+            node = path[depth]
+            if node.name is not None or node.children:
+                break
+            del path[depth - 1].children[key[depth - 1]]
+
+        for gram in self._key_grams(key):
+            postings = self._grams[gram]
+            postings.discard(key)
+            if not postings:
+                del self._grams[gram]
+
+    def update(self, names: Iterable[str]) -> None:
+        """
+        Make the index hold exactly ``names``, touching only what changed.
+
+        Parameters
+        ----------
+        names : Iterable[str]
+            The complete new set of names.
+        """
+        wanted = {name.casefold(): name for name in names}
+        for key in self._names.keys() - wanted.keys():
+            self.remove(key)
+        for key, name in wanted.items():
+            if self._names.get(key) != name:
+                self.add(name)
+
+    def _prefix_matches(self, key: str, limit: int) -> list[str]:
+        """Return up to ``limit`` names starting with ``key``, shortest first."""
+        node = self._root
+        for char in key:
+            if (node := node.children.get(char)) is None:
+                return []
+
+        found: list[str] = []
+        queue = deque([node])
+        while queue and len(found) < limit:
+            current = queue.popleft()
+            if current.name is not None:
+                found.append(current.name)
+            queue.extend(child for _, child in sorted(current.children.items()))
+        return found
+
+    def _substring_keys(self, key: str) -> set[str]:
+        """Return keys containing ``key`` anywhere."""
+        if len(key) <= self._ngram:
+            # Short queries are indexed substrings themselves
+            return set(self._grams.get(key, ()))
+
+        postings = sorted(
+            (
+                self._grams.get(key[i : i + self._ngram], set())
+                for i in range(len(key) - self._ngram + 1)
+            ),
+            key=len,
+        )
+        candidates = set.intersection(*postings)
+        return {candidate for candidate in candidates if key in candidate}
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> list[str]:
+        """
+        Return the best matches for a query.
+
+        Parameters
+        ----------
+        query : str
+            The text typed so far.
+        limit : int, optional
+            Maximum number of results, by default 25.
+
+        Returns
+        -------
+        list[str]
+            Prefix matches (shortest first), then other substring matches
+            (earliest match first).
+        """
+        key = query.strip().casefold()
+        results = self._prefix_matches(key, limit)
+        if len(results) >= limit or not key:
+            return results
+
+        seen = {name.casefold() for name in results}
+        extra = sorted(
+            self._substring_keys(key) - seen,
+            key=lambda candidate: (candidate.index(key), len(candidate), candidate),
+        )
+        results.extend(
+            self._names[candidate] for candidate in extra[: limit - len(results)]
+        )
+        return results
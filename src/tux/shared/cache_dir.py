@@ -0,0 +1,34 @@
+"""On-disk cache directory resolution shared by features that persist caches."""
+
+import os
+from pathlib import Path
+
+__all__ = ["resolve_cache_dir"]
+
+
+def resolve_cache_dir(env_var: str, name: str) -> Path:
+    """
+    Return the absolute cache directory for a feature.
+
+    Docker sets ``env_var`` explicitly; bare metal falls back to
+    ``$XDG_CACHE_HOME/<name>``, then ``~/.cache/<name>``.
+
+    Parameters
+    ----------
+    env_var : str
+        Environment variable overriding the directory, e.g. ``"TLDR_CACHE_DIR"``.
+    name : str
+        Subdirectory name under the XDG cache directory, e.g. ``"tldr"``.
+
+    Returns
+    -------
+    Path
+        The directory, resolved against the working directory if relative.
+    """
+    if explicit := os.getenv(env_var):
+        path = Path(explicit)
+    elif xdg_cache_home := os.getenv("XDG_CACHE_HOME"):
+        path = Path(xdg_cache_home) / name
+    else:
+        path = Path.home() / ".cache" / name
+    return path if path.is_absolute() else path.resolve()
@@ -162,6 +162,14 @@ class Config(BaseSettings):
             examples=["INFO", "DEBUG", "WARNING", "ERROR"],
         ),
     ]
+    LOG_ENQUEUE: Annotated[
+        bool,
+        Field(
+            default=False,
+            description="Write console logs from a background thread instead of the event loop",
+            examples=[False, True],
+        ),
+    ]
     MAINTENANCE_MODE: Annotated[
         bool,
         Field(
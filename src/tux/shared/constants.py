@@ -74,6 +74,8 @@ DEFAULT_REASON: Final[str] = "No reason provided"
 SNIPPET_MAX_NAME_LENGTH: Final[int] = 20
 SNIPPET_ALLOWED_CHARS_REGEX: Final[str] = r"^[a-zA-Z0-9-]+$"
 SNIPPET_PAGINATION_LIMIT: Final[int] = 10
+SNIPPET_SEARCH_RESULT_LIMIT: Final[int] = 100
+SNIPPET_SUGGESTION_LIMIT: Final[int] = 3
 
 # Message timings
 HTTP_TIMEOUT: Final[int] = 10
@@ -10,9 +10,11 @@ import pytest
 from tux.cache.backend import (
     KEY_PREFIX,
     InMemoryBackend,
+    TieredBackend,
     ValkeyBackend,
     get_cache_backend,
 )
+from tux.cache.namespace import CacheNamespace
 
 
 @pytest.mark.unit
@@ -57,6 +59,25 @@ class TestInMemoryBackend:
         await backend.set("k", "v", ttl_sec=120.0)
         assert await backend.get("k") == "v"
 
+    @pytest.mark.asyncio
+    async def test_many_operations_roundtrip(self) -> None:
+        """set_many/get_many/delete_many act on all keys; get_many omits misses."""
+        backend = InMemoryBackend()
+        await backend.set_many({"a": 1, "b": 2})
+        assert await backend.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+        await backend.delete_many(["a"])
+        assert await backend.get_many(["a", "b"]) == {"b": 2}
+
+    @pytest.mark.asyncio
+    async def test_delete_prefix_removes_only_matching_keys(self) -> None:
+        """delete_prefix removes keys with the prefix and returns the count."""
+        backend = InMemoryBackend()
+        await backend.set_many({"prefix:1": "!", "prefix:2": "?", "other": 1})
+        assert await backend.delete_prefix("prefix:") == 2
+        assert await backend.get_many(["prefix:1", "prefix:2", "other"]) == {
+            "other": 1,
+        }
+
 
 @pytest.mark.unit
 class TestValkeyBackend:
@@ -192,6 +213,57 @@ class TestValkeyBackend:
         assert await backend.exists("bar") is False
 
 
+@pytest.mark.unit
+class TestValkeyBackendMany:
+    """ValkeyBackend multi-key operations use MGET, pipelines and UNLINK."""
+
+    @pytest.mark.asyncio
+    async def test_get_many_uses_single_mget(self) -> None:
+        """get_many issues one MGET with prefixed keys and omits misses."""
+        client = MagicMock()
+        client.mget = AsyncMock(return_value=[json.dumps(1), None])
+        backend = ValkeyBackend(client)
+        assert await backend.get_many(["a", "b"]) == {"a": 1}
+        client.mget.assert_awaited_once_with([f"{KEY_PREFIX}a", f"{KEY_PREFIX}b"])
+
+    @pytest.mark.asyncio
+    async def test_set_many_pipelines_writes(self) -> None:
+        """set_many queues SETEX per key and executes the pipeline once."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, True])
+        client = MagicMock()
+        client.pipeline.return_value = pipe
+        backend = ValkeyBackend(client)
+        await backend.set_many({"a": 1, "b": 2}, ttl_sec=30.0)
+        assert pipe.setex.call_count == 2
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_delete_many_uses_one_unlink(self) -> None:
+        """delete_many removes all keys with a single UNLINK."""
+        client = MagicMock()
+        client.unlink = AsyncMock(return_value=2)
+        backend = ValkeyBackend(client)
+        await backend.delete_many(["a", "b"])
+        client.unlink.assert_awaited_once_with(f"{KEY_PREFIX}a", f"{KEY_PREFIX}b")
+
+    @pytest.mark.asyncio
+    async def test_delete_prefix_scans_and_unlinks(self) -> None:
+        """delete_prefix scans with an escaped MATCH pattern and unlinks hits."""
+
+        async def scan_iter(**_: object):
+            for key in (f"{KEY_PREFIX}p*:1", f"{KEY_PREFIX}p*:2"):
+                yield key
+
+        client = MagicMock()
+        client.scan_iter = MagicMock(side_effect=scan_iter)
+        client.unlink = AsyncMock(return_value=2)
+        backend = ValkeyBackend(client)
+        assert await backend.delete_prefix("p*:") == 2
+        assert client.scan_iter.call_args.kwargs["match"] == f"{KEY_PREFIX}p\\*:*"
+        client.unlink.assert_awaited_once_with(f"{KEY_PREFIX}p*:1", f"{KEY_PREFIX}p*:2")
+
+
 @pytest.mark.unit
 class TestGetCacheBackend:
     """get_cache_backend(bot) returns Valkey or InMemory."""
@@ -236,13 +308,149 @@ class TestGetCacheBackend:
         backend = get_cache_backend(bot)
         assert isinstance(backend, InMemoryBackend)
 
-    def test_returns_valkey_backend_when_connected_with_client(self) -> None:
-        """Bot with cache_service connected and client returns ValkeyBackend."""
+    def test_returns_tiered_backend_when_connected_with_client(self) -> None:
+        """Bot with cache_service connected and client returns a shared TieredBackend."""
         bot = MagicMock()
         client = MagicMock()
         bot.cache_service = MagicMock()
         bot.cache_service.is_connected.return_value = True
         bot.cache_service.get_client.return_value = client
         backend = get_cache_backend(bot)
-        assert isinstance(backend, ValkeyBackend)
-        assert backend._client is client
+        assert isinstance(backend, TieredBackend)
+        assert backend.client is client
+        assert get_cache_backend(bot) is backend
+
+
+@pytest.mark.unit
+class TestTieredBackend:
+    """TieredBackend: L1 hits, L2 fallthrough, pub/sub invalidation."""
+
+    @pytest.fixture
+    def mock_client(self) -> MagicMock:
+        """Fake async Valkey client storing raw strings in a dict."""
+        store: dict[str, str] = {}
+
+        async def get(key: str) -> str | None:
+            return store.get(key)
+
+        async def set_key(key: str, value: str) -> None:
+            store[key] = value
+
+        async def delete(key: str) -> None:
+            store.pop(key, None)
+
+        async def mget(keys: list[str]) -> list[str | None]:
+            return [store.get(key) for key in keys]
+
+        async def incr(key: str) -> int:
+            store[key] = str(int(store.get(key, 0)) + 1)
+            return int(store[key])
+
+        client = MagicMock()
+        client.store = store
+        client.get = AsyncMock(side_effect=get)
+        client.set = AsyncMock(side_effect=set_key)
+        client.delete = AsyncMock(side_effect=delete)
+        client.mget = AsyncMock(side_effect=mget)
+        client.incr = AsyncMock(side_effect=incr)
+        client.publish = AsyncMock(return_value=0)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_second_get_served_from_l1(self, mock_client: MagicMock) -> None:
+        """A value read from Valkey is cached in L1 for the next get."""
+        mock_client.store[f"{KEY_PREFIX}k"] = json.dumps({"a": 1})
+        backend = TieredBackend(ValkeyBackend(mock_client))
+
+        assert await backend.get("k") == {"a": 1}
+        assert await backend.get("k") == {"a": 1}
+
+        assert mock_client.get.await_count == 1
+        assert (backend.l1_hits, backend.l2_hits, backend.misses) == (1, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_set_writes_both_tiers_with_json_types(
+        self,
+        mock_client: MagicMock,
+    ) -> None:
+        """Set stores in Valkey and in L1 with the same types a Valkey read yields."""
+        backend = TieredBackend(ValkeyBackend(mock_client))
+        await backend.set("k", {"ids": (1, 2)})
+
+        assert mock_client.store[f"{KEY_PREFIX}k"] == json.dumps({"ids": [1, 2]})
+        assert await backend.get("k") == {"ids": [1, 2]}
+        mock_client.get.assert_not_awaited()
+        mock_client.publish.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_delete_clears_l1(self, mock_client: MagicMock) -> None:
+        """Delete removes the key from both tiers."""
+        backend = TieredBackend(ValkeyBackend(mock_client))
+        await backend.set("k", 1)
+        await backend.delete("k")
+        assert await backend.get("k") is None
+        assert not await backend.exists("k")
+        assert backend.misses == 1
+        mock_client.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_misses_are_cached_until_written(
+        self,
+        mock_client: MagicMock,
+    ) -> None:
+        """Missing keys are remembered in L1 until a write or invalidation."""
+        backend = TieredBackend(ValkeyBackend(mock_client))
+        ns = CacheNamespace("jail_status", backend)
+
+        keys = {await ns.key(1, 2) for _ in range(100)}
+
+        assert keys == {"jail_status:v0:1:v0:2"}
+        assert mock_client.mget.await_count == 1
+
+        # Another process bumps the guild generation and publishes the key
+        mock_client.store[f"{KEY_PREFIX}jail_status:gen:1"] = "1"
+        backend._handle_message(
+            json.dumps({"source": "other", "keys": ["jail_status:gen:1"]}),
+        )
+        assert await ns.key(1, 2) == "jail_status:v0:1:v1:2"
+
+        await ns.invalidate_guild(1)
+        assert await ns.key(1, 2) == "jail_status:v0:1:v2:2"
+        assert mock_client.mget.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation_drops_l1_entry(
+        self,
+        mock_client: MagicMock,
+    ) -> None:
+        """Messages from other processes evict L1; our own messages are ignored."""
+        backend = TieredBackend(ValkeyBackend(mock_client))
+        await backend.set("k", "old")
+        own_message = mock_client.publish.call_args[0][1]
+
+        backend._handle_message(own_message)
+        assert await backend.get("k") == "old"
+
+        mock_client.store[f"{KEY_PREFIX}k"] = json.dumps("new")
+        backend._handle_message(json.dumps({"source": "other", "keys": ["k"]}))
+        assert await backend.get("k") == "new"
+
+    @pytest.mark.asyncio
+    async def test_invalidation_listeners_see_remote_messages_only(
+        self,
+        mock_client: MagicMock,
+    ) -> None:
+        """Listeners get keys and prefixes invalidated by other processes."""
+        backend = TieredBackend(ValkeyBackend(mock_client))
+        seen: list[tuple[list[str], tuple[str, ...]]] = []
+        backend.add_invalidation_listener(
+            lambda keys, prefixes: seen.append((keys, prefixes)),
+        )
+        await backend.set("k", "v")
+
+        backend._handle_message(mock_client.publish.call_args[0][1])
+        backend._handle_message(
+            json.dumps({"source": "other", "keys": ["k"], "prefixes": ["p:"]}),
+        )
+
+        assert seen == [(["k"], ("p:",))]
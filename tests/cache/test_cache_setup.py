@@ -108,7 +108,7 @@ async def test_setup_when_connect_and_ping_succeed_sets_cache_service(
         guild_mgr = GuildConfigCacheManager()
         jail_cache = JailStatusCache()
         guild_mgr._backend = None
-        guild_mgr._cache.clear()
+        guild_mgr._snapshots.clear()
         guild_mgr._locks.clear()
         jail_cache._backend = None
         jail_cache._cache.clear()
@@ -137,7 +137,7 @@ async def test_setup_wires_backend_to_singletons(mock_bot: MagicMock) -> None:
         guild_mgr = GuildConfigCacheManager()
         jail_cache = JailStatusCache()
         guild_mgr._backend = None
-        guild_mgr._cache.clear()
+        guild_mgr._snapshots.clear()
         guild_mgr._locks.clear()
         jail_cache._backend = None
         jail_cache._cache.clear()
@@ -0,0 +1,178 @@
+"""Unit tests for full-row guild config snapshots and the controller reads they serve."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tux.cache import GuildConfigCacheManager, GuildConfigSnapshot
+from tux.cache.backend import InMemoryBackend
+from tux.database.controllers.guild import GuildController
+from tux.database.controllers.guild_config import GuildConfigController
+from tux.database.models import GuildConfig
+
+pytestmark = pytest.mark.unit
+
+GUILD_ID = 4242
+
+
+@pytest.fixture(params=["memory", "backend"])
+def manager(request: pytest.FixtureRequest) -> Generator[GuildConfigCacheManager]:
+    """Singleton in both storage modes; teardown clears all snapshot state."""
+    manager = GuildConfigCacheManager()
+    if request.param == "backend":
+        manager.set_backend(InMemoryBackend())
+    yield manager
+    manager._backend = None
+    manager._namespace = None
+    manager._snapshots.clear()
+    manager._versions.clear()
+    manager._locks.clear()
+
+
+class TestGuildConfigSnapshots:
+    """Versioned write-through and read-through of full config rows."""
+
+    @pytest.mark.asyncio
+    async def test_put_and_get_roundtrip(
+        self,
+        manager: GuildConfigCacheManager,
+    ) -> None:
+        """A written snapshot is returned read-only with all its fields."""
+        stored = await manager.put_snapshot(GUILD_ID, {"prefix": "!", "dev_log_id": 7})
+        snapshot = await manager.get_snapshot(GUILD_ID)
+
+        assert snapshot == stored
+        assert snapshot.exists
+        assert snapshot.get("dev_log_id") == 7
+        assert snapshot.get("starboard_channel_id") is None
+        assert snapshot.version == manager.snapshot_version(GUILD_ID)
+        with pytest.raises(TypeError):
+            snapshot.values["prefix"] = "?"  # type: ignore[index]
+
+    @pytest.mark.asyncio
+    async def test_stale_fill_is_not_cached(
+        self,
+        manager: GuildConfigCacheManager,
+    ) -> None:
+        """A load that raced with a write does not overwrite the written row."""
+        version = manager.snapshot_version(GUILD_ID)
+        await manager.put_snapshot(GUILD_ID, {"prefix": "new"})
+
+        stale = await manager.fill_snapshot(GUILD_ID, {"prefix": "old"}, version)
+        snapshot = await manager.get_snapshot(GUILD_ID)
+
+        assert stale.get("prefix") == "old"
+        assert snapshot is not None
+        assert snapshot.get("prefix") == "new"
+
+    @pytest.mark.asyncio
+    async def test_bulk_fill_skips_written_guilds(
+        self,
+        manager: GuildConfigCacheManager,
+    ) -> None:
+        """Bulk priming caches missing rows too and skips guilds written meanwhile."""
+        versions = {1: manager.snapshot_version(1), 2: manager.snapshot_version(2)}
+        await manager.put_snapshot(2, {"prefix": "?"})
+
+        primed = await manager.fill_snapshots({1: None, 2: {"prefix": "$"}}, versions)
+        missing = await manager.get_snapshot(1)
+        written = await manager.get_snapshot(2)
+
+        assert primed == 1
+        assert missing is not None
+        assert not missing.exists
+        assert written is not None
+        assert written.get("prefix") == "?"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_and_clear_drop_snapshots(
+        self,
+        manager: GuildConfigCacheManager,
+    ) -> None:
+        """Invalidation bumps the version; clear_all drops every snapshot."""
+        await manager.put_snapshot(1, {"prefix": "!"})
+        await manager.put_snapshot(2, {"prefix": "!"})
+        version = manager.snapshot_version(1)
+
+        await manager.invalidate(1)
+        assert await manager.get_snapshot(1) is None
+        assert manager.snapshot_version(1) > version
+
+        await manager.clear_all()
+        assert await manager.get_snapshot(2) is None
+
+    def test_payload_roundtrip(self) -> None:
+        """Backend payloads rebuild the same snapshot; foreign values are ignored."""
+        snapshot = GuildConfigCacheManager._snapshot(GUILD_ID, {"prefix": "!"}, 3)
+
+        assert (
+            GuildConfigSnapshot.from_payload(GUILD_ID, snapshot.to_payload())
+            == snapshot
+        )
+        assert GuildConfigSnapshot.from_payload(GUILD_ID, {"audit_log_id": 1}) is None
+
+
+class TestGuildConfigControllerSnapshots:
+    """Controller getters are served from snapshots and updates write through."""
+
+    @pytest.fixture
+    def controller(
+        self,
+        manager: GuildConfigCacheManager,
+    ) -> GuildConfigController:
+        """Build a controller whose database reads and writes are mocked."""
+        controller = GuildConfigController.__new__(GuildConfigController)
+        row = GuildConfig(id=GUILD_ID, jail_role_id=11, audit_log_id=22)
+        controller.get_by_id = AsyncMock(return_value=row)
+        controller.update_by_id = AsyncMock(
+            return_value=GuildConfig(id=GUILD_ID, jail_role_id=33, audit_log_id=22),
+        )
+        return controller
+
+    @pytest.mark.asyncio
+    async def test_getters_share_one_load(
+        self,
+        controller: GuildConfigController,
+    ) -> None:
+        """Every getter after the first is answered without a database read."""
+        assert await controller.get_jail_role_id(GUILD_ID) == 11
+        assert await controller.get_log_channel_ids(GUILD_ID) == (22, None)
+        assert await controller.get_report_log_id(GUILD_ID) is None
+        assert await controller.get_perm_level_role(GUILD_ID, "3") is None
+        config = await controller.get_config_by_guild_id(GUILD_ID)
+
+        assert config is not None
+        assert config.jail_role_id == 11
+        controller.get_by_id.assert_awaited_once_with(GUILD_ID)  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_update_writes_through(
+        self,
+        controller: GuildConfigController,
+    ) -> None:
+        """An update replaces the snapshot, so reads see it without reloading."""
+        assert await controller.get_jail_role_id(GUILD_ID) == 11
+
+        await controller.update_jail_role_id(GUILD_ID, 33)
+
+        assert await controller.get_jail_config(GUILD_ID) == (33, None)
+        controller.get_by_id.assert_awaited_once()  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_guild_delete_clears_snapshot(
+        self,
+        controller: GuildConfigController,
+    ) -> None:
+        """Deleting a guild drops its cached config along with the row."""
+        assert await controller.get_jail_role_id(GUILD_ID) == 11
+        guilds = GuildController.__new__(GuildController)
+        guilds.delete_by_id = AsyncMock(return_value=True)
+
+        assert await guilds.delete_guild_by_id(GUILD_ID)
+
+        assert await controller.get_jail_role_id(GUILD_ID) is None
+        assert await controller.get_config_by_guild_id(GUILD_ID) is None
+        controller.get_by_id.assert_awaited_once()  # type: ignore[attr-defined]
@@ -0,0 +1,62 @@
+"""Unit tests for CacheNamespace generation-based invalidation."""
+
+from __future__ import annotations
+
+import pytest
+
+from tux.cache.backend import InMemoryBackend
+from tux.cache.namespace import CacheNamespace
+
+
+@pytest.mark.unit
+class TestCacheNamespace:
+    """Keys embed namespace and guild generations; bumps orphan old keys."""
+
+    @pytest.mark.asyncio
+    async def test_key_embeds_generations_and_suffix(self) -> None:
+        """Fresh namespaces start at generation 0 for both counters."""
+        ns = CacheNamespace("jail_status", InMemoryBackend())
+        assert await ns.key(1, 2) == "jail_status:v0:1:v0:2"
+        assert await ns.key(1) == "jail_status:v0:1:v0"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_guild_only_moves_that_guild(self) -> None:
+        """Bumping a guild changes its keys and leaves other guilds alone."""
+        backend = InMemoryBackend()
+        ns = CacheNamespace("jail_status", backend)
+        await backend.set(await ns.key(1, 10), True)
+        await backend.set(await ns.key(2, 10), True)
+
+        await ns.invalidate_guild(1)
+
+        assert await backend.get(await ns.key(1, 10)) is None
+        assert await backend.get(await ns.key(2, 10)) is True
+
+    @pytest.mark.asyncio
+    async def test_invalidate_all_moves_every_guild(self) -> None:
+        """Bumping the namespace orphans every guild's keys."""
+        backend = InMemoryBackend()
+        ns = CacheNamespace("guild_config", backend)
+        await backend.set(await ns.key(1), {"a": 1})
+        await backend.set(await ns.key(2), {"a": 2})
+
+        await ns.invalidate_all()
+
+        assert await backend.get(await ns.key(1)) is None
+        assert await backend.get(await ns.key(2)) is None
+
+    @pytest.mark.asyncio
+    async def test_eviction_pressure_keeps_generations(self) -> None:
+        """Filling a bounded backend evicts entries, never generation counters."""
+        backend = InMemoryBackend(max_size=4)
+        ns = CacheNamespace("jail_status", backend)
+        stale_key = await ns.key(1, 10)
+        await backend.set(stale_key, True, ttl_sec=3600)
+        await ns.invalidate_guild(1)
+
+        for user_id in range(20):
+            await backend.set(await ns.key(2, user_id), True, ttl_sec=3600)
+
+        assert await ns.key(1, 10) == "jail_status:v0:1:v1:10"
+        await backend.set(stale_key, True, ttl_sec=3600)
+        assert await backend.get(await ns.key(1, 10)) is None
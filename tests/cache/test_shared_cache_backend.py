@@ -13,7 +13,7 @@ from tux.cache.backend import InMemoryBackend
 
 @pytest.mark.unit
 class TestGuildConfigCacheManagerWithBackend:
-    """GuildConfigCacheManager get/set/invalidate when backend is set."""
+    """GuildConfigCacheManager snapshot reads, writes and invalidation with a backend."""
 
     @pytest.fixture
     def backend(self) -> InMemoryBackend:
@@ -27,7 +27,9 @@ class TestGuildConfigCacheManagerWithBackend:
         manager.set_backend(backend)
         yield manager
         manager._backend = None
-        manager._cache.clear()
+        manager._namespace = None
+        manager._snapshots.clear()
+        manager._versions.clear()
         manager._locks.clear()
 
     @pytest.mark.asyncio
@@ -36,51 +38,57 @@ class TestGuildConfigCacheManagerWithBackend:
         manager: GuildConfigCacheManager,
     ) -> None:
         """Get with uncached guild returns None."""
-        assert await manager.get(999) is None
+        assert await manager.get_snapshot(999) is None
 
     @pytest.mark.asyncio
-    async def test_set_and_get_roundtrip(
+    async def test_put_and_get_roundtrip(
         self,
         manager: GuildConfigCacheManager,
     ) -> None:
-        """Set then get returns the same config."""
+        """A written snapshot is read back from the backend."""
         guild_id = 12345
-        await manager.set(
+        await manager.put_snapshot(
             guild_id,
-            audit_log_id=111,
-            mod_log_id=222,
-            jail_role_id=333,
-            jail_channel_id=444,
+            {
+                "audit_log_id": 111,
+                "mod_log_id": 222,
+                "jail_role_id": 333,
+                "jail_channel_id": 444,
+            },
         )
-        out = await manager.get(guild_id)
+        out = await manager.get_snapshot(guild_id)
         assert out is not None
-        assert out["audit_log_id"] == 111
-        assert out["mod_log_id"] == 222
-        assert out["jail_role_id"] == 333
-        assert out["jail_channel_id"] == 444
-
-    @pytest.mark.asyncio
-    async def test_set_partial_merge(self, manager: GuildConfigCacheManager) -> None:
-        """Set with partial fields merges with existing."""
-        guild_id = 100
-        await manager.set(guild_id, audit_log_id=1, mod_log_id=2)
-        await manager.set(guild_id, jail_role_id=3)
-        out = await manager.get(guild_id)
-        assert out is not None
-        assert out["audit_log_id"] == 1
-        assert out["mod_log_id"] == 2
-        assert out["jail_role_id"] == 3
+        assert out.get("audit_log_id") == 111
+        assert out.get("mod_log_id") == 222
+        assert out.get("jail_role_id") == 333
+        assert out.get("jail_channel_id") == 444
+
+    @pytest.mark.asyncio
+    async def test_put_snapshot_is_a_single_backend_write(
+        self,
+        manager: GuildConfigCacheManager,
+        backend: InMemoryBackend,
+    ) -> None:
+        """Writing a snapshot does not also delete a key."""
+        await manager.get_snapshot(7)
+        backend.delete = AsyncMock()
+        backend.set_many = AsyncMock()
+
+        await manager.put_snapshot(7, {"audit_log_id": 1})
+
+        backend.delete.assert_not_called()
+        backend.set_many.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_invalidate_removes_entry(
         self,
         manager: GuildConfigCacheManager,
     ) -> None:
-        """Invalidate removes the guild config; get returns None."""
+        """Invalidate removes the guild's snapshot."""
         guild_id = 200
-        await manager.set(guild_id, audit_log_id=1)
+        await manager.put_snapshot(guild_id, {"audit_log_id": 1})
         await manager.invalidate(guild_id)
-        assert await manager.get(guild_id) is None
+        assert await manager.get_snapshot(guild_id) is None
 
     @pytest.mark.asyncio
     async def test_get_returns_none_when_backend_returns_non_dict(
@@ -90,34 +98,19 @@ class TestGuildConfigCacheManagerWithBackend:
     ) -> None:
         """Get when backend returns non-dict (e.g. string) returns None."""
         backend.get = AsyncMock(return_value="not-a-dict")
-        guild_id = 99
-        result = await manager.get(guild_id)
-        assert result is None
+        assert await manager.get_snapshot(99) is None
 
     @pytest.mark.asyncio
-    async def test_async_set_with_backend_merges_and_writes(
+    async def test_clear_all_clears_in_memory_snapshots(
         self,
         manager: GuildConfigCacheManager,
     ) -> None:
-        """async_set with backend merges existing and writes to backend."""
-        guild_id = 50
-        await manager.async_set(guild_id, audit_log_id=10, mod_log_id=20)
-        out = await manager.get(guild_id)
-        assert out is not None
-        assert out["audit_log_id"] == 10
-        assert out["mod_log_id"] == 20
-
-    @pytest.mark.asyncio
-    async def test_clear_all_clears_in_memory_cache(
-        self,
-        manager: GuildConfigCacheManager,
-    ) -> None:
-        """clear_all clears in-memory _cache (when backend is None, get then returns None)."""
+        """clear_all clears in-memory snapshots (backend is None)."""
         manager._backend = None  # Use in-memory path only
         guild_id = 60
-        await manager.set(guild_id, audit_log_id=1)
+        await manager.put_snapshot(guild_id, {"audit_log_id": 1})
         await manager.clear_all()
-        assert await manager.get(guild_id) is None
+        assert await manager.get_snapshot(guild_id) is None
 
 
 @pytest.mark.unit
@@ -226,6 +219,30 @@ class TestJailStatusCacheWithBackend:
         assert await cache.get(100, 2) is None
         assert await cache.get(101, 1) is True
 
+    @pytest.mark.asyncio
+    async def test_invalidate_guild_with_backend_drops_guild_entries(
+        self,
+        cache: JailStatusCache,
+    ) -> None:
+        """invalidate_guild with a backend bumps the guild generation only."""
+        await cache.set(100, 1, True)
+        await cache.set(101, 1, True)
+        await cache.invalidate_guild(100)
+        assert await cache.get(100, 1) is None
+        assert await cache.get(101, 1) is True
+
+    @pytest.mark.asyncio
+    async def test_clear_all_with_backend_drops_all_entries(
+        self,
+        cache: JailStatusCache,
+    ) -> None:
+        """clear_all with a backend makes every guild's entries unreachable."""
+        await cache.set(100, 1, True)
+        await cache.set(101, 1, False)
+        await cache.clear_all()
+        assert await cache.get(100, 1) is None
+        assert await cache.get(101, 1) is None
+
     @pytest.mark.asyncio
     async def test_clear_all_clears_entries(self, cache: JailStatusCache) -> None:
         """clear_all clears in-memory cache (when backend is None, get then returns None)."""
@@ -1,9 +1,14 @@
 """Unit tests for TTLCache (in-memory TTL cache)."""
 
+import os
+import subprocess
+import sys
 import time
+from pathlib import Path
 
 import pytest
 
+from tux.cache import ttl
 from tux.cache.ttl import TTLCache
 
 pytestmark = pytest.mark.unit
@@ -154,3 +159,92 @@ class TestTTLCache:
         cache.set("k", 1)
         cache.clear()
         assert cache.get("k") is None
+
+    def test_lru_hit_protects_key_from_eviction(self) -> None:
+        """With the default LRU policy a read moves the key to most recent."""
+        cache = TTLCache(ttl=60.0, max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.evictions == 1
+
+    def test_fifo_policy_ignores_hits(self) -> None:
+        """The fifo policy keeps insertion-order eviction."""
+        cache = TTLCache(ttl=60.0, max_size=2, policy="fifo")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") is None
+
+    def test_tinylfu_keeps_frequent_keys_under_scan(self) -> None:
+        """A one-off scan does not flush out frequently read keys."""
+        cache = TTLCache(ttl=60.0, max_size=10, policy="tinylfu")
+        for i in range(5):
+            cache.set(f"hot{i}", i)
+        for _ in range(5):
+            for i in range(5):
+                cache.get(f"hot{i}")
+        for i in range(100):
+            cache.set(f"cold{i}", i)
+        assert all(cache.get(f"hot{i}") is not None for i in range(5))
+        assert cache.size() <= 10
+
+    def test_tinylfu_sketch_is_independent_of_hash_seed(self) -> None:
+        """Sketch indexes don't use the per-process salted ``hash()``."""
+        script = (
+            "from tux.cache.ttl import _FrequencySketch;"
+            "print(_FrequencySketch(10)._indexes('hot0'))"
+        )
+        outputs = {
+            subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                check=True,
+                env={
+                    **os.environ,
+                    "PYTHONHASHSEED": seed,
+                    "PYTHONPATH": str(Path(ttl.__file__).parents[2]),
+                },
+                text=True,
+            ).stdout
+            for seed in ("1", "2")
+        }
+        assert len(outputs) == 1
+
+    def test_unknown_policy_raises(self) -> None:
+        """An unknown policy name is rejected."""
+        with pytest.raises(ValueError, match="Unknown eviction policy"):
+            TTLCache(ttl=60.0, max_size=2, policy="random")  # type: ignore[arg-type]
+
+    def test_policy_without_on_insert_fails_at_construction(self) -> None:
+        """A policy missing the insert hook can't be instantiated at all."""
+
+        class NoInsertPolicy(ttl.EvictionPolicy):
+            __slots__ = ()
+
+        with pytest.raises(TypeError, match="on_insert"):
+            NoInsertPolicy()  # type: ignore[abstract]
+
+    def test_expired_entries_purged_on_write(self) -> None:
+        """Writes purge expired entries proactively via the expiry heap."""
+        cache = TTLCache(ttl=60.0)
+        cache.set("old", 1, ttl=0.01)
+        time.sleep(0.02)
+        cache.set("new", 2)
+        assert "old" not in cache._cache
+        assert cache.expirations == 1
+
+    def test_stats_counts_hits_and_misses(self) -> None:
+        """stats() reports size, hits and misses."""
+        cache = TTLCache(ttl=60.0)
+        cache.set("k", 1)
+        cache.get("k")
+        cache.get("missing")
+        stats = cache.stats()
+        assert stats["size"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
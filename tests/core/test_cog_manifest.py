@@ -0,0 +1,141 @@
+"""Unit tests for the persistent cog manifest."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from tux.core.cog_manifest import CogManifest
+
+pytestmark = pytest.mark.unit
+
+PRIORITIES = {"admin": 80, "handlers": 100}
+COG_SOURCE = "async def setup(bot):\n    pass\n"
+HELPER_SOURCE = "def helper():\n    return 1\n"
+
+
+@pytest.fixture
+def cogs(tmp_path: Path) -> dict[str, Path]:
+    """Write a cog, a helper module and a broken file under ``admin/``."""
+    folder = tmp_path / "admin"
+    folder.mkdir()
+    files = {
+        "cog": (folder / "ban.py", COG_SOURCE),
+        "helper": (folder / "utils.py", HELPER_SOURCE),
+        "broken": (folder / "broken.py", "def broken(:\n"),
+    }
+    for path, source in files.values():
+        path.write_text(source, encoding="utf-8")
+    return {name: path for name, (path, _) in files.items()}
+
+
+def _manifest(tmp_path: Path, priorities: dict[str, int] = PRIORITIES) -> CogManifest:
+    """Build a manifest stored under ``tmp_path``."""
+    return CogManifest(tmp_path / "cache" / "cog_manifest.json", priorities)
+
+
+class TestCogManifest:
+    """Eligibility is parsed once and reused until a file's contents change."""
+
+    @pytest.mark.asyncio
+    async def test_scan_records_setup_and_priority(
+        self,
+        tmp_path: Path,
+        cogs: dict[str, Path],
+    ) -> None:
+        """Every file is parsed on the first scan; missing files are left out."""
+        manifest = _manifest(tmp_path)
+        entries = await manifest.scan([*cogs.values(), tmp_path / "gone.py"])
+
+        assert entries[cogs["cog"]].has_setup
+        assert entries[cogs["cog"]].priority == 80
+        assert not entries[cogs["helper"]].has_setup
+        assert entries[cogs["helper"]].valid
+        assert not entries[cogs["broken"]].valid
+        assert tmp_path / "gone.py" not in entries
+        assert manifest.parsed == 3
+
+    @pytest.mark.asyncio
+    async def test_saved_manifest_skips_parsing(
+        self,
+        tmp_path: Path,
+        cogs: dict[str, Path],
+    ) -> None:
+        """A later run reuses saved entries and reparses only the edited file."""
+        first = _manifest(tmp_path)
+        await first.scan(cogs.values())
+        assert first.save()
+        assert not first.save()
+
+        cogs["helper"].write_text(COG_SOURCE + "\n# edited\n", encoding="utf-8")
+        second = _manifest(tmp_path)
+        entries = await second.scan(cogs.values())
+
+        assert entries[cogs["helper"]].has_setup
+        assert second.stats() == {"entries": 3, "hits": 2, "rehashed": 0, "parsed": 1}
+
+    @pytest.mark.asyncio
+    async def test_touched_file_is_rehashed_not_parsed(
+        self,
+        tmp_path: Path,
+        cogs: dict[str, Path],
+    ) -> None:
+        """A new mtime with the same contents is settled by the content hash."""
+        manifest = _manifest(tmp_path)
+        await manifest.scan(cogs.values())
+        stat = cogs["cog"].stat()
+        os.utime(cogs["cog"], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        entry = manifest.lookup(cogs["cog"])
+
+        assert entry is not None
+        assert entry.has_setup
+        assert entry.mtime_ns == stat.st_mtime_ns + 10**9
+        assert (manifest.rehashed, manifest.parsed) == (1, 3)
+
+    @pytest.mark.asyncio
+    async def test_changed_priorities_discard_saved_entries(
+        self,
+        tmp_path: Path,
+        cogs: dict[str, Path],
+    ) -> None:
+        """Entries saved under other priorities are rebuilt, not reused."""
+        first = _manifest(tmp_path)
+        await first.scan(cogs.values())
+        first.save()
+
+        second = _manifest(tmp_path, {"admin": 10})
+        entries = await second.scan(cogs.values())
+
+        assert entries[cogs["cog"]].priority == 10
+        assert second.hits == 0
+
+    @pytest.mark.asyncio
+    async def test_prune_drops_unseen_files(
+        self,
+        tmp_path: Path,
+        cogs: dict[str, Path],
+    ) -> None:
+        """Saving after a full scan forgets files that no longer exist."""
+        first = _manifest(tmp_path)
+        await first.scan(cogs.values())
+        first.save()
+
+        cogs["helper"].unlink()
+        second = _manifest(tmp_path)
+        await second.scan(path for path in cogs.values() if path.exists())
+
+        assert second.save(prune=True)
+        assert second.stats()["entries"] == 2
+
+    def test_corrupt_manifest_is_ignored(self, tmp_path: Path) -> None:
+        """An unreadable manifest file starts an empty manifest."""
+        manifest = _manifest(tmp_path)
+        manifest.path.parent.mkdir(parents=True)
+        manifest.path.write_text("{not json", encoding="utf-8")
+
+        manifest.load()
+
+        assert manifest.stats()["entries"] == 0
@@ -35,6 +35,14 @@ class TestPermissionSystem:
         """Create a mock database coordinator."""
         db_coordinator = MagicMock(spec=DatabaseCoordinator)
         db_coordinator.permission_ranks = MagicMock()
+        db_coordinator.permission_assignments = MagicMock()
+        db_coordinator.permission_assignments.get_role_ranks_by_guild = AsyncMock(
+            return_value={},
+        )
+        db_coordinator.command_permissions = MagicMock()
+        db_coordinator.command_permissions.get_all_command_permissions = AsyncMock(
+            return_value=[],
+        )
         return db_coordinator
 
     @pytest.fixture
@@ -66,11 +74,6 @@ class TestPermissionSystem:
         mock_ctx: commands.Context[Tux],
     ) -> None:
         """User with no assigned roles receives permission rank 0."""
-        # Arrange
-        permission_system.db.permission_assignments.get_user_permission_rank = (
-            AsyncMock(return_value=0)
-        )
-
         # Act
         rank = await permission_system.get_user_permission_rank(mock_ctx)
 
@@ -91,8 +94,8 @@ class TestPermissionSystem:
         mock_role_2 = MagicMock(spec=discord.Role)
         mock_role_2.id = 222222
         mock_ctx.author.roles = [mock_role_1, mock_role_2]
-        permission_system.db.permission_assignments.get_user_permission_rank = (
-            AsyncMock(return_value=3)
+        permission_system.db.permission_assignments.get_role_ranks_by_guild = AsyncMock(
+            return_value={111111: 1, 222222: 3, 333333: 5}
         )
 
         # Act
@@ -131,8 +134,8 @@ class TestPermissionSystem:
         mock_permission = MagicMock(spec=PermissionCommand)
         mock_permission.required_rank = 2
         mock_permission.command_name = command_name
-        permission_system.db.command_permissions.get_command_permission = AsyncMock(
-            return_value=mock_permission,
+        permission_system.db.command_permissions.get_all_command_permissions = (
+            AsyncMock(return_value=[mock_permission])
         )
 
         # Act
@@ -153,9 +156,6 @@ class TestPermissionSystem:
         # Arrange
         guild_id = 123456789
         command_name = "unknown_command"
-        permission_system.db.command_permissions.get_command_permission = AsyncMock(
-            return_value=None,
-        )
 
         # Act
         result = await permission_system.get_command_permission(guild_id, command_name)
@@ -176,14 +176,8 @@ class TestPermissionSystem:
         mock_parent = MagicMock(spec=PermissionCommand)
         mock_parent.command_name = "config"
         mock_parent.required_rank = 5
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [mock_parent]
-        mock_session.execute = AsyncMock(return_value=mock_result)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        permission_system.db.command_permissions.db.session = MagicMock(
-            return_value=mock_session,
+        permission_system.db.command_permissions.get_all_command_permissions = (
+            AsyncMock(return_value=[mock_parent])
         )
 
         # Act
@@ -213,17 +207,8 @@ class TestPermissionSystem:
         mock_parent = MagicMock(spec=PermissionCommand)
         mock_parent.command_name = "config"
         mock_parent.required_rank = 5
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [
-            mock_sub,
-            mock_parent,
-        ]
-        mock_session.execute = AsyncMock(return_value=mock_result)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        permission_system.db.command_permissions.db.session = MagicMock(
-            return_value=mock_session,
+        permission_system.db.command_permissions.get_all_command_permissions = (
+            AsyncMock(return_value=[mock_parent, mock_sub])
         )
 
         # Act
@@ -82,6 +82,7 @@ class _MockLogConfig:
     """Minimal spec for config objects used in log level determination."""
 
     LOG_LEVEL: str | None
+    LOG_ENQUEUE: bool
     DEBUG: bool
 
 
@@ -267,6 +268,7 @@ class TestConfigureLogging:
             # Arrange
             mock_config = MagicMock(spec=_MockLogConfig)
             mock_config.LOG_LEVEL = "WARNING"
+            mock_config.LOG_ENQUEUE = False
             mock_config.DEBUG = False
 
             # Act
@@ -286,6 +288,7 @@ class TestConfigureLogging:
             # Arrange
             mock_config = MagicMock(spec=_MockLogConfig)
             mock_config.LOG_LEVEL = "WARNING"
+            mock_config.LOG_ENQUEUE = False
             mock_config.DEBUG = False
 
             # Act
@@ -527,11 +530,11 @@ class TestLoggingIntegration:
 
 
 class TestMessageFiltering:
-    """Message filtering and escaping (curly braces, angle brackets)."""
+    """Messages with curly braces and angle brackets are rendered verbatim."""
 
     @pytest.mark.unit
-    def test_logged_message_with_curly_braces_is_escaped_in_output(self) -> None:
-        """Messages with curly braces are escaped before formatting."""
+    def test_console_handler_has_no_message_rewriting_filter(self) -> None:
+        """The console sink leaves record messages untouched for other sinks."""
         with _reset_logging_state():
             # Arrange
             configure_logging(level="DEBUG")
@@ -543,44 +546,59 @@ class TestMessageFiltering:
             output = log_capture.getvalue()
 
             # Assert
-            assert "Test {{key}} value" in output
+            assert "Test {key} value" in output
+            assert "{{" not in output
 
     @pytest.mark.unit
-    def test_logged_message_with_angle_brackets_escapes_less_than(self) -> None:
-        """Angle brackets in messages are escaped so Discord mentions don't break colorizer."""
+    def test_console_output_keeps_braces_and_mentions_verbatim(
+        self,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Braces and Discord mentions are neither formatted nor parsed as tags."""
         with _reset_logging_state():
             # Arrange
             configure_logging(level="DEBUG")
-            log_capture = io.StringIO()
-            logger.add(log_capture, level="DEBUG", format="{message}")
 
             # Act
-            logger.debug("User <@&1259555162448724038> and <@1172803065779339304>")
-            output = log_capture.getvalue()
+            logger.debug("User <@&1259555162448724038> sent {'a': 1}")
+            output = capsys.readouterr().err
 
             # Assert
-            assert "\\<@&1259555162448724038>" in output
-            assert "\\<@1172803065779339304>" in output
+            assert "User <@&1259555162448724038> sent {'a': 1}" in output
 
     @pytest.mark.unit
-    def test_safe_message_filter_leaves_non_string_messages_unchanged(
-        self,
-    ) -> None:
-        """Non-string messages are not modified by the filter."""
+    def test_lazy_arguments_are_formatted_only_when_emitted(self) -> None:
+        """Arguments of calls below the active level are never formatted."""
+
+        class Expensive:
+            calls = 0
+
+            def __str__(self) -> str:
+                Expensive.calls += 1
+                return "expensive"
+
         with _reset_logging_state():
-            # Arrange - filter via handler; we exercise it directly since
-            # loguru never passes non-string messages from logger.debug(str)
-            configure_logging(level="DEBUG")
-            handler = logger._core.handlers[next(iter(logger._core.handlers.keys()))]
-            filter_func = handler._filter
-            mock_record: dict[str, object] = {"message": 12345}
+            # Arrange
+            configure_logging(level="INFO")
 
             # Act
-            result = filter_func(mock_record)
+            logger.trace("Value: {}", Expensive())
+            logger.debug("Value: {}", Expensive())
+            logger.info("Value: {}", Expensive())
+
+            # Assert
+            assert Expensive.calls == 1
+
+    @pytest.mark.unit
+    def test_enqueue_option_is_passed_to_console_handler(self) -> None:
+        """The console sink writes from a background thread when enqueued."""
+        with _reset_logging_state():
+            # Arrange & Act
+            configure_logging(level="INFO", enqueue=True)
+            handler = logger._core.handlers[next(iter(logger._core.handlers.keys()))]
 
             # Assert
-            assert result is True
-            assert mock_record["message"] == 12345
+            assert handler._enqueue is True
 
 
 class TestFormatRecord:
@@ -0,0 +1,91 @@
+"""Unit tests for event loop lag sampling and slow-callback detection."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from tux.core.loop_monitor import LoopLagMonitor
+
+pytestmark = pytest.mark.unit
+
+
+def _block_the_loop(seconds: float) -> None:
+    """Stand-in for synchronous I/O on the event loop."""
+    time.sleep(seconds)
+
+
+class TestLoopLagMonitor:
+    """Lag percentiles, offender attribution and metric deltas."""
+
+    def test_small_lag_is_not_a_slow_callback(self) -> None:
+        """Lag under the threshold is sampled but not attributed."""
+        monitor = LoopLagMonitor(threshold=0.1)
+        monitor.record_lag(0.002)
+        monitor.record_lag(-0.001)
+
+        report = monitor.report()
+
+        assert report.slow_callbacks == 0
+        assert report.offenders == []
+        assert report.lag_max_ms == pytest.approx(2.0)
+
+    def test_uncaptured_stall_is_still_counted(self) -> None:
+        """A stall the watchdog missed is recorded without a location."""
+        monitor = LoopLagMonitor(threshold=0.1)
+        monitor.record_lag(0.3)
+        monitor.record_lag(0.2)
+
+        report = monitor.report()
+
+        assert report.slow_callbacks == 2
+        assert report.offenders[0].location == "<not captured>"
+        assert report.offenders[0].count == 2
+        assert report.offenders[0].max_ms == pytest.approx(300.0)
+
+    @pytest.mark.asyncio
+    async def test_watchdog_captures_blocking_stack(self) -> None:
+        """A blocking call on the loop is attributed to its own frame."""
+        monitor = LoopLagMonitor(interval=0.02, threshold=0.05)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.05)
+            _block_the_loop(0.3)
+            await asyncio.sleep(0.1)
+        finally:
+            await monitor.stop()
+
+        report = monitor.report()
+
+        assert report.slow_callbacks >= 1
+        worst = report.offenders[0]
+        assert "_block_the_loop" in worst.location or "_block_the_loop" in worst.stack
+        assert worst.max_ms >= 200
+        assert not monitor.running
+
+    def test_push_metrics_reports_new_slow_callbacks(self) -> None:
+        """Slow callbacks are reported once; lag gauges every push."""
+        monitor = LoopLagMonitor(threshold=0.1)
+        monitor.record_lag(0.5)
+
+        with patch("tux.core.loop_monitor.record_event_loop_metric") as record:
+            monitor.push_metrics()
+            monitor.push_metrics()
+
+        assert [c.args[2] for c in record.call_args_list] == [1, 0]
+        assert record.call_args_list[0].args[1] == pytest.approx(500.0)
+
+    def test_reset_clears_samples(self) -> None:
+        """Reset drops lag samples and offenders."""
+        monitor = LoopLagMonitor(threshold=0.1)
+        monitor.record_lag(0.5)
+        monitor.reset()
+
+        report = monitor.report()
+
+        assert report.slow_callbacks == 0
+        assert report.offenders == []
+        assert report.lag_max_ms == 0.0
@@ -0,0 +1,181 @@
+"""Unit tests for the shared on_message dispatch pipeline."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tux.core.message_pipeline import MessageContext, MessagePipeline
+
+pytestmark = pytest.mark.unit
+
+TEST_GUILD_ID = 123456789
+
+
+def _message(
+    content: str = "Hello",
+    *,
+    bot: bool = False,
+    guild: bool = True,
+    webhook_id: int | None = None,
+) -> MagicMock:
+    """Build a message mock."""
+    message = MagicMock()
+    message.id = 1
+    message.content = content
+    message.author.bot = bot
+    message.webhook_id = webhook_id
+    message.guild = MagicMock(id=TEST_GUILD_ID) if guild else None
+    return message
+
+
+@pytest.fixture
+def mock_bot() -> MagicMock:
+    """Bot mock with a prefix manager and no maintenance mode."""
+    bot = MagicMock()
+    bot.maintenance_mode = False
+    bot.prefix_manager.get_prefix = AsyncMock(return_value="$")
+    bot.get_context = AsyncMock(return_value=MagicMock(valid=True))
+    return bot
+
+
+@pytest.fixture
+def pipeline(mock_bot: MagicMock) -> MessagePipeline:
+    """Pipeline bound to the bot mock."""
+    return MessagePipeline(mock_bot)
+
+
+class TestMessagePipeline:
+    """Stage filtering, shared context and error isolation."""
+
+    @pytest.mark.asyncio
+    async def test_context_is_shared_and_prefix_resolved_once(
+        self,
+        pipeline: MessagePipeline,
+        mock_bot: MagicMock,
+    ) -> None:
+        """All stages get one context; the prefix is looked up once."""
+        seen: list[MessageContext] = []
+
+        async def stage(ctx: MessageContext) -> None:
+            seen.append(ctx)
+
+        pipeline.register("a", stage)
+        pipeline.register("b", stage)
+        await pipeline.dispatch(_message("Hello GIF"))
+
+        assert len(seen) == 2
+        assert seen[0] is seen[1]
+        assert seen[0].prefix == "$"
+        assert seen[0].content_lower == "hello gif"
+        mock_bot.prefix_manager.get_prefix.assert_awaited_once_with(TEST_GUILD_ID)
+        mock_bot.get_context.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_no_matching_stage_skips_prefix_lookup(
+        self,
+        pipeline: MessagePipeline,
+        mock_bot: MagicMock,
+    ) -> None:
+        """Messages filtered out by every stage cost no prefix lookup."""
+        handler = AsyncMock()
+        pipeline.register("guild", handler)
+        pipeline.register("humans", handler, guild_only=False)
+        pipeline.register("never", handler, predicate=lambda _ctx: False)
+
+        await pipeline.dispatch(_message(bot=True, guild=False))
+
+        handler.assert_not_awaited()
+        mock_bot.prefix_manager.get_prefix.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_commands_resolved_once_and_skipped(
+        self,
+        pipeline: MessagePipeline,
+        mock_bot: MagicMock,
+    ) -> None:
+        """get_context runs once and only stages that allow commands see them."""
+        xp = AsyncMock()
+        harmful = AsyncMock()
+        pipeline.register("xp", xp, skip_commands=True)
+        pipeline.register("xp2", xp, skip_commands=True)
+        pipeline.register("harmful", harmful)
+
+        await pipeline.dispatch(_message("$ping"))
+
+        mock_bot.get_context.assert_awaited_once()
+        xp.assert_not_awaited()
+        harmful.assert_awaited_once()
+        assert harmful.await_args.args[0].is_command is True
+
+    @pytest.mark.asyncio
+    async def test_unprefixed_message_skips_get_context(
+        self,
+        pipeline: MessagePipeline,
+        mock_bot: MagicMock,
+    ) -> None:
+        """Content without the prefix is never a command."""
+        xp = AsyncMock()
+        pipeline.register("xp", xp, skip_commands=True)
+
+        await pipeline.dispatch(_message("ping"))
+
+        mock_bot.get_context.assert_not_awaited()
+        xp.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_maintenance_mode_runs_only_opted_in_stages(
+        self,
+        pipeline: MessagePipeline,
+        mock_bot: MagicMock,
+    ) -> None:
+        """Stages must opt in to run during maintenance."""
+        mock_bot.maintenance_mode = True
+        normal = AsyncMock()
+        bridge = AsyncMock()
+        pipeline.register("normal", normal)
+        pipeline.register("bridge", bridge, run_in_maintenance=True)
+
+        await pipeline.dispatch(_message())
+
+        normal.assert_not_awaited()
+        bridge.assert_awaited_once()
+        assert bridge.await_args.args[0].maintenance is True
+
+    @pytest.mark.asyncio
+    async def test_stage_error_is_isolated_and_counted(
+        self,
+        pipeline: MessagePipeline,
+    ) -> None:
+        """A failing stage does not stop the others and is recorded."""
+        ok = AsyncMock()
+        pipeline.register("broken", AsyncMock(side_effect=RuntimeError("boom")))
+        pipeline.register("ok", ok)
+
+        with (
+            patch("tux.core.message_pipeline.capture_exception_safe") as capture,
+            patch("tux.core.message_pipeline.record_task_metric") as record,
+        ):
+            await pipeline.dispatch(_message())
+
+        ok.assert_awaited_once()
+        capture.assert_called_once()
+        assert record.call_count == 2
+        stats = pipeline.stats()
+        assert stats["broken"].calls == 1
+        assert stats["broken"].errors == 1
+        assert stats["ok"].errors == 0
+
+    @pytest.mark.asyncio
+    async def test_unregister_removes_stage(self, pipeline: MessagePipeline) -> None:
+        """Unregistered stages are no longer dispatched; unknown names are ignored."""
+        handler = AsyncMock()
+        pipeline.register("afk", handler)
+        pipeline.unregister("afk")
+        pipeline.unregister("missing")
+
+        await pipeline.dispatch(_message())
+
+        handler.assert_not_awaited()
+        assert pipeline.stages == []
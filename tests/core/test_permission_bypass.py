@@ -182,7 +182,8 @@ class TestPermissionBypass:
 
             # Assert
             mock_logger.debug.assert_called()
-            call_args = mock_logger.debug.call_args[0][0]
+            message, *args = mock_logger.debug.call_args[0]
+            call_args = message.format(*args)
             assert "bypassing permission check" in call_args
             assert str(BOT_OWNER_ID) in call_args
 
@@ -214,7 +215,8 @@ class TestPermissionBypass:
 
             # Assert
             mock_logger.debug.assert_called()
-            call_args = mock_logger.debug.call_args[0][0]
+            message, *args = mock_logger.debug.call_args[0]
+            call_args = message.format(*args)
             assert "Guild owner" in call_args
             assert str(GUILD_OWNER_ID) in call_args
             assert "bypassing permission check" in call_args
@@ -0,0 +1,258 @@
+"""Unit tests for the compiled per-guild permission index (mocked DB)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tux.cache import InMemoryBackend, TieredBackend
+from tux.core.permission_index import PermissionIndex, command_lookup_chain
+from tux.core.permission_system import PermissionSystem
+from tux.database.controllers import permissions
+from tux.database.controllers.permissions import (
+    PERM_GENERATION_KEY_PREFIX,
+    PermissionAssignmentController,
+    PermissionCommandController,
+    bump_permission_generation,
+    get_permission_generation,
+    share_permission_generations,
+)
+from tux.database.models import (
+    PermissionAssignment,
+    PermissionCommand,
+    PermissionRank,
+)
+
+pytestmark = pytest.mark.unit
+
+GUILD_ID = 424242
+
+
+def _command(name: str, rank: int) -> PermissionCommand:
+    return PermissionCommand(guild_id=GUILD_ID, command_name=name, required_rank=rank)
+
+
+def _system(
+    role_ranks: dict[int, int] | None = None,
+    commands: list[PermissionCommand] | None = None,
+) -> PermissionSystem:
+    db = MagicMock()
+    db.permission_assignments.get_role_ranks_by_guild = AsyncMock(
+        return_value=role_ranks or {},
+    )
+    db.command_permissions.get_all_command_permissions = AsyncMock(
+        return_value=commands or [],
+    )
+    return PermissionSystem(MagicMock(), db)
+
+
+def test_command_lookup_chain_orders_most_specific_first() -> None:
+    """Subcommands fall back through each parent in turn."""
+    assert command_lookup_chain("config ranks init") == [
+        "config ranks init",
+        "config ranks",
+        "config",
+    ]
+    assert command_lookup_chain("ban") == ["ban"]
+
+
+def test_index_lookups() -> None:
+    """User rank is the max over roles; commands fall back to parents."""
+    index = PermissionIndex.build(
+        GUILD_ID,
+        0,
+        {1: 2, 2: 5},
+        [_command("config", 5), _command("config ranks init", 7)],
+    )
+
+    assert index.user_rank([1, 2, 3]) == 5
+    assert index.user_rank([3]) == 0
+    assert index.user_rank([]) == 0
+    perm = index.command_permission("config ranks init")
+    assert perm is not None
+    assert perm.required_rank == 7
+    perm = index.command_permission("config ranks list")
+    assert perm is not None
+    assert perm.required_rank == 5
+    assert index.command_permission("ban") is None
+
+
+@pytest.mark.asyncio
+async def test_index_is_built_once_and_reused() -> None:
+    """Warm lookups never touch the database again."""
+    system = _system({1: 3}, [_command("ban", 3)])
+
+    for _ in range(3):
+        assert (
+            await system.get_user_permission_rank_from_interaction(
+                GUILD_ID,
+                0,
+                [1],
+            )
+            == 3
+        )
+        assert await system.get_command_permission(GUILD_ID, "ban") is not None
+
+    system.db.permission_assignments.get_role_ranks_by_guild.assert_awaited_once()
+    assert system.get_cached_index(GUILD_ID) is not None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_lookups_share_one_build() -> None:
+    """Callers racing on a cold guild wait for a single build."""
+    system = _system({1: 2})
+
+    ranks = await asyncio.gather(
+        *(
+            system.get_user_permission_rank_from_interaction(GUILD_ID, 0, [1])
+            for _ in range(5)
+        ),
+    )
+
+    assert ranks == [2] * 5
+    system.db.permission_assignments.get_role_ranks_by_guild.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_generation_bump_invalidates_index() -> None:
+    """A permission write makes the next lookup rebuild from the database."""
+    system = _system({1: 2})
+    await system.get_permission_index(GUILD_ID)
+
+    await bump_permission_generation(GUILD_ID)
+    assert system.get_cached_index(GUILD_ID) is None
+
+    system.db.permission_assignments.get_role_ranks_by_guild.return_value = {1: 4}
+    index = await system.get_permission_index(GUILD_ID)
+
+    assert index.user_rank([1]) == 4
+    assert index.generation == get_permission_generation(GUILD_ID)
+
+
+@pytest.mark.asyncio
+async def test_controller_writes_bump_generation() -> None:
+    """Assigning a rank through the controller invalidates compiled indexes."""
+    backend = MagicMock()
+    backend.delete = AsyncMock()
+    backend.delete_many = AsyncMock()
+    assignments = PermissionAssignmentController(MagicMock(), backend)
+    assignments.create = AsyncMock(return_value=MagicMock())
+    commands = PermissionCommandController(MagicMock(), backend)
+    commands.upsert = AsyncMock(return_value=(MagicMock(), True))
+
+    before = get_permission_generation(GUILD_ID)
+    await assignments.assign_permission_rank(GUILD_ID, 1, 2)
+    await commands.set_command_permission(GUILD_ID, "config ranks", 3)
+
+    assert get_permission_generation(GUILD_ID) == before + 2
+
+
+@pytest.mark.asyncio
+async def test_generation_bumps_are_shared_between_processes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Bumps go to the shared backend; bumps published elsewhere apply here."""
+    monkeypatch.setattr(
+        permissions,
+        "_permission_generations",
+        permissions._PermissionGenerations(),
+    )
+    backend = TieredBackend(MagicMock())
+    backend.incr = AsyncMock(return_value=1)
+    share_permission_generations(backend)
+
+    await bump_permission_generation(GUILD_ID)
+    backend.incr.assert_awaited_once_with(f"{PERM_GENERATION_KEY_PREFIX}{GUILD_ID}")
+
+    remote = {"source": "other", "keys": [f"{PERM_GENERATION_KEY_PREFIX}{GUILD_ID}"]}
+    backend._handle_message(json.dumps(remote))
+    assert get_permission_generation(GUILD_ID) == 2
+
+    # A reconnect may have missed bumps for any guild
+    backend._handle_message(json.dumps({"source": "other", "prefixes": [""]}))
+    assert get_permission_generation(GUILD_ID) == 3
+    assert get_permission_generation(GUILD_ID + 1) == 1
+
+
+def test_in_memory_backend_keeps_generations_local(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A single process has nothing to share generations with."""
+    monkeypatch.setattr(
+        permissions,
+        "_permission_generations",
+        permissions._PermissionGenerations(),
+    )
+    share_permission_generations(InMemoryBackend())
+
+    assert permissions._permission_generations.backend is None
+
+
+def _prewarm_system(guild_ids: list[int]) -> PermissionSystem:
+    """System whose bulk loaders return one admin rank per guild."""
+    db = MagicMock()
+    db.permission_ranks.get_permission_ranks_for_guilds = AsyncMock(
+        return_value={
+            gid: [PermissionRank(id=gid, guild_id=gid, rank=5, name="Admin")]
+            for gid in guild_ids
+        },
+    )
+    db.permission_assignments.get_assignments_for_guilds = AsyncMock(
+        return_value={
+            gid: [
+                PermissionAssignment(guild_id=gid, permission_rank_id=gid, role_id=1),
+            ]
+            for gid in guild_ids
+        },
+    )
+    db.command_permissions.get_command_permissions_for_guilds = AsyncMock(
+        return_value={gid: [_command("ban", 5)] for gid in guild_ids},
+    )
+    db.permission_ranks.prime_guild_ranks_cache = AsyncMock()
+    db.permission_assignments.prime_assignments_cache = AsyncMock()
+    bot = MagicMock()
+    bot.guilds = [MagicMock(id=gid) for gid in guild_ids]
+    return PermissionSystem(bot, db)
+
+
+@pytest.mark.asyncio
+async def test_prewarm_all_guilds_uses_bulk_loads() -> None:
+    """Prewarm builds every index from three bulk loads and primes caches."""
+    guild_ids = [GUILD_ID + 1, GUILD_ID + 2]
+    system = _prewarm_system(guild_ids)
+
+    await system.prewarm_cache_for_all_guilds()
+
+    for gid in guild_ids:
+        index = system.get_cached_index(gid)
+        assert index is not None
+        assert index.user_rank([1]) == 5
+        assert index.command_permission("ban") is not None
+    system.db.permission_assignments.get_role_ranks_by_guild.assert_not_called()
+    primed = system.db.permission_ranks.prime_guild_ranks_cache.await_args.args[0]
+    assert sorted(primed) == guild_ids
+
+
+@pytest.mark.asyncio
+async def test_prewarm_skips_caching_guilds_changed_mid_load() -> None:
+    """A write during the bulk load keeps that guild out of the cache writes."""
+    changed, unchanged = GUILD_ID + 3, GUILD_ID + 4
+    system = _prewarm_system([changed, unchanged])
+    load = system.db.command_permissions.get_command_permissions_for_guilds
+    result = load.return_value
+
+    async def load_with_write(guild_ids: list[int]) -> dict[int, list[object]]:
+        await bump_permission_generation(changed)
+        return result
+
+    load.side_effect = load_with_write
+
+    await system.prewarm_cache_for_all_guilds()
+
+    assert system.get_cached_index(changed) is None
+    assert system.get_cached_index(unchanged) is not None
+    primed = system.db.permission_assignments.prime_assignments_cache.await_args.args[0]
+    assert list(primed) == [unchanged]
@@ -98,3 +98,20 @@ async def test_get_prefix_returns_default_when_guild_id_none(
     """get_prefix with guild_id None returns default prefix."""
     result = await prefix_manager.get_prefix(None)
     assert result == "!"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_all_deletes_backend_prefix_keys(
+    prefix_manager: PrefixManager,
+) -> None:
+    """invalidate_cache() clears the mirror and drops all prefix keys in one call."""
+    prefix_manager._prefix_cache[TEST_GUILD_ID] = "?"
+    mock_backend = MagicMock()
+    mock_backend.delete_prefix = AsyncMock(return_value=1)
+    with patch(
+        "tux.core.prefix_manager.get_cache_backend",
+        return_value=mock_backend,
+    ):
+        await prefix_manager.invalidate_cache()
+    mock_backend.delete_prefix.assert_awaited_once_with("prefix:")
+    assert prefix_manager._prefix_cache == {}
@@ -0,0 +1,139 @@
+"""Unit tests for the dependency-graph setup orchestrator."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from tux.core.setup.base import BaseSetupService
+from tux.core.setup.orchestrator import BotSetupOrchestrator
+from tux.shared.exceptions import TuxDatabaseConnectionError, TuxSetupError
+
+pytestmark = pytest.mark.unit
+
+
+class _FakeService(BaseSetupService):
+    """Service that sleeps, records its run, and optionally fails."""
+
+    def __init__(
+        self,
+        name: str,
+        depends_on: tuple[str, ...] = (),
+        *,
+        delay: float = 0.05,
+        fail: bool = False,
+        log: list[str] | None = None,
+    ) -> None:
+        super().__init__(name)
+        self.depends_on = depends_on  # type: ignore[misc]
+        self.delay = delay
+        self.fail = fail
+        self.log = log if log is not None else []
+
+    async def setup(self) -> None:
+        """Record start and end around a sleep."""
+        self.log.append(f"start:{self.name}")
+        await asyncio.sleep(self.delay)
+        self.log.append(f"end:{self.name}")
+        if self.fail:
+            msg = f"{self.name} broke"
+            raise RuntimeError(msg)
+
+
+def _orchestrator(services: list[BaseSetupService]) -> BotSetupOrchestrator:
+    """Build an orchestrator over fake services and a mocked bot."""
+    orchestrator = BotSetupOrchestrator.__new__(BotSetupOrchestrator)
+    orchestrator.bot = MagicMock()
+    orchestrator.services = services
+    orchestrator.report = None
+    return orchestrator
+
+
+class TestBotSetupOrchestrator:
+    """Services run concurrently where the graph allows, in order otherwise."""
+
+    @pytest.mark.asyncio
+    async def test_independent_services_overlap(self) -> None:
+        """Roots run together; dependents start only after their dependencies."""
+        log: list[str] = []
+        orchestrator = _orchestrator(
+            [
+                _FakeService("database", log=log),
+                _FakeService("cache", log=log),
+                _FakeService("permissions", ("database", "cache"), log=log),
+                _FakeService("cogs", ("permissions",), log=log),
+            ],
+        )
+        span = MagicMock()
+
+        await orchestrator.setup(span)
+
+        assert set(log[:2]) == {"start:database", "start:cache"}
+        assert log.index("start:permissions") > log.index("end:cache")
+        assert log.index("start:permissions") > log.index("end:database")
+        assert log[-1] == "end:cogs"
+
+        report = orchestrator.bot.startup_report
+        assert report is orchestrator.report
+        assert [phase.name for phase in report.phases][-1] == "cogs"
+        # Two 50ms roots in parallel plus two dependents is well under 4 x 50ms
+        assert report.total_ms < report.sequential_ms
+        span.set_data.assert_any_call("setup.total_ms", report.total_ms)
+        orchestrator.bot.task_monitor.start.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failure_waits_for_running_and_skips_dependents(self) -> None:
+        """A failed service lets in-flight work finish but starts nothing new."""
+        log: list[str] = []
+        orchestrator = _orchestrator(
+            [
+                _FakeService("cache", delay=0.01, fail=True, log=log),
+                _FakeService("database", delay=0.05, log=log),
+                _FakeService("permissions", ("database", "cache"), log=log),
+            ],
+        )
+
+        with pytest.raises(TuxSetupError, match="Cache setup failed"):
+            await orchestrator.setup(MagicMock())
+
+        assert "end:database" in log
+        assert "start:permissions" not in log
+        assert orchestrator.report is not None
+        assert not orchestrator.report.phases[0].success
+        orchestrator.bot.task_monitor.start.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_database_failure_raises_connection_error(self) -> None:
+        """Database failures keep their dedicated exception type."""
+        orchestrator = _orchestrator([_FakeService("database", fail=True)])
+
+        with pytest.raises(TuxDatabaseConnectionError, match="uv run db push"):
+            await orchestrator.setup(MagicMock())
+
+    @pytest.mark.parametrize(
+        ("services", "match"),
+        [
+            ([_FakeService("cogs", ("emoji",))], "unknown"),
+            ([_FakeService("a", ("b",)), _FakeService("b", ("a",))], "cycle"),
+            ([_FakeService("a"), _FakeService("a")], "duplicate"),
+        ],
+    )
+    def test_invalid_graphs_are_rejected(
+        self,
+        services: list[BaseSetupService],
+        match: str,
+    ) -> None:
+        """Unknown dependencies, cycles and duplicate names fail fast."""
+        with pytest.raises(TuxSetupError, match=match):
+            BotSetupOrchestrator.validate(services)
+
+    def test_real_services_form_a_valid_graph(self) -> None:
+        """The shipped services have known, acyclic dependencies."""
+        bot = MagicMock()
+        orchestrator = BotSetupOrchestrator(bot)
+
+        BotSetupOrchestrator.validate(orchestrator.services)
+        roots = {s.name for s in orchestrator.services if not s.depends_on}
+        assert roots == {"database", "cache", "emoji", "cog_discovery"}
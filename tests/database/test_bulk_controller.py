@@ -0,0 +1,120 @@
+"""Unit tests for set-based bulk operations (mocked session, no DB)."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from tux.database.controllers.base.bulk import BulkOperationsController
+from tux.database.models import Guild, Levels
+
+pytestmark = pytest.mark.unit
+
+
+def _mock_db(rowcount: int = 1) -> tuple[MagicMock, MagicMock]:
+    """DatabaseService mock recording executed statements."""
+    session = MagicMock()
+    result = MagicMock()
+    result.rowcount = rowcount
+    session.execute = AsyncMock(return_value=result)
+    session.commit = AsyncMock()
+
+    @asynccontextmanager
+    async def _session():
+        yield session
+
+    db = MagicMock()
+    db.session = _session
+    return db, session
+
+
+def _sql(session: MagicMock, call: int = 0) -> str:
+    stmt = session.execute.await_args_list[call].args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_uses_values_join_per_column_set() -> None:
+    """Updates sharing a column set become one UPDATE ... FROM (VALUES ...)."""
+    db, session = _mock_db(rowcount=2)
+    controller = BulkOperationsController(Guild, db)
+
+    updated = await controller.bulk_update(
+        [(1, {"case_count": 5}), (2, {"case_count": 7})],
+    )
+
+    assert updated == 2
+    session.execute.assert_awaited_once()
+    sql = _sql(session)
+    assert "FROM (VALUES" in sql
+    assert "case_count=v.case_count" in sql
+    assert "guild.id = v.id" in sql
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_groups_and_chunks() -> None:
+    """Different column sets and chunk boundaries produce separate statements."""
+    db, session = _mock_db(rowcount=1)
+    controller = BulkOperationsController(Guild, db, chunk_size=2)
+
+    updated = await controller.bulk_update(
+        [
+            (1, {"case_count": 1}),
+            (2, {"case_count": 2}),
+            (3, {"case_count": 3}),
+            (4, {"guild_joined_at": None}),
+        ],
+    )
+
+    # Two chunks for case_count plus one for guild_joined_at
+    assert session.execute.await_count == 3
+    assert updated == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_supports_composite_keys() -> None:
+    """Composite primary keys join on every key column."""
+    db, session = _mock_db(rowcount=1)
+    controller = BulkOperationsController(Levels, db)
+
+    await controller.bulk_update([((10, 20), {"xp": 5.0})])
+
+    sql = _sql(session)
+    assert "levels.member_id = v.member_id" in sql
+    assert "levels.guild_id = v.guild_id" in sql
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_sums_real_rowcounts() -> None:
+    """Delete counts come from the database, not the input length."""
+    db, session = _mock_db(rowcount=1)
+    controller = BulkOperationsController(Guild, db, chunk_size=2)
+
+    deleted = await controller.bulk_delete([1, 2, 3])
+
+    assert session.execute.await_count == 2
+    assert deleted == 2
+
+
+@pytest.mark.asyncio
+async def test_update_where_returns_rowcount() -> None:
+    """update_where reports the affected row count."""
+    db, _ = _mock_db(rowcount=4)
+    controller = BulkOperationsController(Guild, db)
+
+    assert await controller.update_where({"case_count": 0}, {"case_count": 1}) == 4
+
+
+@pytest.mark.asyncio
+async def test_empty_inputs_skip_the_database() -> None:
+    """Empty bulk calls return immediately."""
+    db, session = _mock_db()
+    controller = BulkOperationsController(Guild, db)
+
+    assert await controller.bulk_create([]) == []
+    assert await controller.bulk_update([]) == 0
+    assert await controller.bulk_delete([]) == 0
+    session.execute.assert_not_called()
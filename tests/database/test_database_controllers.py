@@ -48,6 +48,25 @@ class TestGuildController:
         # Should have the same ID
         assert guild1.id == guild2.id
 
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_register_guilds_creates_only_missing(
+        self,
+        guild_controller: GuildController,
+    ) -> None:
+        """Test bulk registration skips existing guilds and is repeatable."""
+        await guild_controller.create_guild(guild_id=TEST_GUILD_ID)
+        guild_ids = [TEST_GUILD_ID, TEST_GUILD_ID + 1, TEST_GUILD_ID + 2]
+
+        created = await guild_controller.register_guilds(guild_ids)
+        assert sorted(created) == [TEST_GUILD_ID + 1, TEST_GUILD_ID + 2]
+
+        # Everything is registered now, so a reconnect creates nothing
+        assert await guild_controller.register_guilds(guild_ids) == []
+        new_guild = await guild_controller.get_guild_by_id(TEST_GUILD_ID + 2)
+        assert new_guild is not None
+        assert new_guild.case_count == 0
+
     @pytest.mark.integration
     @pytest.mark.asyncio
     async def test_delete_guild(self, guild_controller: GuildController) -> None:
@@ -0,0 +1,196 @@
+"""Unit tests for the snippet cache and batched use counters (mocked controller)."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tux.database.models import Snippet
+from tux.database.snippet_cache import SnippetCache
+
+pytestmark = pytest.mark.unit
+
+GUILD_ID = 222
+
+
+def _snippet(snippet_id: int, name: str, alias: str | None = None) -> Snippet:
+    """Build a detached snippet row."""
+    return Snippet(
+        id=snippet_id,
+        snippet_name=name,
+        snippet_content=None if alias else f"{name} content",
+        snippet_user_id=1,
+        guild_id=GUILD_ID,
+        uses=0,
+        alias=alias,
+    )
+
+
+@pytest.fixture
+def mock_controller() -> MagicMock:
+    """SnippetController mock holding ``git`` and its alias ``g``."""
+    rows = {"git": _snippet(1, "git"), "g": _snippet(2, "g", alias="git")}
+    controller = MagicMock()
+    controller.get_snippet_by_name_and_guild_id = AsyncMock(
+        side_effect=lambda name, _guild_id: rows.get(name),
+    )
+    controller.add_snippet_uses_batch = AsyncMock(side_effect=len)
+    controller.search_snippets = AsyncMock(return_value=[rows["git"]])
+    return controller
+
+
+class TestSnippetCache:
+    """Read-through lookups, invalidation and write-behind use counts."""
+
+    @pytest.mark.asyncio
+    async def test_hit_avoids_second_load(self, mock_controller: MagicMock) -> None:
+        """A warm name is served without querying the controller."""
+        cache = SnippetCache(mock_controller)
+        first = await cache.get("git", GUILD_ID)
+        second = await cache.get("git", GUILD_ID)
+
+        assert first is second
+        assert first.target is first.snippet
+        assert not first.is_alias
+        mock_controller.get_snippet_by_name_and_guild_id.assert_awaited_once()
+        assert cache.stats()["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_alias_and_missing_names_are_cached(
+        self,
+        mock_controller: MagicMock,
+    ) -> None:
+        """Aliases cache their target; unknown names cache the miss."""
+        cache = SnippetCache(mock_controller)
+        alias = await cache.get("g", GUILD_ID)
+        missing = await cache.get("nope", GUILD_ID)
+        await cache.get("g", GUILD_ID)
+        await cache.get("nope", GUILD_ID)
+
+        assert alias.is_alias
+        assert alias.target is not None
+        assert alias.target.snippet_name == "git"
+        assert missing.snippet is None
+        assert missing.target is None
+        assert mock_controller.get_snippet_by_name_and_guild_id.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_invalidate_snippet_drops_guild(
+        self,
+        mock_controller: MagicMock,
+    ) -> None:
+        """Writing to an alias target drops the aliases resolved to it."""
+        cache = SnippetCache(mock_controller)
+        await cache.get("g", GUILD_ID)
+
+        cache.invalidate_snippet(1)
+        await cache.get("g", GUILD_ID)
+
+        assert mock_controller.get_snippet_by_name_and_guild_id.await_count == 4
+        cache.invalidate_snippet(999)
+        assert cache.stats()["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_suggestions_are_cached_with_the_miss(
+        self,
+        mock_controller: MagicMock,
+    ) -> None:
+        """Repeated misses search once until the guild's snippets change."""
+        cache = SnippetCache(mock_controller)
+        await cache.get("gti", GUILD_ID)
+
+        assert await cache.suggest("gti", GUILD_ID, 3) == ("git",)
+        assert await cache.suggest("gti", GUILD_ID, 3) == ("git",)
+        mock_controller.search_snippets.assert_awaited_once()
+
+        cache.invalidate_guild(GUILD_ID)
+        await cache.get("gti", GUILD_ID)
+        await cache.suggest("gti", GUILD_ID, 3)
+        assert mock_controller.search_snippets.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_evicting_alias_keeps_target_mapping(
+        self,
+        mock_controller: MagicMock,
+    ) -> None:
+        """A snippet stays invalidatable while any cached entry refers to it."""
+        cache = SnippetCache(mock_controller, max_entries_per_guild=2)
+        await cache.get("g", GUILD_ID)
+        await cache.get("git", GUILD_ID)
+        # Evicts the alias entry, which also referred to "git"
+        await cache.get("nope", GUILD_ID)
+
+        cache.invalidate_snippet(1)
+
+        assert cache.stats()["entries"] == 0
+        assert cache._snippet_guilds == {}
+        assert not cache._snippet_refs
+
+    @pytest.mark.asyncio
+    async def test_uses_are_batched_and_survive_reload(
+        self,
+        mock_controller: MagicMock,
+    ) -> None:
+        """Uses accumulate in memory, survive a reload, and flush in one batch."""
+        cache = SnippetCache(mock_controller)
+        git = (await cache.get("git", GUILD_ID)).snippet
+        alias = (await cache.get("g", GUILD_ID)).snippet
+        assert git is not None
+        assert alias is not None
+        cache.record_use(git)
+        cache.record_use(git)
+        cache.record_use(alias)
+
+        # Fresh rows from the DB don't include pending uses yet
+        git.uses = 0
+        cache.invalidate_guild(GUILD_ID)
+        reloaded = (await cache.get("git", GUILD_ID)).snippet
+        assert reloaded is not None
+        assert reloaded.uses == 2
+
+        assert await cache.flush() == 2
+        mock_controller.add_snippet_uses_batch.assert_awaited_once_with({1: 2, 2: 1})
+        assert cache.pending_uses(1) == 0
+        assert await cache.flush() == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_restores_counts(
+        self,
+        mock_controller: MagicMock,
+    ) -> None:
+        """Transient write failures keep the uses for the next flush."""
+        cache = SnippetCache(mock_controller)
+        git = (await cache.get("git", GUILD_ID)).snippet
+        assert git is not None
+        cache.record_use(git)
+        mock_controller.add_snippet_uses_batch.side_effect = RuntimeError("db down")
+
+        assert await cache.flush() == 0
+        assert cache.pending_uses(1) == 1
+
+        cache.record_use(git)
+        mock_controller.add_snippet_uses_batch.side_effect = len
+        assert await cache.flush() == 1
+        mock_controller.add_snippet_uses_batch.assert_awaited_with({1: 2})
+
+    @pytest.mark.asyncio
+    async def test_threshold_flush_backs_off_after_failure(
+        self,
+        mock_controller: MagicMock,
+    ) -> None:
+        """A failed flush pauses threshold flushes instead of retrying per use."""
+        cache = SnippetCache(mock_controller, max_pending=1)
+        git = (await cache.get("git", GUILD_ID)).snippet
+        assert git is not None
+        mock_controller.add_snippet_uses_batch.side_effect = RuntimeError("db down")
+
+        cache.record_use(git)
+        assert cache._flush_task is not None
+        await cache._flush_task
+        failed_task = cache._flush_task
+        cache.record_use(git)
+
+        assert cache._flush_task is failed_task
+        assert cache.pending_uses(1) == 2
+        mock_controller.add_snippet_uses_batch.assert_awaited_once()
@@ -0,0 +1,226 @@
+"""Tests for snippet search: the SQL it builds and its results in PostgreSQL."""
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import Connection, text
+from sqlalchemy.dialects import postgresql
+
+import tux.database
+from tux.database.controllers import GuildController
+from tux.database.controllers.snippet import SnippetController
+from tux.database.service import DatabaseService
+
+TEST_GUILD_ID = 123456789012345678
+OTHER_GUILD_ID = TEST_GUILD_ID + 1
+AUTHOR_ID = 987654321098765432
+OTHER_AUTHOR_ID = AUTHOR_ID + 1
+TRIGRAM_REVISION = "5f2c8e1a9d47"
+
+
+def _compile(guild_id: int, term: str, creator_id: int | None = None) -> str:
+    """Render the search filter as PostgreSQL with inlined parameters."""
+    expression = SnippetController._search_filter(guild_id, term, creator_id)
+    return str(
+        expression.compile(
+            dialect=postgresql.dialect(paramstyle="named"),
+            compile_kwargs={"literal_binds": True},
+        ),
+    )
+
+
+def _load_migration(revision: str) -> ModuleType:
+    """Import a migration script by its revision ID."""
+    versions = Path(tux.database.__file__).parent / "migrations" / "versions"
+    (path,) = versions.glob(f"*{revision}_*.py")
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _upgrade(connection: Connection, migration: ModuleType) -> None:
+    """Run a migration's ``upgrade()`` on a synchronous connection."""
+    with Operations.context(MigrationContext.configure(connection)):
+        migration.upgrade()
+
+
+@pytest.fixture
+async def snippet_controller(
+    db_service: DatabaseService,
+    guild_controller: GuildController,
+) -> SnippetController:
+    """SnippetController over the trigram migration and a few snippets."""
+    engine = db_service.engine
+    assert engine is not None
+    async with engine.begin() as conn:
+        await conn.run_sync(_upgrade, _load_migration(TRIGRAM_REVISION))
+
+    controller = SnippetController(db_service)
+    for guild_id in (TEST_GUILD_ID, OTHER_GUILD_ID):
+        await guild_controller.create_guild(guild_id=guild_id)
+    rows = [
+        ("docker", "Install docker from the docs", AUTHOR_ID, 1),
+        ("docker-compose", "Compose file reference", AUTHOR_ID, 5),
+        ("dockerfile", "Dockerfile best practices", OTHER_AUTHOR_ID, 2),
+        ("containers", "Run it with docker or podman", AUTHOR_ID, 9),
+        ("python", "Use a virtual environment", AUTHOR_ID, 3),
+    ]
+    for name, content, author_id, uses in rows:
+        snippet = await controller.create_snippet(
+            snippet_name=name,
+            snippet_content=content,
+            guild_id=TEST_GUILD_ID,
+            snippet_user_id=author_id,
+        )
+        assert snippet.id is not None
+        await controller.add_snippet_uses_batch({snippet.id: uses})
+    await controller.create_snippet(
+        snippet_name="docker",
+        snippet_content="Another guild's docker snippet",
+        guild_id=OTHER_GUILD_ID,
+        snippet_user_id=AUTHOR_ID,
+    )
+    return controller
+
+
+@pytest.mark.unit
+class TestSnippetSearchFilter:
+    """The search filter is index-friendly and matches terms literally."""
+
+    def test_matches_name_content_and_trigram_similarity(self) -> None:
+        """Name and content use ILIKE; names also match by similarity."""
+        sql = _compile(1, "docker")
+
+        assert "snippet.guild_id = 1" in sql
+        assert "snippet.snippet_name ILIKE '%docker%'" in sql
+        assert "snippet.snippet_content ILIKE '%docker%'" in sql
+        assert "snippet.snippet_name % 'docker'" in sql
+        assert "snippet_user_id" not in sql
+
+    def test_wildcards_are_escaped(self) -> None:
+        """LIKE wildcards in the term are matched literally."""
+        sql = _compile(1, "50%_off")
+
+        assert r"ILIKE '%50\%\_off%' ESCAPE '\'" in sql
+
+    def test_creator_filter(self) -> None:
+        """Searching one member's snippets adds a creator condition."""
+        sql = _compile(1, "git", creator_id=42)
+
+        assert "snippet.snippet_user_id = 42" in sql
+
+
+class TestSnippetSearchQueries:
+    """Ranking, paging and counting against PostgreSQL with ``pg_trgm``."""
+
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_migration_creates_trigram_indexes(
+        self,
+        snippet_controller: SnippetController,
+    ) -> None:
+        """The migration installs pg_trgm and GIN trigram indexes on snippets."""
+        async with snippet_controller.db.session() as session:
+            result = await session.execute(
+                text(
+                    "SELECT indexname, indexdef FROM pg_indexes "
+                    "WHERE tablename = 'snippet' AND indexname LIKE '%trgm'",
+                ),
+            )
+            indexes = dict(result.tuples().all())
+            similarity = await session.scalar(
+                text("SELECT similarity('dockr', 'docker')"),
+            )
+
+        assert set(indexes) == {"idx_snippet_name_trgm", "idx_snippet_content_trgm"}
+        assert all("gin_trgm_ops" in indexdef for indexdef in indexes.values())
+        assert similarity is not None
+        assert similarity > 0.3
+
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_exact_name_ranks_first_and_content_matches_last(
+        self,
+        snippet_controller: SnippetController,
+    ) -> None:
+        """Name matches outrank content matches; other guilds are excluded."""
+        ranked = await snippet_controller.search_snippets_ranked(
+            TEST_GUILD_ID,
+            "docker",
+        )
+        names = [snippet.snippet_name for snippet, _ in ranked]
+        scores = [score for _, score in ranked]
+
+        assert names[0] == "docker"
+        assert names[-1] == "containers"
+        assert set(names) == {"docker", "docker-compose", "dockerfile", "containers"}
+        assert scores == sorted(scores, reverse=True)
+        assert all(snippet.guild_id == TEST_GUILD_ID for snippet, _ in ranked)
+
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_misspelled_name_matches_by_similarity(
+        self,
+        snippet_controller: SnippetController,
+    ) -> None:
+        """A typo that no ILIKE matches is found through the ``%`` operator."""
+        results = await snippet_controller.search_snippets(TEST_GUILD_ID, "dockr")
+
+        assert results
+        assert results[0].snippet_name == "docker"
+
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_pages_partition_results_and_count_matches(
+        self,
+        snippet_controller: SnippetController,
+    ) -> None:
+        """Limit/offset pages are disjoint slices of the full ranked result."""
+        everything = await snippet_controller.search_snippets(TEST_GUILD_ID, "docker")
+        pages = [
+            await snippet_controller.search_snippets(
+                TEST_GUILD_ID,
+                "docker",
+                limit=2,
+                offset=offset,
+            )
+            for offset in (0, 2, 4)
+        ]
+
+        assert [[s.id for s in page] for page in pages] == [
+            [s.id for s in everything[:2]],
+            [s.id for s in everything[2:4]],
+            [],
+        ]
+        assert await snippet_controller.count_search_matches(
+            TEST_GUILD_ID,
+            "docker",
+        ) == len(everything)
+
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_creator_filter_limits_results_and_count(
+        self,
+        snippet_controller: SnippetController,
+    ) -> None:
+        """Searching one member's snippets leaves out everyone else's."""
+        results = await snippet_controller.search_snippets(
+            TEST_GUILD_ID,
+            "docker",
+            creator_id=OTHER_AUTHOR_ID,
+        )
+        count = await snippet_controller.count_search_matches(
+            TEST_GUILD_ID,
+            "docker",
+            creator_id=OTHER_AUTHOR_ID,
+        )
+
+        assert [snippet.snippet_name for snippet in results] == ["dockerfile"]
+        assert count == 1
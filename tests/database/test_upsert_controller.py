@@ -0,0 +1,176 @@
+"""Unit tests for the single-statement upsert engine (no DB)."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from tux.database.controllers.base.upsert import UpsertController
+from tux.database.models import Guild, Levels, PermissionCommand, StarboardMessage
+
+pytestmark = pytest.mark.unit
+
+
+def _compile(stmt: object) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))  # type: ignore[attr-defined]
+
+
+def _mock_db(row: tuple[object, bool]) -> tuple[MagicMock, MagicMock]:
+    """DatabaseService mock whose session returns a single RETURNING row."""
+    session = MagicMock()
+    result = MagicMock()
+    result.one.return_value = row
+    session.execute = AsyncMock(return_value=result)
+    session.commit = AsyncMock()
+
+    @asynccontextmanager
+    async def _session():
+        yield session
+
+    db = MagicMock()
+    db.session = _session
+    return db, session
+
+
+def test_unique_keys_cover_pk_constraints_and_indexes() -> None:
+    """Primary keys, unique constraints and unique indexes are all discovered."""
+    levels = UpsertController(Levels, MagicMock())
+    commands = UpsertController(PermissionCommand, MagicMock())
+    messages = UpsertController(StarboardMessage, MagicMock())
+
+    assert levels.unique_keys == (frozenset({"member_id", "guild_id"}),)
+    assert frozenset({"guild_id", "command_name"}) in commands.unique_keys
+    assert frozenset({"id", "message_guild_id"}) in messages.unique_keys
+
+
+def test_conflict_target_requires_exact_unique_key() -> None:
+    """Only filter sets that exactly match a unique key use ON CONFLICT."""
+    controller = UpsertController(PermissionCommand, MagicMock())
+    assert controller.conflict_target(["guild_id", "command_name"]) == [
+        "command_name",
+        "guild_id",
+    ]
+    assert controller.conflict_target(["guild_id"]) is None
+    assert controller.conflict_target(["guild_id", "required_rank"]) is None
+
+
+def test_upsert_statement_updates_given_columns() -> None:
+    """Updated columns come from EXCLUDED and updated_at is refreshed."""
+    controller = UpsertController(PermissionCommand, MagicMock())
+    sql = _compile(
+        controller.upsert_statement(
+            ["command_name", "guild_id"],
+            {"guild_id": 1, "command_name": "ban", "required_rank": 3},
+            ["required_rank"],
+        ),
+    )
+    assert "ON CONFLICT (command_name, guild_id) DO UPDATE SET" in sql
+    assert "required_rank = excluded.required_rank" in sql
+    assert "updated_at = now()" in sql
+    assert "(xmax = 0) AS inserted" in sql
+
+
+def test_get_or_create_insert_does_nothing_on_conflict() -> None:
+    """get-or-create never updates, so an existing row is not rewritten."""
+    controller = UpsertController(Guild, MagicMock())
+    sql = _compile(controller.insert_missing_statement(["id"], {"id": 1}))
+    assert "ON CONFLICT (id) DO NOTHING" in sql
+    assert "DO UPDATE" not in sql
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_reads_existing_row_without_writing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """An existing row costs one SELECT and no INSERT."""
+    guild = Guild(id=1)
+    db, session = _mock_db((guild, False))
+    controller = UpsertController(Guild, db)
+    find_one = AsyncMock(return_value=guild)
+    monkeypatch.setattr(
+        "tux.database.controllers.base.upsert.QueryController.find_one",
+        find_one,
+    )
+
+    record, created = await controller.get_or_create(id=1)
+
+    assert (record, created) == (guild, False)
+    find_one.assert_awaited_once()
+    session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_inserts_missing_row(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A missing row is inserted with ON CONFLICT DO NOTHING."""
+    guild = Guild(id=1)
+    db, session = _mock_db((guild, True))
+    session.execute.return_value.scalar_one_or_none.return_value = guild
+    controller = UpsertController(Guild, db)
+    monkeypatch.setattr(
+        "tux.database.controllers.base.upsert.QueryController.find_one",
+        AsyncMock(return_value=None),
+    )
+
+    record, created = await controller.get_or_create(id=1)
+
+    assert (record, created) == (guild, True)
+    session.execute.assert_awaited_once()
+    session.expunge.assert_called_once_with(guild)
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_reselects_after_losing_race(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """When a concurrent insert wins, the row it wrote is selected again."""
+    guild = Guild(id=1)
+    db, session = _mock_db((guild, False))
+    session.execute.return_value.scalar_one_or_none.return_value = None
+    controller = UpsertController(Guild, db)
+    find_one = AsyncMock(side_effect=[None, guild])
+    monkeypatch.setattr(
+        "tux.database.controllers.base.upsert.QueryController.find_one",
+        find_one,
+    )
+
+    record, created = await controller.get_or_create(id=1)
+
+    assert (record, created) == (guild, False)
+    assert find_one.await_count == 2
+    session.execute.assert_awaited_once()
+    session.expunge.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upsert_without_unique_key_falls_back(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Filters that are not a unique key keep the find-then-write path."""
+    db, session = _mock_db((None, False))
+    controller = UpsertController(PermissionCommand, db)
+    created_row = PermissionCommand(guild_id=1, command_name="ban", required_rank=1)
+    create = AsyncMock(return_value=created_row)
+    find_one = AsyncMock(return_value=None)
+    monkeypatch.setattr(
+        "tux.database.controllers.base.upsert.QueryController.find_one",
+        find_one,
+    )
+    monkeypatch.setattr(
+        "tux.database.controllers.base.upsert.CrudController.create",
+        create,
+    )
+
+    record, created = await controller.upsert(
+        filters={"guild_id": 1},
+        command_name="ban",
+        required_rank=1,
+    )
+
+    assert (record, created) == (created_row, True)
+    find_one.assert_awaited_once()
+    session.execute.assert_not_called()
@@ -0,0 +1,204 @@
+"""Unit tests for the write-behind XP ledger (mocked controller, no DB)."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from tux.database.xp_ledger import XpLedger
+
+pytestmark = pytest.mark.unit
+
+MEMBER_ID = 111
+GUILD_ID = 222
+NOW = datetime.now(UTC).replace(tzinfo=None)
+
+
+@pytest.fixture
+def mock_controller() -> MagicMock:
+    """LevelsController mock with no existing rows."""
+    controller = MagicMock()
+    controller.find_one = AsyncMock(return_value=None)
+    controller.upsert_xp_batch = AsyncMock(side_effect=len)
+    return controller
+
+
+@pytest.mark.asyncio
+async def test_get_loads_once_then_serves_from_memory(
+    mock_controller: MagicMock,
+) -> None:
+    """get() hits the controller on first access only."""
+    ledger = XpLedger(mock_controller)
+    first = await ledger.get(MEMBER_ID, GUILD_ID)
+    second = await ledger.get(MEMBER_ID, GUILD_ID)
+    assert first is second
+    assert first.xp == 0.0
+    mock_controller.find_one.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_record_then_flush_writes_single_batch(
+    mock_controller: MagicMock,
+) -> None:
+    """Dirty entries are written in one upsert batch and marked clean."""
+    ledger = XpLedger(mock_controller)
+    for member_id in range(1, 4):
+        await ledger.get(member_id, GUILD_ID)
+        ledger.record(member_id, GUILD_ID, xp=10.0, level=1, last_message=NOW)
+
+    written = await ledger.flush()
+
+    assert written == 3
+    mock_controller.upsert_xp_batch.assert_awaited_once()
+    rows = mock_controller.upsert_xp_batch.await_args.args[0]
+    assert {row["member_id"] for row in rows} == {1, 2, 3}
+    assert ledger.stats()["dirty"] == 0
+    assert await ledger.flush() == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_rows_dirty(mock_controller: MagicMock) -> None:
+    """Transient write failures leave rows dirty for the next flush."""
+    ledger = XpLedger(mock_controller)
+    ledger.record(MEMBER_ID, GUILD_ID, xp=5.0, level=0, last_message=NOW)
+    mock_controller.upsert_xp_batch.side_effect = RuntimeError("db down")
+
+    assert await ledger.flush() == 0
+    assert ledger.stats()["dirty"] == 1
+
+    mock_controller.upsert_xp_batch.side_effect = len
+    assert await ledger.flush() == 1
+
+
+@pytest.mark.asyncio
+async def test_integrity_error_drops_only_bad_rows(
+    mock_controller: MagicMock,
+) -> None:
+    """A constraint violation falls back to per-row writes and drops the bad row."""
+    bad_key = (MEMBER_ID, 999)
+
+    async def upsert(rows: list[dict[str, object]]) -> int:
+        if any((row["member_id"], row["guild_id"]) == bad_key for row in rows):
+            msg = "insert"
+            raise IntegrityError(msg, {}, Exception("fk"))
+        return len(rows)
+
+    mock_controller.upsert_xp_batch.side_effect = upsert
+    ledger = XpLedger(mock_controller)
+    ledger.record(MEMBER_ID, GUILD_ID, xp=5.0, level=0, last_message=NOW)
+    ledger.record(*bad_key, xp=5.0, level=0, last_message=NOW)
+
+    assert await ledger.flush() == 1
+    assert ledger.stats() | {"last_flush_ms": 0} == {
+        "resident": 1,
+        "dirty": 0,
+        "dropped": 0,
+        "flushes": 1,
+        "rows_flushed": 1,
+        "last_flush_ms": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_direct_write_flushes_pending_and_drops_entry(
+    mock_controller: MagicMock,
+) -> None:
+    """direct_write persists pending XP first and forces a reload afterwards."""
+    ledger = XpLedger(mock_controller)
+    await ledger.get(MEMBER_ID, GUILD_ID)
+    ledger.record(MEMBER_ID, GUILD_ID, xp=50.0, level=2, last_message=NOW)
+
+    async with ledger.direct_write(MEMBER_ID, GUILD_ID):
+        mock_controller.upsert_xp_batch.assert_awaited_once()
+
+    assert ledger.stats()["resident"] == 0
+    await ledger.get(MEMBER_ID, GUILD_ID)
+    assert mock_controller.find_one.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_grant_during_direct_write_builds_on_written_row(
+    mock_controller: MagicMock,
+) -> None:
+    """A grant racing an admin write waits for it and is kept afterwards."""
+    ledger = XpLedger(mock_controller)
+    written_row = MagicMock(xp=500.0, level=22, blacklisted=False, last_message=NOW)
+
+    async def grant() -> None:
+        entry = await ledger.get(MEMBER_ID, GUILD_ID)
+        ledger.record(
+            MEMBER_ID,
+            GUILD_ID,
+            xp=entry.xp + 10.0,
+            level=entry.level,
+            last_message=NOW,
+        )
+
+    async with ledger.direct_write(MEMBER_ID, GUILD_ID):
+        granting = asyncio.create_task(grant())
+        await asyncio.sleep(0)
+        mock_controller.find_one.assert_not_awaited()
+        mock_controller.find_one.return_value = written_row
+    await granting
+
+    entry = await ledger.get(MEMBER_ID, GUILD_ID)
+    assert entry.xp == 510.0
+    assert ledger.stats()["dirty"] == 1
+    mock_controller.find_one.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_eviction_skips_dirty_entries(mock_controller: MagicMock) -> None:
+    """Only clean entries are evicted when over the residency bound."""
+    ledger = XpLedger(mock_controller, max_resident=2)
+    ledger.record(1, GUILD_ID, xp=1.0, level=0, last_message=NOW)
+    await ledger.get(2, GUILD_ID)
+    await ledger.get(3, GUILD_ID)
+
+    assert ledger.stats()["resident"] == 2
+    # Dirty member 1 survives; clean member 2 (least recently used) is evicted
+    await ledger.get(1, GUILD_ID)
+    await ledger.get(2, GUILD_ID)
+    assert mock_controller.find_one.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_unflushed_rows_are_capped_while_flushes_fail(
+    mock_controller: MagicMock,
+) -> None:
+    """During an outage the oldest dirty rows are dropped beyond the cap."""
+    ledger = XpLedger(mock_controller, max_unflushed=3)
+    mock_controller.upsert_xp_batch.side_effect = RuntimeError("db down")
+    for member_id in range(1, 6):
+        ledger.record(member_id, GUILD_ID, xp=1.0, level=0, last_message=NOW)
+    await ledger.flush()
+
+    assert ledger.stats()["dirty"] == 3
+    assert ledger.stats()["dropped"] == 2
+
+    mock_controller.upsert_xp_batch.side_effect = len
+    assert await ledger.flush() == 3
+    rows = mock_controller.upsert_xp_batch.await_args.args[0]
+    assert {row["member_id"] for row in rows} == {3, 4, 5}
+
+
+@pytest.mark.asyncio
+async def test_threshold_flush_backs_off_after_failure(
+    mock_controller: MagicMock,
+) -> None:
+    """A failed flush pauses threshold flushes instead of retrying per grant."""
+    ledger = XpLedger(mock_controller, max_dirty=1)
+    mock_controller.upsert_xp_batch.side_effect = RuntimeError("db down")
+
+    ledger.record(1, GUILD_ID, xp=1.0, level=0, last_message=NOW)
+    assert ledger._flush_task is not None
+    await ledger._flush_task
+    failed_task = ledger._flush_task
+    ledger.record(2, GUILD_ID, xp=1.0, level=0, last_message=NOW)
+
+    assert ledger._flush_task is failed_task
+    mock_controller.upsert_xp_batch.assert_awaited_once()
@@ -1,6 +1,7 @@
 """Database-related test fixtures."""
 
 import pytest
+from py_pglite.config import PGliteConfig
 from py_pglite.sqlalchemy import SQLAlchemyAsyncPGliteManager
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlmodel import SQLModel
@@ -19,7 +20,8 @@ from tux.database.service import DatabaseService
 @pytest.fixture(scope="session")
 async def pglite_async_manager():
     """Session-scoped PGlite async manager - shared across tests."""
-    manager = SQLAlchemyAsyncPGliteManager()
+    # pg_trgm backs snippet search (see the 5f2c8e1a9d47 migration)
+    manager = SQLAlchemyAsyncPGliteManager(PGliteConfig(extensions=["pg_trgm"]))
     try:
         manager.start()
         # Wait for PGlite to be fully ready before yielding
@@ -55,8 +55,8 @@ class TestGuildConfigCachePerformance:
         async def run_operations() -> None:
             await cache.clear_all()
             for guild_id in range(100):
-                await cache.set(guild_id, audit_log_id=guild_id * 10)
-                await cache.get(guild_id)
+                await cache.put_snapshot(guild_id, {"audit_log_id": guild_id * 10})
+                await cache.get_snapshot(guild_id)
 
         def run_sync() -> None:
             asyncio.run(run_operations())
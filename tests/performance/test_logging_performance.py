@@ -0,0 +1,72 @@
+"""
+Performance benchmarks for log calls on hot paths.
+
+Compares eager f-string messages with loguru's deferred arguments, both when
+the level is disabled and when the message is emitted through the console
+format. Timings are only compared with each other, never with fixed limits.
+"""
+
+import io
+import timeit
+from collections.abc import Generator
+
+import pytest
+from loguru import logger
+
+from tux.core.logging import _format_record
+
+ITERATIONS = 20_000
+# Emitted messages go through every sink, so fewer of them
+EMITTED_ITERATIONS = 2_000
+# A realistic hot-path payload: a dict whose repr is not free
+PAYLOAD = {f"field_{i}": i for i in range(20)}
+
+
+@pytest.fixture
+def info_sink() -> Generator[io.StringIO]:
+    """Add an INFO sink using the console format, removing only that sink after."""
+    sink = io.StringIO()
+    handler_id = logger.add(sink, level="INFO", format=_format_record)
+    yield sink
+    logger.remove(handler_id)
+
+
+@pytest.mark.performance
+class TestLazyLogFormatting:
+    """Disabled log levels cost near zero when arguments are deferred."""
+
+    def test_disabled_trace_defers_formatting(self, info_sink: io.StringIO) -> None:
+        """Deferred arguments skip the string building an f-string always pays."""
+
+        def eager() -> None:
+            logger.trace(f"Creating Case object with data: {PAYLOAD}")
+
+        def lazy() -> None:
+            logger.trace("Creating Case object with data: {}", PAYLOAD)
+
+        eager_time = min(timeit.repeat(eager, number=ITERATIONS, repeat=3))
+        lazy_time = min(timeit.repeat(lazy, number=ITERATIONS, repeat=3))
+
+        assert info_sink.getvalue() == ""
+        # A disabled lazy call is a method call plus a level comparison
+        assert lazy_time * 2 < eager_time, (
+            f"Lazy trace not cheaper: {lazy_time:.4f}s vs eager {eager_time:.4f}s"
+        )
+
+    def test_emitted_message_overhead(self, info_sink: io.StringIO) -> None:
+        """Deferred arguments cost about the same as an f-string once emitted."""
+        guild_id = 1234
+
+        def eager() -> None:
+            logger.info(f"Cache hit for permission ranks (guild {guild_id})")
+
+        def lazy() -> None:
+            logger.info("Cache hit for permission ranks (guild {})", guild_id)
+
+        eager_time = min(timeit.repeat(eager, number=EMITTED_ITERATIONS, repeat=3))
+        lazy_time = min(timeit.repeat(lazy, number=EMITTED_ITERATIONS, repeat=3))
+
+        assert "Cache hit for permission ranks (guild 1234)" in info_sink.getvalue()
+        assert lazy_time < eager_time * 1.5, (
+            f"Lazy emit too slow: {lazy_time:.4f}s vs eager {eager_time:.4f}s"
+        )
@@ -0,0 +1,83 @@
+"""Unit tests for the cross-guild expiry sweeper."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from tux.database.controllers.base.filters import any_of
+from tux.database.models import Case
+from tux.services.expiry_sweep import ExpirySweeper
+
+pytestmark = pytest.mark.unit
+
+
+def _bot(*guild_ids: int) -> MagicMock:
+    bot = MagicMock()
+    bot.guilds = [MagicMock(id=guild_id) for guild_id in guild_ids]
+    return bot
+
+
+def test_any_of_binds_ids_as_single_array() -> None:
+    """Guild IDs are bound as one array parameter, not an IN list."""
+    sql = str(any_of(Case.guild_id, [1, 2, 3]).compile(dialect=postgresql.dialect()))
+    assert sql.startswith("cases.guild_id = ANY (")
+    assert sql.count("%(") == 1
+
+
+@pytest.mark.asyncio
+async def test_sweep_queries_once_for_all_guilds() -> None:
+    """A single fetch receives every guild ID."""
+    fetch = AsyncMock(return_value=["a", "b"])
+    handle = AsyncMock(side_effect=[True, False])
+    sweeper = ExpirySweeper(_bot(1, 2, 3))
+
+    result = await sweeper.sweep("tempban", fetch, handle)
+
+    fetch.assert_awaited_once_with([1, 2, 3])
+    assert (result.found, result.processed, result.failed) == (2, 1, 1)
+    assert sweeper.stats()["tempban"] is result
+
+
+@pytest.mark.asyncio
+async def test_sweep_isolates_handler_exceptions() -> None:
+    """A raising handler counts as a failure without aborting the sweep."""
+    handle = AsyncMock(side_effect=[RuntimeError("boom"), True])
+    sweeper = ExpirySweeper(_bot(1))
+
+    result = await sweeper.sweep("afk", AsyncMock(return_value=[1, 2]), handle)
+
+    assert (result.processed, result.failed) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_sweep_bounds_concurrency() -> None:
+    """No more than the configured number of handlers run at once."""
+    running = 0
+    peak = 0
+
+    async def handle(_: int) -> bool:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return True
+
+    sweeper = ExpirySweeper(_bot(1), concurrency=2)
+    result = await sweeper.sweep("afk", AsyncMock(return_value=list(range(6))), handle)
+
+    assert result.processed == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_sweep_skips_query_without_guilds() -> None:
+    """No guilds means no database query."""
+    fetch = AsyncMock()
+    result = await ExpirySweeper(_bot()).sweep("afk", fetch, AsyncMock())
+    fetch.assert_not_called()
+    assert result.found == 0
@@ -0,0 +1,173 @@
+"""Unit tests for the per-listener latency profiler."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from tux.services.listener_profiler import (
+    ListenerProfiler,
+    instrument_engine,
+    measure_wait,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class TestListenerProfiler:
+    """Invocation counting, percentiles and wait attribution."""
+
+    @pytest.mark.asyncio
+    async def test_wrap_counts_calls_and_errors(self) -> None:
+        """Wrapped listeners are counted and their failures re-raised."""
+        profiler = ListenerProfiler()
+        ok = profiler.wrap("Cog.on_ok", AsyncMock(return_value=None))
+        broken = profiler.wrap(
+            "Cog.on_broken", AsyncMock(side_effect=ValueError("boom"))
+        )
+
+        assert inspect.iscoroutinefunction(ok)
+        await ok()
+        await ok()
+        with pytest.raises(ValueError, match="boom"):
+            await broken()
+
+        assert profiler.stats["Cog.on_ok"].calls == 2
+        assert profiler.stats["Cog.on_ok"].errors == 0
+        assert profiler.stats["Cog.on_broken"].errors == 1
+
+    @pytest.mark.asyncio
+    async def test_waits_are_attributed_to_the_running_listener(self) -> None:
+        """DB and REST time land on the listener that awaited them only."""
+        profiler = ListenerProfiler()
+
+        async def listener() -> None:
+            with measure_wait("db"):
+                await asyncio.sleep(0.01)
+            with measure_wait("rest"):
+                await asyncio.sleep(0.01)
+
+        async def idle() -> None:
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(
+            profiler.wrap("busy", listener)(),
+            profiler.wrap("idle", idle)(),
+        )
+
+        busy = profiler.report(sort_by="db_ms")[0]
+        assert busy.name == "busy"
+        assert busy.db_ms >= 5
+        assert busy.rest_ms >= 5
+        idle_stats = profiler.stats["idle"]
+        assert idle_stats.db_ms == 0
+        assert idle_stats.rest_ms == 0
+
+    def test_measure_wait_outside_listener_is_noop(self) -> None:
+        """Waits outside any profiled listener are ignored."""
+        with measure_wait("db"):
+            pass
+
+    def test_report_percentiles_sorted_worst_first(self) -> None:
+        """Percentiles come from the recorded window, worst listener first."""
+        profiler = ListenerProfiler()
+        fast = profiler._stats_for("fast")
+        slow = profiler._stats_for("slow")
+        for value in range(1, 101):
+            fast.durations.append(float(value))
+            slow.durations.append(float(value * 10))
+        fast.calls = slow.calls = 100
+
+        report = profiler.report(limit=1)
+
+        assert [s.name for s in report] == ["slow"]
+        assert report[0].p50_ms == 500.0
+        assert report[0].p99_ms == 990.0
+        assert report[0].max_ms == 1000.0
+
+    @pytest.mark.asyncio
+    async def test_push_metrics_reports_deltas(self) -> None:
+        """Only listeners called since the previous push are reported."""
+        profiler = ListenerProfiler()
+        listener = profiler.wrap("Cog.on_event", AsyncMock(return_value=None))
+        await listener()
+        await listener()
+
+        with patch(
+            "tux.services.listener_profiler.record_listener_metric",
+        ) as record:
+            profiler.push_metrics()
+            profiler.push_metrics()
+            await listener()
+            profiler.push_metrics()
+
+        assert [c.kwargs["calls"] for c in record.call_args_list] == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_push_metrics_covers_one_interval(self) -> None:
+        """Percentiles and mean waits reported by a push ignore earlier intervals."""
+        profiler = ListenerProfiler()
+
+        async def slow() -> None:
+            with measure_wait("db"):
+                await asyncio.sleep(0.05)
+
+        async def fast() -> None:
+            with measure_wait("db"):
+                pass
+
+        with patch(
+            "tux.services.listener_profiler.record_listener_metric",
+        ) as record:
+            await profiler.wrap("Cog.on_event", slow)()
+            profiler.push_metrics()
+            await profiler.wrap("Cog.on_event", fast)()
+            profiler.push_metrics()
+
+        first, second = (c.kwargs for c in record.call_args_list)
+        assert first["p99_ms"] >= 40
+        assert first["db_ms"] >= 40
+        assert second["p99_ms"] < 40
+        assert second["db_ms"] < 40
+        # The cumulative stats still cover both calls
+        assert profiler.stats["Cog.on_event"].calls == 2
+
+    @pytest.mark.asyncio
+    async def test_instrument_engine_times_statements_only(self) -> None:
+        """Statements count as DB time; the caller's own work does not."""
+        profiler = ListenerProfiler()
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+
+        async with profiler.track("Cog.on_db"):
+            with engine.connect() as conn:
+                assert conn.execute(text("SELECT 1")).scalar() == 1
+                await asyncio.sleep(0.05)
+
+        stats = profiler.stats["Cog.on_db"]
+        assert 0 < stats.db_ms < 40
+        assert stats.total_ms >= 40
+
+    @pytest.mark.asyncio
+    async def test_instrument_http_times_requests(self) -> None:
+        """Discord REST requests made inside a listener count as REST time."""
+        profiler = ListenerProfiler()
+        http = MagicMock()
+
+        async def request(*_args: object, **_kwargs: object) -> str:
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        http.request = request
+        profiler.instrument_http(http)
+
+        async def listener() -> None:
+            assert await http.request("GET", "/users/@me") == "ok"
+
+        await profiler.wrap("Cog.on_rest", listener)()
+
+        assert profiler.stats["Cog.on_rest"].rest_ms >= 5
@@ -0,0 +1,119 @@
+"""Unit tests for the min-heap reminder scheduler (mocked controller, no DB)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tux.database.models import Reminder
+from tux.services.reminder_scheduler import ReminderScheduler
+
+pytestmark = pytest.mark.unit
+
+NOW = datetime.now(UTC).replace(tzinfo=None)
+
+
+def _reminder(reminder_id: int, offset: timedelta) -> Reminder:
+    return Reminder(
+        id=reminder_id,
+        reminder_content=f"reminder {reminder_id}",
+        reminder_expires_at=NOW + offset,
+        reminder_channel_id=1,
+        reminder_user_id=1,
+        guild_id=1,
+    )
+
+
+def _controller(*pages: list[Reminder]) -> MagicMock:
+    controller = MagicMock()
+    controller.get_pending_reminders_page = AsyncMock(side_effect=[*pages, []])
+    return controller
+
+
+@pytest.mark.asyncio
+async def test_refill_pages_with_keyset_cursor() -> None:
+    """Full pages advance the cursor; a short page closes the window."""
+    first = [_reminder(1, timedelta(minutes=1)), _reminder(2, timedelta(minutes=2))]
+    second = [_reminder(3, timedelta(minutes=3))]
+    controller = _controller(first, second)
+    scheduler = ReminderScheduler(controller, AsyncMock(), page_size=2)
+
+    await scheduler._refill()
+
+    calls = controller.get_pending_reminders_page.await_args_list
+    assert len(calls) == 2
+    assert calls[0].args[0] is None
+    assert calls[1].args[0] == (first[-1].reminder_expires_at, 2)
+    assert scheduler.stats()["depth"] == 3
+
+
+@pytest.mark.asyncio
+async def test_pop_due_returns_only_due_in_order() -> None:
+    """Only reminders at or before now are popped, earliest first."""
+    scheduler = ReminderScheduler(
+        _controller(
+            [
+                _reminder(2, timedelta(minutes=-1)),
+                _reminder(1, timedelta(minutes=-5)),
+                _reminder(3, timedelta(hours=1)),
+            ],
+        ),
+        AsyncMock(),
+    )
+    await scheduler._refill()
+
+    due = scheduler._pop_due(NOW)
+
+    assert [key[1] for key, _ in due] == [1, 2]
+    assert scheduler.stats()["depth"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pop_due_respects_batch_size() -> None:
+    """Batches are bounded and popped earliest first."""
+    scheduler = ReminderScheduler(
+        _controller([_reminder(i, timedelta(minutes=-i)) for i in range(1, 6)]),
+        AsyncMock(),
+        batch_size=2,
+    )
+    await scheduler._refill()
+
+    assert [key[1] for key, _ in scheduler._pop_due(NOW)] == [5, 4]
+    assert [key[1] for key, _ in scheduler._pop_due(NOW)] == [3, 2]
+    assert [key[1] for key, _ in scheduler._pop_due(NOW)] == [1]
+    assert scheduler._pop_due(NOW) == []
+    assert scheduler.stats()["depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_add_only_keeps_reminders_inside_window() -> None:
+    """New reminders beyond the loaded window are left for a later page."""
+    scheduler = ReminderScheduler(_controller(), AsyncMock())
+    await scheduler._refill()
+
+    scheduler.add(_reminder(1, timedelta(minutes=10)))
+    scheduler.add(_reminder(2, timedelta(days=30)))
+
+    assert scheduler.stats()["depth"] == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatch_batch_isolates_failures_and_tracks_lag() -> None:
+    """One failing reminder does not stop the batch; lag is recorded."""
+    dispatch = AsyncMock(side_effect=[RuntimeError("boom"), None])
+    scheduler = ReminderScheduler(
+        _controller(
+            [_reminder(1, timedelta(seconds=-2)), _reminder(2, timedelta(seconds=-1))],
+        ),
+        dispatch,
+    )
+    await scheduler._refill()
+
+    await scheduler._dispatch_batch(NOW, scheduler._pop_due(NOW))
+
+    assert dispatch.await_count == 2
+    stats = scheduler.stats()
+    assert stats["dispatched"] == 2
+    assert stats["max_lag_ms"] >= 2000
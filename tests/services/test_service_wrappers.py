@@ -1,5 +1,11 @@
 """Tests for service wrappers using the centralized HTTP client."""
 
+import asyncio
+import io
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+
 import httpx
 import pytest
 from pytest_httpx import HTTPXMock
@@ -10,7 +16,7 @@ from tux.modules.utility.run import (
     GodboltService,
     WandboxService,
 )
-from tux.services.wrappers import godbolt, wandbox
+from tux.services.wrappers import godbolt, tldr, wandbox, xkcd
 from tux.shared.exceptions import (
     TuxAPIConnectionError,
     TuxAPIRequestError,
@@ -171,6 +177,289 @@ class TestWandboxService:
             await wandbox.getoutput("code", "python-3.9.2", None)
 
 
+def _xkcd_comic(num: int) -> dict[str, object]:
+    """Build xkcd API metadata for a comic."""
+    return {
+        "num": num,
+        "safe_title": f"Comic {num}",
+        "alt": "alt text",
+        "img": f"https://imgs.xkcd.com/comics/{num}.png",
+        "year": "2024",
+        "month": "1",
+        "day": "2",
+    }
+
+
+@pytest.mark.unit
+class TestXkcdClient:
+    """Test the async xkcd client and its comic store."""
+
+    @pytest.mark.asyncio
+    async def test_comics_are_fetched_once(self, httpx_mock: HTTPXMock) -> None:
+        """Published comics are served from the store after the first fetch."""
+        httpx_mock.add_response(
+            url="https://xkcd.com/42/info.0.json",
+            json=_xkcd_comic(42),
+        )
+        client = xkcd.Client(store=xkcd.ComicStore(persist=False))
+
+        first = await client.get_comic(42)
+        second = await client.get_comic(42)
+
+        assert first.title == second.title == "Comic 42"
+        assert first.comic_url == "https://xkcd.com/42/"
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_random_comic_uses_cached_latest_id(
+        self,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        """Random comics need no request once the latest ID and comics are known."""
+        httpx_mock.add_response(
+            url="https://xkcd.com/info.0.json",
+            json=_xkcd_comic(3),
+        )
+        httpx_mock.add_response(
+            url="https://xkcd.com/1/info.0.json",
+            json=_xkcd_comic(1),
+        )
+        httpx_mock.add_response(
+            url="https://xkcd.com/2/info.0.json",
+            json=_xkcd_comic(2),
+        )
+        client = xkcd.Client(store=xkcd.ComicStore(persist=False))
+
+        assert await client.prefetch() == 2
+        requests_after_prefetch = len(httpx_mock.get_requests())
+        comics = {(await client.get_random_comic()).id for _ in range(20)}
+
+        assert comics <= {1, 2, 3}
+        assert len(httpx_mock.get_requests()) == requests_after_prefetch
+
+    @pytest.mark.asyncio
+    async def test_prefetch_skips_failed_comics(self, httpx_mock: HTTPXMock) -> None:
+        """An API error for one comic doesn't stop the others."""
+        httpx_mock.add_response(
+            url="https://xkcd.com/info.0.json",
+            json=_xkcd_comic(3),
+        )
+        httpx_mock.add_response(url="https://xkcd.com/1/info.0.json", status_code=500)
+        httpx_mock.add_response(
+            url="https://xkcd.com/2/info.0.json",
+            json=_xkcd_comic(2),
+        )
+        client = xkcd.Client(store=xkcd.ComicStore(persist=False))
+
+        assert await client.prefetch(concurrency=2) == 1
+        assert 2 in client.store
+        assert 1 not in client.store
+
+    @pytest.mark.asyncio
+    async def test_prefetch_stops_on_connection_error(
+        self,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        """A connection failure ends the prefetch with no requests left running."""
+        httpx_mock.add_response(
+            url="https://xkcd.com/info.0.json",
+            json=_xkcd_comic(50),
+        )
+        httpx_mock.add_exception(httpx.ConnectError("down"), is_reusable=True)
+        client = xkcd.Client(store=xkcd.ComicStore(persist=False))
+
+        with pytest.raises(TuxAPIConnectionError):
+            await client.prefetch(concurrency=4)
+
+        current = asyncio.current_task()
+        assert [task for task in asyncio.all_tasks() if task is not current] == []
+
+    @pytest.mark.asyncio
+    async def test_not_found(self, httpx_mock: HTTPXMock) -> None:
+        """A missing comic raises TuxAPIResourceNotFoundError."""
+        httpx_mock.add_response(status_code=404)
+        client = xkcd.Client(store=xkcd.ComicStore(persist=False))
+
+        with pytest.raises(TuxAPIResourceNotFoundError):
+            await client.get_comic(999999)
+
+    @pytest.mark.asyncio
+    async def test_store_round_trips_through_disk(self, tmp_path: Path) -> None:
+        """Saved comics are loaded back by a new store."""
+        path = tmp_path / "comics.json"
+        store = xkcd.ComicStore(path)
+        store.put(_xkcd_comic(7))
+        await store.save()
+
+        reloaded = xkcd.ComicStore(path)
+        await reloaded.load()
+
+        assert 7 in reloaded
+        assert reloaded.get(7) == _xkcd_comic(7)
+
+
+def _tldr_archive(pages: dict[str, str]) -> bytes:
+    """Build a TLDR pages zip from ``{"platform/command.md": content}``."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("LICENSE.md", "license")
+        for name, content in pages.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def tldr_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point the TLDR client at an empty cache with no open indexes."""
+    monkeypatch.setattr(tldr, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(tldr, "_indexes", {})
+    monkeypatch.setattr(tldr, "_misses", {})
+    monkeypatch.setattr(tldr, "_completions", {})
+    tldr.TldrClient.list_tldr_commands.cache_clear()
+    yield tmp_path
+    for index in tldr._indexes.values():
+        index.close()
+    tldr.TldrClient.list_tldr_commands.cache_clear()
+
+
+@pytest.mark.unit
+class TestTldrIndex:
+    """Test the memory-mapped TLDR corpus and its network fallback."""
+
+    @pytest.mark.asyncio
+    async def test_update_streams_archive_into_index(
+        self,
+        tldr_cache: Path,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        """The archive is packed into a corpus that serves pages locally."""
+        httpx_mock.add_response(
+            url=tldr.ARCHIVE_URL_TEMPLATE.format(suffix=""),
+            content=_tldr_archive(
+                {
+                    "common/tar.md": "# tar",
+                    "linux/ls.md": "# ls (linux)",
+                    "osx/ls.md": "# ls (osx)",
+                },
+            ),
+        )
+
+        result = await tldr.TldrClient.update_tldr_cache("en")
+
+        assert "3 pages" in result
+        assert not tldr.TldrClient.cache_needs_update("en")
+        assert await tldr.TldrClient.fetch_tldr_page("ls", ["en"]) == (
+            "# ls (linux)",
+            "linux",
+        )
+        assert await tldr.TldrClient.fetch_tldr_page("ls", ["en"], "osx") == (
+            "# ls (osx)",
+            "osx",
+        )
+        assert tldr.TldrClient.list_tldr_commands("en", "linux") == ["ls", "tar"]
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_index_survives_reopen(self, tldr_cache: Path) -> None:
+        """A built corpus is mapped again by a fresh index."""
+        archive_path = tldr_cache / "pages.zip"
+        archive_path.write_bytes(_tldr_archive({"common/git.md": "# git"}))
+
+        assert tldr.TldrIndex.build("en", archive_path) == 1
+        index = tldr.TldrIndex.open("en")
+        try:
+            assert index.get("git", "common") == "# git"
+            assert index.get("git", "linux") is None
+            assert index.commands(["common"]) == ["git"]
+        finally:
+            index.close()
+
+    @pytest.mark.asyncio
+    async def test_misses_fall_back_to_network_once(
+        self,
+        tldr_cache: Path,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        """Unindexed pages are fetched once; upstream misses are remembered."""
+        httpx_mock.add_response(
+            url=f"{tldr.PAGES_SOURCE_URL}/linux/foo.md",
+            text="# foo",
+        )
+        httpx_mock.add_response(status_code=404, is_reusable=True)
+
+        found = await tldr.TldrClient.fetch_tldr_page("foo", ["en"], "linux")
+        # A hit in the first priority batch stops the fan-out there
+        assert len(httpx_mock.get_requests()) <= tldr.REMOTE_FETCH_BATCH_SIZE
+        missing = await tldr.TldrClient.fetch_tldr_page("nope", ["en"])
+        requests_made = len(httpx_mock.get_requests())
+
+        assert found == ("# foo", "linux")
+        assert missing is None
+        assert await tldr.TldrClient.fetch_tldr_page("foo", ["en"], "linux") == found
+        assert await tldr.TldrClient.fetch_tldr_page("nope", ["en"]) is None
+        assert len(httpx_mock.get_requests()) == requests_made
+
+    @pytest.mark.asyncio
+    async def test_remembered_misses_are_capped(
+        self,
+        tldr_cache: Path,
+        httpx_mock: HTTPXMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Only the most recent misses are kept, since they are user input."""
+        monkeypatch.setattr(tldr, "MISS_CACHE_MAX_SIZE", 2)
+        httpx_mock.add_response(status_code=404, is_reusable=True)
+
+        for command in ("a", "b", "c"):
+            assert await tldr.TldrClient.fetch_tldr_page(command, ["en"]) is None
+
+        assert [key[0] for key in tldr._misses] == ["b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_completions_follow_cache_changes(
+        self,
+        tldr_cache: Path,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        """Autocomplete picks up rebuilt and network-fetched commands."""
+        completions = tldr.TldrClient.command_completions("en", "linux")
+        assert completions.search("l") == []
+
+        archive_path = tldr_cache / "pages.zip"
+        archive_path.write_bytes(_tldr_archive({"linux/ls.md": "# ls"}))
+        tldr.TldrIndex.build("en", archive_path)
+        old_index = await tldr.TldrClient.get_index("en")
+        await tldr.TldrClient.load_index("en")
+        assert completions.search("l") == ["ls"]
+        assert tldr.TldrClient.command_completions("en", "linux") is completions
+        assert await tldr.TldrClient.get_index("en") is not old_index
+
+        httpx_mock.add_response(
+            url=f"{tldr.PAGES_SOURCE_URL}/common/lsof.md",
+            text="# lsof",
+        )
+        httpx_mock.add_response(status_code=404, is_reusable=True)
+        await tldr.TldrClient.fetch_tldr_page("lsof", ["en"])
+
+        assert completions.search("ls") == ["ls", "lsof"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_keys_are_not_cached(
+        self,
+        tldr_cache: Path,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        """User-typed languages and platforms never open indexes or add entries."""
+        httpx_mock.add_response(status_code=404, is_reusable=True)
+
+        assert tldr.TldrClient.command_completions("xx", "linux").search("") == []
+        assert tldr.TldrClient.command_completions("en", "nowhere").search("") == []
+        assert await tldr.TldrClient.get_index("xx") is None
+        assert await tldr.TldrClient.fetch_tldr_page("ls", ["xx", "en"]) is None
+
+        assert list(tldr._indexes) == ["en"]
+        assert tldr._completions == {}
+
+
 @pytest.mark.integration
 class TestServiceWrapperIntegration:
     """Integration tests for service wrappers with the run module."""
@@ -0,0 +1,109 @@
+"""Unit tests for the in-memory starboard tally engine (no Discord I/O)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from tux.services.starboard_tally import (
+    ChannelRestBudget,
+    MessageTally,
+    StarboardAction,
+    StarboardSettings,
+    StarboardTally,
+)
+
+pytestmark = pytest.mark.unit
+
+AUTHOR_ID = 42
+
+
+def _tally(message_id: int = 1, count: int = 0, guild_id: int = 10) -> MessageTally:
+    return MessageTally(
+        guild_id=guild_id,
+        channel_id=20,
+        message_id=message_id,
+        author_id=AUTHOR_ID,
+        count=count,
+        author_name="author",
+        author_avatar_url=None,
+        content="hello",
+        image_url=None,
+        jump_url="https://discord.com/channels/10/20/1",
+        created_at=datetime.now(UTC),
+    )
+
+
+def test_add_and_remove_adjust_count_but_ignore_author() -> None:
+    """Stars from other users count; the author's own star never does."""
+    engine = StarboardTally()
+    engine.seed(_tally(count=2))
+
+    assert engine.apply_add(1, user_id=7) is True
+    assert engine.apply_add(1, user_id=AUTHOR_ID) is False
+    assert engine.apply_remove(1, user_id=AUTHOR_ID) is False
+    assert engine.apply_remove(1, user_id=8) is True
+
+    tally = engine.get(1)
+    assert tally is not None
+    assert tally.count == 2
+
+
+def test_untracked_message_reports_not_counted() -> None:
+    """Events for unseeded messages are left for the seed to pick up."""
+    engine = StarboardTally()
+    assert engine.apply_add(99, user_id=7) is False
+    assert engine.apply_clear(99) is None
+
+
+def test_pending_action_only_when_display_changes() -> None:
+    """REST work is needed only to cross the threshold or change the count."""
+    tally = _tally(count=3)
+    assert tally.pending_action(threshold=3) is StarboardAction.POST
+
+    tally.starboard_message_id = 555
+    tally.displayed_count = 3
+    assert tally.pending_action(threshold=3) is None
+
+    tally.count = 4
+    assert tally.pending_action(threshold=3) is StarboardAction.EDIT
+
+    tally.count = 2
+    assert tally.pending_action(threshold=3) is StarboardAction.DELETE
+
+
+def test_lru_bound_evicts_least_recently_touched() -> None:
+    """The store keeps at most max_messages tallies."""
+    engine = StarboardTally(max_messages=2)
+    engine.seed(_tally(message_id=1))
+    engine.seed(_tally(message_id=2))
+    engine.get(1)
+    engine.seed(_tally(message_id=3))
+
+    assert len(engine) == 2
+    assert engine.get(2) is None
+    assert engine.get(1) is not None
+
+
+def test_invalidate_settings_drops_guild_state() -> None:
+    """Changing a guild's config forgets its settings and tallies."""
+    engine = StarboardTally()
+    engine.set_settings(10, StarboardSettings(channel_id=1, emoji="⭐", threshold=3))
+    engine.seed(_tally(message_id=1, guild_id=10))
+    engine.seed(_tally(message_id=2, guild_id=11))
+
+    engine.invalidate_settings(10)
+
+    assert engine.has_settings(10) is False
+    assert engine.get(1) is None
+    assert engine.get(2) is not None
+
+
+def test_rest_budget_refuses_after_burst() -> None:
+    """A channel gets a burst of calls, then must wait; channels are independent."""
+    budget = ChannelRestBudget(calls=2, period=10.0)
+    assert budget.acquire(1) == 0.0
+    assert budget.acquire(1) == 0.0
+    assert budget.acquire(1) > 0.0
+    assert budget.acquire(2) == 0.0
@@ -0,0 +1,68 @@
+"""Unit tests for the ranked autocomplete index."""
+
+import pytest
+
+from tux.shared.autocomplete import AutocompleteIndex
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def index() -> AutocompleteIndex:
+    """Index over a few TLDR-like command names."""
+    return AutocompleteIndex(
+        ["git", "git-status", "git-commit", "gitk", "tar", "docker-compose", "Go"],
+    )
+
+
+class TestAutocompleteIndex:
+    """Prefix ranking, substring fallback and incremental updates."""
+
+    def test_prefix_matches_shortest_first(self, index: AutocompleteIndex) -> None:
+        """Prefix hits are ordered by length, then alphabetically."""
+        assert index.search("git") == ["git", "gitk", "git-commit", "git-status"]
+
+    def test_substring_fallback_after_prefixes(self, index: AutocompleteIndex) -> None:
+        """Names containing the query follow the prefix hits."""
+        assert index.search("com") == ["git-commit", "docker-compose"]
+        assert index.search("o") == ["Go", "docker-compose", "git-commit"]
+
+    def test_case_insensitive_and_limited(self, index: AutocompleteIndex) -> None:
+        """Matching ignores case and returns names as added, up to the limit."""
+        assert index.search("GO") == ["Go"]
+        assert index.search("", limit=2) == ["Go", "git"]
+
+    def test_update_applies_only_changes(self, index: AutocompleteIndex) -> None:
+        """Removed names stop matching, shared prefixes survive, new names appear."""
+        index.update(["git", "gitk", "tar", "ls"])
+
+        assert len(index) == 4
+        assert "git-status" not in index
+        assert index.search("git") == ["git", "gitk"]
+        assert index.search("com") == []
+        assert index.search("l") == ["ls"]
+
+    def test_remove_unknown_is_ignored(self, index: AutocompleteIndex) -> None:
+        """Removing a missing name leaves the index untouched."""
+        index.remove("missing")
+        index.remove("git-commit")
+        index.remove("git-commit")
+
+        assert len(index) == 6
+        assert index.search("git-c") == []
+
+    def test_short_queries_read_one_posting_list(
+        self,
+        index: AutocompleteIndex,
+    ) -> None:
+        """Queries shorter than a gram are looked up directly, not scanned."""
+        assert index._substring_keys("it") == {
+            "git",
+            "gitk",
+            "git-commit",
+            "git-status",
+        }
+        assert index.search("ar") == ["tar"]
+
+        index.update([])
+        assert index._grams == {}
@@ -0,0 +1,51 @@
+"""Unit tests for cache directory resolution."""
+
+from pathlib import Path
+
+import pytest
+
+from tux.shared.cache_dir import resolve_cache_dir
+
+pytestmark = pytest.mark.unit
+
+
+class TestResolveCacheDir:
+    """The explicit variable wins, then XDG_CACHE_HOME, then ~/.cache."""
+
+    def test_explicit_variable_wins(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A feature's own variable overrides XDG_CACHE_HOME."""
+        monkeypatch.setenv("TLDR_CACHE_DIR", str(tmp_path / "tldr-cache"))
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+
+        assert resolve_cache_dir("TLDR_CACHE_DIR", "tldr") == tmp_path / "tldr-cache"
+
+    def test_falls_back_to_xdg_then_home(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Without the variable the name is placed under the XDG or home cache."""
+        monkeypatch.delenv("TLDR_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        assert resolve_cache_dir("TLDR_CACHE_DIR", "tldr") == tmp_path / "xdg" / "tldr"
+
+        monkeypatch.delenv("XDG_CACHE_HOME")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert resolve_cache_dir("TLDR_CACHE_DIR", "tldr") == (
+            tmp_path / ".cache" / "tldr"
+        )
+
+    def test_relative_paths_are_resolved(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A relative override is made absolute against the working directory."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("COG_CACHE_DIR", "cache")
+
+        assert resolve_cache_dir("COG_CACHE_DIR", "tux") == tmp_path.resolve() / "cache"